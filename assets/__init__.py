@@ -12,12 +12,24 @@ Key Components:
 - ResourceDiscovery: Asset scanning and organization
 """
 
-from .manager import AssetManager, get_asset_manager, initialize_asset_manager, shutdown_asset_manager
-from .types import AssetType, Asset, SpriteAsset, FontAsset, SoundAsset, ThemeAsset, DataAsset
-from .loader import AssetLoader, LoaderRegistry, get_loader_registry
-from .cache import AssetCache, CachePolicy, CacheStats
-from .discovery import ResourceDiscovery, AssetMetadata, ScanResult, AssetCatalog
-from .exceptions import AssetError, AssetNotFoundError, AssetLoadError, AssetValidationError
+from utils.lazy_exports import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    '.manager': [
+        'AssetManager', 'get_asset_manager', 'initialize_asset_manager',
+        'shutdown_asset_manager',
+    ],
+    '.types': [
+        'AssetType', 'Asset', 'SpriteAsset', 'FontAsset', 'SoundAsset', 'ThemeAsset',
+        'DataAsset',
+    ],
+    '.loader': ['AssetLoader', 'LoaderRegistry', 'get_loader_registry'],
+    '.cache': ['AssetCache', 'CachePolicy', 'CacheStats'],
+    '.discovery': ['ResourceDiscovery', 'AssetMetadata', 'ScanResult', 'AssetCatalog'],
+    '.exceptions': [
+        'AssetError', 'AssetNotFoundError', 'AssetLoadError', 'AssetValidationError',
+    ],
+})
 
 __all__ = [
     'AssetManager',
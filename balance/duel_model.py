@@ -0,0 +1,725 @@
+"""Analytical duel model: outcome distributions for simplified 1-vs-N melee.
+
+Balance sweeps over weapon/armor variants currently cost 30-100 full
+simulated runs per variant. For plain melee scenarios (dueling pit, orc
+swarms, depth-N baselines) the fight is a small Markov chain over
+
+    (player HP, current target, target HP, player momentum counter)
+
+and can be solved without sampling in milliseconds. Each round mirrors the
+scenario harness turn order:
+
+1. The player attacks the current target: d20 + to-hit vs AC, natural 1
+   misses, rolls at or above the weapon's crit threshold hit for double
+   damage. The first attack on a monster that is not yet aware of the
+   player is a surprise attack: it always hits and always crits. If the
+   target survives and the player is faster, the momentum counter advances
+   and may grant a bonus attack (SpeedBonusTracker rules).
+2. Every surviving monster attacks the player: accuracy vs evasion
+   (balance.hit_model.compute_hit_chance), then the same d20 resolution,
+   plus speed bonus attacks. A monster's momentum counter advances once per
+   round regardless of hits, so its bonus chance follows a fixed schedule.
+
+Damage per hit follows Fighter.attack_d20: weapon dice or damage range (fist
+or natural attack range when unarmed), + STR modifier, damage-type
+multiplier (or the legacy +/-1 resistance/vulnerability), crit doubling,
+minimum 1, then the defender's percentage resistance.
+
+Not modelled: the approach before melee, items and potions, status effects,
+monster abilities (regeneration, life drain, plague, ...) and target
+switching. The player fights monsters in list order. Potion use keeps
+simulated swarm death rates well below the model's. Use
+cross_validate_scenario() to check that a scenario is simple enough for the
+model before trusting it in a sweep.
+
+Usage:
+    from balance.duel_model import profile_from_entity, solve_duel
+
+    outcome = solve_duel(profile_from_entity(player),
+                         [profile_from_entity(m) for m in monsters])
+    outcome.win_rate, outcome.expected_rounds, outcome.hp_loss_distribution
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from balance.hit_model import DEFAULT_ACCURACY, DEFAULT_EVASION, compute_hit_chance
+
+logger = logging.getLogger(__name__)
+
+Distribution = Dict[int, float]
+
+# Damage type names Fighter.apply_resistance understands
+RESISTANCE_TYPES = ("fire", "cold", "poison", "lightning", "electric", "acid", "physical")
+
+# Stop iterating once this little probability mass is still undecided
+_MASS_EPSILON = 1e-12
+
+
+# =============================================================================
+# Distributions
+# =============================================================================
+
+def dice_distribution(dice: str) -> Distribution:
+    """Exact distribution of a dice roll in D&D notation (e.g. "2d6+1")."""
+    from dice import parse_dice
+
+    num_dice, die_size, modifier = parse_dice(dice)
+    face = 1.0 / die_size
+    dist: Distribution = {modifier: 1.0}
+    for _ in range(num_dice):
+        rolled: Distribution = defaultdict(float)
+        for total, p in dist.items():
+            for value in range(1, die_size + 1):
+                rolled[total + value] += p * face
+        dist = dict(rolled)
+    return dist
+
+
+def uniform_distribution(low: int, high: int) -> Distribution:
+    """Distribution of random.randint(low, high)."""
+    p = 1.0 / (high - low + 1)
+    return {value: p for value in range(low, high + 1)}
+
+
+def _convolve(a: Distribution, b: Distribution, cap: Optional[int] = None) -> Distribution:
+    """Distribution of the sum of two independent variables, sums above cap clamped to cap."""
+    out: Distribution = defaultdict(float)
+    for x, p in a.items():
+        for y, q in b.items():
+            total = x + y
+            if cap is not None and total > cap:
+                total = cap
+            out[total] += p * q
+    return dict(out)
+
+
+def _mean(dist: Distribution) -> float:
+    return sum(value * p for value, p in dist.items())
+
+
+# =============================================================================
+# Combatant profiles
+# =============================================================================
+
+@dataclass
+class CombatantProfile:
+    """Combat-relevant snapshot of a fighter.
+
+    Plain data, so sweeps can vary one field at a time with
+    dataclasses.replace() instead of building entities.
+
+    Attributes:
+        name: Display name
+        hp: Hit points at the start of the fight
+        armor_class: Fighter.armor_class
+        accuracy: Accuracy stat (hit model)
+        evasion: Evasion stat (hit model)
+        to_hit: DEX modifier + weapon to-hit bonus
+        strength_mod: Added to every damage roll
+        damage: Base damage distribution before STR (weapon, fists or natural attack)
+        crit_threshold: Natural roll needed for a critical hit
+        damage_type: Damage type of the attack (weapon or natural), if any
+        speed_bonus: SpeedBonusTracker.speed_bonus_ratio
+        resistances: Damage type name -> resistance percentage (0-100)
+        damage_type_modifiers: Damage type -> damage multiplier taken
+        damage_resistance: Legacy resisted damage type (-1 damage)
+        damage_vulnerability: Legacy vulnerable damage type (+1 damage)
+        unaware: Not yet aware of the player, so the player's first attack
+            on it is a surprise attack
+    """
+    name: str
+    hp: int
+    armor_class: int
+    accuracy: int = DEFAULT_ACCURACY
+    evasion: int = DEFAULT_EVASION
+    to_hit: int = 0
+    strength_mod: int = 0
+    damage: Distribution = field(default_factory=lambda: {0: 1.0})
+    crit_threshold: int = 20
+    damage_type: Optional[str] = None
+    speed_bonus: float = 0.0
+    resistances: Dict[str, int] = field(default_factory=dict)
+    damage_type_modifiers: Dict[str, float] = field(default_factory=dict)
+    damage_resistance: Optional[str] = None
+    damage_vulnerability: Optional[str] = None
+    unaware: bool = False
+
+    def bonus_schedule(self) -> Tuple[float, ...]:
+        """Bonus attack chance at each momentum counter value (1, 2, ...).
+
+        Mirrors SpeedBonusTracker.roll_for_bonus_attack: the chance grows by
+        the speed ratio per attack and the counter resets once the chance
+        reaches 100%. Empty when the fighter has no speed bonus.
+        """
+        if self.speed_bonus <= 0.0:
+            return ()
+        schedule = []
+        counter = 0
+        while True:
+            counter += 1
+            chance = counter * self.speed_bonus
+            if chance >= 1.0:
+                schedule.append(1.0)
+                return tuple(schedule)
+            schedule.append(chance)
+
+    def with_changes(self, **changes: Any) -> "CombatantProfile":
+        """Return a copy with some fields replaced (for sweeps)."""
+        return replace(self, **changes)
+
+
+def profile_from_entity(entity: Any) -> CombatantProfile:
+    """Build a CombatantProfile from a live Entity with a Fighter.
+
+    Args:
+        entity: Entity with a Fighter component (equipment, speed tracker optional)
+
+    Returns:
+        CombatantProfile reflecting the entity's current stats and gear
+    """
+    from components.ai.basic_monster import is_monster_aware
+    from components.component_registry import ComponentType
+
+    fighter = entity.require_component(ComponentType.FIGHTER)
+    equipment = fighter._get_equipment(entity)
+    weapon = equipment.main_hand if equipment else None
+    equippable = getattr(weapon, 'equippable', None) if weapon else None
+
+    to_hit = fighter.dexterity_mod
+    crit_threshold = 20
+    damage_type = None
+    weapon_damage: Distribution = {0: 1.0}
+    if equippable is not None:
+        to_hit += getattr(equippable, 'to_hit_bonus', 0) or 0
+        threshold = getattr(equippable, 'crit_threshold', 20)
+        if isinstance(threshold, int) and 1 <= threshold <= 20:
+            crit_threshold = threshold
+        damage_type = getattr(equippable, 'damage_type', None)
+        if equippable.damage_dice:
+            weapon_damage = dice_distribution(equippable.damage_dice)
+        elif equippable.damage_min > 0 and equippable.damage_max > 0:
+            weapon_damage = uniform_distribution(equippable.damage_min, equippable.damage_max)
+    elif weapon is None:
+        damage_type = getattr(entity, 'natural_damage_type', None)
+
+    # A zero weapon roll falls back to fists / natural attacks (see attack_d20)
+    if fighter.damage_min > 0 and fighter.damage_max > 0:
+        fallback = uniform_distribution(fighter.damage_min, fighter.damage_max)
+    else:
+        fallback = {0: 1.0}
+    damage: Distribution = defaultdict(float)
+    for value, p in weapon_damage.items():
+        if value > 0:
+            damage[value] += p
+        else:
+            for fist, q in fallback.items():
+                damage[fist] += p * q
+
+    speed_tracker = entity.get_component_optional(ComponentType.SPEED_BONUS_TRACKER)
+    modifiers = getattr(entity, 'damage_type_modifiers', None)
+
+    return CombatantProfile(
+        name=entity.name,
+        hp=fighter.hp,
+        armor_class=fighter.armor_class,
+        accuracy=getattr(fighter, 'accuracy', DEFAULT_ACCURACY),
+        evasion=getattr(fighter, 'evasion', DEFAULT_EVASION),
+        to_hit=to_hit,
+        strength_mod=fighter.strength_mod,
+        damage=dict(damage),
+        crit_threshold=crit_threshold,
+        damage_type=damage_type,
+        speed_bonus=speed_tracker.speed_bonus_ratio if speed_tracker else 0.0,
+        resistances={
+            name: fighter.get_resistance(name)
+            for name in RESISTANCE_TYPES
+            if fighter.get_resistance(name) > 0
+        },
+        damage_type_modifiers=dict(modifiers) if isinstance(modifiers, dict) else {},
+        damage_resistance=getattr(entity, 'damage_resistance', None),
+        damage_vulnerability=getattr(entity, 'damage_vulnerability', None),
+        unaware=(entity.get_component_optional(ComponentType.AI) is not None
+                 and not is_monster_aware(entity)),
+    )
+
+
+# =============================================================================
+# Single attack
+# =============================================================================
+
+def hit_chances(
+    attacker: CombatantProfile,
+    defender: CombatantProfile,
+    accuracy_roll: bool = True,
+) -> Tuple[float, float, float]:
+    """Probabilities for one attack.
+
+    Args:
+        attacker: Attacking profile
+        defender: Defending profile
+        accuracy_roll: Whether the accuracy-vs-evasion roll gates the attack
+            (monster attacks; the harness player path skips it)
+
+    Returns:
+        (accuracy pass, d20 hit given accuracy pass, d20 crit given accuracy pass)
+    """
+    accuracy = compute_hit_chance(attacker.accuracy, defender.evasion) if accuracy_roll else 1.0
+    hits = crits = 0
+    for roll in range(1, 21):
+        if roll >= attacker.crit_threshold:
+            hits += 1
+            crits += 1
+        elif roll != 1 and roll + attacker.to_hit >= defender.armor_class:
+            hits += 1
+    return accuracy, hits / 20.0, crits / 20.0
+
+
+def _hit_damage(attacker: CombatantProfile, defender: CombatantProfile, base: int, critical: bool) -> int:
+    """Damage one landed hit deals, following Fighter.attack_d20 and take_damage."""
+    damage = base + attacker.strength_mod
+
+    damage_type = attacker.damage_type
+    if damage_type:
+        if defender.damage_type_modifiers:
+            multiplier = defender.damage_type_modifiers.get(damage_type, 1.0)
+            if multiplier != 1.0:
+                damage = int(damage * multiplier)
+        elif defender.damage_resistance == damage_type:
+            damage -= 1
+        elif defender.damage_vulnerability == damage_type:
+            damage += 1
+
+    damage = max(1, damage * 2) if critical else max(1, damage)
+
+    if damage_type:
+        resistance = defender.resistances.get(damage_type.lower(), 0)
+        if resistance > 0:
+            damage = int(damage * ((100 - min(resistance, 100)) / 100.0))
+    return damage
+
+
+def attack_distribution(
+    attacker: CombatantProfile,
+    defender: CombatantProfile,
+    accuracy_roll: bool = True,
+) -> Distribution:
+    """Distribution of damage dealt by one attack (0 = miss).
+
+    Args:
+        attacker: Attacking profile
+        defender: Defending profile
+        accuracy_roll: See hit_chances()
+
+    Returns:
+        Damage -> probability
+    """
+    accuracy, hit, crit = hit_chances(attacker, defender, accuracy_roll)
+    normal = accuracy * (hit - crit)
+    critical = accuracy * crit
+
+    dist: Distribution = defaultdict(float)
+    dist[0] += 1.0 - normal - critical
+    for base, p in attacker.damage.items():
+        if normal:
+            dist[_hit_damage(attacker, defender, base, False)] += normal * p
+        if critical:
+            dist[_hit_damage(attacker, defender, base, True)] += critical * p
+    return dict(dist)
+
+
+def surprise_attack_distribution(attacker: CombatantProfile, defender: CombatantProfile) -> Distribution:
+    """Distribution of damage dealt by a surprise attack.
+
+    Fighter.attack_d20 with is_surprise: no accuracy roll, no fumble, the
+    attack always hits and always crits.
+    """
+    dist: Distribution = defaultdict(float)
+    for base, p in attacker.damage.items():
+        dist[_hit_damage(attacker, defender, base, True)] += p
+    return dict(dist)
+
+
+def attack_summary(
+    attacker: CombatantProfile,
+    defender: CombatantProfile,
+    accuracy_roll: bool = True,
+) -> Dict[str, float]:
+    """Per-attack rates in the same terms as the harness metrics.
+
+    Returns:
+        Dict with accuracy, d20 hit rate (given accuracy pass, like
+        total_*_hits / total_*_attacks), crit rate, mean damage per landed
+        hit and damage per attack
+    """
+    accuracy, hit, crit = hit_chances(attacker, defender, accuracy_roll)
+    dist = attack_distribution(attacker, defender, accuracy_roll)
+    landed = accuracy * hit
+    per_attack = _mean(dist)
+    return {
+        "accuracy": accuracy,
+        "hit_rate": hit,
+        "crit_rate": crit,
+        "damage_per_hit": per_attack / landed if landed else 0.0,
+        "damage_per_attack": per_attack,
+    }
+
+
+# =============================================================================
+# Fight
+# =============================================================================
+
+@dataclass
+class DuelOutcome:
+    """Outcome distribution of a modelled 1-vs-N melee fight."""
+    win_rate: float
+    loss_rate: float
+    timeout_rate: float
+    expected_rounds: float
+    expected_kills: float
+    # HP lost by the end of the fight; a death counts as losing all starting HP
+    hp_loss_distribution: Dict[int, float]
+    rounds_distribution: Dict[int, float]
+    rounds_solved: int
+    # Player attacks made, attacks that landed and damage they dealt
+    expected_player_attacks: float = 0.0
+    expected_player_hits: float = 0.0
+    expected_player_damage: float = 0.0
+
+    @property
+    def expected_hp_loss(self) -> float:
+        return _mean(self.hp_loss_distribution)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-friendly dict."""
+        return {
+            "win_rate": round(self.win_rate, 6),
+            "loss_rate": round(self.loss_rate, 6),
+            "timeout_rate": round(self.timeout_rate, 6),
+            "expected_rounds": round(self.expected_rounds, 4),
+            "expected_kills": round(self.expected_kills, 4),
+            "expected_hp_loss": round(self.expected_hp_loss, 4),
+            "expected_player_attacks": round(self.expected_player_attacks, 4),
+            "expected_player_hits": round(self.expected_player_hits, 4),
+            "expected_player_damage": round(self.expected_player_damage, 4),
+            "hp_loss_distribution": {k: round(v, 6) for k, v in sorted(self.hp_loss_distribution.items())},
+            "rounds_distribution": {k: round(v, 6) for k, v in sorted(self.rounds_distribution.items())},
+        }
+
+
+def solve_duel(
+    player: CombatantProfile,
+    monsters: Sequence[CombatantProfile],
+    max_rounds: int = 100,
+    player_accuracy_roll: bool = False,
+) -> DuelOutcome:
+    """Solve the 1-vs-N melee chain.
+
+    The chain is propagated one round at a time as a (player HP x fight
+    state) probability array, where the fight state is (target, target HP,
+    player momentum counter) plus an absorbing "won" state. An unaware
+    monster also has a one-shot "not yet attacked" state per counter, left
+    by the player's surprise attack on it. The player phase
+    is a fixed matrix over fight states; the monster phase shifts mass down
+    the player HP axis by each possible round damage.
+
+    Args:
+        player: Player profile
+        monsters: Monster profiles, fought in this order; all are engaged
+            from round 1
+        max_rounds: Rounds before the fight counts as a timeout
+        player_accuracy_roll: Gate player attacks on the accuracy roll too.
+            The scenario harness skips it for the player (attack_d20 only);
+            the interactive game (game_actions) applies it.
+
+    Returns:
+        DuelOutcome
+    """
+    if not monsters:
+        return DuelOutcome(1.0, 0.0, 0.0, 0.0, 0.0, {0: 1.0}, {0: 1.0}, 0)
+
+    count = len(monsters)
+    max_hp = player.hp
+    player_attacks = [attack_distribution(player, m, player_accuracy_roll) for m in monsters]
+    surprise_attacks = [surprise_attack_distribution(player, m) for m in monsters]
+    player_schedule = player.bonus_schedule()
+    player_momentum = [bool(player_schedule) and player.speed_bonus > m.speed_bonus for m in monsters]
+    monster_attacks = [attack_distribution(m, player) for m in monsters]
+    monster_schedules = [m.bonus_schedule() if m.speed_bonus > player.speed_bonus else () for m in monsters]
+
+    # Fight state -> column; last column = won. Each monster's block starts
+    # with its unattacked states (unaware monsters only), then (hp, counter).
+    counters = max(1, len(player_schedule))
+    offsets = []
+    columns = 0
+    for monster in monsters:
+        offsets.append(columns)
+        if monster.unaware:
+            columns += counters
+        columns += monster.hp * counters
+    won = columns
+
+    def column(idx: int, thp: int, counter: int) -> int:
+        fresh = counters if monsters[idx].unaware else 0
+        return offsets[idx] + fresh + (thp - 1) * counters + counter
+
+    def engage(idx: int, counter: int) -> int:
+        # Column a target starts in: unattacked if it is unaware
+        if monsters[idx].unaware:
+            return offsets[idx] + counter
+        return column(idx, monsters[idx].hp, counter)
+
+    kernel = np.zeros((columns + 1, columns + 1))
+    kernel[won, won] = 1.0
+    # Player attacks made, landed and damage dealt from each state
+    row_attacks = np.zeros(columns + 1)
+    row_hits = np.zeros(columns + 1)
+    row_damage = np.zeros(columns + 1)
+
+    def land(row: int, idx: int, thp: int, counter: int, p: float) -> None:
+        if thp > 0:
+            kernel[row, column(idx, thp, counter)] += p
+        elif idx + 1 < count:
+            kernel[row, engage(idx + 1, counter)] += p
+        else:
+            kernel[row, won] += p
+
+    def fill(row: int, idx: int, thp: int, counter: int, first: Distribution) -> None:
+        bonus_attack = player_attacks[idx]
+        for dmg, q in first.items():
+            row_attacks[row] += q
+            row_hits[row] += q if dmg else 0.0
+            row_damage[row] += q * dmg
+            rest = thp - dmg
+            if rest <= 0 or not player_momentum[idx]:
+                land(row, idx, rest, counter, q)
+                continue
+            counter_next = counter + 1
+            chance = player_schedule[counter_next - 1]
+            if chance >= 1.0:
+                counter_next = 0
+            else:
+                land(row, idx, rest, counter_next, q * (1.0 - chance))
+            for dmg2, q2 in bonus_attack.items():
+                row_attacks[row] += q * chance * q2
+                row_hits[row] += q * chance * q2 if dmg2 else 0.0
+                row_damage[row] += q * chance * q2 * dmg2
+                land(row, idx, rest - dmg2, counter_next, q * chance * q2)
+
+    for idx, monster in enumerate(monsters):
+        for counter in range(counters):
+            if monster.unaware:
+                fill(offsets[idx] + counter, idx, monster.hp, counter, surprise_attacks[idx])
+            for thp in range(1, monster.hp + 1):
+                fill(column(idx, thp, counter), idx, thp, counter, player_attacks[idx])
+
+    # probs[php, state]; row 0 (dead) is never populated
+    probs = np.zeros((max_hp + 1, columns + 1))
+    probs[max_hp, engage(0, 0)] = 1.0
+
+    win = loss = rounds_total = kills_total = 0.0
+    attacks_total = hits_total = damage_total = 0.0
+    hp_loss = np.zeros(max_hp + 1)
+    rounds_dist: Dict[int, float] = {}
+
+    rnd = 0
+    while rnd < max_rounds:
+        rnd += 1
+
+        # Player phase
+        state_mass = probs.sum(axis=0)
+        attacks_total += float(state_mass @ row_attacks)
+        hits_total += float(state_mass @ row_hits)
+        damage_total += float(state_mass @ row_damage)
+        probs = probs @ kernel
+        won_mass = probs[:, won]
+        won_total = float(won_mass.sum())
+        if won_total:
+            win += won_total
+            kills_total += count * won_total
+            hp_loss += won_mass[::-1]
+            probs[:, won] = 0.0
+        round_mass = won_total
+
+        # Monster phase: everyone from the current target on is alive
+        after = np.zeros_like(probs)
+        for idx in range(count):
+            cols = slice(offsets[idx], offsets[idx + 1] if idx + 1 < count else won)
+            block = probs[:, cols]
+            if not block.any():
+                continue
+            damage = {0: 1.0}
+            for j in range(idx, count):
+                damage = _convolve(damage, _monster_round(monster_attacks[j], monster_schedules[j], rnd), max_hp)
+            for dmg, q in damage.items():
+                if dmg == 0:
+                    after[:, cols] += q * block
+                    continue
+                if dmg < max_hp:
+                    after[1:max_hp + 1 - dmg, cols] += q * block[1 + dmg:]
+                dead = q * float(block[1:dmg + 1].sum())
+                loss += dead
+                kills_total += idx * dead
+                hp_loss[max_hp] += dead
+                round_mass += dead
+        probs = after
+
+        rounds_total += rnd * round_mass
+        if round_mass:
+            rounds_dist[rnd] = round_mass
+        if probs.sum() < _MASS_EPSILON:
+            break
+
+    # Whatever is still undecided ran out of rounds
+    timeout = float(probs.sum())
+    if timeout:
+        rounds_total += rnd * timeout
+        rounds_dist[rnd] = rounds_dist.get(rnd, 0.0) + timeout
+        by_hp = probs.sum(axis=1)
+        hp_loss += by_hp[::-1]
+        for idx in range(count):
+            cols = slice(offsets[idx], offsets[idx + 1] if idx + 1 < count else won)
+            kills_total += idx * float(probs[:, cols].sum())
+
+    return DuelOutcome(
+        win_rate=win,
+        loss_rate=loss,
+        timeout_rate=timeout,
+        expected_rounds=rounds_total,
+        expected_kills=kills_total,
+        hp_loss_distribution={int(lost): float(p) for lost, p in enumerate(hp_loss) if p > 0.0},
+        rounds_distribution=rounds_dist,
+        rounds_solved=rnd,
+        expected_player_attacks=attacks_total,
+        expected_player_hits=hits_total,
+        expected_player_damage=damage_total,
+    )
+
+
+def _monster_round(attack: Distribution, schedule: Tuple[float, ...], rnd: int) -> Distribution:
+    """Damage one monster deals in round rnd, including its speed bonus attack."""
+    if not schedule:
+        return attack
+    chance = schedule[(rnd - 1) % len(schedule)]
+    bonus = {0: 1.0 - chance} if chance < 1.0 else {}
+    for dmg, q in attack.items():
+        bonus[dmg] = bonus.get(dmg, 0.0) + chance * q
+    return _convolve(attack, bonus)
+
+
+# =============================================================================
+# Scenarios and cross-validation
+# =============================================================================
+
+def scenario_profiles(scenario: Any, seed: Optional[int] = None) -> Tuple[CombatantProfile, List[CombatantProfile]]:
+    """Build a scenario world once and profile its player and monsters.
+
+    Args:
+        scenario: ScenarioDefinition
+        seed: Optional global seed applied before building (placement only;
+            stats don't depend on it)
+
+    Returns:
+        (player profile, monster profiles in spawn order)
+    """
+    from components.component_registry import ComponentType
+    from services.scenario_harness import _reset_global_services
+    from services.scenario_level_loader import build_scenario_map
+
+    _reset_global_services()
+    if seed is not None:
+        from engine.rng_config import run_rng_scope, set_global_seed
+        set_global_seed(seed)
+        with run_rng_scope(seed):
+            result = build_scenario_map(scenario)
+    else:
+        result = build_scenario_map(scenario)
+    player = profile_from_entity(result.player)
+    monsters = [
+        profile_from_entity(entity)
+        for entity in result.entities
+        if entity is not result.player
+        and entity.get_component_optional(ComponentType.FIGHTER)
+        and entity.get_component_optional(ComponentType.AI)
+    ]
+    return player, monsters
+
+
+def cross_validate_scenario(
+    scenario_id: str,
+    runs: int = 30,
+    turn_limit: Optional[int] = None,
+    seed_base: int = 1337,
+    player_bot: str = "tactical_fighter",
+    workers: int = 1,
+) -> Dict[str, Any]:
+    """Compare the analytical model against the scenario simulator.
+
+    Args:
+        scenario_id: Scenario to check
+        runs: Simulated runs
+        turn_limit: Turn limit (default: scenario default, else 100); also the
+            model's round limit
+        seed_base: Base seed for the simulated runs
+        player_bot: Bot policy for the simulated runs
+        workers: Worker processes for the simulated runs
+
+    Returns:
+        Dict with "analytic", "simulated" and "delta" sections over
+        death_rate, player_hit_rate, monster_hit_rate and player_damage_per_hit,
+        plus the full analytic outcome
+    """
+    from config.level_template_registry import get_scenario_registry
+    from services.scenario_harness import make_bot_policy, run_scenario_many
+
+    scenario = get_scenario_registry().get_scenario_definition(scenario_id)
+    if scenario is None:
+        raise ValueError(f"Scenario '{scenario_id}' not found")
+    if turn_limit is None:
+        turn_limit = (scenario.defaults or {}).get("turn_limit", 100)
+
+    player, monsters = scenario_profiles(scenario, seed=seed_base)
+    outcome = solve_duel(player, monsters, max_rounds=turn_limit)
+
+    # Player rates come from the chain, so surprise attacks count once per
+    # fight rather than once per attack
+    monster_rates = [attack_summary(m, player) for m in monsters]
+    analytic = {
+        "death_rate": outcome.loss_rate,
+        "player_hit_rate": _ratio(outcome.expected_player_hits, outcome.expected_player_attacks),
+        "monster_hit_rate": _average(r["hit_rate"] for r in monster_rates),
+        "player_damage_per_hit": _ratio(outcome.expected_player_damage, outcome.expected_player_hits),
+    }
+
+    metrics = run_scenario_many(
+        scenario, make_bot_policy(player_bot), runs, turn_limit, seed_base, workers=workers,
+    )
+    simulated = {
+        "death_rate": metrics.player_deaths / metrics.runs if metrics.runs else 0.0,
+        "player_hit_rate": _ratio(metrics.total_player_hits, metrics.total_player_attacks),
+        "monster_hit_rate": _ratio(metrics.total_monster_hits, metrics.total_monster_attacks),
+        "player_damage_per_hit": _ratio(metrics.total_player_damage_dealt, metrics.total_player_hits),
+    }
+
+    return {
+        "scenario_id": scenario_id,
+        "runs": runs,
+        "monsters": len(monsters),
+        "analytic": analytic,
+        "simulated": simulated,
+        "delta": {key: analytic[key] - simulated[key] for key in analytic},
+        "outcome": outcome.to_dict(),
+    }
+
+
+def _average(values) -> float:
+    values = list(values)
+    return sum(values) / len(values) if values else 0.0
+
+
+def _ratio(numerator: float, denominator: float) -> float:
+    return numerator / denominator if denominator else 0.0
@@ -21,8 +21,7 @@ import os
 from dataclasses import dataclass
 from typing import Dict, Optional, Tuple, Any
 
-import yaml
-
+from config.content_cache import load_yaml
 from utils.resource_paths import get_resource_path
 
 logger = logging.getLogger(__name__)
@@ -107,6 +106,11 @@ class ETPConfig:
 # Global config instance (lazy loaded)
 _etp_config: Optional[ETPConfig] = None
 
+# Monster definitions by type (lazy loaded) and memoized ETP per
+# (monster_type, depth). Both are cleared by reload_etp_config().
+_monster_index: Optional[Dict[str, Dict[str, Any]]] = None
+_monster_etp_cache: Dict[Tuple[str, int], float] = {}
+
 
 def _load_etp_config() -> ETPConfig:
     """Load ETP configuration from YAML file."""
@@ -116,8 +120,7 @@ def _load_etp_config() -> ETPConfig:
         logger.warning(f"ETP config not found at {config_path}, using defaults")
         return _get_default_config()
     
-    with open(config_path, "r") as f:
-        yaml_data = yaml.safe_load(f)
+    yaml_data = load_yaml(config_path)
     
     return ETPConfig.from_yaml(yaml_data)
 
@@ -164,9 +167,15 @@ def get_etp_config() -> ETPConfig:
 
 
 def reload_etp_config() -> None:
-    """Force reload of ETP configuration from disk."""
-    global _etp_config
+    """Force reload of ETP configuration from disk.
+    
+    Also drops the monster definition index and memoized ETP values so
+    they are rebuilt against the new configuration.
+    """
+    global _etp_config, _monster_index
     _etp_config = _load_etp_config()
+    _monster_index = None
+    _monster_etp_cache.clear()
     logger.info("ETP configuration reloaded")
 
 
@@ -458,6 +467,26 @@ def get_monster_etp(
     Returns:
         Effective Threat Points value
     """
+    # Plain lookups are memoized per (monster, depth); explicit stats or a
+    # synergy bonus bypass the cache
+    if monster_data is not None or synergy_bonus:
+        return _calculate_monster_etp(monster_type, depth, monster_data, synergy_bonus)
+    
+    key = (monster_type, depth)
+    etp = _monster_etp_cache.get(key)
+    if etp is None:
+        etp = _calculate_monster_etp(monster_type, depth, None, 0.0)
+        _monster_etp_cache[key] = etp
+    return etp
+
+
+def _calculate_monster_etp(
+    monster_type: str,
+    depth: int,
+    monster_data: Optional[Dict[str, Any]],
+    synergy_bonus: float,
+) -> float:
+    """Calculate ETP without memoization (see get_monster_etp)."""
     # Check if this is an elite variant and extract base type
     is_elite = _is_elite_variant(monster_type)
     base_type = _get_base_monster_type(monster_type)
@@ -554,7 +583,7 @@ def get_monster_etp(
 
 
 def _load_monster_data(monster_type: str) -> Optional[Dict[str, Any]]:
-    """Load monster data from entities.yaml.
+    """Look up monster data from the monster definition index.
     
     Args:
         monster_type: Monster type identifier
@@ -562,21 +591,45 @@ def _load_monster_data(monster_type: str) -> Optional[Dict[str, Any]]:
     Returns:
         Monster data dict or None if not found
     """
+    return _get_monster_index().get(monster_type)
+
+
+def _get_monster_index() -> Dict[str, Dict[str, Any]]:
+    """Get raw monster definitions by type (lazy load)."""
+    global _monster_index
+    if _monster_index is None:
+        _monster_index = _build_monster_index()
+    return _monster_index
+
+
+def _build_monster_index() -> Dict[str, Dict[str, Any]]:
+    """Build the monster definition index.
+    
+    Reuses the YAML already parsed by the EntityRegistry when it is loaded,
+    otherwise parses entities.yaml once.
+    
+    Returns:
+        Dict mapping monster type to its raw entities.yaml definition
+    """
+    from config.entity_registry import get_entity_registry
+    
+    registry = get_entity_registry()
+    if registry.is_loaded() and isinstance(registry.data, dict):
+        return dict(registry.data.get("monsters") or {})
+    
     config_path = get_resource_path("config/entities.yaml")
     
     if not os.path.exists(config_path):
         logger.warning(f"Entities config not found at {config_path}")
-        return None
+        return {}
     
     try:
-        with open(config_path, "r") as f:
-            entities = yaml.safe_load(f)
+        entities = load_yaml(config_path)
         
-        monsters = entities.get("monsters", {})
-        return monsters.get(monster_type)
+        return dict(entities.get("monsters") or {})
     except Exception as e:
         logger.error(f"Error loading monster data: {e}")
-        return None
+        return {}
 
 
 def get_room_etp_budget(depth: int, allow_spike: bool = False) -> Tuple[float, float]:
@@ -695,17 +748,13 @@ def initialize_encounter_budget_engine() -> None:
     from services.encounter_budget_engine import get_encounter_budget_engine
     
     engine = get_encounter_budget_engine()
-    config_path = get_resource_path("config/entities.yaml")
+    monsters = _get_monster_index()
     
-    if not os.path.exists(config_path):
-        logger.warning(f"Entities config not found at {config_path}, skipping ETP init")
+    if not monsters:
+        logger.warning("No monster definitions available, skipping ETP init")
         return
     
     try:
-        with open(config_path, "r") as f:
-            entities = yaml.safe_load(f)
-        
-        monsters = entities.get("monsters", {})
         registered_count = 0
         
         for monster_type, monster_data in monsters.items():
@@ -19,9 +19,9 @@ Example with defaults:
     - Wraith (acc=3) vs Player (eva=1): 75% + (3-1)*5% = 85% hit
 """
 
-import random
 from typing import TYPE_CHECKING, Callable, Optional
 
+from engine.rng_config import get_rng
 from logger_config import get_logger
 
 if TYPE_CHECKING:
@@ -90,13 +90,13 @@ def roll_to_hit(
         attacker_accuracy: Attacker's accuracy stat
         defender_evasion: Defender's evasion stat
         rng: Optional RNG function returning float in [0.0, 1.0).
-            Defaults to random.random(). Useful for testing.
+            Defaults to the run's combat stream. Useful for testing.
             
     Returns:
         bool: True if attack hits, False if it misses
     """
     if rng is None:
-        rng = random.random
+        rng = get_rng("combat").random
     
     hit_chance = compute_hit_chance(attacker_accuracy, defender_evasion)
     roll = rng()
@@ -1,4 +1,3 @@
-from random import randint
 from typing import List, Optional, Any, Dict, TYPE_CHECKING
 
 from game_messages import Message
@@ -1,4 +1,3 @@
-from random import randint
 from typing import List, Optional, Any, Dict, TYPE_CHECKING
 
 from game_messages import Message
@@ -11,6 +10,8 @@ from fov_functions import map_is_in_fov
 from components.monster_action_logger import MonsterActionLogger
 from components.faction import Faction, are_factions_hostile, get_target_priority
 from components.component_registry import ComponentType
+from engine.rng_config import get_rng
+from map_objects.spatial_index import blocking_entity_at, entities_in_range
 
 
 def _get_metrics_collector():
@@ -172,6 +173,10 @@ class BasicMonster:
         results = []
         actions_taken = []
 
+        # Shared per-phase lookups when run from an enemy phase, else None
+        from services.turn_context import get_turn_context
+        context = get_turn_context(entities)
+
         # NOTE: Status effects are now processed at the AI system level (with state_manager)
         # before take_turn is called. This ensures DOT effects can finalize deaths properly.
         # Do NOT process them here again.
@@ -192,10 +197,13 @@ class BasicMonster:
         rally_target = None
         if hasattr(self, 'rally_directive_target_id') and self.rally_directive_target_id:
             # Find the rally target entity
-            for entity in entities:
-                if id(entity) == self.rally_directive_target_id:
-                    rally_target = entity
-                    break
+            if context:
+                rally_target = context.entity_by_id(self.rally_directive_target_id)
+            else:
+                for entity in entities:
+                    if id(entity) == self.rally_directive_target_id:
+                        rally_target = entity
+                        break
             
             # If rally target found and alive, prioritize it over normal target
             if rally_target:
@@ -223,7 +231,7 @@ class BasicMonster:
             return results
 
         # Check if there's a taunted target (Yo Mama spell effect)
-        taunted_target = find_taunted_target(entities)
+        taunted_target = context.taunted_target() if context else find_taunted_target(entities)
         is_pursuing_taunt = False
         is_taunted_target = False  # Is THIS monster the taunted one?
         
@@ -237,7 +245,7 @@ class BasicMonster:
                 is_pursuing_taunt = True
         
         # Phase 10: Check for EnragedAgainstFaction effect (Scroll of Unreasonable Aggravation)
-        enraged_target = self._check_enraged_against_faction(entities, fov_map)
+        enraged_target = self._check_enraged_against_faction(entities, fov_map, context)
         is_enraged = enraged_target is not None
         if is_enraged:
             # Enraged monster prioritizes the target faction over everything
@@ -282,7 +290,7 @@ class BasicMonster:
                 
                 monster_faction = getattr(self.owner, 'faction', None)
                 
-                for entity in entities:
+                for entity in (context.living_entities() if context else entities):
                     if entity == self.owner:  # Skip self
                         continue
                     
@@ -336,7 +344,7 @@ class BasicMonster:
                     
                     monster_faction = getattr(self.owner, 'faction', None)
                     
-                    for entity in entities:
+                    for entity in (context.living_entities() if context else entities):
                         if entity == self.owner or entity == target:  # Skip self and invisible player
                             continue
                         
@@ -371,10 +379,9 @@ class BasicMonster:
             
             # Check for item usage first (scrolls, potions, etc.)
             # Only try to use items occasionally to avoid overuse of valuable resources
-            from random import random
             from config.game_constants import get_monster_equipment_config
             monster_config = get_monster_equipment_config()
-            if random() < monster_config.ITEM_USAGE_ATTEMPT_RATE:
+            if get_rng("ai").random() < monster_config.ITEM_USAGE_ATTEMPT_RATE:
                 item_usage_action = self._try_item_usage(target, game_map, entities)
             else:
                 item_usage_action = None
@@ -793,13 +800,7 @@ class BasicMonster:
             not game_map.is_blocked(flee_x, flee_y)):
             
             # Check for blocking entities
-            blocked = False
-            for entity in entities:
-                if entity.x == flee_x and entity.y == flee_y and entity.blocks:
-                    blocked = True
-                    break
-            
-            if not blocked:
+            if blocking_entity_at(entities, flee_x, flee_y) is None:
                 monster.x = flee_x
                 monster.y = flee_y
                 return results
@@ -823,13 +824,7 @@ class BasicMonster:
                 not game_map.is_blocked(new_x, new_y)):
                 
                 # Check for blocking entities
-                blocked = False
-                for entity in entities:
-                    if entity.x == new_x and entity.y == new_y and entity.blocks:
-                        blocked = True
-                        break
-                
-                if not blocked:
+                if blocking_entity_at(entities, new_x, new_y) is None:
                     monster.x = new_x
                     monster.y = new_y
                     return results
@@ -841,7 +836,7 @@ class BasicMonster:
     # PHASE 10: FACTION MANIPULATION & ZOMBIE SWARM AI
     # ═══════════════════════════════════════════════════════════════════════════════
     
-    def _check_enraged_against_faction(self, entities, fov_map) -> Optional['Entity']:
+    def _check_enraged_against_faction(self, entities, fov_map, context=None) -> Optional['Entity']:
         """Check if this monster is enraged against a faction and find target.
         
         Phase 10: Scroll of Unreasonable Aggravation makes monsters attack
@@ -850,6 +845,8 @@ class BasicMonster:
         Args:
             entities: List of all entities
             fov_map: FOV map for visibility checks
+            context (TurnContext, optional): Enemy-phase lookups; when given
+                only living members of the target faction are scanned
             
         Returns:
             Entity to attack (member of target faction), or None
@@ -869,7 +866,8 @@ class BasicMonster:
         closest_target = None
         closest_distance = float('inf')
         
-        for entity in entities:
+        candidates = context.living_members(target_faction) if context else entities
+        for entity in candidates:
             if entity == self.owner:
                 continue
             
@@ -940,9 +938,9 @@ class BasicMonster:
         if not has_swarm:
             return current_target
         
-        # Find all adjacent creatures
+        # Find all adjacent creatures (spatial index lookup for EntityLists)
         adjacent_creatures = []
-        for entity in entities:
+        for entity in entities_in_range(entities, self.owner.x, self.owner.y, 1):
             if entity == self.owner:
                 continue
             
@@ -959,7 +957,6 @@ class BasicMonster:
         
         # Swarm rule: if adjacent to 2+ creatures, randomly retarget
         if len(adjacent_creatures) >= 2:
-            from random import choice
             
             # Phase 11: Register swarm_ai trait discovery
             try:
@@ -970,7 +967,7 @@ class BasicMonster:
             except ImportError:
                 pass  # Knowledge system not available
             
-            return choice(adjacent_creatures)
+            return get_rng("ai").choice(adjacent_creatures)
         elif len(adjacent_creatures) == 1:
             # Only one adjacent - attack it
             return adjacent_creatures[0]
@@ -1015,11 +1012,10 @@ class BasicMonster:
         Returns:
             List of result dicts if stepped into portal, None otherwise
         """
-        from random import random
         
         # Get curiosity chance
         curiosity = self.get_portal_curiosity_chance()
-        if curiosity <= 0 or random() > curiosity:
+        if curiosity <= 0 or get_rng("ai").random() > curiosity:
             return None
         
         # Check for adjacent portals
@@ -1038,8 +1034,7 @@ class BasicMonster:
             return None
         
         # Found an adjacent portal - step into it!
-        from random import choice
-        portal = choice(adjacent_portals)
+        portal = get_rng("ai").choice(adjacent_portals)
         
         # Move to portal position (portal handling happens elsewhere)
         old_x, old_y = self.owner.x, self.owner.y
@@ -1,4 +1,3 @@
-from random import randint
 from typing import List, Optional, Any, Dict, TYPE_CHECKING
 
 from game_messages import Message
@@ -11,6 +10,7 @@ from fov_functions import map_is_in_fov
 from components.monster_action_logger import MonsterActionLogger
 from components.faction import Faction, are_factions_hostile, get_target_priority
 from components.component_registry import ComponentType
+from engine.rng_config import get_rng
 from logger_config import get_logger
 
 if TYPE_CHECKING:
@@ -115,8 +115,8 @@ class ConfusedMonster:
         results = []
 
         if self.number_of_turns > 0:
-            random_x = self.owner.x + randint(0, 2) - 1
-            random_y = self.owner.y + randint(0, 2) - 1
+            random_x = self.owner.x + get_rng("ai").randint(0, 2) - 1
+            random_y = self.owner.y + get_rng("ai").randint(0, 2) - 1
 
             if random_x != self.owner.x and random_y != self.owner.y:
                 self.owner.move_towards(random_x, random_y, game_map, entities)
@@ -1,4 +1,3 @@
-from random import randint
 from typing import List, Optional, Any, Dict, TYPE_CHECKING
 
 from game_messages import Message
@@ -11,6 +10,7 @@ from fov_functions import map_is_in_fov
 from components.monster_action_logger import MonsterActionLogger
 from components.faction import Faction, are_factions_hostile, get_target_priority
 from components.component_registry import ComponentType
+from engine.rng_config import get_rng
 from logger_config import get_logger
 
 if TYPE_CHECKING:
@@ -134,7 +134,9 @@ class MindlessZombieAI:
 
         # Check if there's a taunted target (Yo Mama spell effect)
         # Even mindless zombies are drawn to the insult!
-        taunted_target = find_taunted_target(entities)
+        from services.turn_context import get_turn_context
+        context = get_turn_context(entities)
+        taunted_target = context.taunted_target() if context else find_taunted_target(entities)
         is_pursuing_taunt = False
         if taunted_target and taunted_target != self.owner:
             # Override current target with taunted target
@@ -171,11 +173,9 @@ class MindlessZombieAI:
                         
                         if other_adjacent:
                             # There's at least one other adjacent target - 50% chance to switch
-                            from random import random
-                            if random() < 0.5:
-                                from random import choice
+                            if get_rng("ai").random() < 0.5:
                                 old_target = self.current_target
-                                self.current_target = choice(other_adjacent)
+                                self.current_target = get_rng("ai").choice(other_adjacent)
                                 logger.info(f"Zombie {self.owner.name} switched target from {old_target.name} to {self.current_target.name}")
                         
                         # Attack current target (use new d20 system)
@@ -239,8 +239,8 @@ class MindlessZombieAI:
             results.append({'message': MB.custom(f"{self.owner.name} struggles against the glue!", (139, 69, 19))})
             return results
         
-        dx = randint(-1, 1)
-        dy = randint(-1, 1)
+        dx = get_rng("ai").randint(-1, 1)
+        dy = get_rng("ai").randint(-1, 1)
         
         # Check if destination is valid
         if dx != 0 or dy != 0:
@@ -10,11 +10,11 @@ Design:
 - Leap can be countered via root/entangle status effects
 """
 
-from random import randint, random
 from typing import List, Optional, Any, Dict
 
 from components.ai.basic_monster import BasicMonster, get_weapon_reach
 from components.component_registry import ComponentType
+from engine.rng_config import get_rng
 from message_builder import MessageBuilder as MB
 from fov_functions import map_is_in_fov
 from logger_config import get_logger
@@ -286,7 +286,7 @@ class SkirmisherAI(BasicMonster):
         fast_pressure_damage_mult = getattr(self.owner, 'fast_pressure_damage_mult', 0.7)
         
         # Roll for fast pressure trigger
-        if random() > fast_pressure_chance:
+        if get_rng("ai").random() > fast_pressure_chance:
             return results
         
         # Fast pressure triggered!
@@ -1,4 +1,3 @@
-from random import randint
 from typing import List, Optional, Any, Dict, TYPE_CHECKING
 
 from game_messages import Message
@@ -122,7 +121,9 @@ class SlimeAI:
         # NOTE: Sleep is handled via skip_turn in SleepEffect.process_turn_start()
 
         # Check if there's a taunted target (Yo Mama spell effect)
-        taunted_target = find_taunted_target(entities)
+        from services.turn_context import get_turn_context
+        context = get_turn_context(entities)
+        taunted_target = context.taunted_target() if context else find_taunted_target(entities)
         is_pursuing_taunt = False
         
         if taunted_target and taunted_target != self.owner:
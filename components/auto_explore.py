@@ -18,18 +18,23 @@ Design Decisions:
 - Clear stop messages so player knows why exploration halted
 """
 
-import logging
-import random
 from typing import List, Tuple, Optional, Set, TYPE_CHECKING
 from collections import deque
-import heapq
 
+import numpy as np
+import tcod
+
+from engine.rng_config import get_rng
+from map_objects.component_index import entities_with
 from map_objects.rectangle import Rect
+from map_objects.spatial_index import blocking_entity_at, entities_at, entities_in_fov
+from map_objects.tile import tile_field_array
+from logger_config import get_lazy_logger
 
 if TYPE_CHECKING:
     from map_objects.game_map import GameMap
 
-logger = logging.getLogger(__name__)
+logger = get_lazy_logger(__name__)
 
 
 # Pithy adventure quotes for starting auto-explore
@@ -54,6 +59,13 @@ ADVENTURE_QUOTES = [
     "Charting new territory!",
 ]
 
+# Step costs of the exploration distance field, as in _calculate_path_to
+_STEP_WEIGHTS = {
+    (-1, -1): 3, (0, -1): 2, (1, -1): 3,
+    (-1, 0): 2, (1, 0): 2,
+    (-1, 1): 3, (0, 1): 2, (1, 1): 3,
+}
+
 # Bot-only configuration: Opportunistic loot picking
 # When in bot mode, AutoExplore will make small detours to pick up nearby valuable items
 # This improves soak-test survivability without destabilizing core exploration logic
@@ -108,6 +120,12 @@ class AutoExplore:
         self._stuck_movement_counter: int = 0
         # Oscillation detection: track recent positions to detect A-B-A-B loops
         self._position_history: deque = deque(maxlen=6)  # Last 6 positions
+        # Distance field rooted at the last frontier searched, reused while
+        # walls, hazards and the frontier are unchanged:
+        # (map id, blocked, hazards, frontier, distance)
+        self._distance_cache: Optional[tuple] = None
+        # Route down that field from the owner to the last tile it found
+        self._frontier_route: List[Tuple[int, int]] = []
     
     def start(self, game_map: 'GameMap', entities: List['Entity'], fov_map=None, bot_mode: bool = False) -> str:
         """Begin auto-exploring the dungeon.
@@ -146,7 +164,7 @@ class AutoExplore:
                 return "Nothing left to explore"
             
             logger.info(
-                f"🔍 DIAGNOSTIC: AutoExplore.start: Found {len(unexplored_tiles)} unexplored tiles, "
+                lambda: f"🔍 DIAGNOSTIC: AutoExplore.start: Found {len(unexplored_tiles)} unexplored tiles, "
                 f"activating at pos={player_pos}, was_active={was_active}"
             )
         except (TypeError, AttributeError):
@@ -178,17 +196,22 @@ class AutoExplore:
         
         # Snapshot all currently explored tiles
         # This lets us distinguish between "already seen" vs "discovered during auto-explore"
-        for x in range(game_map.width):
-            for y in range(game_map.height):
-                if game_map.is_explored(x, y):
-                    self.explored_tiles_at_start.add((x, y))
+        explored = getattr(game_map, "explored", None)
+        if isinstance(explored, np.ndarray):
+            xs, ys = np.nonzero(explored)
+            self.explored_tiles_at_start.update(zip(xs.tolist(), ys.tolist()))
+        else:
+            for x in range(game_map.width):
+                for y in range(game_map.height):
+                    if game_map.is_explored(x, y):
+                        self.explored_tiles_at_start.add((x, y))
         
         # Record entities already visible (so we don't stop for them)
         if fov_map:
             from fov_functions import map_is_in_fov
             from components.component_registry import ComponentType
             
-            for entity in entities:
+            for entity in entities_in_fov(entities, fov_map):
                 # Track known items/chests/signposts
                 if (entity.components.has(ComponentType.ITEM) or 
                     entity.components.has(ComponentType.CHEST) or
@@ -208,10 +231,10 @@ class AutoExplore:
                     if map_is_in_fov(fov_map, entity.x, entity.y):
                         self.known_stairs.add((entity.x, entity.y))
             
-            logger.debug(f"Auto-explore initialized with {len(self.known_items)} known items, {len(self.known_monsters)} known monsters, and {len(self.known_stairs)} known stairs in FOV")
+            logger.debug(lambda: f"Auto-explore initialized with {len(self.known_items)} known items, {len(self.known_monsters)} known monsters, and {len(self.known_stairs)} known stairs in FOV")
         
-        logger.info(f"Auto-explore started for {self.owner.name}")
-        return random.choice(ADVENTURE_QUOTES)
+        logger.info(lambda: f"Auto-explore started for {self.owner.name}")
+        return get_rng("ai").choice(ADVENTURE_QUOTES)
     
     def stop(self, reason: str) -> None:
         """Stop auto-exploring.
@@ -231,7 +254,7 @@ class AutoExplore:
         self.stop_reason = reason
         self.current_path = []
         self.target_tile = None
-        logger.info(f"Auto-explore stopped: {reason}")
+        logger.info(lambda: f"Auto-explore stopped: {reason}")
     
     def is_active(self) -> bool:
         """Check if auto-explore is currently running.
@@ -265,11 +288,11 @@ class AutoExplore:
                   or None if auto-explore should stop
         """
         if not self.active or not self.owner:
-            logger.debug(f"AutoExplore.get_next_action: not active or no owner (active={self.active}, owner={self.owner})")
+            logger.debug(lambda: f"AutoExplore.get_next_action: not active or no owner (active={self.active}, owner={self.owner})")
             return None
         
         player_pos = (self.owner.x, self.owner.y)
-        logger.debug(f"AutoExplore.get_next_action: player_pos={player_pos}, active={self.active}, target={self.target_tile}, path_len={len(self.current_path)}")
+        logger.debug(lambda: f"AutoExplore.get_next_action: player_pos={player_pos}, active={self.active}, target={self.target_tile}, path_len={len(self.current_path)}")
         
         # OSCILLATION DETECTION: Detect and stop when bouncing between tiles (e.g. A ↔ B)
         # This prevents infinite loops in both manual auto-explore and bot/soak runs.
@@ -320,7 +343,7 @@ class AutoExplore:
             next_pos = self.current_path.pop(0)
             dx = next_pos[0] - self.owner.x
             dy = next_pos[1] - self.owner.y
-            logger.debug(f"AutoExplore.get_next_action: following path from {player_pos} to {next_pos}, delta=({dx},{dy}), remaining_path_len={len(self.current_path)}")
+            logger.debug(lambda: f"AutoExplore.get_next_action: following path from {player_pos} to {next_pos}, delta=({dx},{dy}), remaining_path_len={len(self.current_path)}")
             return {'dx': dx, 'dy': dy}
         
         # BOT OPPORTUNISTIC LOOT: Check for nearby valuable items before continuing exploration
@@ -336,7 +359,7 @@ class AutoExplore:
             loot_target = self._find_opportunistic_loot_target(game_map, entities, fov_map)
         
         if loot_target and loot_target != player_pos:  # Defensive: don't target own position
-            logger.debug(f"AutoExplore: Opportunistic loot target found at {loot_target}")
+            logger.debug(lambda: f"AutoExplore: Opportunistic loot target found at {loot_target}")
             next_target = loot_target
         else:
             # Need to find a new exploration target
@@ -344,29 +367,35 @@ class AutoExplore:
         
         if next_target is None:
             # No more unexplored tiles reachable
-            logger.debug(f"AutoExplore.get_next_action: STOPPING at {player_pos}, reason='All areas explored' (no unexplored tiles found)")
+            logger.debug(lambda: f"AutoExplore.get_next_action: STOPPING at {player_pos}, reason='All areas explored' (no unexplored tiles found)")
             self.stop("All areas explored")
             return None
         
-        logger.debug(f"AutoExplore.get_next_action: found new target={next_target} from {player_pos}")
+        logger.debug(lambda: f"AutoExplore.get_next_action: found new target={next_target} from {player_pos}")
         
-        # Calculate path to target
+        # Walk down the frontier field when the route to the target is clear;
+        # otherwise (loot detours, blocking entities) fall back to A*
         self.target_tile = next_target
-        self.current_path = self._calculate_path_to(next_target, game_map, entities)
+        if (next_target != loot_target and self._frontier_route
+                and self._frontier_route[-1] == next_target
+                and self._route_is_clear(self._frontier_route, entities)):
+            self.current_path = list(self._frontier_route)
+        else:
+            self.current_path = self._calculate_path_to(next_target, game_map, entities)
         
         if not self.current_path:
             # No path found
-            logger.debug(f"AutoExplore.get_next_action: STOPPING at {player_pos}, reason='Cannot reach unexplored areas' (no path to {next_target})")
+            logger.debug(lambda: f"AutoExplore.get_next_action: STOPPING at {player_pos}, reason='Cannot reach unexplored areas' (no path to {next_target})")
             self.stop("Cannot reach unexplored areas")
             return None
         
-        logger.debug(f"AutoExplore.get_next_action: calculated path from {player_pos} to {next_target}, path_len={len(self.current_path)}")
+        logger.debug(lambda: f"AutoExplore.get_next_action: calculated path from {player_pos} to {next_target}, path_len={len(self.current_path)}")
         
         # Follow the path
         next_pos = self.current_path.pop(0)
         dx = next_pos[0] - self.owner.x
         dy = next_pos[1] - self.owner.y
-        logger.debug(f"AutoExplore.get_next_action: starting new path from {player_pos} to {next_pos}, delta=({dx},{dy}), remaining_path_len={len(self.current_path)}")
+        logger.debug(lambda: f"AutoExplore.get_next_action: starting new path from {player_pos} to {next_pos}, delta=({dx},{dy}), remaining_path_len={len(self.current_path)}")
         return {'dx': dx, 'dy': dy}
     
     def _check_stop_conditions(
@@ -470,7 +499,7 @@ class AutoExplore:
         from fov_functions import map_is_in_fov
         from components.component_registry import ComponentType
         
-        for entity in entities:
+        for entity in entities_in_fov(entities, fov_map):
             # Skip non-monsters
             if not entity.components.has(ComponentType.AI):
                 continue
@@ -551,7 +580,7 @@ class AutoExplore:
         
         # New vault discovered!
         self._visited_vaults.add(vault_key)
-        logger.debug(f"Entered new treasure vault at grid {vault_key}")
+        logger.debug(lambda: f"Entered new treasure vault at grid {vault_key}")
         return True
     
     def _valuable_item_in_fov(
@@ -579,7 +608,7 @@ class AutoExplore:
         from fov_functions import map_is_in_fov
         from components.component_registry import ComponentType
         
-        for entity in entities:
+        for entity in entities_in_fov(entities, fov_map):
             # Must have item component
             if not entity.components.has(ComponentType.ITEM):
                 continue
@@ -617,7 +646,7 @@ class AutoExplore:
                 if is_valuable:
                     # Found a new valuable item! Mark it as known and return it
                     self.known_items.add(entity_id)
-                    logger.debug(f"New valuable item found: {entity.name}")
+                    logger.debug(lambda: f"New valuable item found: {entity.name}")
                     return entity
         
         return None
@@ -642,7 +671,7 @@ class AutoExplore:
         
         from fov_functions import map_is_in_fov
         
-        for entity in entities:
+        for entity in entities_in_fov(entities, fov_map):
             # Must be a secret door marker
             if not (hasattr(entity, 'is_secret_door_marker') and entity.is_secret_door_marker):
                 continue
@@ -657,7 +686,7 @@ class AutoExplore:
                 
                 # Found a new secret door! Mark it as known and return it
                 self.known_items.add(entity_id)
-                logger.debug(f"New secret door found at ({entity.x}, {entity.y})")
+                logger.debug(lambda: f"New secret door found at ({entity.x}, {entity.y})")
                 return entity
         
         return None
@@ -684,11 +713,7 @@ class AutoExplore:
         from components.component_registry import ComponentType
         from components.chest import ChestState
         
-        for entity in entities:
-            # Must have chest component
-            if not entity.components.has(ComponentType.CHEST):
-                continue
-            
+        for entity in entities_in_fov(entities_with(entities, ComponentType.CHEST), fov_map):
             # Check if in FOV
             if map_is_in_fov(fov_map, entity.x, entity.y):
                 entity_id = id(entity)
@@ -707,7 +732,7 @@ class AutoExplore:
                 if chest and chest.state != ChestState.OPEN:
                     # Found a new unopened chest! Mark it as known and return it
                     self.known_items.add(entity_id)
-                    logger.debug(f"New unopened chest found: {entity.name}")
+                    logger.debug(lambda: f"New unopened chest found: {entity.name}")
                     return entity
         
         return None
@@ -733,11 +758,7 @@ class AutoExplore:
         from fov_functions import map_is_in_fov
         from components.component_registry import ComponentType
         
-        for entity in entities:
-            # Must have signpost component
-            if not entity.components.has(ComponentType.SIGNPOST):
-                continue
-            
+        for entity in entities_in_fov(entities_with(entities, ComponentType.SIGNPOST), fov_map):
             # Check if in FOV
             if map_is_in_fov(fov_map, entity.x, entity.y):
                 entity_id = id(entity)
@@ -756,7 +777,7 @@ class AutoExplore:
                 if signpost and not signpost.has_been_read:
                     # Found a new unread signpost! Mark it as known and return it
                     self.known_items.add(entity_id)
-                    logger.debug(f"New unread signpost found: {entity.name}")
+                    logger.debug(lambda: f"New unread signpost found: {entity.name}")
                     return entity
         
         return None
@@ -782,11 +803,7 @@ class AutoExplore:
         from fov_functions import map_is_in_fov
         from components.component_registry import ComponentType
         
-        for entity in entities:
-            # Must have mural component
-            if not entity.components.has(ComponentType.MURAL):
-                continue
-            
+        for entity in entities_in_fov(entities_with(entities, ComponentType.MURAL), fov_map):
             # Check if in FOV
             if map_is_in_fov(fov_map, entity.x, entity.y):
                 entity_id = id(entity)
@@ -807,7 +824,7 @@ class AutoExplore:
                 if mural and not is_read:
                     # Found a new unread mural! Mark it as known and return it
                     self.known_items.add(entity_id)
-                    logger.debug(f"New unread mural found: {entity.name}")
+                    logger.debug(lambda: f"New unread mural found: {entity.name}")
                     return entity
         
         return None
@@ -832,7 +849,7 @@ class AutoExplore:
         player_pos = (self.owner.x, self.owner.y)
         
         # Check for stairs entity at player position
-        for entity in entities:
+        for entity in entities_at(entities, self.owner.x, self.owner.y):
             if entity.components.has(ComponentType.STAIRS):
                 if entity.x == self.owner.x and entity.y == self.owner.y:
                     # Found stairs at player position
@@ -840,11 +857,11 @@ class AutoExplore:
                     if player_pos not in self.known_stairs:
                         # New stairs discovered! Add to known and return True to stop
                         self.known_stairs.add(player_pos)
-                        logger.debug(f"New stairs discovered at {player_pos}")
+                        logger.debug(lambda: f"New stairs discovered at {player_pos}")
                         return True
                     else:
                         # Already knew about these stairs - don't stop
-                        logger.debug(f"Standing on known stairs at {player_pos} - continuing exploration")
+                        logger.debug(lambda: f"Standing on known stairs at {player_pos} - continuing exploration")
                         return False
         
         return False
@@ -923,16 +940,16 @@ class AutoExplore:
             )
             if room_unexplored:
                 # Find closest unexplored tile in current room
-                logger.debug(f"AutoExplore._find_next_unexplored_tile: at {player_pos}, in room {self.current_room}, found {len(room_unexplored)} unexplored tiles in room")
+                logger.debug(lambda: f"AutoExplore._find_next_unexplored_tile: at {player_pos}, in room {self.current_room}, found {len(room_unexplored)} unexplored tiles in room")
                 closest = self._find_closest_tile(room_unexplored, game_map)
-                logger.debug(f"AutoExplore._find_next_unexplored_tile: closest in room is {closest}")
+                logger.debug(lambda: f"AutoExplore._find_next_unexplored_tile: closest in room is {closest}")
                 return closest
         
         # Either not in a room, or current room is done
         # Find any unexplored tile
         all_unexplored = self._get_all_unexplored_tiles(game_map)
         
-        logger.debug(f"AutoExplore._find_next_unexplored_tile: at {player_pos}, current_room={self.current_room}, found {len(all_unexplored)} total unexplored tiles")
+        logger.debug(lambda: f"AutoExplore._find_next_unexplored_tile: at {player_pos}, current_room={self.current_room}, found {len(all_unexplored)} total unexplored tiles")
         
         if not all_unexplored:
             logger.debug(f"AutoExplore._find_next_unexplored_tile: NO unexplored tiles remaining")
@@ -940,7 +957,7 @@ class AutoExplore:
         
         # Find closest reachable unexplored tile
         closest = self._find_closest_tile(all_unexplored, game_map)
-        logger.debug(f"AutoExplore._find_next_unexplored_tile: closest unexplored tile (any room) is {closest}")
+        logger.debug(lambda: f"AutoExplore._find_next_unexplored_tile: closest unexplored tile (any room) is {closest}")
         return closest
     
     def _identify_current_room(self, game_map: 'GameMap') -> Optional[Rect]:
@@ -961,6 +978,7 @@ class AutoExplore:
         px, py = self.owner.x, self.owner.y
         
         # Flood fill from player position to find room bounds
+        blocked = tile_field_array(game_map, "blocked")
         visited = set()
         queue = deque([(px, py)])
         room_tiles = []
@@ -975,7 +993,7 @@ class AutoExplore:
                 continue
             
             # Check if tile is walkable
-            if game_map.tiles[x][y].blocked:
+            if blocked[x, y]:
                 continue
             
             visited.add((x, y))
@@ -1013,22 +1031,17 @@ class AutoExplore:
         Returns:
             List of (x, y) tuples for unexplored tiles
         """
-        unexplored = []
-        
-        for x in range(room.x1 + 1, room.x2):
-            for y in range(room.y1 + 1, room.y2):
-                if not (0 <= x < game_map.width and 0 <= y < game_map.height):
-                    continue
-                
-                tile = game_map.tiles[x][y]
-                
-                # Must be walkable and not yet explored
-                if not tile.blocked and not tile.explored:
-                    # Also check for hazards (treat as blocked)
-                    if not game_map.hazard_manager.has_hazard_at(x, y):
-                        unexplored.append((x, y))
+        # Clip the room interior to the map, then keep walkable, unexplored cells
+        x1, x2 = max(room.x1 + 1, 0), min(room.x2, game_map.width)
+        y1, y2 = max(room.y1 + 1, 0), min(room.y2, game_map.height)
+        if x1 >= x2 or y1 >= y2:
+            return []
         
-        return unexplored
+        candidates = ~(
+            tile_field_array(game_map, "blocked")[x1:x2, y1:y2]
+            | tile_field_array(game_map, "explored")[x1:x2, y1:y2]
+        )
+        return self._filter_hazards(candidates, game_map, x1, y1)
     
     def _get_all_unexplored_tiles(self, game_map: 'GameMap') -> List[Tuple[int, int]]:
         """Get all unexplored walkable tiles on the map.
@@ -1039,24 +1052,152 @@ class AutoExplore:
         Returns:
             List of (x, y) tuples for unexplored tiles
         """
-        unexplored = []
+        # Must be walkable and not yet explored
+        candidates = ~(
+            tile_field_array(game_map, "blocked") | tile_field_array(game_map, "explored")
+        )
+        return self._filter_hazards(candidates, game_map)
+    
+    @staticmethod
+    def _filter_hazards(
+        candidates: np.ndarray, game_map: 'GameMap', x_offset: int = 0, y_offset: int = 0
+    ) -> List[Tuple[int, int]]:
+        """Turn a candidate mask into (x, y) tuples, dropping hazard tiles.
         
-        for x in range(game_map.width):
-            for y in range(game_map.height):
-                tile = game_map.tiles[x][y]
-                
-                # Must be walkable and not yet explored
-                if not tile.blocked and not tile.explored:
-                    # Also check for hazards (treat as blocked)
-                    if not game_map.hazard_manager.has_hazard_at(x, y):
-                        unexplored.append((x, y))
+        Args:
+            candidates: Bool mask indexed [x, y] relative to the offsets
+            game_map: Game map (for hazard checks, treated as blocked)
+            x_offset: Map x of candidates[0, 0]
+            y_offset: Map y of candidates[0, 0]
+            
+        Returns:
+            List of (x, y) tuples in x-major order
+        """
+        width, height = candidates.shape
+        hazards = AutoExplore._hazard_mask(game_map)
+        candidates = candidates & ~hazards[x_offset:x_offset + width, y_offset:y_offset + height]
+        xs, ys = np.nonzero(candidates)
+        return list(zip((xs + x_offset).tolist(), (ys + y_offset).tolist()))
+    
+    @staticmethod
+    def _hazard_mask(game_map: 'GameMap') -> np.ndarray:
+        """Return a (width, height) bool array, True where a ground hazard lies.
         
-        return unexplored
+        Args:
+            game_map: Game map whose hazard_manager is consulted
+            
+        Returns:
+            np.ndarray: Hazard mask indexed [x, y]
+        """
+        width, height = game_map.width, game_map.height
+        mask = np.zeros((width, height), dtype=bool)
+        hazard_manager = game_map.hazard_manager
+        hazards = getattr(hazard_manager, 'hazards', None)
+        if isinstance(hazards, dict):
+            for x, y in hazards:
+                if 0 <= x < width and 0 <= y < height:
+                    mask[x, y] = True
+        else:
+            # Hazard managers without a position dict (e.g. test doubles)
+            has_hazard_at = hazard_manager.has_hazard_at
+            for x in range(width):
+                for y in range(height):
+                    if has_hazard_at(x, y):
+                        mask[x, y] = True
+        return mask
+    
+    def _distance_map(self, game_map: 'GameMap', frontier: np.ndarray) -> np.ndarray:
+        """Return walking distances to the nearest ``frontier`` tile.
+        
+        One multi-source Dijkstra over walkable, hazard-free tiles, rooted at
+        every frontier tile and weighted like _calculate_path_to (cardinal 2,
+        diagonal 3). It does not depend on the owner's position, so it is
+        reused until the walls, the hazards or the frontier change.
+        
+        Args:
+            game_map: Game map for pathfinding
+            frontier: (width, height) bool mask of target tiles
+            
+        Returns:
+            np.ndarray: Distances indexed [x, y]; unreachable tiles hold the
+                dtype's maximum value
+        """
+        blocked = tile_field_array(game_map, "blocked")
+        hazards = self._hazard_mask(game_map)
+        
+        cached = self._distance_cache
+        if (cached is not None and cached[0] == id(game_map)
+                and np.array_equal(cached[1], blocked)
+                and np.array_equal(cached[2], hazards)
+                and np.array_equal(cached[3], frontier)):
+            return cached[4]
+        
+        cost = (~(blocked | hazards)).astype(np.int8)
+        graph = tcod.path.SimpleGraph(cost=cost, cardinal=2, diagonal=3)
+        pathfinder = tcod.path.Pathfinder(graph)
+        for root in zip(*np.nonzero(frontier & (cost > 0))):
+            pathfinder.add_root((int(root[0]), int(root[1])))
+        pathfinder.resolve()
+        distance = pathfinder.distance
+        
+        self._distance_cache = (id(game_map), blocked.copy(), hazards, frontier.copy(), distance)
+        return distance
+    
+    @staticmethod
+    def _descend(distance: np.ndarray, start: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Follow a distance field downhill from ``start`` to one of its roots.
+        
+        Each step goes to the neighbour it is cheapest to continue from; ties
+        go to the smallest (x, y).
+        
+        Args:
+            distance: Field from _distance_map
+            start: Tile to descend from (it may itself be unwalkable)
+            
+        Returns:
+            Tiles visited after ``start``, ending on a root, or [] if no
+            root is reachable
+        """
+        width, height = distance.shape
+        unreachable = np.iinfo(distance.dtype).max
+        route: List[Tuple[int, int]] = []
+        x, y = start
+        while True:
+            best = None
+            best_score = None
+            for dx, dy in _STEP_WEIGHTS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                remaining = int(distance[nx, ny])
+                if remaining == unreachable:
+                    continue
+                score = remaining + _STEP_WEIGHTS[(dx, dy)]
+                if best_score is None or score < best_score or (
+                        score == best_score and (nx, ny) < best):
+                    best, best_score = (nx, ny), score
+            if best is None or (route and distance[best] >= distance[x, y]):
+                return []
+            route.append(best)
+            if distance[best] == 0:
+                return route
+            x, y = best
+    
+    def _route_is_clear(self, route: List[Tuple[int, int]], entities: List['Entity']) -> bool:
+        """Whether no blocking entity other than the owner stands on ``route`` before its end."""
+        for x, y in route[:-1]:
+            blocker = blocking_entity_at(entities, x, y)
+            if blocker is not None and blocker is not self.owner:
+                return False
+        return True
     
     def _find_closest_tile(
         self, tiles: List[Tuple[int, int]], game_map: 'GameMap'
     ) -> Optional[Tuple[int, int]]:
-        """Find the closest reachable tile from the list using Dijkstra.
+        """Find the closest reachable tile from the list by walking distance.
+        
+        Descends the distance field rooted at ``tiles`` from the owner, and
+        keeps the route in ``_frontier_route`` for get_next_action to walk.
         
         Args:
             tiles: List of candidate tiles
@@ -1065,58 +1206,26 @@ class AutoExplore:
         Returns:
             (x, y): Closest reachable tile, or None if none reachable
         """
+        self._frontier_route = []
         if not self.owner or not tiles:
             return None
         
-        # Use Dijkstra to find closest tile
-        # Priority queue: (distance, (x, y))
         start = (self.owner.x, self.owner.y)
-        pq = [(0, start)]
-        visited = set()
-        distances = {start: 0}
-        target_tiles = set(tiles)
-        
-        while pq:
-            dist, pos = heapq.heappop(pq)
-            
-            if pos in visited:
-                continue
-            
-            visited.add(pos)
-            
-            # Check if we reached a target
-            if pos in target_tiles:
-                logger.debug(f"AutoExplore._find_closest_tile: found reachable target {pos} at distance {dist} from {start}")
-                return pos
-            
-            x, y = pos
-            
-            # Check neighbors
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nx, ny = x + dx, y + dy
-                neighbor = (nx, ny)
-                
-                # Check bounds
-                if not (0 <= nx < game_map.width and 0 <= ny < game_map.height):
-                    continue
-                
-                # Check if walkable
-                if game_map.tiles[nx][ny].blocked:
-                    continue
-                
-                # Check for hazards (treat as blocked)
-                if game_map.hazard_manager.has_hazard_at(nx, ny):
-                    continue
-                
-                # Calculate new distance
-                new_dist = dist + 1
-                
-                if neighbor not in distances or new_dist < distances[neighbor]:
-                    distances[neighbor] = new_dist
-                    heapq.heappush(pq, (new_dist, neighbor))
+        if start in tiles:
+            return start
+        frontier = np.zeros((game_map.width, game_map.height), dtype=bool)
+        xs, ys = np.array(tiles, dtype=np.intp).T
+        in_bounds = (xs >= 0) & (xs < game_map.width) & (ys >= 0) & (ys < game_map.height)
+        frontier[xs[in_bounds], ys[in_bounds]] = True
+        
+        route = self._descend(self._distance_map(game_map, frontier), start)
+        if route:
+            self._frontier_route = route
+            logger.debug(lambda: f"AutoExplore._find_closest_tile: found reachable target {route[-1]} {len(route)} steps from {start}")
+            return route[-1]
         
         # No reachable target found
-        logger.debug(f"AutoExplore._find_closest_tile: NO reachable targets found from {start} among {len(tiles)} candidates")
+        logger.debug(lambda: f"AutoExplore._find_closest_tile: NO reachable targets found from {start} among {len(tiles)} candidates")
         return None
     
     def _find_opportunistic_loot_target(
@@ -1160,7 +1269,7 @@ class AutoExplore:
         candidate_items = []
         
         # Scan FOV for valuable items
-        for entity in entities:
+        for entity in entities_in_fov(entities, fov_map):
             # Skip items at player's position (handled by LOOT state)
             if (entity.x, entity.y) == player_pos:
                 continue
@@ -1215,7 +1324,7 @@ class AutoExplore:
         
         # Return the best candidate's position
         _, _, loot_pos, loot_entity = candidate_items[0]
-        logger.info(f"AutoExplore: Opportunistic loot target: {loot_entity.name} at {loot_pos} (priority {candidate_items[0][0]}, distance {candidate_items[0][1]})")
+        logger.info(lambda: f"AutoExplore: Opportunistic loot target: {loot_entity.name} at {loot_pos} (priority {candidate_items[0][0]}, distance {candidate_items[0][1]})")
         
         return loot_pos
     
@@ -1239,23 +1348,11 @@ class AutoExplore:
             return []
         
         # Use A* pathfinding with hazard avoidance
-        import tcod
-        import numpy as np
-        
         # Create cost map using numpy (indexed as [y, x])
         # This matches entity.py's approach (lines 392-395)
-        cost = np.zeros((game_map.height, game_map.width), dtype=np.int8)
-        
-        for y in range(game_map.height):
-            for x in range(game_map.width):
-                # Blocked tiles are impassable
-                if game_map.tiles[x][y].blocked:
-                    cost[y, x] = 0
-                # Hazards are treated as impassable
-                elif game_map.hazard_manager.has_hazard_at(x, y):
-                    cost[y, x] = 0
-                else:
-                    cost[y, x] = 1
+        # Blocked tiles and hazards are impassable
+        blocked = tile_field_array(game_map, "blocked") | self._hazard_mask(game_map)
+        cost = (~blocked.T).astype(np.int8)
         
         # Entities block movement (except target tile)
         for entity in entities:
@@ -1273,7 +1370,7 @@ class AutoExplore:
         start_x, start_y = self.owner.x, self.owner.y
         
         # Log dimensions for debugging
-        logger.debug(f"Map dimensions: {game_map.width}x{game_map.height}, "
+        logger.debug(lambda: f"Map dimensions: {game_map.width}x{game_map.height}, "
                     f"Player position: ({start_x}, {start_y}), "
                     f"Target: {target}, "
                     f"Cost array shape after transpose: {cost_array.shape}")
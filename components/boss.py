@@ -138,8 +138,8 @@ class Boss:
             return None
         
         if use_random:
-            from random import choice
-            return choice(lines)
+            from engine.rng_config import get_rng
+            return get_rng("ai").choice(lines)
         else:
             return lines[0]
     
@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING, Optional, Dict, Any, List
 from components.component_registry import ComponentType
 
 from components.map_feature import MapFeature, MapFeatureType
+from engine.rng_config import get_rng
 
 if TYPE_CHECKING:
     pass
@@ -116,7 +117,6 @@ class Chest(MapFeature):
         
         # TODO: Implement perception check when we have stats
         # For now, give a base 50% chance + Ring of Searching bonus
-        import random
         
         base_chance = 0.5
         
@@ -130,7 +130,7 @@ class Chest(MapFeature):
                     if ring_entity.ring.ring_effect == RingEffect.SEARCHING:
                         return True  # Ring of Searching always detects
         
-        return random.random() < base_chance
+        return get_rng("loot").random() < base_chance
     
     def open(self, actor: 'Entity', has_key: bool = False) -> List[Dict[str, Any]]:
         """Attempt to open the chest.
@@ -327,7 +327,6 @@ class Chest(MapFeature):
         Returns:
             List of loot entities
         """
-        import random
         from config.entity_factory import EntityFactory
         
         loot = []
@@ -341,7 +340,7 @@ class Chest(MapFeature):
         }
         
         min_items, max_items = loot_counts.get(self.loot_quality, (1, 2))
-        num_items = random.randint(min_items, max_items)
+        num_items = get_rng("loot").randint(min_items, max_items)
         
         # Loot tables by quality
         # Format: [(item_type, weight), ...]
@@ -396,7 +395,7 @@ class Chest(MapFeature):
                 items = [item for item, weight in loot_table]
                 weights = [weight for item, weight in loot_table]
                 
-                item_type = random.choices(items, weights=weights, k=1)[0]
+                item_type = get_rng("loot").choices(items, weights=weights, k=1)[0]
                 
                 # Create the item
                 # Try different factory methods based on item type
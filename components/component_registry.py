@@ -19,7 +19,7 @@ Classes:
 """
 
 from enum import Enum, auto
-from typing import Dict, Optional, Any, Iterator, List
+from typing import Dict, Optional, Any, Iterator, List, Tuple
 
 
 class ComponentType(Enum):
@@ -109,7 +109,11 @@ class ComponentRegistry:
     
     Attributes:
         _components: Internal dictionary mapping ComponentType to component instances
+        _indexes: (ComponentIndex, entity) pairs notified when components are
+            added or removed (see map_objects.component_index)
     """
+
+    _indexes: Tuple[Tuple[Any, Any], ...] = ()
     
     def __init__(self):
         """Initialize an empty component registry."""
@@ -142,6 +146,8 @@ class ComponentRegistry:
             raise ValueError(f"Component {component_type.name} already exists in registry")
         
         self._components[component_type] = component
+        for index, entity in self._indexes:
+            index.component_added(entity, component_type)
     
     def get(self, component_type: ComponentType) -> Optional[Any]:
         """Get a component by type.
@@ -207,7 +213,11 @@ class ComponentRegistry:
             >>> removed == fighter
             True
         """
-        return self._components.pop(component_type, None)
+        if component_type not in self._components:
+            return None
+        for index, entity in self._indexes:
+            index.component_removed(entity, component_type)
+        return self._components.pop(component_type)
     
     def get_all_types(self) -> List[ComponentType]:
         """Get a list of all component types in this registry.
@@ -242,7 +252,17 @@ class ComponentRegistry:
             >>> len(registry._components)
             0
         """
+        for index, entity in self._indexes:
+            for component_type in self._components:
+                index.component_removed(entity, component_type)
         self._components.clear()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Index membership belongs to the containing EntityList, which
+        # rebuilds it on unpickle/deepcopy
+        state = self.__dict__.copy()
+        state.pop('_indexes', None)
+        return state
     
     def __contains__(self, component_type: ComponentType) -> bool:
         """Support 'in' operator for checking component existence.
@@ -57,6 +57,22 @@ class Equipment:
         self.quiver: Optional[Any] = quiver  # Phase 22.2.2: Special ammo slot
         self.owner: Optional[Any] = None  # Entity, Will be set when component is registered
 
+    _SLOTS = frozenset((
+        'main_hand', 'off_hand', 'head', 'chest', 'feet',
+        'left_ring', 'right_ring', 'quiver',
+    ))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # Equip/unequip (toggle_equip or direct slot assignment) changes the
+        # owner's derived combat stats
+        if name in Equipment._SLOTS:
+            owner = self.__dict__.get('owner')
+            if owner is not None:
+                fighter = getattr(owner, 'fighter', None)
+                if fighter is not None and hasattr(fighter, 'invalidate_stats'):
+                    fighter.invalidate_stats()
+
     @property
     def max_hp_bonus(self) -> int:
         """Calculate total max HP bonus from all equipped items.
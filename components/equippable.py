@@ -6,6 +6,8 @@ equippable and defines their stat bonuses and equipment slot.
 
 from typing import Optional, Any
 
+from engine.rng_config import get_rng
+
 
 class Equippable:
     """Component that makes an entity equippable with stat bonuses.
@@ -99,6 +101,21 @@ class Equippable:
         self.applies_knockback_on_hit: bool = bool(applies_knockback_on_hit)
         self.owner: Optional[Any] = None  # Entity, Will be set when component is registered
     
+    # Fields that feed Fighter.armor_class/max_hp/power/defense
+    _DERIVED_STAT_FIELDS = frozenset((
+        'power_bonus', 'defense_bonus', 'max_hp_bonus',
+        'armor_class_bonus', 'armor_type', 'dex_cap',
+    ))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # In-place changes after construction (enchanting, corrosion) must
+        # reach whoever has this item equipped; the item doesn't know who
+        # that is, so invalidate every fighter's derived stats.
+        if name in Equippable._DERIVED_STAT_FIELDS and 'owner' in self.__dict__:
+            from components.fighter import invalidate_derived_stats
+            invalidate_derived_stats()
+
     def get_damage_range_text(self) -> str:
         """Get formatted damage range text for display.
         
@@ -140,8 +157,7 @@ class Equippable:
         
         # Fall back to legacy damage range
         if self.damage_min > 0 and self.damage_max > 0:
-            import random
-            return random.randint(self.damage_min, self.damage_max)
+            return get_rng("combat").randint(self.damage_min, self.damage_max)
         
         return 0
     
@@ -152,8 +168,7 @@ class Equippable:
             int: Random defense value between defense_min and defense_max (inclusive)
         """
         if self.defense_min > 0 and self.defense_max > 0:
-            import random
-            return random.randint(self.defense_min, self.defense_max)
+            return get_rng("combat").randint(self.defense_min, self.defense_max)
         return 0
     
     def modify_damage_range(self, min_bonus: int, max_bonus: int) -> None:
@@ -1,4 +1,4 @@
-import random
+import os
 from enum import Enum, auto
 from typing import Optional, Dict, Any, List
 from game_messages import Message
@@ -6,6 +6,7 @@ from message_builder import MessageBuilder as MB
 from config.testing_config import is_testing_mode
 from visual_effects import show_hit, show_miss
 from components.component_registry import ComponentType
+from engine.rng_config import get_rng
 
 
 def _get_metrics_collector():
@@ -76,6 +77,46 @@ def normalize_resistance_type(damage_type: Any) -> Optional[ResistanceType]:
     return None
 
 
+# Derived-stat cache (armor_class, max_hp, power, defense).
+# Per-fighter caches are dropped by Fighter.invalidate_stats() (equip/unequip,
+# status effect add/remove, base stat writes). Items don't know who holds
+# them, so in-place item stat changes bump this epoch, which invalidates every
+# fighter's cache at once.
+_derived_stats_epoch = 0
+
+# Debug cross-check: recompute on every cache hit and fail if values differ
+_derived_stats_crosscheck = os.environ.get('YARL_CHECK_STAT_CACHE', '').lower() in ('true', '1', 'yes', 'on')
+
+_cacheable_owner_types = None
+
+
+def invalidate_derived_stats() -> None:
+    """Invalidate every fighter's cached derived stats."""
+    global _derived_stats_epoch
+    _derived_stats_epoch += 1
+
+
+def set_derived_stats_crosscheck(enabled: bool) -> None:
+    """Enable or disable the derived-stat cache cross-check.
+
+    When enabled, every cache hit is recomputed from scratch and an
+    AssertionError is raised if the cached value is stale.
+    """
+    global _derived_stats_crosscheck
+    _derived_stats_crosscheck = bool(enabled)
+
+
+def _get_cacheable_owner_types():
+    """(Entity, Equipment, StatusEffectManager), imported on first use."""
+    global _cacheable_owner_types
+    if _cacheable_owner_types is None:
+        from entity import Entity
+        from components.equipment import Equipment
+        from components.status_effects import StatusEffectManager
+        _cacheable_owner_types = (Entity, Equipment, StatusEffectManager)
+    return _cacheable_owner_types
+
+
 class Fighter:
     """Component that handles combat statistics and actions.
 
@@ -119,6 +160,9 @@ class Fighter:
             accuracy (int, optional): Accuracy stat for hit chance. Defaults to 2.
             evasion (int, optional): Evasion stat for dodge chance. Defaults to 1.
         """
+        # (key, {stat name: value}) - see _get_derived_stat()
+        self._derived_stats = None
+
         self.base_max_hp = hp
         self.hp = hp
         self.base_defense = defense
@@ -145,6 +189,87 @@ class Fighter:
         
         self.owner = None  # Will be set by Entity when component is registered
 
+    # Writing any of these (level-ups, boons, buffs, raising) drops the derived-stat cache
+    _DERIVED_STAT_INPUTS = frozenset((
+        'base_max_hp', 'base_defense', 'base_power',
+        'strength', 'dexterity', 'constitution', 'owner',
+    ))
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in Fighter._DERIVED_STAT_INPUTS:
+            object.__setattr__(self, '_derived_stats', None)
+
+    def invalidate_stats(self) -> None:
+        """Drop cached armor_class/max_hp/power/defense so they are recomputed.
+
+        Called by Equipment when a slot changes and by StatusEffectManager
+        when an effect is added or removed. Base stat writes invalidate
+        automatically.
+        """
+        self._derived_stats = None
+
+    def _derived_stats_key(self):
+        """Return the cache key for the current owner state, or None if uncacheable.
+
+        The key pins the equipment and status effect components the values
+        were computed from, plus the global item-stat epoch. Owners that are
+        not real Entities (or carry stand-in components) are never cached.
+        """
+        owner = self.owner
+        if owner is None:
+            return (_derived_stats_epoch, None, None, None)
+
+        entity_type, equipment_type, status_type = _get_cacheable_owner_types()
+        if not isinstance(owner, entity_type):
+            return None
+
+        equipment = self._get_equipment(owner)
+        equipment_attr = owner.equipment
+        status_effects = owner.status_effects
+        for component, component_type in ((equipment, equipment_type),
+                                          (equipment_attr, equipment_type),
+                                          (status_effects, status_type)):
+            if component is not None and not isinstance(component, component_type):
+                return None
+
+        return (_derived_stats_epoch, equipment, equipment_attr, status_effects)
+
+    def _get_derived_stat(self, name, compute):
+        """Return a derived stat from the cache, computing it on a miss.
+
+        Args:
+            name: Stat name used as the cache slot
+            compute: Zero-argument callable that computes the stat from scratch
+
+        Returns:
+            int: The stat value
+        """
+        key = self._derived_stats_key()
+        if key is None:
+            return compute()
+
+        cached = self._derived_stats
+        if cached is None or cached[0] != key:
+            cached = (key, {})
+            self._derived_stats = cached
+
+        values = cached[1]
+        if name in values:
+            value = values[name]
+            if _derived_stats_crosscheck:
+                fresh = compute()
+                if fresh != value:
+                    raise AssertionError(
+                        f"Stale cached {name} for {getattr(self.owner, 'name', self.owner)}: "
+                        f"cached {value}, recomputed {fresh}"
+                    )
+            return value
+
+        value = compute()
+        values[name] = value
+        return value
+
     @staticmethod
     def get_stat_modifier(stat):
         """Calculate D&D-style stat modifier.
@@ -359,9 +484,21 @@ class Fighter:
             Skeleton with 3 adjacent skeleton allies:
             AC = 10 + 1 (DEX) + 0 (no armor) + 3 (shield wall) = 14
         
+        Everything except the shield wall bonus (which tracks adjacent allies
+        every turn) is served from the derived-stat cache.
+
         Returns:
             int: Armor Class (typically 10-25)
         """
+        return (self._get_derived_stat('armor_class', self._compute_armor_class)
+                + self._calculate_shield_wall_bonus())
+
+    def _compute_armor_class(self):
+        """Compute AC from scratch, excluding the shield wall bonus.
+
+        Returns:
+            int: 10 + capped DEX modifier + armor, status effect and ring bonuses
+        """
         base_ac = 10
         dex_bonus = self.dexterity_mod
         
@@ -416,10 +553,7 @@ class Fighter:
                 if ring and ring.components.has(ComponentType.RING):
                     ring_ac_bonus += ring.ring.get_ac_bonus()
         
-        # Phase 19: Shield Wall bonus - count adjacent skeleton allies (4-way adjacency)
-        shield_wall_bonus = self._calculate_shield_wall_bonus()
-        
-        return base_ac + dex_bonus + armor_ac_bonus + status_ac_bonus + ring_ac_bonus + shield_wall_bonus
+        return base_ac + dex_bonus + armor_ac_bonus + status_ac_bonus + ring_ac_bonus
 
     def _calculate_shield_wall_bonus(self) -> int:
         """Calculate Shield Wall AC bonus from adjacent skeleton allies.
@@ -461,6 +595,10 @@ class Fighter:
         Returns:
             int: Maximum health points including all modifiers
         """
+        return self._get_derived_stat('max_hp', self._compute_max_hp)
+
+    def _compute_max_hp(self):
+        """Compute max HP from scratch (see max_hp)."""
         if self.owner and self.owner.equipment:
             equipment_bonus = self.owner.equipment.max_hp_bonus
         else:
@@ -480,6 +618,10 @@ class Fighter:
         Returns:
             int: Attack power including equipment bonuses
         """
+        return self._get_derived_stat('power', self._compute_power)
+
+    def _compute_power(self):
+        """Compute attack power from scratch (see power)."""
         if self.owner and self.owner.equipment:
             bonus = self.owner.equipment.power_bonus
         else:
@@ -494,6 +636,10 @@ class Fighter:
         Returns:
             int: Defense value including equipment bonuses
         """
+        return self._get_derived_stat('defense', self._compute_defense)
+
+    def _compute_defense(self):
+        """Compute defense from scratch (see defense)."""
         if self.owner and self.owner.equipment:
             bonus = self.owner.equipment.defense_bonus
         else:
@@ -667,7 +813,7 @@ class Fighter:
                         results.append({"message": MB.custom(f"{boss.boss_name}: \"{low_hp_line}\"", MB.YELLOW)})
                 
                 # Random "hit" reaction (10% chance when boss takes damage)
-                elif not boss.has_used_dialogue("hit") and random.random() < 0.1:
+                elif not boss.has_used_dialogue("hit") and get_rng("combat").random() < 0.1:
                     hit_line = boss.get_dialogue("hit")
                     if hit_line:
                         results.append({"message": MB.custom(f"{boss.boss_name}: \"{hit_line}\"", MB.LIGHT_GRAY)})
@@ -789,12 +935,11 @@ class Fighter:
                     damage_bonus_dice = ring.ring.get_damage_bonus()
                     if damage_bonus_dice:
                         # Parse dice notation (e.g., "1d4") and roll
-                        import random
                         parts = damage_bonus_dice.split('d')
                         if len(parts) == 2:
                             num_dice = int(parts[0])
                             die_size = int(parts[1])
-                            bonus_damage = sum(random.randint(1, die_size) for _ in range(num_dice))
+                            bonus_damage = sum(get_rng("combat").randint(1, die_size) for _ in range(num_dice))
                             total_attack += bonus_damage
         
         # Apply boss damage multiplier if attacker is an enraged boss
@@ -957,7 +1102,6 @@ class Fighter:
         Returns:
             list: List of result dictionaries with combat messages and effects
         """
-        import random
         from game_messages import Message
         
         results = []
@@ -1031,7 +1175,7 @@ class Fighter:
             pass  # Knowledge system not available
         
         # Roll d20 for attack (still roll for natural 20 display, but surprise bypasses miss)
-        d20_roll = random.randint(1, 20)
+        d20_roll = get_rng("combat").randint(1, 20)
         
         # Get attacker's to-hit bonus
         to_hit_bonus = self.dexterity_mod
@@ -1179,8 +1323,7 @@ class Fighter:
                     collector.increment('disarmed_weapon_attacks_prevented')
                 # Phase 20E.2: Use fixed minimal unarmed damage (1-2) instead of natural attacks
                 # This prevents monsters with high natural damage from trivializing disarm
-                import random
-                base_damage = random.randint(1, 2)  # Minimal unarmed: punching/grappling
+                base_damage = get_rng("combat").randint(1, 2)  # Minimal unarmed: punching/grappling
             elif weapon_damage > 0:
                 base_damage = weapon_damage
             else:
@@ -1565,8 +1708,7 @@ class Fighter:
             int: Random damage within the entity's base damage range, or 0 if no range configured
         """
         if self.damage_min > 0 and self.damage_max > 0:
-            import random
-            return random.randint(self.damage_min, self.damage_max)
+            return get_rng("combat").randint(self.damage_min, self.damage_max)
         return 0
     
     def _get_monster_variable_damage(self) -> int:
@@ -1615,7 +1757,6 @@ class Fighter:
             return results
         
         # Import here to avoid circular imports
-        import random
         from game_messages import Message
         
         # Phase 19: Tiered corrosion chance by slime type (5%/10%/15%)
@@ -1623,7 +1764,7 @@ class Fighter:
         corrosion_chance = getattr(self.owner, 'corrosion_chance', 0.05)
         
         # Chance to corrode equipment on successful hit (deterministic under seeded runs)
-        if random.random() < corrosion_chance:
+        if get_rng("combat").random() < corrosion_chance:
             # Phase 19: Only corrode target's METAL weapon
             weapon_corrosion = self._corrode_weapon(target)
             results.extend(weapon_corrosion)
@@ -1806,10 +1947,9 @@ class Fighter:
             return results  # Already infected
         
         # Plague spread chance: 25%
-        import random
         PLAGUE_SPREAD_CHANCE = 0.25
         
-        if random.random() < PLAGUE_SPREAD_CHANCE:
+        if get_rng("combat").random() < PLAGUE_SPREAD_CHANCE:
             # Apply plague effect to target
             # NOTE: apply_plague_effect expects target as keyword arg, not positional
             from item_functions import apply_plague_effect
@@ -2048,9 +2188,8 @@ class Fighter:
         # =====================================================================
         oath_embers = status_effects.get_effect('oath_of_embers')
         if oath_embers:
-            import random
             # 33% chance to apply burning to target
-            if random.random() < oath_embers.burn_chance:
+            if get_rng("combat").random() < oath_embers.burn_chance:
                 from components.status_effects import BurningEffect, StatusEffectManager
                 
                 # Ensure target has status_effects component
@@ -2098,9 +2237,8 @@ class Fighter:
         # =====================================================================
         oath_venom = status_effects.get_effect('oath_of_venom')
         if oath_venom:
-            import random
             # 25% chance to apply/extend poison
-            if random.random() < oath_venom.poison_chance:
+            if get_rng("combat").random() < oath_venom.poison_chance:
                 from components.status_effects import PoisonEffect, StatusEffectManager
                 
                 # Ensure target has status_effects component
@@ -2482,9 +2620,7 @@ class Fighter:
         effect_chance = getattr(ammo, 'ammo_effect_chance', 1.0)  # Phase 22.2.3
         
         # Phase 22.2.3: Roll for effect chance (deterministic via seeded RNG)
-        # random_utils does not re-export the stdlib random() function; import directly.
-        from random import random
-        if random() >= effect_chance:
+        if get_rng("combat").random() >= effect_chance:
             # Effect didn't trigger
             return results
         
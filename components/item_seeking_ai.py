@@ -10,6 +10,7 @@ import math
 from typing import List, Optional, Tuple, Any
 from config.game_constants import get_monster_equipment_config
 from components.component_registry import ComponentType
+from map_objects.spatial_index import blocking_entity_at
 
 logger = logging.getLogger(__name__)
 
@@ -111,7 +112,10 @@ class ItemSeekingAI:
         """
         nearby_items = []
         
-        for entity in entities:
+        # During an enemy phase only the floor's items need checking
+        from services.turn_context import get_turn_context
+        context = get_turn_context(entities)
+        for entity in (context.ground_items() if context else entities):
             # Only consider items (entities with item component)
             if not entity.components.has(ComponentType.ITEM):
                 continue
@@ -225,9 +229,8 @@ class ItemSeekingAI:
             return False
             
         # Check for blocking entities
-        for entity in entities:
-            if entity.x == x and entity.y == y and getattr(entity, 'blocks', False):
-                return False
+        if blocking_entity_at(entities, x, y) is not None:
+            return False
                 
         return True
 
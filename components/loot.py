@@ -18,8 +18,8 @@ Usage:
 
 from enum import Enum
 from typing import Optional, Tuple, Dict, Any
-from random import randint, random, choice
 
+from engine.rng_config import get_rng
 from entity import Entity
 from components.item import Item
 from components.equippable import Equippable
@@ -53,7 +53,7 @@ class LootRarity(Enum):
     
     def get_bonus(self) -> int:
         """Get a random bonus value for this rarity tier."""
-        return randint(*self.bonus_range)
+        return get_rng("loot").randint(*self.bonus_range)
 
 
 class LootComponent:
@@ -143,7 +143,7 @@ class LootGenerator:
         level_factor = min(dungeon_level / 10.0, 1.5)
         
         # Roll for rarity with level scaling
-        roll = random() - (level_factor * 0.1) - luck_modifier
+        roll = get_rng("loot").random() - (level_factor * 0.1) - luck_modifier
         
         # Check from best to worst
         cumulative = 0.0
@@ -297,19 +297,19 @@ class LootGenerator:
             Weapon name string
         """
         base_names = ["Sword", "Axe", "Mace", "Dagger", "Spear"]
-        base = choice(base_names)
+        base = get_rng("loot").choice(base_names)
         
         if rarity == LootRarity.COMMON:
             return f"{base}"
         elif rarity == LootRarity.UNCOMMON:
-            prefix, _, _ = choice(self.WEAPON_PREFIXES[:2])  # Sharp, Keen
+            prefix, _, _ = get_rng("loot").choice(self.WEAPON_PREFIXES[:2])  # Sharp, Keen
             return f"{prefix} {base}"
         elif rarity == LootRarity.RARE:
-            prefix, _, _ = choice(self.WEAPON_PREFIXES[2:4])  # Deadly, Vicious
+            prefix, _, _ = get_rng("loot").choice(self.WEAPON_PREFIXES[2:4])  # Deadly, Vicious
             return f"{prefix} {base}"
         else:  # LEGENDARY
-            prefix, _, _ = choice(self.WEAPON_PREFIXES[3:])  # Vicious, Masterwork
-            suffix, _, _ = choice(self.WEAPON_SUFFIXES[2:])  # of Slaying, of the Warrior
+            prefix, _, _ = get_rng("loot").choice(self.WEAPON_PREFIXES[3:])  # Vicious, Masterwork
+            suffix, _, _ = get_rng("loot").choice(self.WEAPON_SUFFIXES[2:])  # of Slaying, of the Warrior
             return f"{prefix} {base} {suffix}"
     
     def _generate_armor_name(self, rarity: LootRarity, bonus: int) -> str:
@@ -323,19 +323,19 @@ class LootGenerator:
             Armor name string
         """
         base_names = ["Shield", "Buckler", "Tower Shield"]
-        base = choice(base_names)
+        base = get_rng("loot").choice(base_names)
         
         if rarity == LootRarity.COMMON:
             return f"{base}"
         elif rarity == LootRarity.UNCOMMON:
-            prefix, _, _ = choice(self.ARMOR_PREFIXES[:2])  # Sturdy, Reinforced
+            prefix, _, _ = get_rng("loot").choice(self.ARMOR_PREFIXES[:2])  # Sturdy, Reinforced
             return f"{prefix} {base}"
         elif rarity == LootRarity.RARE:
-            prefix, _, _ = choice(self.ARMOR_PREFIXES[2:4])  # Blessed, Runed
+            prefix, _, _ = get_rng("loot").choice(self.ARMOR_PREFIXES[2:4])  # Blessed, Runed
             return f"{prefix} {base}"
         else:  # LEGENDARY
-            prefix, _, _ = choice(self.ARMOR_PREFIXES[3:])  # Runed, Enchanted
-            suffix, _, _ = choice(self.ARMOR_SUFFIXES[2:])  # of the Guardian, of Invulnerability
+            prefix, _, _ = get_rng("loot").choice(self.ARMOR_PREFIXES[3:])  # Runed, Enchanted
+            suffix, _, _ = get_rng("loot").choice(self.ARMOR_SUFFIXES[2:])  # of the Guardian, of Invulnerability
             return f"{prefix} {base} {suffix}"
     
     def should_monster_drop_loot(self, monster_name: str, dungeon_level: int) -> bool:
@@ -367,14 +367,14 @@ class LootGenerator:
         
         # Weak monsters (rat, bat, etc.)
         if any(weak in monster_lower for weak in ['rat', 'bat', 'spider', 'goblin']):
-            return random() < 0.30
+            return get_rng("loot").random() < 0.30
         
         # Strong monsters
         if any(strong in monster_lower for strong in ['troll', 'ogre', 'warrior', 'knight']):
-            return random() < 0.70
+            return get_rng("loot").random() < 0.70
         
         # Normal monsters
-        return random() < 0.50
+        return get_rng("loot").random() < 0.50
     
     def generate_boss_loot(
         self, 
@@ -403,7 +403,7 @@ class LootGenerator:
         
         # 50% chance for second legendary
         secondary_drop = None
-        if random() < 0.5:
+        if get_rng("loot").random() < 0.5:
             secondary_drop = self.generate_armor(x, y, dungeon_level, rarity=LootRarity.LEGENDARY)
             logger.info(f"{boss_name} dropped BONUS LEGENDARY: {secondary_drop.name}")
         
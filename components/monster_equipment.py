@@ -5,10 +5,10 @@ and monster inventory management. It provides configurable spawn rates based on
 dungeon level and game mode (normal vs testing).
 """
 
-import random
 import logging
 from typing import List, Optional, Tuple
 from config.game_constants import get_monster_equipment_config
+from engine.rng_config import get_rng
 from config.testing_config import is_testing_mode
 from config.entity_factory import get_entity_factory
 from components.monster_action_logger import MonsterActionLogger
@@ -44,7 +44,7 @@ class MonsterEquipmentSpawner:
             level_bonus = (dungeon_level - 1) * self.config.NORMAL_LEVEL_MULTIPLIER * base_chance
             chance = min(base_chance + level_bonus, self.config.NORMAL_MAX_CHANCE)
         
-        roll = random.random()
+        roll = get_rng("loot").random()
         should_spawn = roll < chance
         
         logger.debug(f"Equipment spawn check for {monster_type} at level {dungeon_level}: "
@@ -72,7 +72,7 @@ class MonsterEquipmentSpawner:
         equipment_list = []
         
         # Determine what type of equipment to spawn
-        equipment_roll = random.random()
+        equipment_roll = get_rng("loot").random()
         
         if equipment_roll < self.config.WEAPON_SPAWN_WEIGHT:
             # Spawn weapon
@@ -169,7 +169,6 @@ class MonsterLootDropper:
             List: List of dropped item entities (includes both equipped and generated loot)
         """
         from components.loot import get_loot_generator
-        from random import random
         
         # Slimes are just blobs - they don't carry items!
         if 'slime' in monster.name.lower():
@@ -269,7 +268,7 @@ class MonsterLootDropper:
             dropped_item_names = {item.name.lower() for item in dropped_items}
             
             # 70% chance for weapon, 30% chance for armor
-            if random() < 0.70:
+            if get_rng("loot").random() < 0.70:
                 drop_x, drop_y = MonsterLootDropper._find_drop_location(x, y, dropped_items, game_map)
                 magic_weapon = loot_gen.generate_weapon(drop_x, drop_y, dungeon_level)
                 
@@ -6,9 +6,9 @@ design for different item types.
 """
 
 import logging
-import random
 from typing import List, Optional, Dict, Any
 from config.game_constants import get_monster_equipment_config
+from engine.rng_config import get_rng
 from game_messages import Message
 from message_builder import MessageBuilder as MB
 from components.monster_action_logger import MonsterActionLogger
@@ -164,7 +164,7 @@ class MonsterItemUsage:
             failure_rate = 0.0  # Unknown item type, no failure
             
         # Roll for failure
-        if random.random() < failure_rate:
+        if get_rng("ai").random() < failure_rate:
             failure_results = self._handle_item_failure(item, target, entities)
             results.extend(failure_results)
             # Extract failure mode from results for logging
@@ -264,7 +264,7 @@ class MonsterItemUsage:
         
         # Determine failure mode
         failure_modes = ['fizzle', 'wrong_target', 'equipment_damage']
-        failure_mode = random.choice(failure_modes)
+        failure_mode = get_rng("ai").choice(failure_modes)
         
         if failure_mode == 'fizzle':
             # Item does nothing
@@ -389,7 +389,7 @@ class MonsterItemUsage:
             return results
         
         # Randomly select equipment to damage
-        equipment_type, equipment_item = random.choice(equipment_to_damage)
+        equipment_type, equipment_item = get_rng("ai").choice(equipment_to_damage)
         
         # For enhancement scrolls, reduce the equipment's effectiveness
         if equipment_item.components.has(ComponentType.EQUIPPABLE):
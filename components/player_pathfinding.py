@@ -13,6 +13,7 @@ import tcod
 
 from config.game_constants import get_pathfinding_config
 from fov_functions import map_is_in_fov
+from map_objects.tile import tile_field_array
 from game_messages import Message
 
 if TYPE_CHECKING:
@@ -251,12 +252,10 @@ class PlayerPathfinding:
             warnings.filterwarnings("ignore", category=DeprecationWarning)
             fov = tcod.map.Map(game_map.width, game_map.height)
         
-        # Scan the current map each turn and set all the walls as unwalkable
-        # Note: fov arrays use [y, x] indexing, game_map.tiles uses [x][y] indexing
-        for y1 in range(game_map.height):
-            for x1 in range(game_map.width):
-                fov.transparent[y1, x1] = not game_map.tiles[x1][y1].block_sight
-                fov.walkable[y1, x1] = not game_map.tiles[x1][y1].blocked
+        # Copy the map's walls in one slice each
+        # Note: fov arrays use [y, x] indexing, game_map arrays use [x, y] indexing
+        fov.transparent[:] = ~tile_field_array(game_map, "block_sight").T
+        fov.walkable[:] = ~tile_field_array(game_map, "blocked").T
         
         # Scan all the objects to see if there are objects that must be
         # navigated around. Don't block the destination tile even if there's an entity there
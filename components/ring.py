@@ -13,6 +13,7 @@ from enum import Enum, auto
 from typing import Optional, List, Dict, Any
 
 from components.component_registry import ComponentType
+from engine.rng_config import get_rng
 
 
 class RingEffect(Enum):
@@ -222,8 +223,7 @@ class Ring:
         
         # Ring of Teleportation: chance to teleport when hit
         if self.ring_effect == RingEffect.TELEPORTATION:
-            import random
-            if random.randint(1, 100) <= self.effect_strength:  # Default: 20% chance
+            if get_rng("combat").randint(1, 100) <= self.effect_strength:  # Default: 20% chance
                 # Trigger teleportation
                 results.append({
                     'teleport': True,
@@ -27,8 +27,8 @@ Phase 5 additions:
 - Dynamic ratio updates via set_bonus_ratio() and set_temporary_bonus()
 """
 
-import random
 from typing import Optional, Callable, List
+from engine.rng_config import get_rng
 from logger_config import get_logger
 
 logger = get_logger(__name__)
@@ -79,7 +79,7 @@ class SpeedBonusTracker:
             speed_bonus_ratio: Speed bonus as a ratio (e.g., 0.25 for +25% speed).
                 Must be >= 0.0. Values > 1.0 guarantee at least one bonus per attack.
             rng: Optional RNG function that returns float in [0.0, 1.0).
-                Defaults to random.random(). Useful for testing.
+                Defaults to the active run's combat stream. Useful for testing.
         
         Raises:
             ValueError: If speed_bonus_ratio is negative
@@ -97,7 +97,8 @@ class SpeedBonusTracker:
         self._equipment_sources: List[str] = []  # Names of items providing speed bonus
         
         self.attack_counter = 0
-        self._rng = rng if rng is not None else random.random
+        # None: draw from the combat stream of whichever run is active at roll time
+        self._rng = rng
         self.owner = None  # Will be set by Entity when component is registered
     
     @property
@@ -325,7 +326,7 @@ class SpeedBonusTracker:
             return True
         
         # Roll for early bonus
-        roll = self._rng()
+        roll = self._rng() if self._rng is not None else get_rng("combat").random()
         if roll < chance:
             logger.debug(
                 f"SpeedBonusTracker: Early bonus! "
@@ -1,6 +1,7 @@
 from typing import List, Dict, Any, TYPE_CHECKING, Optional
 from message_builder import MessageBuilder as MB
 from components.component_registry import ComponentType
+from engine.rng_config import get_rng
 from logger_config import get_logger
 
 if TYPE_CHECKING:
@@ -137,8 +138,7 @@ class ShieldEffect(StatusEffect):
         
         if is_monster:
             # 10% chance to backfire for monsters!
-            from random import random
-            if random() < 0.10:
+            if get_rng("combat").random() < 0.10:
                 self.backfired = True
                 # Halve base defense (defense property is read-only)
                 fighter = self.owner.get_component_optional(ComponentType.FIGHTER)
@@ -1066,8 +1066,7 @@ class IdentifyModeEffect(StatusEffect):
         
         # If there are unidentified items, identify one randomly
         if unidentified_items:
-            import random
-            item_to_identify = random.choice(unidentified_items)
+            item_to_identify = get_rng("loot").choice(unidentified_items)
             item_comp = item_to_identify.item
             old_appearance = item_comp.appearance if hasattr(item_comp, 'appearance') else "mysterious item"
             
@@ -2379,14 +2378,23 @@ class StatusEffectManager:
 
         self.active_effects[effect.name] = effect
         results.extend(effect.apply())
+        self._invalidate_owner_stats()
         return results
 
     def remove_effect(self, name: str) -> List[Dict[str, Any]]:
         if name in self.active_effects:
             effect = self.active_effects.pop(name)
-            return effect.remove()
+            results = effect.remove()
+            self._invalidate_owner_stats()
+            return results
         return []
 
+    def _invalidate_owner_stats(self) -> None:
+        """Drop the owner's cached derived stats (effects like protection change AC)."""
+        fighter = getattr(self.owner, 'fighter', None)
+        if fighter is not None and hasattr(fighter, 'invalidate_stats'):
+            fighter.invalidate_stats()
+
     def has_effect(self, name: str) -> bool:
         return name in self.active_effects
 
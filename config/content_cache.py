@@ -0,0 +1,302 @@
+"""Content cache - parse each YAML content file once, load it from a pickle after.
+
+The content registries (entities, level templates and scenarios, loot policy,
+vault themes, murals, signposts, visuals, ETP) each ran ``yaml.safe_load`` on
+their own files at startup. That is pure-Python parsing of ~15k lines of
+YAML, taking over a second, paid again by every suite subprocess and, for
+some files, by more than one loader (entities.yaml) or on every use
+(yo_mama_jokes.yaml).
+
+``load_yaml(path)`` replaces those calls. Parsed documents are kept as pickled
+blobs, in memory for the process and in one versioned cache file in the user
+data directory, keyed by path and validated against the file's mtime and size
+and, when those change, its SHA-256 (so a fresh checkout with new mtimes but
+identical content still hits). Each call unpickles a fresh copy, so loaders
+may mutate what they get.
+
+Precompile every ``config/**/*.yaml`` and report cold vs cached load time:
+
+    python -m config.content_cache
+
+Set ``YARL_CONTENT_CACHE=0`` to disable the cache file (the in-process cache
+is always used), or to a file path to relocate it.
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import yaml
+
+from utils.resource_paths import get_resource_path, get_user_data_dir
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cache file layout or the parsing rules change
+CACHE_FORMAT_VERSION = 1
+
+CACHE_ENV_VAR = "YARL_CONTENT_CACHE"
+
+# libyaml's loader builds the same documents as yaml.SafeLoader, several times faster
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class ContentCache:
+    """Parsed-YAML cache shared by the content registries.
+
+    Attributes:
+        cache_path (Path): Cache file location, or None for memory only
+        files_parsed (int): Files parsed from YAML this process
+        files_from_cache (int): Loads served from a cached blob
+        parse_seconds (float): Time spent reading and parsing YAML
+        cache_seconds (float): Time spent loading the cache file and unpickling
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        """Initialize the cache.
+
+        Args:
+            cache_path: Cache file; None keeps parsed files in memory only
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        # path -> {'mtime_ns', 'size', 'sha256', 'blob'}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._file_loaded = False
+        self._dirty = False
+        self._save_at_exit = False
+
+        self.files_parsed = 0
+        self.files_from_cache = 0
+        self.parse_seconds = 0.0
+        self.cache_seconds = 0.0
+
+    def load_yaml(self, path: str) -> Any:
+        """Return the parsed contents of a YAML file.
+
+        Args:
+            path: Path to the YAML file
+
+        Returns:
+            The document, as ``yaml.safe_load`` would return it
+
+        Raises:
+            OSError: If the file cannot be read
+            yaml.YAMLError: If the file is not valid YAML
+        """
+        self._load_cache_file()
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        entry = self._entries.get(key)
+
+        if entry is not None and (entry["mtime_ns"], entry["size"]) == (stat.st_mtime_ns, stat.st_size):
+            return self._unpickle(entry["blob"])
+
+        start = time.perf_counter()
+        with open(key, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+
+        if entry is not None and entry["sha256"] == digest:
+            # Touched but unchanged (checkout, copy): keep the blob
+            self.parse_seconds += time.perf_counter() - start
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+            self._mark_dirty()
+            return self._unpickle(entry["blob"])
+
+        data = yaml.load(raw, Loader=_SafeLoader)
+        blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        self.parse_seconds += time.perf_counter() - start
+        self.files_parsed += 1
+
+        self._entries[key] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "blob": blob,
+        }
+        self._mark_dirty()
+        return data
+
+    def compile(self, root: Optional[str] = None) -> int:
+        """Parse every YAML file under ``root`` into the cache and save it.
+
+        Args:
+            root: Directory to scan (default: the bundled config/ directory)
+
+        Returns:
+            int: Number of YAML files compiled
+        """
+        root_path = Path(root or get_resource_path("config"))
+        paths = sorted(root_path.rglob("*.yaml"))
+        for path in paths:
+            try:
+                self.load_yaml(str(path))
+            except (OSError, yaml.YAMLError) as e:
+                logger.warning(f"Skipping {path}: {e}")
+        self.save()
+        return len(paths)
+
+    def save(self) -> None:
+        """Write the cache file if anything changed (atomically)."""
+        if self.cache_path is None or not self._dirty:
+            return
+        # Only bundled content is persisted; other files (saves, test
+        # fixtures) stay in memory so the file cannot fill with stale paths
+        content_root = os.path.join(os.path.abspath(get_resource_path("config")), "")
+        entries = {
+            key: entry for key, entry in self._entries.items()
+            if key.startswith(content_root) and os.path.exists(key)
+        }
+        payload = {
+            "format": CACHE_FORMAT_VERSION,
+            "yaml": yaml.__version__,
+            "entries": entries,
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+            logger.debug(f"Saved content cache ({len(entries)} files) to {self.cache_path}")
+        except OSError as e:
+            logger.warning(f"Could not write content cache {self.cache_path}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return load counters and timings for reporting.
+
+        Returns:
+            dict: files_parsed, files_from_cache, parse_ms, cache_ms
+        """
+        return {
+            "files_parsed": self.files_parsed,
+            "files_from_cache": self.files_from_cache,
+            "parse_ms": round(self.parse_seconds * 1000.0, 1),
+            "cache_ms": round(self.cache_seconds * 1000.0, 1),
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _unpickle(self, blob: bytes) -> Any:
+        start = time.perf_counter()
+        data = pickle.loads(blob)
+        self.cache_seconds += time.perf_counter() - start
+        self.files_from_cache += 1
+        return data
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self.cache_path is not None and not self._save_at_exit:
+            atexit.register(self.save)
+            self._save_at_exit = True
+
+    def _load_cache_file(self) -> None:
+        """Read the cache file once; a missing, stale or corrupt file is ignored."""
+        if self._file_loaded:
+            return
+        self._file_loaded = True
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+
+        start = time.perf_counter()
+        try:
+            with open(self.cache_path, "rb") as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable content cache {self.cache_path}: {e}")
+            return
+        finally:
+            self.cache_seconds += time.perf_counter() - start
+
+        if (not isinstance(payload, dict)
+                or payload.get("format") != CACHE_FORMAT_VERSION
+                or payload.get("yaml") != yaml.__version__):
+            logger.info(f"Content cache {self.cache_path} is from another version, rebuilding")
+            return
+        self._entries.update(payload["entries"])
+
+
+def default_cache_path() -> Optional[Path]:
+    """Cache file location from ``YARL_CONTENT_CACHE`` or the user data directory.
+
+    Returns:
+        Path, or None when the cache file is disabled
+    """
+    override = os.environ.get(CACHE_ENV_VAR)
+    if override is not None:
+        if override.strip().lower() in ("", "0", "false", "off"):
+            return None
+        return Path(override)
+    return get_user_data_dir() / "cache" / "content_cache.pickle"
+
+
+# Singleton instance
+_content_cache: Optional[ContentCache] = None
+
+
+def get_content_cache() -> ContentCache:
+    """Get the global content cache instance.
+
+    Returns:
+        ContentCache instance
+    """
+    global _content_cache
+    if _content_cache is None:
+        _content_cache = ContentCache(default_cache_path())
+    return _content_cache
+
+
+def reset_content_cache() -> None:
+    """Reset the global content cache instance (for testing)."""
+    global _content_cache
+    _content_cache = None
+
+
+def load_yaml(path: str) -> Any:
+    """Load a YAML content file through the global content cache.
+
+    Drop-in for ``with open(path) as f: yaml.safe_load(f)``.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        The parsed document (a fresh copy the caller may mutate)
+    """
+    return get_content_cache().load_yaml(path)
+
+
+def main() -> int:
+    """Precompile the content cache and report cold vs cached load time."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    cold = ContentCache(None)
+    start = time.perf_counter()
+    count = cold.compile()
+    cold_ms = (time.perf_counter() - start) * 1000.0
+
+    cache = get_content_cache()
+    cache.compile()
+
+    warm = ContentCache(cache.cache_path)
+    start = time.perf_counter()
+    warm.compile()
+    warm_ms = (time.perf_counter() - start) * 1000.0
+
+    print(f"Compiled {count} YAML files into {cache.cache_path or '(memory only)'}")
+    print(f"  Cold parse:  {cold_ms:8.1f} ms")
+    print(f"  From cache:  {warm_ms:8.1f} ms  {warm.stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
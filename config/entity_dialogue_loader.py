@@ -7,12 +7,12 @@ The Entity's voice becomes more anxious and desperate as player descends.
 Phase 2 implementation - simple depth-based triggers.
 """
 
-import yaml
 import logging
 import os
 from typing import Dict, Optional, Any
 from dataclasses import dataclass
 
+from config.content_cache import load_yaml
 from utils.resource_paths import get_resource_path
 
 logger = logging.getLogger(__name__)
@@ -52,8 +52,7 @@ class EntityDialogueLoader:
                 logger.warning(f"Entity dialogue file not found: {self.dialogue_file}")
                 return
                 
-            with open(self.dialogue_file, 'r') as f:
-                data = yaml.safe_load(f)
+            data = load_yaml(self.dialogue_file)
                 
             if not data:
                 logger.warning(f"Empty dialogue file: {self.dialogue_file}")
@@ -472,9 +472,10 @@ class EntityRegistry:
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Entity configuration file not found: {config_path}")
 
+        from config.content_cache import load_yaml
+
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
+            config_data = load_yaml(config_path)
             
             if not config_data:
                 logger.warning(f"Empty or invalid YAML file: {config_path}")
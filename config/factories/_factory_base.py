@@ -9,10 +9,10 @@ This module contains common functionality used by all factory types:
 """
 
 import logging
-import random
 from typing import Optional
 
 from entity import Entity
+from engine.rng_config import get_rng
 from components.component_registry import ComponentType
 from components.fighter import Fighter, ResistanceType, normalize_resistance_type
 from components.ai import BasicMonster
@@ -171,7 +171,7 @@ class FactoryBase:
         
         # Roll for pre-identification (FIRST TIME for this type)
         # This decision will apply to ALL future items of this type
-        roll = random.random() * 100
+        roll = get_rng("loot").random() * 100
         if roll < pre_id_percent:
             # Item starts identified - register type globally
             item.identified = True
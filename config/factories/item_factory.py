@@ -8,6 +8,7 @@ Handles creation of consumable items:
 import logging
 from typing import Optional
 
+from engine.rng_config import get_rng
 from entity import Entity
 from components.component_registry import ComponentType
 from components.item import Item
@@ -92,11 +93,10 @@ class ItemFactory(FactoryBase):
             return None
 
         try:
-            import random
             
             # Calculate random starting charges
             # Base: 2-4, + (level-1), max 10
-            base_charges = random.randint(2, 4)
+            base_charges = get_rng("loot").randint(2, 4)
             level_bonus = dungeon_level - 1
             starting_charges = min(base_charges + level_bonus, 10)
             
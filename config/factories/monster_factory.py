@@ -11,6 +11,7 @@ Handles creation of all monster entities including:
 import logging
 from typing import Optional
 
+from engine.rng_config import get_rng
 from entity import Entity
 from components.component_registry import ComponentType
 from components.fighter import Fighter
@@ -390,7 +391,6 @@ class MonsterFactory(FactoryBase):
                     }
                 }
         """
-        import random
         
         spawn_chances = equipment_config.get('spawn_chances', {})
         equipment_pool = equipment_config.get('equipment_pool', {})
@@ -398,7 +398,7 @@ class MonsterFactory(FactoryBase):
         # Process each equipment slot
         for slot_name, spawn_chance in spawn_chances.items():
             # Roll for this slot
-            if random.random() > spawn_chance:
+            if get_rng("loot").random() > spawn_chance:
                 continue  # Didn't spawn equipment in this slot
             
             # Get items available for this slot
@@ -409,7 +409,7 @@ class MonsterFactory(FactoryBase):
             
             # Select item using weighted random
             total_weight = sum(item_def.get('weight', 1) for item_def in slot_items)
-            roll = random.random() * total_weight
+            roll = get_rng("loot").random() * total_weight
             
             cumulative_weight = 0
             selected_item = None
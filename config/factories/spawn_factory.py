@@ -446,15 +446,14 @@ class SpawnFactory(FactoryBase):
             dialogue_source = npc_def.get('dialogue_source', 'guide_dialogue')
             
             # Load dialogue from YAML
-            import yaml
             import os
             from components.npc_dialogue import create_dialogue_from_yaml
+            from config.content_cache import load_yaml
             from utils.resource_paths import get_resource_path
             
             dialogue_file = get_resource_path(f"config/{dialogue_source}.yaml")
             if os.path.exists(dialogue_file):
-                with open(dialogue_file, 'r') as f:
-                    dialogue_data = yaml.safe_load(f)
+                dialogue_data = load_yaml(dialogue_file)
                 
                 npc_dialogue = create_dialogue_from_yaml(dialogue_data)
                 entity.npc_dialogue = npc_dialogue
@@ -53,6 +53,10 @@ class PerformanceConfig:
     # Rendering
     TARGET_FPS: int = 60  # Target frames per second
     MAX_DIRTY_RECTANGLES: int = 50  # Maximum dirty rectangles before full redraw
+    
+    # Monster activation (services/monster_activation.py)
+    AI_DORMANCY_ENABLED: bool = True  # Skip turns of far-away, unaware monsters
+    AI_WAKE_RADIUS: int = 15  # Monsters within this many tiles of the player always act
 
 
 @dataclass
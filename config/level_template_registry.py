@@ -17,6 +17,7 @@ from dataclasses import dataclass, field
 import yaml
 
 from config.testing_config import is_testing_mode
+from config.content_cache import load_yaml
 from utils.resource_paths import get_resource_path
 
 
@@ -404,8 +405,8 @@ class TrapRules:
         if total_weight <= 0:
             return None
         
-        from random import random
-        roll = random() * total_weight
+        from engine.rng_config import get_rng
+        roll = get_rng("mapgen").random() * total_weight
         cumulative = 0
         
         for entry in self.trap_table:
@@ -459,8 +460,8 @@ class DoorRules:
         if total_weight <= 0:
             return self.styles[0].type
         
-        from random import random
-        roll = random() * total_weight
+        from engine.rng_config import get_rng
+        roll = get_rng("mapgen").random() * total_weight
         cumulative = 0
         
         for style in self.styles:
@@ -480,8 +481,8 @@ class GuaranteedSpawn:
     
     def get_random_count(self) -> int:
         """Get a random count within the configured range."""
-        from random import randint
-        return randint(self.count_min, self.count_max)
+        from engine.rng_config import get_rng
+        return get_rng("mapgen").randint(self.count_min, self.count_max)
 
 
 @dataclass
@@ -632,8 +633,7 @@ class LevelTemplateRegistry:
             return
             
         try:
-            with open(filepath, 'r') as f:
-                data = yaml.safe_load(f)
+            data = load_yaml(filepath)
                 
             if not data:
                 logger.warning(f"Empty template file: {filepath}")
@@ -1802,8 +1802,7 @@ class ScenarioRegistry:
             raise ScenarioLoadError(f"Scenario file not found", filepath)
         
         try:
-            with open(filepath, 'r') as f:
-                data = yaml.safe_load(f)
+            data = load_yaml(filepath)
         except yaml.YAMLError as e:
             raise ScenarioLoadError(f"YAML parse error: {e}", filepath)
         
@@ -7,7 +7,6 @@ and the dragons' tragedy.
 
 import os
 import logging
-import random
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
@@ -17,6 +16,7 @@ try:
 except ImportError:
     YAML_AVAILABLE = False
 
+from engine.rng_config import get_rng
 from utils.resource_paths import get_resource_path
 
 logger = logging.getLogger(__name__)
@@ -75,9 +75,10 @@ class MuralsRegistry:
             self._load_fallback_murals()
             return
         
+        from config.content_cache import load_yaml
+
         try:
-            with open(config_path, 'r') as f:
-                data = yaml.safe_load(f)
+            data = load_yaml(config_path)
             
             if not data:
                 logger.warning("Empty murals file. Using fallback murals.")
@@ -159,7 +160,7 @@ class MuralsRegistry:
         if not valid_murals:
             return (None, None)
         
-        selected_mural = random.choice(valid_murals)
+        selected_mural = get_rng("mapgen").choice(valid_murals)
         return (selected_mural.text, selected_mural.mural_id)
     
     def get_all_murals_for_depth(self, depth: int) -> List[Tuple[str, str]]:
@@ -6,7 +6,6 @@ Messages can be filtered by type and dungeon depth for contextual signposts.
 
 import os
 import logging
-import random
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
@@ -16,6 +15,7 @@ try:
 except ImportError:
     YAML_AVAILABLE = False
 
+from engine.rng_config import get_rng
 from utils.resource_paths import get_resource_path
 
 logger = logging.getLogger(__name__)
@@ -78,9 +78,10 @@ class SignpostMessageRegistry:
             self._load_fallback_messages()
             return
         
+        from config.content_cache import load_yaml
+
         try:
-            with open(config_path, 'r') as f:
-                data = yaml.safe_load(f)
+            data = load_yaml(config_path)
             
             if not data:
                 logger.warning("Empty signpost messages file. Using fallback messages.")
@@ -180,7 +181,7 @@ class SignpostMessageRegistry:
         if not valid_messages:
             valid_messages = message_pool
         
-        selected_message = random.choice(valid_messages)
+        selected_message = get_rng("mapgen").choice(valid_messages)
         return selected_message.text
     
     def get_all_messages_for_type(self, sign_type: str) -> List[str]:
@@ -15,6 +15,7 @@ import logging
 import os
 from typing import Dict, Optional, List, Any
 
+from config.content_cache import load_yaml
 from utils.resource_paths import get_resource_path
 
 logger = logging.getLogger(__name__)
@@ -50,8 +51,7 @@ class VaultThemeRegistry:
             config_path = get_resource_path("config/vault_themes.yaml")
         
         try:
-            with open(config_path, 'r') as f:
-                data = yaml.safe_load(f)
+            data = load_yaml(config_path)
             
             # Load vault themes
             if 'vault_themes' in data:
@@ -37,9 +37,9 @@ SEE ALSO:
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
-import random
 from typing import List, Optional, Dict, Any
 
+from engine.rng_config import get_rng
 from game_messages import Message
 from message_builder import MessageBuilder as MB
 from game_states import GameStates
@@ -209,7 +209,7 @@ def _check_plague_reanimation(monster, game_map, entities) -> Optional[Dict[str,
         return None
     
     # Schedule reanimation in 1-3 turns
-    reanimate_delay = random.randint(1, 3)
+    reanimate_delay = get_rng("combat").randint(1, 3)
     
     return {
         'corpse_x': monster.x,
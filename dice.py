@@ -4,10 +4,11 @@ This module provides functions for parsing and rolling dice using
 standard D&D notation (e.g., "1d4", "2d6+3", "1d20").
 """
 
-import random
 import re
 from typing import Tuple
 
+from engine.rng_config import get_rng
+
 
 def parse_dice(dice_str: str) -> Tuple[int, int, int]:
     """Parse dice notation string into components.
@@ -79,7 +80,8 @@ def roll_dice(dice_str: str) -> int:
     num_dice, die_size, modifier = parse_dice(dice_str)
     
     # Roll each die and sum
-    total = sum(random.randint(1, die_size) for _ in range(num_dice))
+    rng = get_rng("combat")
+    total = sum(rng.randint(1, die_size) for _ in range(num_dice))
     
     return total + modifier
 
@@ -15,6 +15,8 @@ Usage:
     python3 ecosystem_sanity.py --scenario backstab_training  # Run scenario
     python3 ecosystem_sanity.py --scenario backstab_training --runs 20
     python3 ecosystem_sanity.py --scenario plague_arena --turn-limit 500 --player-bot observe_only
+    python3 ecosystem_sanity.py --scenario depth3_orc_brutal --runs 50 --seed-base 1337 --workers 8
+    python3 ecosystem_sanity.py --scenario depth3_orc_brutal --runs 20 --profile --export-json out.json
 
 Examples:
     # List all available scenarios
@@ -33,7 +35,6 @@ import sys
 import logging
 import warnings
 import json
-from pathlib import Path
 from typing import Optional
 from services.scenario_invariants import ScenarioInvariantError
 from services.scenario_harness import evaluate_expectations
@@ -109,6 +110,8 @@ def run_scenario(
     seed_base: Optional[int] = None,
     disable_depth_boons: bool = False,
     inject_boons: Optional[list] = None,
+    workers: int = 1,
+    profile: bool = False,
 ) -> int:
     """Run a scenario and display results.
 
@@ -125,12 +128,16 @@ def run_scenario(
             Used for A/B depth pressure analysis (see --disable-depth-boons flag).
         inject_boons: When provided, inject these boon IDs after player creation
             and suppress auto depth boons. Used for A/B ON variant injection.
+        workers: Number of worker processes for the run batch (1 = serial).
+        profile: Record per-phase turn timings; printed and exported under
+            "profile" next to "metrics".
 
     Returns:
         Exit code (0 for success, 1 for error)
     """
     from config.level_template_registry import get_scenario_registry
     from services.scenario_harness import run_scenario_many, make_bot_policy
+    from services.suite_runner import build_export_payload, write_metrics_sidecar
     
     # Look up scenario
     registry = get_scenario_registry()
@@ -161,6 +168,8 @@ def run_scenario(
     print(f"Runs: {runs}")
     print(f"Turn Limit: {turn_limit}")
     print(f"Bot Policy: {player_bot}")
+    if workers > 1:
+        print(f"Workers: {workers}")
     print("=" * 60)
     print()
     
@@ -177,6 +186,8 @@ def run_scenario(
             seed_base=seed_base,
             disable_depth_boons=disable_depth_boons,
             inject_boons=inject_boons,
+            workers=workers,
+            profile=profile,
         )
     except ScenarioInvariantError as e:
         print(f"Scenario invariant failed: {e}")
@@ -238,6 +249,10 @@ def run_scenario(
     
     print("=" * 60)
     
+    if metrics.phase_profile:
+        print_phase_profile(metrics.phase_profile)
+        print_content_load_stats()
+    
     # Expected outcomes
     expectation_results, unsupported_keys = evaluate_expectations(scenario, metrics)
     print("\nExpected Outcomes:")
@@ -260,14 +275,9 @@ def run_scenario(
 
     # JSON export (if requested)
     if export_json:
-        payload = {
-            "scenario_id": scenario_id,
-            "runs": runs,
-            "turn_limit": turn_limit,
-            "player_bot": player_bot,
-            "depth": getattr(scenario, "depth", None),
-            "metrics": metrics.to_dict(),
-        }
+        payload = build_export_payload(
+            scenario_id, runs, turn_limit, player_bot, scenario, metrics,
+        )
         try:
             with open(export_json, "w", encoding="utf-8") as f:
                 json.dump(payload, f, separators=(",", ":"))
@@ -276,43 +286,7 @@ def run_scenario(
             return 1
         # Phase 16D: also drop a normalized copy into reports/metrics for tooling.
         try:
-            metrics_dir = Path("reports") / "metrics"
-            metrics_dir.mkdir(parents=True, exist_ok=True)
-            dest = metrics_dir / f"{scenario_id}_metrics.json"
-
-            def _safe_div(numerator: float, denominator: float) -> float:
-                return numerator / denominator if denominator else 0.0
-
-            totals = payload["metrics"]
-            runs_for_div = totals.get("runs", runs) or runs or 1
-            player_attacks = totals.get("total_player_attacks", 0)
-            monster_attacks = totals.get("total_monster_attacks", 0)
-            player_hits = totals.get("total_player_hits", 0)
-            monster_hits = totals.get("total_monster_hits", 0)
-            bonus_attacks = totals.get("total_bonus_attacks_triggered", 0)
-            player_deaths = totals.get("player_deaths", 0)
-
-            player_attacks_per_run = _safe_div(player_attacks, runs_for_div)
-            monster_attacks_per_run = _safe_div(monster_attacks, runs_for_div)
-
-            family_parts = scenario_id.split("_")
-            family = "_".join(family_parts[:2]) if len(family_parts) > 1 else scenario_id
-
-            normalized = {
-                "scenario_id": scenario_id,
-                "family": family,
-                "runs": runs_for_div,
-                "depth": payload.get("depth") or totals.get("depth"),
-                "player_hit_rate": _safe_div(player_hits, player_attacks),
-                "monster_hit_rate": _safe_div(monster_hits, monster_attacks),
-                "bonus_attacks_per_run": _safe_div(bonus_attacks, runs_for_div),
-                "death_rate": _safe_div(player_deaths, runs_for_div),
-                "player_attacks_per_run": player_attacks_per_run,
-                "monster_attacks_per_run": monster_attacks_per_run,
-                "pressure_index": monster_attacks_per_run - player_attacks_per_run,
-                "raw": payload,
-            }
-            dest.write_text(json.dumps(normalized, indent=2, sort_keys=True), encoding="utf-8")
+            write_metrics_sidecar(payload)
         except Exception as e:  # noqa: BLE001
             logger.warning("Failed to write reports/metrics sidecar: %s", e)
     
@@ -326,6 +300,25 @@ def run_scenario(
     return 0
 
 
+def print_phase_profile(phase_profile: dict) -> None:
+    """Print per-phase turn timings, most expensive first."""
+    print("\nPhase Profile:")
+    print(f"  {'phase':<36} {'calls':>8} {'total ms':>11} {'mean us':>10}")
+    ordered = sorted(phase_profile.items(), key=lambda item: item[1]["total_ms"], reverse=True)
+    for name, entry in ordered:
+        print(f"  {name:<36} {entry['calls']:>8} {entry['total_ms']:>11.1f} {entry['mean_us']:>10.1f}")
+    print("=" * 60)
+
+
+def print_content_load_stats() -> None:
+    """Print how this process loaded its YAML content (see config/content_cache.py)."""
+    from config.content_cache import get_content_cache
+    stats = get_content_cache().stats()
+    print(f"Content load: {stats['files_parsed']} parsed in {stats['parse_ms']:.1f} ms, "
+          f"{stats['files_from_cache']} from cache in {stats['cache_ms']:.1f} ms")
+    print("=" * 60)
+
+
 def main() -> int:
     """Main entry point.
     
@@ -426,6 +419,26 @@ Examples:
         ),
     )
 
+    parser.add_argument(
+        '--workers', '-j',
+        type=int,
+        default=1,
+        metavar='N',
+        help=(
+            'Spread runs across N worker processes (default: 1 = serial). '
+            'Aggregated metrics are identical to the serial path for a given --seed-base.'
+        ),
+    )
+
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help=(
+            'Record wall time and call counts per turn phase (bot decision, player action, '
+            'enemy AI by type, reanimations, status effects); exported under "profile".'
+        ),
+    )
+
     args = parser.parse_args()
     
     # Setup logging
@@ -473,6 +486,8 @@ Examples:
             seed_base=args.seed_base,
             disable_depth_boons=args.disable_depth_boons,
             inject_boons=inject_boons_list,
+            workers=max(1, args.workers),
+            profile=args.profile,
         )
     
     # Should not reach here due to mutually exclusive group
@@ -41,7 +41,7 @@ before running any games, preventing "Console must not be NULL" crashes.
 import sys
 import os
 
-if '--headless' in sys.argv:
+if '--headless' in sys.argv or '--simulate' in sys.argv:
     os.environ['SDL_VIDEODRIVER'] = 'dummy'
 # =============================================================================
 
@@ -78,7 +78,7 @@ from engine.systems.optimized_render_system import OptimizedRenderSystem
 from systems.turn_controller import initialize_turn_controller
 
 # Initialize centralized logging system (DEBUG level for tooltip debugging)
-from logger_config import setup_logging
+from logger_config import setup_logging, start_background_logging
 setup_logging(log_level=logging.DEBUG)  # Enable DEBUG for tooltip instrumentation
 print("📝 Centralized logging enabled: logs/rlike.log (DEBUG level for tooltip debugging)")
 
@@ -211,6 +211,20 @@ Examples:
         help='Run in headless mode (no window, for CI/automated testing)'
     )
     
+    parser.add_argument(
+        '--simulate',
+        action='store_true',
+        help='Render-free simulation core for --bot-soak: no window, no frame delay, '
+             'no drawing (implies --headless). Reports turns/second.'
+    )
+    
+    parser.add_argument(
+        '--no-gc-tuning',
+        action='store_true',
+        help='Leave the cyclic GC at interpreter defaults during --bot-soak '
+             '(GC pauses are still recorded, for comparison)'
+    )
+    
     parser.add_argument(
         '--max-turns',
         type=int,
@@ -279,6 +293,9 @@ def main():
     debug_log = setup_debug_logging("debug.log", console_level="WARNING")
     print(f"🔍 Debug logging enabled: {debug_log}")
     
+    # Write log files from a background thread instead of the game loop
+    start_background_logging()
+    
     # Parse command line arguments
     args = parse_arguments()
     
@@ -289,7 +306,9 @@ def main():
         from engine.soak_harness import run_bot_soak
         
         # Headless mode: SDL_VIDEODRIVER was already set at top of file (before tcod import)
-        if args.headless:
+        if args.simulate:
+            print("⚡ Simulation mode enabled (no window, no frame delay, no drawing)")
+        elif args.headless:
             print("🔇 Headless mode enabled (no window)")
         else:
             print("🖥️  Window mode enabled (game visible)")
@@ -343,6 +362,8 @@ def main():
             metrics_log_path=args.metrics_log,
             base_seed=args.seed,
             replay_log_path=args.replay_log,
+            simulate=args.simulate,
+            manage_gc=not args.no_gc_tuning,
         )
         
         # Print session summary
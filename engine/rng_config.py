@@ -20,19 +20,44 @@ Usage:
     # For deterministic scenario runs (balance suite):
     from engine.rng_config import stable_scenario_seed
     seed = stable_scenario_seed("depth3_orc_brutal", run_idx=5, seed_base=1337)
+
+Per-run streams:
+    set_global_seed only seeds the module-level ``random``, which every run in
+    the process shares. A RunRNG holds one independent ``random.Random`` per
+    named stream (combat, mapgen, loot, ai), all derived from the run seed, so
+    two runs in one process (or in threads / async tasks, via contextvars)
+    cannot disturb each other and mapgen can be re-seeded without shifting
+    combat rolls:
+
+    with run_rng_scope(RunRNG(seed)):
+        ...                       # game code draws via get_rng("combat") etc.
+
+    Outside a scope get_rng() returns the ``random`` module itself, so code
+    paths that never start a run (and tests seeding or patching ``random``)
+    behave exactly as before.
 """
 
+import contextvars
 import hashlib
 import logging
 import random
 import time
-from typing import Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
 # Global state for current seed
 _current_seed: Optional[int] = None
 
+# Named sub-streams of a run:
+#   combat - attack, damage and effect rolls and other action outcomes
+#            (trap detection, teleports, splits)
+#   mapgen - level layout, spawn tables and placements
+#   loot   - drops, chest contents, monster equipment, identification
+#   ai     - monster decisions
+RNG_STREAMS = ("combat", "mapgen", "loot", "ai")
+
 
 def generate_seed() -> int:
     """Generate a new random seed based on current time.
@@ -82,6 +107,7 @@ def reset_rng_state() -> None:
     """
     global _current_seed
     _current_seed = None
+    _active_run_rng.set(None)
     logger.debug("RNG state reset")
 
 
@@ -120,3 +146,157 @@ def stable_scenario_seed(scenario_id: str, run_idx: int, seed_base: int = 1337)
     
     return seed
 
+
+
+def derive_stream_seed(seed: int, stream: str) -> int:
+    """Derive a stable seed for one named stream of a run.
+
+    Args:
+        seed: The run seed
+        stream: Stream name (see RNG_STREAMS)
+
+    Returns:
+        int: A 64-bit seed, stable across Python versions
+    """
+    hash_bytes = hashlib.sha256(f"{seed}:{stream}".encode('utf-8')).digest()
+    return int.from_bytes(hash_bytes[:8], byteorder='big')
+
+
+class RunRNG:
+    """Independent random streams for one game run.
+
+    Each stream is a ``random.Random`` seeded from (run seed, stream name),
+    created on first use. Draws from one stream never shift another.
+
+    Attributes:
+        seed (int): The run seed the streams derive from
+    """
+
+    def __init__(self, seed: int):
+        """Initialize the run's streams.
+
+        Args:
+            seed: Run seed
+        """
+        self.seed = seed
+        self._streams: Dict[str, random.Random] = {}
+
+    def stream(self, name: str) -> random.Random:
+        """Return the named stream.
+
+        Args:
+            name: One of RNG_STREAMS
+
+        Returns:
+            random.Random for that stream
+
+        Raises:
+            ValueError: If name is not a known stream
+        """
+        rng = self._streams.get(name)
+        if rng is None:
+            if name not in RNG_STREAMS:
+                raise ValueError(f"Unknown RNG stream {name!r} (expected one of {RNG_STREAMS})")
+            rng = random.Random(derive_stream_seed(self.seed, name))
+            self._streams[name] = rng
+        return rng
+
+    def streams_used(self) -> Tuple[str, ...]:
+        """Names of the streams drawn from (created) so far."""
+        return tuple(self._streams)
+
+    def reseed(self, name: str, seed: int) -> None:
+        """Re-seed one stream, leaving the others where they are.
+
+        E.g. regenerate a floor with a different layout while combat rolls
+        continue the run's sequence.
+
+        Args:
+            name: One of RNG_STREAMS
+            seed: New seed for that stream
+        """
+        self.stream(name).seed(derive_stream_seed(seed, name))
+
+    @property
+    def combat(self) -> random.Random:
+        return self.stream("combat")
+
+    @property
+    def mapgen(self) -> random.Random:
+        return self.stream("mapgen")
+
+    @property
+    def loot(self) -> random.Random:
+        return self.stream("loot")
+
+    @property
+    def ai(self) -> random.Random:
+        return self.stream("ai")
+
+    def __repr__(self) -> str:
+        return f"RunRNG(seed={self.seed})"
+
+
+# The run whose streams game code draws from. A ContextVar rather than a
+# module global so threads and asyncio tasks each see their own run.
+_active_run_rng: contextvars.ContextVar[Optional[RunRNG]] = contextvars.ContextVar(
+    "active_run_rng", default=None
+)
+
+
+def get_run_rng() -> Optional[RunRNG]:
+    """Get the active run's RunRNG.
+
+    Returns:
+        RunRNG, or None outside a run scope
+    """
+    return _active_run_rng.get()
+
+
+def set_run_rng(run_rng: Optional[RunRNG]) -> None:
+    """Make run_rng the active run in the current context (None clears it).
+
+    Prefer run_rng_scope() where the run fits in one block.
+
+    Args:
+        run_rng: RunRNG to activate, or None
+    """
+    _active_run_rng.set(run_rng)
+
+
+@contextmanager
+def run_rng_scope(run_rng: Union[RunRNG, int]) -> Iterator[RunRNG]:
+    """Activate a run's streams for the duration of a block.
+
+    Args:
+        run_rng: RunRNG, or a seed to build one from
+
+    Yields:
+        The active RunRNG
+    """
+    if not isinstance(run_rng, RunRNG):
+        run_rng = RunRNG(run_rng)
+    token = _active_run_rng.set(run_rng)
+    try:
+        yield run_rng
+    finally:
+        _active_run_rng.reset(token)
+
+
+def get_rng(stream: str) -> Any:
+    """Get the random source for a stream of the active run.
+
+    Call sites use it like the ``random`` module:
+    ``get_rng("combat").randint(1, 20)``.
+
+    Args:
+        stream: One of RNG_STREAMS
+
+    Returns:
+        The active run's random.Random stream, or the ``random`` module
+        itself outside a run
+    """
+    run_rng = _active_run_rng.get()
+    if run_rng is None:
+        return random
+    return run_rng.stream(stream)
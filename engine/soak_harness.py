@@ -29,6 +29,14 @@ The lifecycle is:
 
 This approach ensures ConsoleRenderer.render() → console_flush() never crashes
 with "Console must not be NULL or root console must exist" errors.
+
+SIMULATION MODE (run_bot_soak(simulate=True) / engine.py --bot-soak --simulate):
+-------------------------------------------------------------------------------
+Skips all of the above: no root console, no per-run consoles, no 16 ms frame
+delay and no drawing. play_game_with_engine() drives GameCore plus the world
+systems; the render system only recomputes FOV and marks explored tiles, and
+the message log is a counting-only NullMessageLog.
+Per-run and session turns/second are reported so the gain can be tracked.
 """
 
 import logging
@@ -40,6 +48,7 @@ from typing import List, Optional, Dict, Any
 import json
 import tcod.libtcodpy as libtcod
 
+from game_messages import NullMessageLog
 from io_layer.bot_metrics import BotMetricsRecorder, BotRunSummary
 from utils.resource_paths import get_resource_path
 
@@ -92,6 +101,10 @@ class SoakRunResult:
         bot_reasons: Flattened reason counts (dict)
         exception: Optional exception message if run crashed
         timestamp: ISO timestamp when run completed
+        turns_per_second: Player turns per second of run wall time
+        gc_collections: Cyclic GC collections during the run (all generations)
+        gc_pause_ms: Total time the run spent in GC pauses
+        gc_pause_max_ms: Longest single GC pause of the run
     """
     run_number: int
     run_id: str = ""
@@ -124,6 +137,10 @@ class SoakRunResult:
     final_max_hp: Optional[int] = None
     final_hp_percent: Optional[float] = None
     potions_remaining_on_death: Optional[int] = None
+    turns_per_second: float = 0.0
+    gc_collections: int = 0
+    gc_pause_ms: float = 0.0
+    gc_pause_max_ms: float = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -159,6 +176,10 @@ class SoakRunResult:
             'final_max_hp': self.final_max_hp,
             'final_hp_percent': self.final_hp_percent,
             'potions_remaining_on_death': self.potions_remaining_on_death,
+            'turns_per_second': round(self.turns_per_second, 1),
+            'gc_collections': self.gc_collections,
+            'gc_pause_ms': round(self.gc_pause_ms, 3),
+            'gc_pause_max_ms': round(self.gc_pause_max_ms, 3),
         }
     
     @staticmethod
@@ -340,6 +361,15 @@ class SoakRunResult:
                 max_turns_limit=getattr(run_metrics, 'max_turns_limit', None),
             )
             potions_remaining_on_death = potions_remaining if refined_outcome == "death" else None
+            duration_seconds = run_metrics.duration_seconds or 0.0
+            steps_taken = run_metrics.steps_taken
+            turns_per_second = 0.0
+            if (
+                isinstance(steps_taken, (int, float))
+                and isinstance(duration_seconds, (int, float))
+                and duration_seconds > 0
+            ):
+                turns_per_second = steps_taken / duration_seconds
             
             return cls(
                 run_number=run_number,
@@ -373,6 +403,7 @@ class SoakRunResult:
                 final_max_hp=final_max_hp,
                 final_hp_percent=final_hp_percent,
                 potions_remaining_on_death=potions_remaining_on_death,
+                turns_per_second=turns_per_second,
             )
         else:
             # Fallback for missing run_metrics - classify as exception
@@ -415,6 +446,12 @@ class SoakSessionResult:
         avg_floors_per_run: Average floors visited per run
         total_monsters_killed: Total monsters killed across all runs
         total_items_picked_up: Total items picked up across all runs
+        total_turns: Total player turns across all runs
+        turns_per_second: Session throughput (total turns / summed run durations)
+        simulate: Whether the session ran in render-free simulation mode
+        gc_managed: Whether the harness managed GC (memory.gc_optimizer.HarnessGC)
+        gc_pause_ms: Total GC pause time inside runs
+        gc_between_runs_ms: Time spent in full collections between runs
         persona: Bot persona used for this session
         session_timestamp: ISO timestamp when session started
     """
@@ -428,6 +465,12 @@ class SoakSessionResult:
     avg_floors_per_run: float = 0.0
     total_monsters_killed: int = 0
     total_items_picked_up: int = 0
+    total_turns: int = 0
+    turns_per_second: float = 0.0
+    simulate: bool = False
+    gc_managed: bool = False
+    gc_pause_ms: float = 0.0
+    gc_between_runs_ms: float = 0.0
     persona: str = "balanced"
     session_timestamp: str = ""
     
@@ -447,6 +490,13 @@ class SoakSessionResult:
         # Totals include all runs
         self.total_monsters_killed = sum(r.monsters_killed for r in self.runs)
         self.total_items_picked_up = sum(r.items_picked_up for r in self.runs)
+        self.total_turns = sum(r.steps_taken for r in self.runs)
+        self.gc_pause_ms = sum(r.gc_pause_ms for r in self.runs)
+        
+        # Throughput over time actually spent inside runs (excludes setup)
+        run_seconds = sum(r.duration_seconds for r in valid_runs)
+        if run_seconds > 0:
+            self.turns_per_second = sum(r.steps_taken for r in valid_runs) / run_seconds
     
     def print_summary(self) -> None:
         """Print human-readable session summary to stdout."""
@@ -454,6 +504,7 @@ class SoakSessionResult:
         print("🧪 Bot Soak Session Summary")
         print("="*60)
         print(f"   Persona: {self.persona}")
+        print(f"   Mode: {'simulation (render-free)' if self.simulate else 'rendered'}")
         print(f"   Runs: {self.total_runs}")
         print(f"   Completed: {self.completed_runs}")
         print(f"   Crashes: {self.bot_crashes}")
@@ -464,6 +515,11 @@ class SoakSessionResult:
         print(f"   Avg Floors per Run: {self.avg_floors_per_run:.1f}")
         print(f"   Total Monsters Killed: {self.total_monsters_killed}")
         print(f"   Total Items Picked Up: {self.total_items_picked_up}")
+        print(f"   Total Turns: {self.total_turns}")
+        print(f"   Turns/Second: {self.turns_per_second:.1f}")
+        print(f"   GC Pauses: {self.gc_pause_ms:.1f}ms in runs, "
+              f"{self.gc_between_runs_ms:.1f}ms between runs "
+              f"({'managed' if self.gc_managed else 'interpreter default'})")
         print("="*60)
         
         # Per-run breakdown (compact)
@@ -501,6 +557,7 @@ class SoakSessionResult:
             'bot_steps', 'bot_floors', 'bot_actions', 'bot_contexts', 'bot_reasons',
             'exception', 'timestamp',
             'final_hp', 'final_max_hp', 'final_hp_percent', 'potions_remaining_on_death',
+            'turns_per_second', 'gc_collections', 'gc_pause_ms', 'gc_pause_max_ms',
         ]
         
         with open(output_path, 'w', newline='') as csvfile:
@@ -619,6 +676,27 @@ def _initialize_libtcod_for_soak(constants: Dict[str, Any]) -> None:
     logger.info(f"Libtcod root console initialized: {ui_layout.screen_width}x{ui_layout.screen_height}")
 
 
+def _load_static_content(constants: Dict[str, Any]) -> None:
+    """Load the content registries every run reads.
+    
+    Done once before the first run so the harness can freeze them out of the
+    cyclic GC (HarnessGC.freeze_static_content).
+    
+    Args:
+        constants: Game constants (scenario_id selects the scenario registry)
+    """
+    from config.entity_registry import load_entity_config
+    from config.factories import get_entity_factory
+    from spells.spell_catalog import register_all_spells
+    
+    load_entity_config()
+    get_entity_factory()
+    register_all_spells()
+    if constants.get("scenario_id"):
+        from config.level_template_registry import get_scenario_registry
+        get_scenario_registry()
+
+
 def _create_scenario_game(constants: Dict[str, Any]):
     """Create a game from a scenario definition (for scenario-based soak).
     
@@ -657,6 +735,8 @@ def run_bot_soak(
     metrics_log_path: Optional[str] = None,
     base_seed: Optional[int] = None,
     replay_log_path: Optional[str] = None,
+    simulate: bool = False,
+    manage_gc: bool = True,
 ) -> SoakSessionResult:
     """Run multiple bot games back-to-back for soak testing.
     
@@ -697,6 +777,12 @@ def run_bot_soak(
         base_seed: Optional base RNG seed. If provided, run N uses seed = base_seed + N.
                    If None, each run generates a random seed (logged in output).
         replay_log_path: Optional base path for action replay logs.
+        simulate: If True, run render-free: no libtcod root console or per-run
+                  consoles, no frame delay, no drawing (see module docstring).
+        manage_gc: If True (default), content registries are frozen out of the
+                   cyclic GC, automatic GC is off during runs (the harness
+                   collects every few enemy phases) and a full collection
+                   runs between runs. GC pauses are recorded either way.
         
     Returns:
         SoakSessionResult with aggregate statistics
@@ -711,9 +797,11 @@ def run_bot_soak(
     )
     from game_states import GameStates
     from config.ui_layout import get_ui_layout
+    from memory.gc_optimizer import HarnessGC
     
     logger.info(f"Starting bot soak session: {runs} runs, telemetry={telemetry_enabled}, "
-                f"max_turns={max_turns}, max_floors={max_floors}, start_floor={start_floor}")
+                f"max_turns={max_turns}, max_floors={max_floors}, start_floor={start_floor}, "
+                f"simulate={simulate}, manage_gc={manage_gc}")
     
     session_start = time.time()
     session_timestamp = datetime.now().isoformat()
@@ -730,6 +818,8 @@ def run_bot_soak(
         total_runs=runs,
         persona=persona,
         session_timestamp=session_timestamp,
+        simulate=simulate,
+        gc_managed=manage_gc,
     )
     
     # Enable bot mode in constants
@@ -739,6 +829,9 @@ def run_bot_soak(
     # Mark this as bot soak mode for engine_integration to disable enemy AI
     constants["bot_soak_mode"] = True
     
+    # Render-free simulation core (read by engine_integration)
+    constants["simulation_mode"] = simulate
+    
     # Store soak harness config in constants for per-run access
     # Note: seed is set per-run in the loop below
     # For scenarios: max_floors is NOT passed because scenarios are single-floor arenas
@@ -761,7 +854,9 @@ def run_bot_soak(
     # CRITICAL: Initialize libtcod root console ONCE for the entire session
     # Without this, ConsoleRenderer.render() will crash on console_flush()
     # because no root console exists. This matches normal mode initialization.
-    _initialize_libtcod_for_soak(constants)
+    # Simulation mode never draws, so it needs no root console at all.
+    if not simulate:
+        _initialize_libtcod_for_soak(constants)
     
     # Get UI layout for console creation
     ui_layout = get_ui_layout()
@@ -776,7 +871,13 @@ def run_bot_soak(
         logger.info(f"Telemetry JSONL output: {jsonl_path}")
     
     # Import RNG config
-    from engine.rng_config import set_global_seed, generate_seed
+    from engine.rng_config import RunRNG, set_global_seed, set_run_rng, generate_seed
+    
+    # Load content registries once, then keep them out of the cyclic GC's scans
+    harness_gc = HarnessGC(manage=manage_gc)
+    harness_gc.start()
+    _load_static_content(constants)
+    harness_gc.freeze_static_content()
     
     # Run N bot games
     for run_num in range(1, runs + 1):
@@ -789,8 +890,9 @@ def run_bot_soak(
         else:
             run_seed = generate_seed()  # Random seed
         
-        # Set the global RNG seed for this run
+        # Set the global RNG seed for this run and give it its own streams
         set_global_seed(run_seed)
+        set_run_rng(RunRNG(run_seed))
         logger.info(f"Run {run_num} seed: {run_seed}")
         
         # Update soak_config with current run's seed for run_metrics
@@ -804,6 +906,7 @@ def run_bot_soak(
         # Provide recorder to downstream creation path
         constants["bot_metrics_recorder"] = bot_metrics_recorder
         
+        harness_gc.begin_run()
         try:
             # Reset global singletons for clean run
             # CRITICAL: These must be reset before each run to prevent state leakage
@@ -872,10 +975,15 @@ def run_bot_soak(
             bot_input_source.reset_bot_run_state()
             logger.debug(f"Bot input source state reset for run {run_num}")
             
-            # Create consoles (required for rendering)
-            sidebar_console = libtcod.console_new(ui_layout.sidebar_width, ui_layout.screen_height)
-            viewport_console = libtcod.console_new(ui_layout.viewport_width, ui_layout.viewport_height)
-            status_console = libtcod.console_new(ui_layout.status_panel_width, ui_layout.status_panel_height)
+            # Create consoles (required for rendering; not used in simulation mode)
+            if simulate:
+                sidebar_console = viewport_console = status_console = None
+                # Nothing draws the status panel, so skip wrapping/storing combat text
+                message_log = NullMessageLog(message_log.x, message_log.width, message_log.height)
+            else:
+                sidebar_console = libtcod.console_new(ui_layout.sidebar_width, ui_layout.screen_height)
+                viewport_console = libtcod.console_new(ui_layout.viewport_width, ui_layout.viewport_height)
+                status_console = libtcod.console_new(ui_layout.status_panel_width, ui_layout.status_panel_height)
             
             # Play the game in bot mode
             # Note: play_game_with_engine will return when the run ends (death/quit/bot_completed)
@@ -891,6 +999,7 @@ def run_bot_soak(
                 status_console,
                 constants,
             )
+            gc_stats = harness_gc.end_run()
             
             # Capture run metrics and telemetry
             run_metrics_recorder = get_run_metrics_recorder()
@@ -955,13 +1064,16 @@ def run_bot_soak(
                     bot_summary,
                     bot_decisions=decisions_data,
                     survivability=survivability_snapshot,
+                    gc_stats=gc_stats,
                 )
             
             logger.info(f"Run {run_num} completed: outcome={run_result.outcome}, "
                        f"duration={run_result.duration_seconds:.1f}s, "
-                       f"floor={run_result.deepest_floor}")
+                       f"floor={run_result.deepest_floor}, "
+                       f"turns/s={run_result.turns_per_second:.1f}")
         
         except Exception as e:
+            gc_stats = harness_gc.end_run()
             exception_msg = str(e)
             logger.error(f"Run {run_num} crashed: {exception_msg}", exc_info=True)
             bot_summary = bot_metrics_recorder.summarize()
@@ -992,7 +1104,17 @@ def run_bot_soak(
         
         # Add run result to session
         if run_result:
+            run_result.gc_collections = gc_stats['total_collections']
+            run_result.gc_pause_ms = gc_stats['total_gc_time_ms']
+            run_result.gc_pause_max_ms = gc_stats['max_gc_time_ms']
             session_result.runs.append(run_result)
+        
+        # Reclaim the run's garbage outside the timed run
+        harness_gc.collect_between_runs()
+    
+    set_run_rng(None)
+    harness_gc.stop()
+    session_result.gc_between_runs_ms = harness_gc.between_runs_ms
     
     # Compute session aggregates
     session_end = time.time()
@@ -1019,6 +1141,7 @@ def _append_run_to_jsonl(
     bot_summary: Optional[BotRunSummary] = None,
     bot_decisions: Optional[list] = None,
     survivability: Optional[dict] = None,
+    gc_stats: Optional[dict] = None,
 ) -> None:
     """Append a single run's telemetry to JSONL file.
     
@@ -1026,6 +1149,7 @@ def _append_run_to_jsonl(
         jsonl_path: Path to JSONL file
         run_metrics: RunMetrics instance
         telemetry_service: TelemetryService instance
+        gc_stats: GC pause statistics for the run (GCStats.to_dict())
     """
     try:
         # Build combined JSON object
@@ -1044,6 +1168,7 @@ def _append_run_to_jsonl(
             'bot_summary': bot_summary.to_dict() if bot_summary else None,
             'bot_decisions': bot_decisions,
             'survivability': survivability,
+            'gc': gc_stats,
             'timestamp': datetime.now().isoformat(),
         }
         
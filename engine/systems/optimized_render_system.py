@@ -9,7 +9,7 @@ import logging
 
 from .render_system import RenderSystem
 from render_functions import render_all, clear_all, draw_entity, clear_entity
-from fov_functions import recompute_fov
+from fov_functions import recompute_fov, mark_visible_as_explored
 from io_layer.console_renderer import ConsoleRenderer
 from rendering.frame_models import FrameContext
 
@@ -159,6 +159,8 @@ class OptimizedRenderSystem(RenderSystem):
                 game_state.get("fov_light_walls", True),
                 game_state.get("fov_algorithm", 12),
             )
+            # One vectorized explored |= visibility per recompute, drawn or not
+            mark_visible_as_explored(self.fov_map, game_map)
 
         if self.skip_drawing:
             # Headless/abstraction mode: respect flag resets without touching consoles.
@@ -445,7 +445,9 @@ def create_game_engine(constants, sidebar_console, viewport_console, status_cons
         colors=constants["colors"],
         priority=100,  # Render last
         use_optimizations=False,  # DISABLE optimizations for debugging
-        skip_drawing=False,  # RenderSystem handles rendering for now
+        # Simulation mode (render-free bot soak) keeps FOV/explored bookkeeping
+        # but never touches a console.
+        skip_drawing=bool(constants.get("simulation_mode", False)),
     )
     engine.register_system(render_system)
 
@@ -546,6 +548,10 @@ def play_game_with_engine(
     # Detect bot mode early (before creating ActionProcessor)
     input_mode = "bot" if constants.get("input_config", {}).get("bot_enabled") else "keyboard"
     
+    # Simulation mode (bot soak only): no root console, no frame delay, no drawing.
+    # The loop runs as fast as GameCore + systems allow.
+    simulation_mode = input_mode == "bot" and bool(constants.get("simulation_mode", False))
+    
     # Create action processor for clean action handling
     # Pass is_bot_mode to suppress spammy per-frame logs during soak testing
     action_processor = ActionProcessor(engine.state_manager, is_bot_mode=(input_mode == "bot"))
@@ -619,11 +625,13 @@ def play_game_with_engine(
     # PHASE 1 (INPUT): ✅ COMPLETE - input_source.next_action() is the primary input path
     # PHASE 2 (RENDERING): ✅ COMPLETE - renderer.render() is called each frame
     # PHASE 3+ (OPTIONAL): System cleanup (not required for functionality)
-    while not libtcod.console_is_window_closed():
+    while simulation_mode or not libtcod.console_is_window_closed():
         # Pump OS events and throttle frame rate so bot mode doesn't spin
         # in a tight loop. Keyboard input still works because the pumped
         # key/mouse objects are handed off to the input source.
-        pump_events_and_sleep(input_source)
+        # Simulation mode has no window to pump and nothing to throttle for.
+        if not simulation_mode:
+            pump_events_and_sleep(input_source)
 
         # =====================================================================
         # INPUT HANDLING (Unified)
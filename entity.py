@@ -61,8 +61,6 @@ class Entity:
     """
     
     # Type annotations for attributes
-    x: int
-    y: int
     char: str
     color: Tuple[int, int, int]
     name: str
@@ -81,6 +79,10 @@ class Entity:
     equipment: Optional['Equipment']
     equippable: Optional['Equippable']
 
+    # Spatial indexes (map_objects.spatial_index) this entity is filed in;
+    # notified whenever x or y changes
+    _spatial_indexes: Tuple[Any, ...] = ()
+
     def __init__(
         self,
         x: int,
@@ -349,6 +351,35 @@ class Entity:
             **components
         )
 
+    @property
+    def x(self) -> int:
+        """int: X coordinate on the game map."""
+        return self._x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        self._x = value
+        for index in self._spatial_indexes:
+            index.update(self)
+
+    @property
+    def y(self) -> int:
+        """int: Y coordinate on the game map."""
+        return self._y
+
+    @y.setter
+    def y(self, value: int) -> None:
+        self._y = value
+        for index in self._spatial_indexes:
+            index.update(self)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Index membership belongs to the containing EntityList, which
+        # rebuilds it on unpickle/deepcopy
+        state = self.__dict__.copy()
+        state.pop('_spatial_indexes', None)
+        return state
+
     def move(self, dx: int, dy: int) -> bool:
         """Move the entity by a given amount.
         
@@ -380,8 +411,10 @@ class Entity:
         if dx != 0 or dy != 0:
             self.moved_last_turn = True
         
-        self.x += dx
-        self.y += dy
+        self._x += dx
+        self._y += dy
+        for index in self._spatial_indexes:
+            index.update(self)
         return True  # Movement succeeded
 
     def move_towards(self, target_x: int, target_y: int, game_map: 'GameMap', entities: List['Entity']) -> None:
@@ -501,18 +534,26 @@ class Entity:
             entities: List of entities that block movement
             game_map: The game map for pathfinding (may include hazard_manager)
         """
-        # Create a FOV map using the modern numpy-based API
+        # During an enemy phase, monsters chasing the player share one
+        # Dijkstra field instead of each building their own A* graph
+        from services.navigation_service import get_navigation_service
+        navigation = get_navigation_service()
+        if navigation.covers(target, game_map):
+            step = navigation.next_step(self, entities)
+            if step is not None:
+                (x, y), path_length = step
+                if path_length < get_pathfinding_config().MAX_PATH_LENGTH:
+                    self._step_to_if_clear(x, y, entities)
+                    return
+            self.move_towards(target.x, target.y, game_map, entities)
+            return
+
         import numpy as np
+        from map_objects.tile import tile_field_array
         
-        # Initialize transparent and walkable arrays
-        transparent = np.ones((game_map.height, game_map.width), dtype=bool, order="F")
-        walkable = np.ones((game_map.height, game_map.width), dtype=bool, order="F")
-        
-        # Scan the current map each turn and set all the walls as unwalkable
-        for y1 in range(game_map.height):
-            for x1 in range(game_map.width):
-                transparent[y1, x1] = not game_map.tiles[x1][y1].block_sight
-                walkable[y1, x1] = not game_map.tiles[x1][y1].blocked
+        # Walls are unwalkable. The map stores [x, y]; this function works in
+        # [y, x], so take a transposed copy we can safely mark entities on.
+        walkable = ~tile_field_array(game_map, "blocked").T
 
         # Scan all the objects to see if there are objects that must be
         # navigated around. Check also that the object isn't self or the target
@@ -564,28 +605,31 @@ class Entity:
         if len(path) > 1 and len(path) < pathfinding_config.MAX_PATH_LENGTH:
             # Get next step (skip first element which is current position)
             x, y = path[1]
-            
-            # Validate that the destination is not occupied by a blocking entity
-            # (entities might have moved since pathfinding was calculated)
-            destination_blocked = False
-            for entity in entities:
-                if entity.blocks and entity != self and entity.x == x and entity.y == y:
-                    destination_blocked = True
-                    break
-            
-            # Only move if destination is clear
-            if not destination_blocked:
-                # Use move() to respect status effects like entangle
-                dx = x - self.x
-                dy = y - self.y
-                self.move(dx, dy)  # May return False if blocked by status effect
-            # If blocked, don't move this turn (path will be recalculated next turn)
+            self._step_to_if_clear(x, y, entities)
         else:
             # Keep the old move function as a backup so that if there are no
             # paths (for example another monster blocks a corridor) it will
             # still try to move towards the player (closer to the corridor opening)
             self.move_towards(target.x, target.y, game_map, entities)
 
+    def _step_to_if_clear(self, x: int, y: int, entities: List['Entity']) -> None:
+        """Take one pathfinding step to (x, y) unless a blocking entity is there.
+
+        Args:
+            x: Destination x (adjacent to this entity)
+            y: Destination y (adjacent to this entity)
+            entities: List of entities that block movement
+        """
+        # Validate that the destination is not occupied by a blocking entity
+        # (entities might have moved since pathfinding was calculated)
+        blocker = get_blocking_entities_at_location(entities, x, y)
+        if blocker is not None and blocker != self:
+            # If blocked, don't move this turn (path will be recalculated next turn)
+            return
+        
+        # Use move() to respect status effects like entangle
+        self.move(x - self.x, y - self.y)  # May return False if blocked by status effect
+
     def distance_to(self, other: 'Entity') -> float:
         """Calculate the Euclidean distance to another entity.
 
@@ -818,8 +862,5 @@ def get_blocking_entities_at_location(entities: List[Entity], destination_x: int
     Returns:
         The blocking entity at the location, or None if no blocking entity found
     """
-    for entity in entities:
-        if entity.blocks and entity.x == destination_x and entity.y == destination_y:
-            return entity
-
-    return None
+    from map_objects.spatial_index import blocking_entity_at
+    return blocking_entity_at(entities, destination_x, destination_y)
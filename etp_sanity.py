@@ -10,6 +10,7 @@ Usage:
     python3 etp_sanity.py --verbose          # Show detailed per-monster ETP
     python3 etp_sanity.py --depth 3          # Test single depth only
     python3 etp_sanity.py --runs 5           # Multiple runs per band for statistics
+    python3 etp_sanity.py --plan-only        # Don't instantiate spawns (fast sampling)
 """
 
 import argparse
@@ -185,11 +186,13 @@ def analyze_room_etp(
     )
 
 
-def generate_test_level(depth: int) -> Tuple[Any, List[Any], List[Any]]:
+def generate_test_level(depth: int, plan_only: bool = False) -> Tuple[Any, List[Any], List[Any]]:
     """Generate a test level at the specified depth.
     
     Args:
         depth: Dungeon level to generate
+        plan_only: Place spawns as PlannedEntity stand-ins instead of
+            instantiating them (same positions and types, much faster)
         
     Returns:
         Tuple of (game_map, entities, rooms)
@@ -225,23 +228,25 @@ def generate_test_level(depth: int) -> Tuple[Any, List[Any], List[Any]]:
         map_height=45,
         player=player,
         entities=entities,
+        plan_only=plan_only,
     )
     
     return game_map, entities, game_map.rooms if hasattr(game_map, 'rooms') else []
 
 
-def analyze_level_etp(depth: int, verbose: bool = False) -> LevelETPResult:
+def analyze_level_etp(depth: int, verbose: bool = False, plan_only: bool = False) -> LevelETPResult:
     """Generate and analyze a level for ETP compliance.
     
     Args:
         depth: Dungeon depth to analyze
         verbose: Whether to print detailed info
+        plan_only: Generate the level without instantiating spawns
         
     Returns:
         LevelETPResult with full analysis
     """
     # Generate the level
-    game_map, entities, _ = generate_test_level(depth)
+    game_map, entities, _ = generate_test_level(depth, plan_only=plan_only)
     
     # Get band info
     band = get_band_for_depth(depth)
@@ -356,6 +361,7 @@ def run_sanity_check(
     strict: bool = False,
     verbose: bool = False,
     runs_per_band: int = 1,
+    plan_only: bool = False,
 ) -> bool:
     """Run ETP sanity check across bands.
     
@@ -364,6 +370,7 @@ def run_sanity_check(
         strict: Fail if any room exceeds budget
         verbose: Show detailed output
         runs_per_band: Number of test runs per band
+        plan_only: Generate levels without instantiating spawns
         
     Returns:
         True if all checks pass, False otherwise
@@ -390,7 +397,7 @@ def run_sanity_check(
     
     for depth in depths:
         for run in range(runs_per_band):
-            result = analyze_level_etp(depth, verbose)
+            result = analyze_level_etp(depth, verbose, plan_only=plan_only)
             all_results.append(result)
             
             # Print room results
@@ -519,6 +526,10 @@ def main():
         '--test-levels', action='store_true',
         help='Test ETP test levels 81-85 specifically'
     )
+    parser.add_argument(
+        '--plan-only', action='store_true',
+        help='Place spawns without instantiating them (same layout, much faster)'
+    )
     
     args = parser.parse_args()
     
@@ -535,6 +546,7 @@ def main():
         strict=args.strict,
         verbose=args.verbose,
         runs_per_band=args.runs,
+        plan_only=args.plan_only,
     )
     
     sys.exit(0 if success else 1)
@@ -13,33 +13,38 @@ Key Components:
 - EventPattern: Complex event patterns and chains
 """
 
-from .core import Event, EventPriority, EventResult, EventContext, SimpleEvent, create_event
-from .bus import EventBus, get_event_bus, initialize_event_bus, shutdown_event_bus
-from .dispatcher import (
-    EventDispatcher, AsyncEventDispatcher, SynchronousDispatcher, 
-    QueuedDispatcher, ThreadedDispatcher, PriorityDispatcher,
-    DispatchStrategy, create_dispatcher, create_async_dispatcher
-)
-from .listener import (
-    EventListener, EventHandler, event_handler, SimpleEventListener,
-    CallableEventListener, EventListenerRegistry
-)
-from .game_events import (
-    GameEvent, GameEventType, CombatEvent, MovementEvent, InventoryEvent, LevelEvent,
-    PlayerEvent, EntityEvent, SystemEvent, UIEvent,
-    create_combat_event, create_movement_event, create_inventory_event,
-    create_player_event, create_system_event
-)
-from .patterns import (
-    EventChain, ConditionalEvent, DelayedEvent, RecurringEvent,
-    EventSequence, EventGroup, EventPattern, PatternState,
-    create_event_chain, create_delayed_event, create_recurring_event,
-    create_conditional_event
-)
-from .exceptions import (
-    EventError, EventDispatchError, EventListenerError, EventRegistrationError,
-    EventValidationError, EventTimeoutError, EventCancellationError
-)
+from utils.lazy_exports import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    '.core': [
+        'Event', 'EventPriority', 'EventResult', 'EventContext', 'SimpleEvent', 'create_event',
+    ],
+    '.bus': ['EventBus', 'get_event_bus', 'initialize_event_bus', 'shutdown_event_bus'],
+    '.dispatcher': [
+        'EventDispatcher', 'AsyncEventDispatcher', 'SynchronousDispatcher', 'QueuedDispatcher',
+        'ThreadedDispatcher', 'PriorityDispatcher', 'DispatchStrategy', 'create_dispatcher',
+        'create_async_dispatcher',
+    ],
+    '.listener': [
+        'EventListener', 'EventHandler', 'event_handler', 'SimpleEventListener',
+        'CallableEventListener', 'EventListenerRegistry',
+    ],
+    '.game_events': [
+        'GameEvent', 'GameEventType', 'CombatEvent', 'MovementEvent', 'InventoryEvent',
+        'LevelEvent', 'PlayerEvent', 'EntityEvent', 'SystemEvent', 'UIEvent',
+        'create_combat_event', 'create_movement_event', 'create_inventory_event',
+        'create_player_event', 'create_system_event',
+    ],
+    '.patterns': [
+        'EventChain', 'ConditionalEvent', 'DelayedEvent', 'RecurringEvent', 'EventSequence',
+        'EventGroup', 'EventPattern', 'PatternState', 'create_event_chain',
+        'create_delayed_event', 'create_recurring_event', 'create_conditional_event',
+    ],
+    '.exceptions': [
+        'EventError', 'EventDispatchError', 'EventListenerError', 'EventRegistrationError',
+        'EventValidationError', 'EventTimeoutError', 'EventCancellationError',
+    ],
+})
 
 __all__ = [
     # Core
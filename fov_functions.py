@@ -35,22 +35,68 @@ SEE ALSO:
 import numpy as np
 import tcod.map
 
+from map_objects.tile import tile_field_array
+
 
 class ModernFOVMap:
     """Compatibility wrapper for modern tcod FOV using numpy arrays.
     
     This class provides a backward-compatible interface that mimics the old
     tcod.map.Map API while using the modern numpy-based FOV calculations.
+    
+    When built from a GameMap (see initialize_fov) it reads transparency
+    straight from the map's live ``block_sight`` array, so opened doors and
+    revealed secret doors are seen without rebuilding the FOV map. A compute
+    is skipped when the viewer, parameters and every sight-blocking cell in
+    radius are unchanged since the last one.
+    
+    Attributes:
+        visibility (np.ndarray): (width, height) bool array from the last compute
+        game_map (GameMap): Map whose tiles supply transparency, or None
+        computes (int): Number of FOV computations actually run
+        skipped (int): Number of compute_fov calls answered from the last result
     """
     
-    def __init__(self, transparency_array):
+    def __init__(self, transparency_array, game_map=None):
         """Initialize with a transparency array.
         
         Args:
             transparency_array (np.ndarray): 2D boolean array where True = transparent
+            game_map (GameMap, optional): Map to read live transparency from
         """
-        self.transparency = transparency_array
+        self._transparency = transparency_array
+        self.game_map = game_map
         self.visibility = None
+        self._last_key = None
+        self._last_window = None
+        self.computes = 0
+        self.skipped = 0
+    
+    @property
+    def transparency(self):
+        """np.ndarray: (width, height) bool array, True where sight passes."""
+        block_sight = self._live_block_sight()
+        if block_sight is not None:
+            return ~block_sight
+        return self._transparency
+    
+    @transparency.setter
+    def transparency(self, value):
+        # An explicit array replaces the link to the map
+        self._transparency = value
+        self.game_map = None
+        self.invalidate()
+    
+    def invalidate(self):
+        """Force the next compute_fov to run even if nothing seems to have changed."""
+        self._last_key = None
+        self._last_window = None
+    
+    def _live_block_sight(self):
+        block_sight = getattr(self.game_map, 'block_sight', None)
+        if isinstance(block_sight, np.ndarray):
+            return block_sight
+        return None
         
     def compute_fov(self, x, y, radius, light_walls=True, algorithm=12):
         """Compute FOV and store the result internally.
@@ -62,13 +108,34 @@ class ModernFOVMap:
             light_walls (bool): Whether walls are lit
             algorithm (int): FOV algorithm to use
         """
+        block_sight = self._live_block_sight()
+        source = block_sight if block_sight is not None else self._transparency
+        
+        # Only cells within radius can affect the result (radius 0 = unlimited)
+        if radius and radius > 0:
+            window = source[max(0, x - radius):x + radius + 1,
+                            max(0, y - radius):y + radius + 1]
+        else:
+            window = source
+        key = (x, y, radius, light_walls, algorithm, source.shape)
+        
+        if (self.visibility is not None
+                and key == self._last_key
+                and np.array_equal(window, self._last_window)):
+            self.skipped += 1
+            return
+        
+        transparency = ~block_sight if block_sight is not None else self._transparency
         self.visibility = tcod.map.compute_fov(
-            self.transparency,
+            transparency,
             pov=(x, y),
             radius=radius,
             light_walls=light_walls,
             algorithm=algorithm
         )
+        self._last_key = key
+        self._last_window = window.copy()
+        self.computes += 1
         
     def is_in_fov(self, x, y):
         """Check if a position is visible (compatibility method).
@@ -89,6 +156,8 @@ def initialize_fov(game_map):
     """Initialize a FOV map from a game map for FOV calculations.
 
     Creates a modern FOV map using numpy arrays with backward compatibility.
+    Maps that expose a ``block_sight`` array are linked rather than copied, so
+    later tile changes need no re-initialization.
 
     Args:
         game_map (GameMap): The game map to create FOV data from
@@ -98,12 +167,10 @@ def initialize_fov(game_map):
     """
     # Create transparency array (True = transparent, False = blocks sight)
     # Use (width, height) to match game_map.tiles[x][y] coordinate system
-    transparency = np.zeros((game_map.width, game_map.height), dtype=bool, order="F")
-    
-    for y in range(game_map.height):
-        for x in range(game_map.width):
-            transparency[x, y] = not game_map.tiles[x][y].block_sight
+    transparency = np.asfortranarray(~tile_field_array(game_map, "block_sight"))
 
+    if isinstance(getattr(game_map, 'block_sight', None), np.ndarray):
+        return ModernFOVMap(transparency, game_map=game_map)
     return ModernFOVMap(transparency)
 
 
@@ -121,6 +188,45 @@ def recompute_fov(fov_map, x, y, radius, light_walls=True, algorithm=12):
     fov_map.compute_fov(x, y, radius, light_walls, algorithm)
 
 
+def mark_visible_as_explored(fov_map, game_map):
+    """Mark every currently visible tile as explored.
+
+    The render system calls this once after every FOV recompute, whether or
+    not it draws, so exploration state is the same in rendered and
+    simulation-mode runs. Drawing still marks tiles it lights, which is a
+    no-op by then.
+
+    Args:
+        fov_map (ModernFOVMap): FOV map with a computed visibility array
+        game_map (GameMap): Map whose tiles should be updated
+
+    Returns:
+        int: Number of tiles newly marked explored
+    """
+    visibility = getattr(fov_map, 'visibility', None)
+    if not isinstance(visibility, np.ndarray):
+        return 0
+
+    explored = getattr(game_map, 'explored', None)
+    if isinstance(explored, np.ndarray):
+        # GameMap keeps explored_count in step when marking goes through it
+        if isinstance(getattr(game_map, 'explored_count', None), int):
+            return game_map.mark_explored(visibility)
+        newly_explored = int(np.count_nonzero(visibility & ~explored))
+        explored |= visibility
+        return newly_explored
+
+    newly_explored = 0
+    tiles = game_map.tiles
+    xs, ys = np.nonzero(visibility)
+    for x, y in zip(xs.tolist(), ys.tolist()):
+        tile = tiles[x][y]
+        if not tile.explored:
+            tile.explored = True
+            newly_explored += 1
+    return newly_explored
+
+
 def is_visible(fov_array, x, y):
     """Check if a position is visible in the field of view.
     
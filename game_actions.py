@@ -22,9 +22,9 @@ def _get_metrics_collector():
         return get_active_metrics_collector()
     except Exception:
         return None
-from logger_config import get_logger
+from logger_config import LazyLogger, get_lazy_logger, get_logger
 
-logger = get_logger(__name__)
+logger = LazyLogger(get_logger(__name__))
 
 
 class ActionProcessor:
@@ -147,8 +147,7 @@ class ActionProcessor:
             action: Dictionary of keyboard actions
             mouse_action: Dictionary of mouse actions
         """
-        import logging
-        logger = logging.getLogger(__name__)
+        logger = get_lazy_logger(__name__)
         if mouse_action:
             logger.warning(f"PROCESS_ACTIONS: mouse_action = {mouse_action}")
         current_state = self.state_manager.state.current_state
@@ -175,7 +174,7 @@ class ActionProcessor:
                 # DIAGNOSTIC: Log AutoExplore state check
                 if action or mouse_action:
                     logger.info(
-                        f"🔍 DIAGNOSTIC: ActionProcessor.process_actions: "
+                        lambda: f"🔍 DIAGNOSTIC: ActionProcessor.process_actions: "
                         f"pos={player_pos}, action={action}, mouse_action={mouse_action}, "
                         f"auto_explore_exists={auto_explore is not None}, "
                         f"auto_explore_active={auto_explore_active}"
@@ -191,7 +190,7 @@ class ActionProcessor:
                         # Fall through to process pickup action below
                     else:
                         # Process auto-explore movement automatically
-                        logger.debug(f"🔍 DIAGNOSTIC: ActionProcessor: Processing AutoExplore turn at {player_pos}")
+                        logger.debug(lambda: f"🔍 DIAGNOSTIC: ActionProcessor: Processing AutoExplore turn at {player_pos}")
                         self._process_auto_explore_turn()
                         
                         # Check if any key was pressed to cancel
@@ -350,7 +349,7 @@ class ActionProcessor:
         player = self.state_manager.state.player
         player_pos = (player.x, player.y) if player else None
         logger.info(
-            f"🔍 DIAGNOSTIC: ActionProcessor._handle_start_auto_explore called at pos={player_pos}"
+            lambda: f"🔍 DIAGNOSTIC: ActionProcessor._handle_start_auto_explore called at pos={player_pos}"
         )
         if not player:
             logger.error("No player found for auto-explore")
@@ -393,7 +392,7 @@ class ActionProcessor:
                 MB.system("You begin exploring the dungeon")
             )
         
-        logger.info(f"Auto-explore start attempt: quote='{quote}', active={is_active_after_start}")
+        logger.info(lambda: f"Auto-explore start attempt: quote='{quote}', active={is_active_after_start}")
     
     def _handle_bot_abort_run(self, abort_reason) -> None:
         """Handle bot run abort signal (Phase 1.6: Bot Soak Harness).
@@ -415,7 +414,7 @@ class ActionProcessor:
         """
         # Handle both string reasons and legacy True value
         reason_str = abort_reason if isinstance(abort_reason, str) else "unspecified"
-        logger.info(f"Bot abort run signal received - reason: {reason_str}")
+        logger.info(lambda: f"Bot abort run signal received - reason: {reason_str}")
         
         # Set marker so play_game_with_engine knows to exit with bot_completed outcome
         self.state_manager.set_extra_data("bot_abort_run", True)
@@ -494,7 +493,7 @@ class ActionProcessor:
             return
         
         player_pos = (player.x, player.y)
-        logger.debug(f"ActionProcessor._process_auto_explore_turn: processing at {player_pos}, active={auto_explore.is_active()}")
+        logger.debug(lambda: f"ActionProcessor._process_auto_explore_turn: processing at {player_pos}, active={auto_explore.is_active()}")
         
         # Get next action from auto-explore
         action = auto_explore.get_next_action(
@@ -506,7 +505,7 @@ class ActionProcessor:
         if action is None:
             # Auto-explore stopped
             reason = auto_explore.stop_reason or "Unknown reason"
-            logger.debug(f"ActionProcessor._process_auto_explore_turn: auto_explore stopped at {player_pos}, reason='{reason}'")
+            logger.debug(lambda: f"ActionProcessor._process_auto_explore_turn: auto_explore stopped at {player_pos}, reason='{reason}'")
             self.state_manager.state.message_log.add_message(
                 MB.system(f"Auto-explore stopped: {reason}")
             )
@@ -516,7 +515,7 @@ class ActionProcessor:
         dx = action.get('dx', 0)
         dy = action.get('dy', 0)
         
-        logger.debug(f"ActionProcessor._process_auto_explore_turn: moving from {player_pos} by ({dx},{dy})")
+        logger.debug(lambda: f"ActionProcessor._process_auto_explore_turn: moving from {player_pos} by ({dx},{dy})")
         
         if dx != 0 or dy != 0:
             # Use the normal movement handler
@@ -704,7 +703,7 @@ class ActionProcessor:
             if transition_service.has_pending_transition():
                 request = transition_service.consume_transition()
                 if request and request.transition_type == "next_floor":
-                    logger.info(f"=== PROCESSING TRANSITION REQUEST: {request.cause} ===")
+                    logger.info(lambda: f"=== PROCESSING TRANSITION REQUEST: {request.cause} ===")
                     
                     # Execute canonical level transition
                     message_log.add_message(MB.system(f"You descend to the next level..."))
@@ -885,12 +884,12 @@ class ActionProcessor:
                 # Phase 21: Invisibility grants surprise (handled in attack_d20, but flag for VFX)
                 if attacker_was_invisible:
                     is_surprise_attack = True
-                    logger.info(f"[INVIS ATTACK] {attacker.name} strikes {target.name} from invisibility!")
+                    logger.info(lambda: f"[INVIS ATTACK] {attacker.name} strikes {target.name} from invisibility!")
                     # Note: Metrics now tracked in attack_d20() for canonical convergence
                 # Phase 9: Unaware monster = surprise attack  
                 elif not is_monster_aware(target):
                     is_surprise_attack = True
-                    logger.info(f"[SURPRISE ATTACK] {attacker.name} strikes {target.name} from the shadows!")
+                    logger.info(lambda: f"[SURPRISE ATTACK] {attacker.name} strikes {target.name} from the shadows!")
                     if collector:
                         collector.record_surprise_attack(attacker, target)
         
@@ -924,7 +923,7 @@ class ActionProcessor:
                 target_ai = target.get_component_optional(ComponentType.AI)
                 if target_ai and not is_monster_aware(target):
                     set_monster_aware(target)
-                    logger.debug(f"[AWARENESS] {target.name} became aware (attack missed)")
+                    logger.debug(lambda: f"[AWARENESS] {target.name} became aware (attack missed)")
             
             # IMPORTANT: Momentum still builds on miss (counts as "attack action")
             # This ensures the speed system isn't penalized by misses
@@ -1091,7 +1090,7 @@ class ActionProcessor:
                 miss_msg = MB.combat_miss(f"{attacker.name.capitalize()} misses {target.name}!")
         
         self.state_manager.state.message_log.add_message(miss_msg)
-        logger.debug(f"Attack miss: {attacker.name} -> {target.name}")
+        logger.debug(lambda: f"Attack miss: {attacker.name} -> {target.name}")
     
     def _show_momentum_status(self, speed_tracker) -> None:
         """Show momentum building status in combat log.
@@ -1196,7 +1195,7 @@ class ActionProcessor:
             if run_metrics:
                 # Store metrics on game state for death screen display and telemetry
                 self.state_manager.state.run_metrics = run_metrics
-                logger.info(f"Run metrics finalized on death: {run_metrics.run_id}")
+                logger.info(lambda: f"Run metrics finalized on death: {run_metrics.run_id}")
                 
                 # Log bot results summary if bot mode is enabled
                 if self.constants.get("input_config", {}).get("bot_enabled", False):
@@ -1239,7 +1238,7 @@ class ActionProcessor:
             pending_ending = self.state_manager.get_extra_data("pending_ending")
             if pending_ending and hasattr(dead_entity, 'is_boss') and dead_entity.is_boss:
                 # Boss defeated! Trigger the ending screen
-                logger.info(f"=== BOSS DEFEATED: Triggering ending {pending_ending} ===")
+                logger.info(lambda: f"=== BOSS DEFEATED: Triggering ending {pending_ending} ===")
                 print(f">>> BOSS DEFEATED: {dead_entity.name}, triggering ending '{pending_ending}'")
 
                 # Store that we should show ending screen next frame
@@ -1342,7 +1341,7 @@ class ActionProcessor:
                 # Store the NPC we're talking to
                 self.state_manager.state.current_dialogue_npc = entity
                 
-                logger.info(f"Started conversation with {entity.name} at dungeon level {dungeon_level}")
+                logger.info(lambda: f"Started conversation with {entity.name} at dungeon level {dungeon_level}")
                 return  # Don't consume turn for dialogue
         
         # SECOND: Use PickupService for item pickup (REFACTORED - single source of truth)
@@ -1574,8 +1573,7 @@ class ActionProcessor:
         Args:
             inventory_index: Index of item in inventory
         """
-        import logging
-        logger = logging.getLogger(__name__)
+        logger = get_lazy_logger(__name__)
         
         current_state = self.state_manager.state.current_state
         player = self.state_manager.state.player
@@ -1990,7 +1988,7 @@ class ActionProcessor:
         
         current_state = self.state_manager.state.current_state
         if current_state != GameStates.PLAYERS_TURN:
-            logger.debug(f"_handle_stairs: Wrong state ({current_state}), returning")
+            logger.debug(lambda: f"_handle_stairs: Wrong state ({current_state}), returning")
             return
         
         player = self.state_manager.state.player
@@ -2007,7 +2005,7 @@ class ActionProcessor:
         if speed_tracker:
             speed_tracker.reset()
         
-        logger.info(f"_handle_stairs: Player at ({player.x}, {player.y}), checking for stairs")
+        logger.info(lambda: f"_handle_stairs: Player at ({player.x}, {player.y}), checking for stairs")
         
         # Check if player is on stairs
         stairs_found = False
@@ -2022,7 +2020,7 @@ class ActionProcessor:
                 is_going_down = target_level > game_map.dungeon_level
                 is_going_up = target_level < game_map.dungeon_level
                 
-                logger.info(f"=== TAKING STAIRS: Level {game_map.dungeon_level} → {target_level} ===")
+                logger.info(lambda: f"=== TAKING STAIRS: Level {game_map.dungeon_level} → {target_level} ===")
                 
                 # Check stairs configuration
                 from config.level_template_registry import get_level_template_registry
@@ -2064,14 +2062,14 @@ class ActionProcessor:
                 telemetry_service = get_telemetry_service()
                 if telemetry_service.enabled:
                     telemetry_service.end_floor()
-                    logger.info(f"Telemetry ended for floor {game_map.dungeon_level}")
+                    logger.info(lambda: f"Telemetry ended for floor {game_map.dungeon_level}")
                 
                 # Save current floor state before leaving
                 from services.floor_state_manager import get_floor_state_manager
                 fsm = get_floor_state_manager()
                 fsm.save_floor_state(game_map.dungeon_level, entities, game_map, 
                                     stairs_entry=(player.x, player.y))
-                logger.info(f"Saved floor {game_map.dungeon_level} state")
+                logger.info(lambda: f"Saved floor {game_map.dungeon_level} state")
                 
                 # Generate next floor (or load previous if going up)
                 if is_going_up:
@@ -2080,7 +2078,7 @@ class ActionProcessor:
                     if saved_floor:
                         message = MB.info(f"You return to level {target_level}...")
                         message_log.add_message(message)
-                        logger.info(f"Returning to previously visited level {target_level}")
+                        logger.info(lambda: f"Returning to previously visited level {target_level}")
                     else:
                         message = MB.info(f"You return to level {target_level}...")
                         message_log.add_message(message)
@@ -2089,22 +2087,22 @@ class ActionProcessor:
                 from services.mural_manager import get_mural_manager
                 mural_mgr = get_mural_manager()
                 mural_mgr.set_current_floor(game_map.dungeon_level)
-                logger.debug(f"Mural manager updated for floor {game_map.dungeon_level}")
+                logger.debug(lambda: f"Mural manager updated for floor {game_map.dungeon_level}")
                 
                 # Generate next floor
                 new_entities = game_map.next_floor(player, message_log, self.constants)
                 self.state_manager.update_state(entities=new_entities)
-                logger.info(f"Floor generated: {len(new_entities)} entities")
+                logger.info(lambda: f"Floor generated: {len(new_entities)} entities")
                 
                 # METRICS: Record floor reached for soak stats
                 if hasattr(player, 'statistics') and player.statistics:
                     player.statistics.record_level_reached(target_level)
-                    logger.debug(f"Recorded floor {target_level} reached (deepest: {player.statistics.deepest_level})")
+                    logger.debug(lambda: f"Recorded floor {target_level} reached (deepest: {player.statistics.deepest_level})")
                 
                 # Initialize new FOV map for the new level
                 from fov_functions import initialize_fov
                 new_fov_map = initialize_fov(game_map)
-                logger.info(f"FOV map initialized: {new_fov_map is not None}")
+                logger.info(lambda: f"FOV map initialized: {new_fov_map is not None}")
                 
                 self.state_manager.update_state(fov_map=new_fov_map)
                 self.state_manager.request_fov_recompute()
@@ -2118,11 +2116,11 @@ class ActionProcessor:
                     old_dims = (camera.map_width, camera.map_height)
                     camera.map_width = game_map.width
                     camera.map_height = game_map.height
-                    logger.info(f"Camera map dimensions updated: {old_dims} → ({camera.map_width}, {camera.map_height})")
+                    logger.info(lambda: f"Camera map dimensions updated: {old_dims} → ({camera.map_width}, {camera.map_height})")
                     
                     # Now center on player
                     camera.update(player.x, player.y)
-                    logger.info(f"Camera centered on player at ({player.x}, {player.y}), camera at ({camera.x}, {camera.y})")
+                    logger.info(lambda: f"Camera centered on player at ({player.x}, {player.y}), camera at ({camera.x}, {camera.y})")
                 else:
                     logger.warning("Camera not found! This may cause rendering issues.")
                 
@@ -2391,8 +2389,7 @@ class ActionProcessor:
         Args:
             click_pos: Tuple of (screen_x, screen_y) click coordinates
         """
-        import logging
-        logger = logging.getLogger(__name__)
+        logger = get_lazy_logger(__name__)
         logger.warning(f"_handle_sidebar_click called with {click_pos}")
         
         from ui.sidebar_interaction import handle_sidebar_click
@@ -2484,8 +2481,7 @@ class ActionProcessor:
         Args:
             click_pos: Tuple of (screen_x, screen_y) click coordinates
         """
-        import logging
-        logger = logging.getLogger(__name__)
+        logger = get_lazy_logger(__name__)
         logger.warning(f"_handle_sidebar_right_click called with {click_pos}")
         
         from ui.sidebar_interaction import handle_sidebar_click
@@ -2747,7 +2743,7 @@ class ActionProcessor:
                 game_map = self.state_manager.state.game_map
                 message_log = self.state_manager.state.message_log
                 entities = self.state_manager.state.entities
-                logger = __import__('logging').getLogger(__name__)
+                logger = get_lazy_logger(__name__)
                 logger.warning(f"DEBUG: Portal targeting - entities list id: {id(entities)}, state_manager.state.entities id: {id(self.state_manager.state.entities)}")
                 
                 # Check if portal placer needs entrance portal
@@ -2918,7 +2914,7 @@ class ActionProcessor:
                     auto_explore = player.get_component_optional(ComponentType.AUTO_EXPLORE)
                     if auto_explore and auto_explore.is_active():
                         auto_explore.stop(result.auto_explore_stop_reason)
-                        logger.info(f"AutoExplore stopped due to interaction: {result.auto_explore_stop_reason}")
+                        logger.info(lambda: f"AutoExplore stopped due to interaction: {result.auto_explore_stop_reason}")
                 
                 # Show message
                 if result.message:
@@ -5,6 +5,7 @@ Provides classes for individual messages and the scrolling message log.
 """
 
 import textwrap
+from collections import deque
 
 
 class Message:
@@ -37,20 +38,70 @@ class Message:
 
 
 class MessageLog:
+    """Scrolling message log shown in the status panel.
+
+    Messages are kept unwrapped in a ring buffer and only wrapped to
+    ``width`` when ``messages`` is read, so turns that add many messages
+    between renders pay for wrapping once.
+
+    Attributes:
+        x (int): Left edge of the log in the status panel
+        width (int): Wrap width in characters
+        height (int): Number of visible lines
+        message_count (int): Total messages added over the log's lifetime
+    """
+
     def __init__(self, x, width, height):
-        self.messages = []
         self.x = x
         self.width = width
         self.height = height
+        self.message_count = 0
+        # Every stored message wraps to at least one line, so the newest
+        # ``height`` messages always cover the visible lines
+        self._entries = deque(maxlen=max(height, 0))
+        self._lines = None
+        self._lines_width = None
 
     def add_message(self, message):
-        # Split the message if necessary, among multiple lines
-        new_msg_lines = textwrap.wrap(message.text, self.width)
+        self.message_count += 1
+        # Blank text wraps to no lines; storing it would evict a visible one
+        if not message.text or message.text.isspace():
+            return
+        self._entries.append(message)
+        self._lines = None
+
+    @property
+    def messages(self):
+        """list: The visible lines, as wrapped Message objects (oldest first)."""
+        if self._lines is None or self._lines_width != self.width:
+            lines = deque(maxlen=max(self.height, 0))
+            for message in self._entries:
+                # Split the message if necessary, among multiple lines
+                for line in textwrap.wrap(message.text, self.width):
+                    lines.append(Message(line, message.color))
+            self._lines = list(lines)
+            self._lines_width = self.width
+        return self._lines
+
+
+class NullMessageLog(MessageLog):
+    """Counting-only message log for headless runs.
 
-        for line in new_msg_lines:
-            # If the buffer is full, remove the first line to make room for the new one
-            if len(self.messages) == self.height:
-                del self.messages[0]
+    Drops every message without storing or wrapping it; only
+    ``message_count`` is kept. Install it where nothing renders the log,
+    e.g. the scenario harness and soak simulation mode.
+    """
+
+    def __init__(self, x, width, height):
+        # Geometry is kept for callers that read it; there is no buffer
+        self.x = x
+        self.width = width
+        self.height = height
+        self.message_count = 0
+
+    def add_message(self, message):
+        self.message_count += 1
 
-            # Add the new line as a Message object, with the text and the color
-            self.messages.append(Message(line, message.color))
+    @property
+    def messages(self):
+        return []
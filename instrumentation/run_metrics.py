@@ -21,6 +21,10 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, Literal
 
+import numpy as np
+
+from map_objects.tile import tile_field_array
+
 logger = logging.getLogger(__name__)
 
 
@@ -271,17 +275,16 @@ class RunMetricsRecorder:
         if not game_map or not hasattr(game_map, 'tiles'):
             return 0
         
-        count = 0
+        # GameMap keeps a running total; only ad-hoc maps need counting
+        explored_count = getattr(game_map, 'explored_count', None)
+        if isinstance(explored_count, int):
+            return explored_count
+        
         try:
-            for x in range(game_map.width):
-                for y in range(game_map.height):
-                    if game_map.tiles[x][y].explored:
-                        count += 1
+            return int(np.count_nonzero(tile_field_array(game_map, "explored")))
         except (AttributeError, IndexError) as e:
             logger.warning(f"Failed to count explored tiles: {e}")
             return 0
-        
-        return count
 
 
 # Global singleton instance
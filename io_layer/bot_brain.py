@@ -6,20 +6,21 @@ Phase 2.0 scope: EXPLORE + simple COMBAT + simple LOOT behavior.
 Supports bot personas for different playstyles (balanced, cautious, aggressive, greedy, speedrunner).
 """
 
-import logging
 from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from io_layer.bot_metrics import BotMetricsRecorder
 
 from game_states import GameStates
 from components.component_registry import ComponentType
+from map_objects.component_index import entities_with
 from fov_functions import map_is_in_fov
 from components.faction import are_factions_hostile
+from logger_config import get_lazy_logger
 
-logger = logging.getLogger(__name__)
+logger = get_lazy_logger(__name__)
 
 
 class LogLevel(Enum):
@@ -565,7 +566,7 @@ class BotBrain:
                 # This can happen legitimately if all visible enemies were dropped due to being stuck
                 if len(engageable_enemies) == 0 and len(visible_enemies) > 0:
                     # All enemies were filtered out - proceed directly to stair descent
-                    self._debug(f"All {len(visible_enemies)} visible enemies were dropped, proceeding to stairs")
+                    self._debug(lambda: f"All {len(visible_enemies)} visible enemies were dropped, proceeding to stairs")
                     # Call floor complete with empty enemy list to force stair descent
                     return self._handle_floor_complete(player, entities, game_map, [])
                 else:
@@ -600,7 +601,7 @@ class BotBrain:
             
             if adjacent_enemy:
                 # Adjacency overrides all drop flags - we must fight when toe-to-toe
-                self._debug(f"Adjacent enemy detected at ({adjacent_enemy.x}, {adjacent_enemy.y}), forcing COMBAT (overriding drop flags)")
+                self._debug(lambda: f"Adjacent enemy detected at ({adjacent_enemy.x}, {adjacent_enemy.y}), forcing COMBAT (overriding drop flags)")
                 self.state = BotState.COMBAT
                 self.current_target = adjacent_enemy
                 # Clear all drop flags - adjacency means we must engage
@@ -633,7 +634,7 @@ class BotBrain:
                     
                     # Persona: avoid_combat skips non-adjacent enemies entirely
                     if self.persona.avoid_combat and manhattan_dist > 1:
-                        self._debug(f"Persona '{self.persona.name}' avoiding combat with enemy at distance {manhattan_dist}")
+                        self._debug(lambda: f"Persona '{self.persona.name}' avoiding combat with enemy at distance {manhattan_dist}")
                         # Fall through to EXPLORE handling below
                         nearest_enemy = None
                     elif manhattan_dist <= self.persona.combat_engagement_distance:
@@ -659,7 +660,7 @@ class BotBrain:
                         else:
                             # Different target or flags not set - can enter COMBAT
                             if self.state != BotState.COMBAT or self.current_target != nearest_enemy:
-                                self._debug(f"Entering COMBAT with enemy at ({nearest_enemy.x}, {nearest_enemy.y}), distance {manhattan_dist}")
+                                self._debug(lambda: f"Entering COMBAT with enemy at ({nearest_enemy.x}, {nearest_enemy.y}), distance {manhattan_dist}")
                                 # Reset stuck state when switching targets
                                 if self.current_target != nearest_enemy:
                                     self._reset_stuck_state()
@@ -674,7 +675,7 @@ class BotBrain:
                             self._stuck_skip_counter = 0  # Reset counter when entering combat
                     else:
                         if self.state == BotState.COMBAT:
-                            self._debug(f"Enemy too far (distance {manhattan_dist}), leaving COMBAT")
+                            self._debug(lambda: f"Enemy too far (distance {manhattan_dist}), leaving COMBAT")
                         self._log_state_transition(BotState.EXPLORE)
                         self.current_target = None
                         self.state = BotState.EXPLORE
@@ -689,7 +690,7 @@ class BotBrain:
             elif standing_on_loot:
                 # Persona: loot_priority=0 skips loot entirely
                 if self.persona.loot_priority == 0:
-                    self._debug(f"Persona '{self.persona.name}' skipping loot (loot_priority=0)")
+                    self._debug(lambda: f"Persona '{self.persona.name}' skipping loot (loot_priority=0)")
                     # Stay in EXPLORE, don't pick up loot
                     self._log_state_transition(BotState.EXPLORE)
                     self.current_target = None
@@ -697,7 +698,7 @@ class BotBrain:
                 # Check if we should skip LOOT state (oscillation prevention)
                 elif self._turn_counter < self._skip_loot_until_turn:
                     # Skip LOOT for now - stay in EXPLORE to break oscillation
-                    self._debug(f"Skipping LOOT state until turn {self._skip_loot_until_turn} (oscillation prevention)")
+                    self._debug(lambda: f"Skipping LOOT state until turn {self._skip_loot_until_turn} (oscillation prevention)")
                     # Re-enable opportunistic loot after cooldown expires
                     auto_explore = player.get_component_optional(ComponentType.AUTO_EXPLORE)
                     if auto_explore and auto_explore.disable_opportunistic_loot and self._turn_counter >= self._skip_loot_until_turn - 1:
@@ -782,7 +783,7 @@ class BotBrain:
                     return self._handle_explore(player, game_state)
                 elif self.state == BotState.EXPLORE or self.state == BotState.LOOT:
                     # EXPLORE/LOOT oscillation: Break out of the loop
-                    self._debug(f"Oscillation detected in {self.state.name}, forcing EXPLORE and skipping LOOT for 5 turns")
+                    self._debug(lambda: f"Oscillation detected in {self.state.name}, forcing EXPLORE and skipping LOOT for 5 turns")
                     self._recent_positions.clear()
                     # Reset stuck skip counter to give combat another chance if enemy appears
                     self._stuck_skip_counter = 0
@@ -810,7 +811,7 @@ class BotBrain:
                     self._combat_noop_counter += 1
                     if self._combat_noop_counter >= self._combat_noop_threshold:
                         self._debug(
-                            f"COMBAT fail-safe triggered: {self._combat_noop_counter} consecutive no-op actions. "
+                            lambda: f"COMBAT fail-safe triggered: {self._combat_noop_counter} consecutive no-op actions. "
                             "Dropping to EXPLORE."
                         )
                         self._reset_stuck_state()
@@ -823,7 +824,7 @@ class BotBrain:
                         self._noop_dropped_target = old_target
                         # Force an EXPLORE decision NOW instead of returning the no-op
                         explore_action = self._handle_explore(player, game_state)
-                        self._debug(f"COMBAT fail-safe choose explore_action={explore_action}")
+                        self._debug(lambda: f"COMBAT fail-safe choose explore_action={explore_action}")
                         return explore_action
                 else:
                     # Reset counter when non-no-op action is produced
@@ -924,29 +925,20 @@ class BotBrain:
         if not fov_map:
             return enemies
         
-        # Safely convert entities to iterable list
+        # Must have AI component (is a monster)
         try:
-            entities_iter = list(entities)
+            monsters = entities_with(entities, ComponentType.AI)
         except TypeError:
             # entities is not iterable (e.g. bare Mock) - treat as empty
             return enemies
         
         player_faction = getattr(player, 'faction', None)
         
-        for entity in entities_iter:
+        for entity in monsters:
             # Skip self
             if entity == player:
                 continue
             
-            # Must have AI component (is a monster)
-            # Safely check for components.has() - some mocks may not have this
-            if hasattr(entity, 'components') and hasattr(entity.components, 'has'):
-                if not entity.components.has(ComponentType.AI):
-                    continue
-            else:
-                # No components attribute or no has method - skip
-                continue
-            
             # Must have fighter component and be alive
             get_component_optional = getattr(entity, 'get_component_optional', None)
             if not callable(get_component_optional):
@@ -1140,7 +1132,7 @@ class BotBrain:
         # Use str() to handle any numpy string types
         stop_reason_str = str(stop_reason) if stop_reason else None
         if stop_reason_str in TERMINAL_EXPLORE_REASONS:
-            self._debug(f"BotBrain: Floor exploration complete ('{stop_reason}'), not restarting AutoExplore")
+            self._debug(lambda: f"BotBrain: Floor exploration complete ('{stop_reason}'), not restarting AutoExplore")
             return {}
         
         # Don't restart AutoExplore if we're walking to stairs
@@ -1159,7 +1151,7 @@ class BotBrain:
         
         # For other stop reasons (or first time), start autoexplore
         player_pos = (player.x, player.y)
-        self._debug(f"BotBrain: Starting AutoExplore at {player_pos}, stop_reason='{stop_reason}'")
+        self._debug(lambda: f"BotBrain: Starting AutoExplore at {player_pos}, stop_reason='{stop_reason}'")
         return {"start_auto_explore": True}
     
     def _handle_combat(self, player: Any, enemies: List[Any], game_state: Any) -> Dict[str, Any]:
@@ -1332,11 +1324,11 @@ class BotBrain:
                 if self._is_attack_action(action):
                     # Attacking in place is legitimate progress
                     self._stuck_counter = 0
-                    self._debug(f"Attack action in place, resetting stuck counter (player at {current_player_pos}, target at {current_target_pos})")
+                    self._debug(lambda: f"Attack action in place, resetting stuck counter (player at {current_player_pos}, target at {current_target_pos})")
                 else:
                     # Move/wait/no-op without movement = stuck
                     self._stuck_counter += 1
-                    self._debug(f"Stuck counter: {self._stuck_counter} (player at {current_player_pos}, target at {current_target_pos}, action={action})")
+                    self._debug(lambda: f"Stuck counter: {self._stuck_counter} (player at {current_player_pos}, target at {current_target_pos}, action={action})")
             else:
                 # Positions changed → we made progress
                 self._stuck_counter = 0
@@ -1425,7 +1417,7 @@ class BotBrain:
         oscillating = self._is_oscillating()
         
         self._debug(
-            f"state={self.state.name}, "
+            lambda: f"state={self.state.name}, "
             f"player=({player.x},{player.y}), "
             f"target={target_str}, "
             f"visible_enemies={len(visible_enemies)}, "
@@ -1497,7 +1489,7 @@ class BotBrain:
             msg: Message to log
         """
         if self.log_level in (LogLevel.SUMMARY, LogLevel.DEBUG):
-            logger.info(f"BotBrain: {msg}")
+            logger.info(lambda: f"BotBrain: {msg}")
     
     def _log_error(self, msg: str) -> None:
         """Log error-level message (contract violations, impossible states).
@@ -1507,13 +1499,16 @@ class BotBrain:
         """
         logger.error(f"BotBrain ERROR: {msg}")
     
-    def _debug(self, msg: str) -> None:
+    def _debug(self, msg: Union[str, Callable[[], str]]) -> None:
         """Log debug message if debug mode is enabled.
         
         Args:
-            msg: Message to log
+            msg: Message to log, or a callable returning it (only called
+                in debug mode)
         """
         if self.log_level == LogLevel.DEBUG:
+            if callable(msg):
+                msg = msg()
             # Print directly to console for immediate visibility during debugging
             # Also log to file for later analysis
             print(f"BotBrain: {msg}")
@@ -1616,21 +1611,20 @@ class BotBrain:
         """
         import tcod
         import numpy as np
+        from map_objects.tile import tile_field_array
         
         try:
             # Create cost map using numpy (indexed as [y, x])
-            cost = np.zeros((game_map.height, game_map.width), dtype=np.int8)
-            
-            for y in range(game_map.height):
-                for x in range(game_map.width):
-                    # Blocked tiles are impassable
-                    if game_map.tiles[x][y].blocked:
-                        cost[y, x] = 0
-                    # Hazards are treated as impassable (if hazard_manager exists)
-                    elif hasattr(game_map, 'hazard_manager') and game_map.hazard_manager.has_hazard_at(x, y):
+            # Blocked tiles are impassable
+            cost = (~tile_field_array(game_map, "blocked").T).astype(np.int8)
+            
+            # Hazards are treated as impassable (if hazard_manager exists)
+            if hasattr(game_map, 'hazard_manager'):
+                has_hazard_at = game_map.hazard_manager.has_hazard_at
+                ys, xs = np.nonzero(cost)
+                for y, x in zip(ys.tolist(), xs.tolist()):
+                    if has_hazard_at(x, y):
                         cost[y, x] = 0
-                    else:
-                        cost[y, x] = 1
             
             # Entities block movement (except target tile)
             for entity in entities:
@@ -1646,7 +1640,7 @@ class BotBrain:
             # Validate player position is within map bounds
             start_x, start_y = player.x, player.y
             if start_x < 0 or start_x >= game_map.width or start_y < 0 or start_y >= game_map.height:
-                self._debug(f"Player position ({start_x}, {start_y}) out of map bounds")
+                self._debug(lambda: f"Player position ({start_x}, {start_y}) out of map bounds")
                 return []
             
             # Create graph and pathfinder (modern tcod API)
@@ -1662,7 +1656,7 @@ class BotBrain:
             
         except (AttributeError, TypeError, IndexError) as e:
             # Handle mock objects or missing attributes gracefully
-            self._debug(f"Pathfinding error: {e}")
+            self._debug(lambda: f"Pathfinding error: {e}")
             return []
     
     def _handle_floor_complete(
@@ -1715,7 +1709,7 @@ class BotBrain:
             dx = next_pos[0] - player.x
             dy = next_pos[1] - player.y
             
-            self._debug(f"Walking to stairs: moving from ({player.x}, {player.y}) to {next_pos}, "
+            self._debug(lambda: f"Walking to stairs: moving from ({player.x}, {player.y}) to {next_pos}, "
                        f"{len(self._stairs_path)} steps remaining")
             
             return self._build_move_action(dx, dy)
@@ -1913,7 +1907,7 @@ class BotBrain:
             damage_taken = max(0, self._last_hp - current_hp)
             if damage_taken > 0:
                 self._damage_history.append(damage_taken)
-                self._debug(f"Damage tracking: took {damage_taken} damage (history: {list(self._damage_history)})")
+                self._debug(lambda: f"Damage tracking: took {damage_taken} damage (history: {list(self._damage_history)})")
         
         # Update last HP for next turn
         self._last_hp = current_hp
@@ -2008,7 +2002,7 @@ class BotBrain:
         # Sort by threat count (ascending) and return safest
         safe_tiles.sort(key=lambda x: x[1])
         best_tile, threat_count = safe_tiles[0]
-        self._debug(f"Retreat: found safe tile {best_tile} with {threat_count} adjacent threats")
+        self._debug(lambda: f"Retreat: found safe tile {best_tile} with {threat_count} adjacent threats")
         return best_tile
     
     def _should_retreat(self, player: Any, visible_enemies: List[Any], heal_config: PersonaHealConfig, has_potion: bool) -> bool:
@@ -2031,7 +2025,7 @@ class BotBrain:
         
         # Critical retreat: low HP + no potion + enemies present
         if hp_fraction <= heal_config.panic_threshold and not has_potion and visible_enemies:
-            self._debug(f"Critical retreat: HP {hp_fraction:.1%} ≤ panic {heal_config.panic_threshold:.1%}, no potion")
+            self._debug(lambda: f"Critical retreat: HP {hp_fraction:.1%} ≤ panic {heal_config.panic_threshold:.1%}, no potion")
             return True
         
         # Conservative retreat: moderate HP + single enemy + can kite to conserve potion
@@ -2039,7 +2033,7 @@ class BotBrain:
             hp_fraction > heal_config.panic_threshold and
             has_potion and 
             len(visible_enemies) == 1):
-            self._debug(f"Conservative retreat: HP {hp_fraction:.1%}, single enemy, conserving potion")
+            self._debug(lambda: f"Conservative retreat: HP {hp_fraction:.1%}, single enemy, conserving potion")
             return True
         
         return False
@@ -2078,7 +2072,7 @@ class BotBrain:
             # Phase 17C: Lowered requirement - ANY adjacent enemy at low HP = panic
             if adjacent_count >= 1:
                 self._debug(
-                    f"PANIC: HP {hp_fraction:.1%} ≤ {heal_config.panic_threshold:.1%} "
+                    lambda: f"PANIC: HP {hp_fraction:.1%} ≤ {heal_config.panic_threshold:.1%} "
                     f"with {adjacent_count} adjacent enemies"
                 )
                 return True
@@ -2091,7 +2085,7 @@ class BotBrain:
             spike_threshold = fighter.max_hp * 0.20  # 20% max HP (raised from 12%)
             if last_damage > spike_threshold:
                 self._debug(
-                    f"PANIC: Damage spike {last_damage}/{fighter.max_hp} "
+                    lambda: f"PANIC: Damage spike {last_damage}/{fighter.max_hp} "
                     f"({last_damage/fighter.max_hp:.1%}) > 20% threshold at HP {hp_fraction:.1%}"
                 )
                 return True
@@ -2100,7 +2094,7 @@ class BotBrain:
         emergency_threshold = heal_config.panic_threshold * 0.67  # e.g., 10% for balanced (15% * 0.67)
         if hp_fraction <= emergency_threshold:
             self._debug(
-                f"PANIC: Emergency HP {hp_fraction:.1%} ≤ {emergency_threshold:.1%}"
+                lambda: f"PANIC: Emergency HP {hp_fraction:.1%} ≤ {emergency_threshold:.1%}"
             )
             return True
         
@@ -2149,7 +2143,7 @@ class BotBrain:
         if visible_enemies:
             # Enemies present - check combat healing policy (persona-configurable)
             if not heal_config.allow_combat_healing:
-                self._debug(f"Combat healing disabled by persona '{self.persona.name}', skipping heal")
+                self._debug(lambda: f"Combat healing disabled by persona '{self.persona.name}', skipping heal")
                 return False
             # Combat healing allowed - heal at threshold
             return True
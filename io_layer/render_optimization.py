@@ -9,6 +9,7 @@ from typing import Dict, Set, Tuple, Optional, Any
 from dataclasses import dataclass
 from enum import Enum, auto
 import sys
+import numpy as np
 import tcod.libtcodpy as libtcod
 
 from fov_functions import map_is_in_fov
@@ -44,6 +45,9 @@ class OptimizedTileRenderer:
     It maintains full backward compatibility with the existing render_all() function.
     
     Key optimizations:
+    - Full redraws of a real tcod console are vectorized: the camera window's
+      color layers are computed from the map/FOV arrays and written to
+      ``Console.rgb`` in bulk (see _render_window_vectorized)
     - Tile state caching to avoid redundant FOV and tile checks
     - Dirty rectangle tracking to minimize console operations
     - Batch rendering for better performance
@@ -78,6 +82,7 @@ class OptimizedTileRenderer:
             'cache_misses': 0,
             'fov_changes': 0,
             'full_redraws': 0,
+            'vectorized_redraws': 0,
         }
     
     def render_tiles_optimized(
@@ -192,6 +197,9 @@ class OptimizedTileRenderer:
             colors: Color configuration dictionary
             camera: Camera for viewport scrolling (optional)
         """
+        if self._render_window_vectorized(con, game_map, fov_map, colors, camera):
+            return
+
         # Determine which tiles to render based on camera viewport
         if camera:
             # Only render tiles visible in viewport
@@ -220,6 +228,94 @@ class OptimizedTileRenderer:
                     ignore_cache=ignore_cache,
                 )
     
+    def _render_window_vectorized(
+        self,
+        con,
+        game_map,
+        fov_map,
+        colors: Dict[str, Any],
+        camera=None,
+    ) -> bool:
+        """Redraw the whole camera window with numpy bulk writes.
+
+        Builds the tile color layer for the window from ``fov_map.visibility``
+        and the map's ``block_sight``/``explored`` arrays, marks visible tiles
+        explored, and assigns the background colors to ``con.rgb`` in one
+        masked write. Hazard glyphs (few per map) are then stamped per hazard.
+        Output matches the per-tile path: visible tiles are lit, explored ones
+        dark, unexplored ones left untouched.
+
+        Only applies to a real tcod Console with a computed ModernFOVMap and a
+        numpy-backed GameMap; anything else (test doubles, legacy FOV maps)
+        returns False so the caller falls back to per-tile rendering.
+
+        Returns:
+            bool: True if the window was rendered here
+        """
+        rgb = getattr(con, 'rgb', None)
+        visibility = getattr(fov_map, 'visibility', None)
+        block_sight = getattr(game_map, 'block_sight', None)
+        explored = getattr(game_map, 'explored', None)
+        if not all(
+            isinstance(array, np.ndarray)
+            for array in (rgb, visibility, block_sight, explored)
+        ):
+            return False
+        map_shape = (game_map.width, game_map.height)
+        if visibility.shape != map_shape or block_sight.shape != map_shape:
+            return False
+        hazard_manager = getattr(game_map, 'hazard_manager', None)
+        hazards = getattr(hazard_manager, 'hazards', None) if hazard_manager else {}
+        if not isinstance(hazards, dict):
+            return False
+        palette = np.array(
+            [colors.get(key) for key in ("light_wall", "light_ground", "dark_wall", "dark_ground")],
+            dtype=np.uint8,
+        )[:, :3]
+
+        # Console cells indexed [x, y] regardless of the console's order
+        cells = rgb if (rgb.flags.f_contiguous and not rgb.flags.c_contiguous) else rgb.T
+
+        # World-space window (inclusive camera bounds) clipped to map and console
+        if camera:
+            min_x, min_y, max_x, max_y = camera.get_viewport_bounds()
+            x0, y0 = max(0, min_x), max(0, min_y)
+            view_x, view_y = camera.world_to_viewport(x0, y0)
+            x1, y1 = min(game_map.width, max_x + 1), min(game_map.height, max_y + 1)
+        else:
+            x0 = y0 = view_x = view_y = 0
+            x1, y1 = map_shape
+        x1 = min(x1, x0 + cells.shape[0] - view_x)
+        y1 = min(y1, y0 + cells.shape[1] - view_y)
+        if x1 <= x0 or y1 <= y0:
+            return True
+
+        visible = visibility[x0:x1, y0:y1]
+        if isinstance(getattr(game_map, 'explored_count', None), int):
+            game_map.mark_explored(visible, x0, y0)
+        else:
+            explored[x0:x1, y0:y1] |= visible
+        seen = explored[x0:x1, y0:y1]
+
+        # 0 light wall, 1 light ground, 2 dark wall, 3 dark ground
+        layer = np.where(visible, 0, 2) + ~block_sight[x0:x1, y0:y1]
+        window = cells[view_x:view_x + (x1 - x0), view_y:view_y + (y1 - y0)]
+        window["bg"][seen] = palette[layer[seen]]
+
+        if hazards:
+            from render_functions import _hazard_glyph
+            for (hx, hy), hazard in hazards.items():
+                if x0 <= hx < x1 and y0 <= hy < y1 and seen[hx - x0, hy - y0]:
+                    char, color = _hazard_glyph(hazard, bool(visible[hx - x0, hy - y0]), colors)
+                    window["ch"][hx - x0, hy - y0] = char
+                    window["fg"][hx - x0, hy - y0] = color
+
+        # Per-tile cache entries are stale now; dirty redraws must repaint
+        self.tile_cache.clear()
+        self.optimization_stats['vectorized_redraws'] += 1
+        self.optimization_stats['cache_misses'] += visible.size
+        return True
+
     def _render_dirty_tiles(
         self,
         con,
@@ -291,14 +387,16 @@ class OptimizedTileRenderer:
                 visible = map_is_in_fov(fov_map, x, y)
             except AttributeError:
                 visible = False
-        wall = game_map.tiles[x][y].block_sight
-        explored = game_map.tiles[x][y].explored
+        tile = game_map.tiles[x][y]
+        wall = tile.block_sight
+        explored = tile.explored
         
         # Determine render state
         if visible:
             render_state = TileRenderState.VISIBLE_WALL if wall else TileRenderState.VISIBLE_FLOOR
             # Mark as explored when visible
-            game_map.tiles[x][y].explored = True
+            if not explored:
+                tile.explored = True
         elif explored:
             render_state = TileRenderState.EXPLORED_WALL if wall else TileRenderState.EXPLORED_FLOOR
         else:
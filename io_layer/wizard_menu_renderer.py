@@ -244,10 +244,7 @@ def wizard_reveal_map(game_state_manager):
     message_log = state.message_log
     
     if game_map:
-        # Mark all tiles as explored
-        for x in range(game_map.width):
-            for y in range(game_map.height):
-                game_map.tiles[x][y].explored = True
+        game_map.reveal_all()
         
         message_log.add_message(MB.custom("🧙 WIZARD: Revealed entire map", WIZARD_COLOR))
     
@@ -14,7 +14,6 @@ libtcod = None
 libtcodpy = None
 
 import math
-from random import randint, random
 
 from components.ai import ConfusedMonster
 from components.component_registry import ComponentType
@@ -42,6 +41,7 @@ from components.status_effects import (
     StatusEffectManager,
     WeaknessEffect
 )
+from engine.rng_config import get_rng
 from game_messages import Message
 from message_builder import MessageBuilder as MB
 from fov_functions import map_is_in_fov
@@ -250,7 +250,7 @@ def enhance_armor(*args, **kwargs):
         return results
 
     # Randomly select an armor piece
-    slot_name, armor = random.choice(armor_pieces)
+    slot_name, armor = get_rng("combat").choice(armor_pieces)
     old_bonus = armor.equippable.armor_class_bonus
 
     # Apply enhancement
@@ -313,12 +313,12 @@ def cast_teleport(*args, **kwargs):
     results = []
     
     # 10% chance of misfire!
-    if random() < 0.10:
+    if get_rng("combat").random() < 0.10:
         # Misfire - teleport to random location
         max_attempts = 100
         for _ in range(max_attempts):
-            random_x = randint(1, game_map.width - 2)
-            random_y = randint(1, game_map.height - 2)
+            random_x = get_rng("combat").randint(1, game_map.width - 2)
+            random_y = get_rng("combat").randint(1, game_map.height - 2)
             
             # Check if location is valid (walkable and unoccupied)
             if not game_map.tiles[random_x][random_y].blocked:
@@ -335,7 +335,7 @@ def cast_teleport(*args, **kwargs):
                     entity.y = random_y
                     
                     # Apply disorientation effect (3-5 turns of random movement)
-                    disorientation_duration = randint(3, 5)
+                    disorientation_duration = get_rng("combat").randint(3, 5)
                     disorientation_effect = DisorientationEffect(
                         duration=disorientation_duration,
                         owner=entity
@@ -1130,7 +1130,7 @@ def drink_paralysis_potion(*args, **kwargs):
         entity.status_effects = StatusEffectManager(entity)
     
     # Add paralysis effect for 3-5 turns (random)
-    duration = random.randint(3, 5)
+    duration = get_rng("combat").randint(3, 5)
     paralysis_effect = ParalysisEffect(duration=duration, owner=entity)
     effect_results = entity.status_effects.add_effect(paralysis_effect)
     results.extend(effect_results)
@@ -1743,7 +1743,7 @@ def use_aggravation_scroll(*args, **kwargs):
             resist_chance = 0.20  # 20% resist for low undead (zombies, skeletons)
     
     # Roll for resistance
-    if resist_chance > 0 and random() < resist_chance:
+    if resist_chance > 0 and get_rng("combat").random() < resist_chance:
         results.append({
             "consumed": True,  # Scroll is used even on resist
             "message": MB.spell_fail(
@@ -16,7 +16,7 @@ from components.item import Item
 from components.equippable import Equippable
 from components.level import Level
 from map_objects.game_map import GameMap
-from map_objects.tile import Tile
+from map_objects.spatial_index import EntityList
 from game_messages import MessageLog, Message
 from game_states import GameStates
 from equipment_slots import EquipmentSlots
@@ -132,7 +132,7 @@ def _load_json_save(json_path=None):
         raise KeyError(f"Save file is missing required data: {missing_keys}")
     
     # Deserialize data
-    entities = [_deserialize_entity(entity_data) for entity_data in save_data["entities"]]
+    entities = EntityList(_deserialize_entity(entity_data) for entity_data in save_data["entities"])
     game_map = _deserialize_game_map(save_data["game_map"])
     message_log = _deserialize_message_log(save_data["message_log"])
     
@@ -356,12 +356,21 @@ def _serialize_equipment(equipment: Equipment) -> Dict[str, Any]:
 
 def _serialize_game_map(game_map: GameMap) -> Dict[str, Any]:
     """Serialize a GameMap including hazards."""
+    # Read whole columns out of the tile arrays rather than one proxy per tile
+    blocked = game_map.blocked.tolist()
+    block_sight = game_map.block_sight.tolist()
+    explored = game_map.explored.tolist()
     result = {
         "width": int(game_map.width),
         "height": int(game_map.height),
         "dungeon_level": int(game_map.dungeon_level),
-        "tiles": [[_serialize_tile(game_map.tiles[x][y]) for y in range(game_map.height)] 
-                  for x in range(game_map.width)]
+        "tiles": [
+            [
+                {"blocked": b, "block_sight": s, "explored": e}
+                for b, s, e in zip(blocked[x], block_sight[x], explored[x])
+            ]
+            for x in range(game_map.width)
+        ]
     }
     
     # Serialize ground hazards if present
@@ -371,15 +380,6 @@ def _serialize_game_map(game_map: GameMap) -> Dict[str, Any]:
     return result
 
 
-def _serialize_tile(tile: Tile) -> Dict[str, Any]:
-    """Serialize a Tile."""
-    return {
-        "blocked": tile.blocked,
-        "block_sight": tile.block_sight,
-        "explored": tile.explored
-    }
-
-
 def _serialize_message_log(message_log: MessageLog) -> Dict[str, Any]:
     """Serialize a MessageLog."""
     return {
@@ -533,11 +533,11 @@ def _deserialize_game_map(data: Dict[str, Any]) -> GameMap:
         dungeon_level=data["dungeon_level"]
     )
     
-    # Deserialize tiles
-    for x in range(game_map.width):
-        for y in range(game_map.height):
-            tile_data = data["tiles"][x][y]
-            game_map.tiles[x][y] = _deserialize_tile(tile_data)
+    # Deserialize tiles straight into the map's tile arrays
+    for x, column in enumerate(data["tiles"]):
+        game_map.blocked[x, :] = [tile["blocked"] for tile in column]
+        game_map.block_sight[x, :] = [tile.get("block_sight", tile["blocked"]) for tile in column]
+        game_map.mark_explored([[tile.get("explored", False) for tile in column]], x0=x)
     
     # Deserialize ground hazards if present
     if "hazards" in data:
@@ -547,17 +547,10 @@ def _deserialize_game_map(data: Dict[str, Any]) -> GameMap:
     return game_map
 
 
-def _deserialize_tile(data: Dict[str, Any]) -> Tile:
-    """Deserialize a Tile."""
-    tile = Tile(blocked=data["blocked"], block_sight=data.get("block_sight", data["blocked"]))
-    tile.explored = data.get("explored", False)
-    return tile
-
-
 def _deserialize_message_log(data: Dict[str, Any]) -> MessageLog:
     """Deserialize a MessageLog."""
     message_log = MessageLog(x=data["x"], width=data["width"], height=data["height"])
     for msg_data in data["messages"]:
         message = Message(msg_data["text"], tuple(msg_data["color"]))
-        message_log.messages.append(message)
+        message_log.add_message(message)
     return message_log
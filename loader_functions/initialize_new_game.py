@@ -31,6 +31,7 @@ from equipment_slots import EquipmentSlots
 from game_messages import MessageLog
 from game_states import GameStates
 from map_objects.game_map import GameMap
+from map_objects.spatial_index import EntityList
 from render_functions import RenderOrder
 from spells.spell_catalog import register_all_spells
 from logger_config import get_logger
@@ -223,7 +224,7 @@ def get_game_variables(constants):
     # Scenarios can apply Oaths via player config in scenario YAML
     # Future: Add UI selection at run start for non-scenario games
     
-    entities = [player]
+    entities = EntityList([player])
 
     # Create starting equipment using EntityFactory
     dagger = entity_factory.create_weapon("dagger", 0, 0)
@@ -273,9 +274,7 @@ def get_game_variables(constants):
     # Tier 1 - Reveal entire map if requested (MUST be after level skip!)
     if config.reveal_map:
         # Mark all tiles as explored (will be rendered as visible)
-        for x in range(game_map.width):
-            for y in range(game_map.height):
-                game_map.tiles[x][y].explored = True
+        game_map.reveal_all()
     
     # Initialize run metrics recorder (Phase 1.5: Run Metrics)
     # Detect bot mode from constants (set by engine.py CLI parsing)
@@ -6,6 +6,10 @@ This module provides a unified logging system with:
 - Separate error tracking
 - Module-based logger hierarchy
 - Consistent message formatting
+- Optional background writer (QueueHandler/QueueListener) so file I/O
+  happens off the game thread
+- LazyLogger facade for hot paths: messages may be callables that are only
+  formatted when the level is enabled
 
 Logs are written to the user data directory:
 - Windows: %APPDATA%/CatacombsOfYARL/logs/
@@ -13,9 +17,12 @@ Logs are written to the user data directory:
 - Linux: ~/.local/share/catacombs-of-yarl/logs/
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from utils.resource_paths import get_log_dir
 
@@ -38,6 +45,7 @@ def setup_logging(log_level=logging.WARNING):
     app_logger.setLevel(log_level)
     
     # Remove existing handlers to avoid duplicates
+    stop_background_logging()
     app_logger.handlers.clear()
     
     # Create formatters
@@ -93,6 +101,193 @@ def get_logger(module_name):
     return logging.getLogger(f'rlike.{module_name}')
 
 
+# ============================================================================
+# BACKGROUND WRITER
+# ============================================================================
+
+class _ThreadQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for a listener in the same process.
+
+    The stdlib prepare() formats and copies every record so it can be
+    pickled; a thread can take the record as is. Only the message text is
+    frozen, so later changes to the arguments don't show up in the log.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+class _PropagationRouter(logging.Handler):
+    """Listener-side handler that replays propagation for moved loggers.
+
+    Records are enqueued once, by the most specific moved logger (moved
+    loggers stop propagating while their handlers are on the listener), and
+    handed here to that logger's original handlers and then its moved
+    ancestors', as Logger.callHandlers would have done.
+    """
+
+    def __init__(self, moved: Dict[str, Tuple[List[logging.Handler], bool]]):
+        super().__init__()
+        # Logger name -> (original handlers, original propagate), most specific first
+        self.chain = sorted(moved.items(), key=lambda item: -len(item[0]))
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        name = record.name
+        for logger_name, (handlers, propagate) in self.chain:
+            if logger_name and name != logger_name and not name.startswith(logger_name + '.'):
+                continue
+            for handler in handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            if not propagate:
+                break
+        return True
+
+
+# Running background writer: (listener, {logger name: (handlers, propagate)})
+_background: Optional[Tuple[logging.handlers.QueueListener, Dict[str, Tuple[List[logging.Handler], bool]]]] = None
+
+
+def start_background_logging(*logger_names: str) -> None:
+    """Move the handlers of the given loggers onto a background thread.
+
+    Each logger's handlers are replaced by a QueueHandler; one QueueListener
+    thread hands the queued records to the original handlers (respecting
+    their levels and the loggers' propagation). The game thread only builds
+    the record; formatting, file writes and rotation happen on the listener.
+
+    Calling again restarts the writer, picking up handlers added since.
+    The writer is stopped (and its queue drained) at interpreter exit.
+
+    Args:
+        *logger_names: Loggers to move (default: the root logger and 'rlike')
+    """
+    global _background
+    stop_background_logging()
+
+    moved: Dict[str, Tuple[List[logging.Handler], bool]] = {}
+    for name in logger_names or ('', 'rlike'):
+        logger = logging.getLogger(name)
+        if logger.handlers:
+            moved[name] = (list(logger.handlers), logger.propagate)
+    if not moved:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    for name, (handlers, _) in moved.items():
+        logger = logging.getLogger(name)
+        for handler in handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(_ThreadQueueHandler(log_queue))
+        if name:
+            logger.propagate = False
+
+    listener = logging.handlers.QueueListener(log_queue, _PropagationRouter(moved))
+    listener.start()
+    _background = (listener, moved)
+
+
+def stop_background_logging() -> None:
+    """Stop the background writer, flushing queued records to disk.
+
+    The original handlers are put back on their loggers, so logging keeps
+    working synchronously afterwards.
+    """
+    global _background
+    if _background is None:
+        return
+    listener, moved = _background
+    _background = None
+    listener.stop()
+    for name, (handlers, propagate) in moved.items():
+        logger = logging.getLogger(name)
+        for handler in list(logger.handlers):
+            if isinstance(handler, _ThreadQueueHandler):
+                logger.removeHandler(handler)
+        for handler in handlers:
+            logger.addHandler(handler)
+        logger.propagate = propagate
+
+
+atexit.register(stop_background_logging)
+
+
+# ============================================================================
+# LAZY FORMATTING
+# ============================================================================
+
+Message = Union[str, Callable[[], str]]
+
+
+class LazyLogger:
+    """Logger facade that skips message formatting for disabled levels.
+
+    Hot paths log f-strings that are built on every call, even when the level
+    is filtered out. Passing a callable instead defers the f-string until the
+    record is actually emitted::
+
+        logger = LazyLogger(logging.getLogger(__name__))
+        logger.debug(lambda: f"path from {start} to {goal}: {len(path)} steps")
+
+    Plain strings and %-style arguments work as with logging.Logger, and every
+    other attribute (setLevel, handlers, exception, ...) is forwarded to the
+    wrapped logger.
+    """
+
+    __slots__ = ('logger',)
+
+    def __init__(self, logger: logging.Logger):
+        """Wrap a logger.
+
+        Args:
+            logger: The logging.Logger records are emitted through
+        """
+        self.logger = logger
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.logger, name)
+
+    def _log(self, level: int, msg: Message, args: tuple, kwargs: Dict[str, Any]) -> None:
+        if not self.logger.isEnabledFor(level):
+            return
+        if callable(msg):
+            msg = msg()
+        # Attribute the record to our caller, not to this facade
+        kwargs['stacklevel'] = kwargs.get('stacklevel', 1) + 2
+        self.logger.log(level, msg, *args, **kwargs)
+
+    def log(self, level: int, msg: Message, *args: Any, **kwargs: Any) -> None:
+        """Log ``msg`` at ``level``, calling it first if it is a callable."""
+        self._log(level, msg, args, kwargs)
+
+    def debug(self, msg: Message, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.DEBUG, msg, args, kwargs)
+
+    def info(self, msg: Message, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.INFO, msg, args, kwargs)
+
+    def warning(self, msg: Message, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.WARNING, msg, args, kwargs)
+
+    def error(self, msg: Message, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.ERROR, msg, args, kwargs)
+
+
+def get_lazy_logger(name: str) -> LazyLogger:
+    """Get a LazyLogger for ``logging.getLogger(name)``.
+
+    Args:
+        name: Logger name, usually ``__name__``
+
+    Returns:
+        LazyLogger: Facade over the named logger
+    """
+    return LazyLogger(logging.getLogger(name))
+
+
 # Initialize logging on module import
 _root_logger = setup_logging()
 
@@ -11,6 +11,7 @@ Usage:
     python3 loot_sanity.py --depth 5          # Test single depth only
     python3 loot_sanity.py --verbose          # Show detailed per-item breakdown
     python3 loot_sanity.py --category healing # Filter to specific category
+    python3 loot_sanity.py --plan-only        # Don't instantiate spawns (fast sampling)
 """
 
 import argparse
@@ -149,11 +150,13 @@ class BandSummary:
         return triggers.get(pity_type, 0) / self.pity_normal_rooms
 
 
-def generate_test_level(depth: int) -> Tuple[Any, List[Any], List[Any]]:
+def generate_test_level(depth: int, plan_only: bool = False) -> Tuple[Any, List[Any], List[Any]]:
     """Generate a test level at the specified depth.
     
     Args:
         depth: Dungeon level to generate
+        plan_only: Place spawns as PlannedEntity stand-ins instead of
+            instantiating them (same positions and types, much faster)
         
     Returns:
         Tuple of (game_map, entities, rooms)
@@ -189,6 +192,7 @@ def generate_test_level(depth: int) -> Tuple[Any, List[Any], List[Any]]:
         map_height=45,
         player=player,
         entities=entities,
+        plan_only=plan_only,
     )
     
     return game_map, entities, game_map.rooms if hasattr(game_map, 'rooms') else []
@@ -317,18 +321,19 @@ def analyze_room_loot(
     )
 
 
-def analyze_level_loot(depth: int, verbose: bool = False) -> LevelLootResult:
+def analyze_level_loot(depth: int, verbose: bool = False, plan_only: bool = False) -> LevelLootResult:
     """Generate and analyze a level for loot distribution.
     
     Args:
         depth: Dungeon depth to analyze
         verbose: Whether to print detailed info
+        plan_only: Generate the level without instantiating spawns
         
     Returns:
         LevelLootResult with full analysis
     """
     # Generate the level
-    game_map, entities, _ = generate_test_level(depth)
+    game_map, entities, _ = generate_test_level(depth, plan_only=plan_only)
     
     band = get_band_for_depth(depth)
     
@@ -430,6 +435,7 @@ def run_loot_analysis(
     verbose: bool = False,
     category_filter: Optional[str] = None,
     normal_mode: bool = False,
+    plan_only: bool = False,
 ) -> Dict[int, BandSummary]:
     """Run loot analysis across bands.
     
@@ -439,6 +445,7 @@ def run_loot_analysis(
         verbose: Show detailed output
         category_filter: Only show items in this category
         normal_mode: If True, use normal game mode instead of testing mode
+        plan_only: Generate levels without instantiating spawns
         
     Returns:
         Dictionary of band number to BandSummary
@@ -485,7 +492,7 @@ def run_loot_analysis(
             reset_pity_state()
             reset_pity_trigger_stats()
             
-            result = analyze_level_loot(depth, verbose)
+            result = analyze_level_loot(depth, verbose, plan_only=plan_only)
             
             # Capture pity stats from this run
             pity_stats = get_pity_trigger_stats()
@@ -763,6 +770,10 @@ def main():
         '--normal', action='store_true',
         help='Use normal mode instead of testing mode (tests actual game balance)'
     )
+    parser.add_argument(
+        '--plan-only', action='store_true',
+        help='Place spawns without instantiating them (same layout, much faster)'
+    )
     
     args = parser.parse_args()
     
@@ -803,6 +814,7 @@ def main():
         verbose=args.verbose,
         category_filter=args.category,
         normal_mode=args.normal,
+        plan_only=args.plan_only,
     )
     
     # Print summary
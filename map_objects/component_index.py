@@ -0,0 +1,209 @@
+"""Index of entities by component type.
+
+``EntityList`` (``map_objects.spatial_index``) keeps a ``ComponentIndex`` next
+to its spatial hash. Membership follows the entities' ``ComponentRegistry``:
+``add``/``remove``/``clear`` on a registry notify every index its entity is
+filed in, and list mutations (spawn/despawn) add and drop whole entities. A
+query like ``entities.with_components(AI, FIGHTER)`` therefore walks only the
+smallest matching set instead of every entity on the floor.
+
+``entities_with`` accepts any entity sequence: an ``EntityList`` answers from
+its index, a plain list falls back to a ``components.has`` scan with the same
+results. Entities without a registry are matched on their component
+attributes (``entity.ai``, ``entity.fighter``) instead.
+"""
+
+from itertools import count
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from components.component_registry import ComponentRegistry, ComponentType
+
+
+def _has_all(entity: Any, component_types) -> bool:
+    has = getattr(getattr(entity, 'components', None), 'has', None)
+    if callable(has):
+        return all(has(component_type) for component_type in component_types)
+    # No registry: match on the component attributes (entity.ai, entity.fighter)
+    return all(
+        getattr(entity, component_type.name.lower(), None) is not None
+        for component_type in component_types
+    )
+
+
+class ComponentIndex:
+    """Maps component types to the entities carrying them.
+
+    Attributes:
+        by_type (dict): ComponentType -> {id(entity): entity}
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.by_type: Dict[ComponentType, Dict[int, Any]] = {}
+        # id(entity) -> [membership count, insertion sequence, entity]
+        self._members: Dict[int, list] = {}
+        # Members without a ComponentRegistry (test doubles, plan stand-ins);
+        # checked with components.has() on every query
+        self._opaque: Dict[int, Any] = {}
+        self._sequence = count()
+        # Per type: highest insertion sequence filed so far, and the types
+        # whose dict is no longer in insertion order (need a sort on query)
+        self._last_sequence: Dict[ComponentType, int] = {}
+        self._unordered: Set[ComponentType] = set()
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, entity: Any) -> bool:
+        return id(entity) in self._members
+
+    def add(self, entity: Any) -> None:
+        """Index an entity (again, if it is already a member)."""
+        member = self._members.get(id(entity))
+        if member is not None:
+            member[0] += 1
+            return
+        self._members[id(entity)] = [1, next(self._sequence), entity]
+
+        registry = getattr(entity, 'components', None)
+        if not isinstance(registry, ComponentRegistry):
+            self._opaque[id(entity)] = entity
+            return
+        registry._indexes = registry._indexes + ((self, entity),)
+        for component_type in registry._components:
+            self.component_added(entity, component_type)
+
+    def discard(self, entity: Any) -> None:
+        """Drop one membership of an entity; unindex it when none remain."""
+        member = self._members.get(id(entity))
+        if member is None:
+            return
+        member[0] -= 1
+        if member[0] > 0:
+            return
+        del self._members[id(entity)]
+        if self._opaque.pop(id(entity), None) is not None:
+            return
+
+        registry = entity.components
+        self._unwatch(registry, entity)
+        for component_type in registry._components:
+            self.component_removed(entity, component_type)
+
+    def clear(self) -> None:
+        """Drop every entity from the index."""
+        for _, _, entity in self._members.values():
+            if id(entity) not in self._opaque:
+                self._unwatch(entity.components, entity)
+        self.by_type.clear()
+        self._members.clear()
+        self._opaque.clear()
+        self._last_sequence.clear()
+        self._unordered.clear()
+
+    def resequence(self, entities: Iterable[Any]) -> None:
+        """Renumber insertion order to follow ``entities`` (after an insert or reorder)."""
+        members = self._members
+        sequence = count()
+        renumbered = set()
+        for entity in entities:
+            member = members.get(id(entity))
+            if member is not None and id(entity) not in renumbered:
+                renumbered.add(id(entity))
+                member[1] = next(sequence)
+        self._sequence = sequence
+        self._members = members = dict(sorted(members.items(), key=lambda item: item[1][1]))
+        self._last_sequence.clear()
+        self._unordered.clear()
+        for component_type, filed in self.by_type.items():
+            ordered = sorted(filed.items(), key=lambda item: members[item[0]][1])
+            self.by_type[component_type] = dict(ordered)
+            if ordered:
+                self._last_sequence[component_type] = members[ordered[-1][0]][1]
+
+    def component_added(self, entity: Any, component_type: ComponentType) -> None:
+        """File an entity under a component type it just gained."""
+        sequence = self._members[id(entity)][1]
+        if sequence < self._last_sequence.get(component_type, -1):
+            self._unordered.add(component_type)
+        else:
+            self._last_sequence[component_type] = sequence
+        self.by_type.setdefault(component_type, {})[id(entity)] = entity
+
+    def component_removed(self, entity: Any, component_type: ComponentType) -> None:
+        """Unfile an entity from a component type it just lost."""
+        members = self.by_type.get(component_type)
+        if members is not None:
+            members.pop(id(entity), None)
+
+    def _unwatch(self, registry: ComponentRegistry, entity: Any) -> None:
+        registry._indexes = tuple(
+            watcher for watcher in registry._indexes
+            if watcher[0] is not self or watcher[1] is not entity
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def with_components(self, *component_types: ComponentType) -> List[Any]:
+        """Return the entities that have every one of ``component_types``.
+
+        Costs O(smallest matching set), not O(all entities). Results are in
+        insertion order; ``EntityList`` renumbers it after inserts and
+        reorders, so for an ``EntityList`` it is list order.
+        """
+        if not component_types:
+            return [member[2] for member in self._members.values()]
+
+        sets = [self.by_type.get(component_type) for component_type in component_types]
+        if not all(sets):
+            found = []
+            ordered = True
+        else:
+            smallest_type = min(component_types, key=lambda component_type: len(self.by_type[component_type]))
+            smallest = self.by_type[smallest_type]
+            others = [members for members in sets if members is not smallest]
+            if not others:
+                found = list(smallest.values())
+            elif len(others) == 1:
+                other = others[0]
+                found = [entity for key, entity in smallest.items() if key in other]
+            else:
+                found = [
+                    entity for key, entity in smallest.items()
+                    if all(key in members for members in others)
+                ]
+            ordered = smallest_type not in self._unordered
+
+        if self._opaque:
+            found.extend(
+                entity for entity in self._opaque.values()
+                if _has_all(entity, component_types)
+            )
+            ordered = False
+        if not ordered:
+            members = self._members
+            found.sort(key=lambda entity: members[id(entity)][1])
+        return found
+
+
+def _index_of(entities: Iterable[Any]) -> Optional[ComponentIndex]:
+    index = getattr(entities, 'component_index', None)
+    return index if isinstance(index, ComponentIndex) else None
+
+
+def entities_with(entities: Iterable[Any], *component_types: ComponentType) -> List[Any]:
+    """Return every entity that has all of ``component_types``.
+
+    Args:
+        entities: EntityList or any iterable of entities
+        *component_types: Required components (none = every entity)
+
+    Returns:
+        list: Matching entities, in list order
+    """
+    index = _index_of(entities)
+    if index is not None:
+        return index.with_components(*component_types)
+    return [entity for entity in entities if _has_all(entity, component_types)]
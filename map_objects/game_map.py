@@ -5,7 +5,8 @@ tile management, entity placement, and map navigation. It uses BSP-style
 room generation with connecting tunnels.
 """
 
-from random import randint, random, choice
+
+import numpy as np
 
 from components.ai import BasicMonster
 from components.equippable import Equippable
@@ -13,13 +14,16 @@ from components.fighter import Fighter
 from components.component_registry import ComponentType
 from config.entity_factory import get_entity_factory
 from config.level_template_registry import get_level_template_registry
+from engine.rng_config import get_rng
 from entity import Entity
 from entity_sorting_cache import invalidate_entity_cache
 from equipment_slots import EquipmentSlots
 from game_messages import Message
 from message_builder import MessageBuilder as MB
 from map_objects.rectangle import Rect
-from map_objects.tile import Tile
+from map_objects.spatial_index import EntityList
+from map_objects.spawn_plan import SpawnRecorder, is_planned
+from map_objects.tile import Tile, TileGridView, new_tile_array, tile_array_from_tiles
 from random_utils import from_dungeon_level, random_choice_from_dict
 from render_functions import RenderOrder
 from stairs import Stairs
@@ -67,6 +71,34 @@ except Exception as e:
     logger.warning(f"Failed to initialize ETP engine: {e}")
 
 
+def floor_dimensions(dungeon_level, constants):
+    """Return the (width, height) a floor at ``dungeon_level`` is generated with.
+
+    Level template overrides take precedence over ``constants``.
+
+    Args:
+        dungeon_level (int): Depth of the floor
+        constants (dict): Game configuration constants
+
+    Returns:
+        tuple: (map_width, map_height)
+    """
+    map_width = constants["map_width"]
+    map_height = constants["map_height"]
+
+    level_override = get_level_template_registry().get_level_override(dungeon_level)
+    if level_override and level_override.has_parameters():
+        params = level_override.parameters
+        if params.map_width is not None:
+            map_width = params.map_width
+            logger.info(f"Level {dungeon_level}: Overriding map_width = {map_width}")
+        if params.map_height is not None:
+            map_height = params.map_height
+            logger.info(f"Level {dungeon_level}: Overriding map_height = {map_height}")
+
+    return map_width, map_height
+
+
 class GameMap:
     """Manages the game map including tiles, rooms, and entity placement.
 
@@ -77,7 +109,11 @@ class GameMap:
     Attributes:
         width (int): Map width in tiles
         height (int): Map height in tiles
-        tiles (list): 2D array of Tile objects
+        tiles (TileGridView): ``tiles[x][y]`` Tile-compatible view of ``tile_data``
+        tile_data (np.ndarray): (width, height) structured array of ``tile_dt``
+        blocked, block_sight, explored (np.ndarray): (width, height) bool field
+            views of ``tile_data``; slice these instead of walking ``tiles``
+        explored_count (int): Running number of explored tiles
         dungeon_level (int): Current dungeon level for scaling difficulty
         hazard_manager (GroundHazardManager): Manages persistent ground hazards
     """
@@ -109,17 +145,108 @@ class GameMap:
         # Track generated rooms for ETP analysis and debugging
         # Each room is a dict with 'rect' (Rect object) and 'metadata' (RoomMetadata or None)
         self.rooms = []  # List of room dicts: {'rect': Rect, 'metadata': RoomMetadata}
+        
+        # SpawnPlan of the last make_map call; the recorder only exists during it
+        self.spawn_plan = None
+        self._spawner = None
 
     def initialize_tiles(self):
         """Initialize the map with blocked wall tiles.
 
         Returns:
-            list: 2D array of Tile objects, all initially blocked
+            np.ndarray: (width, height) tile array, all initially blocked
+        """
+        return new_tile_array(self.width, self.height, blocked=True)
+
+    @property
+    def tiles(self):
+        """``tiles[x][y]`` view returning Tile-compatible proxies.
+
+        Kept for existing callers; reads and writes go through to
+        ``tile_data``. Bulk work should use the array properties instead.
+        """
+        return self._tile_grid
+
+    @tiles.setter
+    def tiles(self, tiles):
+        if isinstance(tiles, TileGridView):
+            data = tiles.data
+        elif isinstance(tiles, np.ndarray):
+            data = tiles
+        else:
+            # Legacy list-of-lists of Tile objects
+            data = tile_array_from_tiles(tiles)
+        self._tile_grid = TileGridView(data)
+
+    @property
+    def tile_data(self):
+        """np.ndarray: (width, height) structured array of ``tile_dt``."""
+        return self._tile_grid.data
+
+    @property
+    def blocked(self):
+        """np.ndarray: (width, height) bool array, True where movement is blocked."""
+        return self._tile_grid.blocked
+
+    @property
+    def block_sight(self):
+        """np.ndarray: (width, height) bool array, True where sight is blocked."""
+        return self._tile_grid.block_sight
+
+    @property
+    def explored(self):
+        """np.ndarray: (width, height) bool array, True where the player has seen the tile."""
+        return self._tile_grid.explored
+
+    @property
+    def explored_count(self):
+        """int: Number of explored tiles, kept as a running total (O(1))."""
+        return self._tile_grid.explored_count
+
+    def mark_explored(self, mask, x0=0, y0=0):
+        """Mark tiles explored wherever ``mask`` is True.
+
+        Use this (or ``tiles[x][y].explored``) rather than writing to
+        ``explored`` directly so ``explored_count`` stays accurate.
+
+        Args:
+            mask (array-like): bool array covering the map, or a window of it
+            x0 (int, optional): Map x of the window's left column. Defaults to 0.
+            y0 (int, optional): Map y of the window's top row. Defaults to 0.
+
+        Returns:
+            int: Number of tiles newly marked explored
+        """
+        mask = np.asarray(mask, dtype=bool)
+        grid = self._tile_grid
+        region = grid.explored[x0:x0 + mask.shape[0], y0:y0 + mask.shape[1]]
+        newly_explored = int(np.count_nonzero(mask & ~region))
+        if newly_explored:
+            region |= mask
+            grid.explored_count += newly_explored
+        return newly_explored
+
+    def reveal_all(self):
+        """Mark every tile explored (magic mapping, reveal-map cheats).
+
+        Returns:
+            int: Number of tiles newly marked explored
         """
-        """Function initializing the tiles in the map"""
-        tiles = [[Tile(True) for y in range(self.height)] for x in range(self.width)]
+        grid = self._tile_grid
+        newly_explored = grid.explored.size - grid.explored_count
+        grid.explored[:] = True
+        grid.explored_count = grid.explored.size
+        return newly_explored
+
+    @property
+    def walkable(self):
+        """np.ndarray: Fresh (width, height) bool array, True where not blocked."""
+        return ~self._tile_grid.blocked
 
-        return tiles
+    @property
+    def transparent(self):
+        """np.ndarray: Fresh (width, height) bool array, True where sight passes."""
+        return ~self._tile_grid.block_sight
 
     def get_walkable_stats(self):
         """Calculate walkable tile statistics for the map.
@@ -130,11 +257,7 @@ class GameMap:
                 - total_tiles: Total number of tiles on map
                 - walkable_percent: Fraction of map that is walkable (0.0 to 1.0)
         """
-        walkable_count = 0
-        for x in range(self.width):
-            for y in range(self.height):
-                if not self.tiles[x][y].blocked:
-                    walkable_count += 1
+        walkable_count = int(np.count_nonzero(~self.blocked))
 
         total_tiles = self.width * self.height
         walkable_percent = walkable_count / total_tiles if total_tiles else 0.0
@@ -149,6 +272,7 @@ class GameMap:
         map_height,
         player,
         entities,
+        plan_only=False,
     ):
         """Generate a new dungeon map with rooms and tunnels.
 
@@ -157,6 +281,11 @@ class GameMap:
         room and stairs in the last room.
         
         Level parameters can be overridden via level templates (Tier 2).
+        
+        Every factory-created entity is recorded into ``self.spawn_plan``.
+        With ``plan_only=True`` monsters, items, chests, traps and NPCs are
+        not instantiated: ``entities`` receives PlannedEntity stand-ins and
+        the same placement code runs on them (see map_objects.spawn_plan).
 
         Args:
             max_rooms (int): Maximum number of rooms to generate
@@ -166,7 +295,34 @@ class GameMap:
             map_height (int): Map height in tiles
             player (Entity): Player entity to place
             entities (list): List to populate with generated entities
+            plan_only (bool, optional): Record the floor without building
+                entities. Defaults to False.
+
+        Returns:
+            SpawnPlan: What was placed on the floor (also ``self.spawn_plan``)
         """
+        self._spawner = SpawnRecorder(get_entity_factory(), plan_only=plan_only)
+        try:
+            self._generate_floor(
+                max_rooms, room_min_size, room_max_size, map_width, map_height, player, entities
+            )
+        finally:
+            spawner, self._spawner = self._spawner, None
+        
+        self.spawn_plan = spawner.build_plan(self, player, entities)
+        return self.spawn_plan
+
+    def _generate_floor(
+        self,
+        max_rooms,
+        room_min_size,
+        room_max_size,
+        map_width,
+        map_height,
+        player,
+        entities,
+    ):
+        """Body of make_map; entity creation goes through self._entity_factory()."""
         # CRITICAL: Clear corridor connections from previous floor
         # Without this, connections accumulate across all floors!
         self.corridor_connections = []
@@ -197,11 +353,11 @@ class GameMap:
 
         for r in range(max_rooms):
             # random width and height
-            w = randint(room_min_size, room_max_size)
-            h = randint(room_min_size, room_max_size)
+            w = get_rng("mapgen").randint(room_min_size, room_max_size)
+            h = get_rng("mapgen").randint(room_min_size, room_max_size)
             # random position without going out of the boundaries of the map
-            x = randint(0, map_width - w - 1)
-            y = randint(0, map_height - h - 1)
+            x = get_rng("mapgen").randint(0, map_width - w - 1)
+            y = get_rng("mapgen").randint(0, map_height - h - 1)
 
             # "Rect" class makes rectangles easier to work with
             new_room = Rect(x, y, w, h)
@@ -254,7 +410,7 @@ class GameMap:
                     (prev_x, prev_y) = prev_room.center()
 
                     # flip a coin (random number that is either 0 or 1)
-                    if randint(0, 1) == 1:
+                    if get_rng("mapgen").randint(0, 1) == 1:
                         # first move horizontally, then vertically
                         self.create_h_tunnel(prev_x, new_x, prev_y)
                         self.create_v_tunnel(prev_y, new_y, new_x)
@@ -318,8 +474,7 @@ class GameMap:
         
         # VICTORY CONDITION: Spawn Ruby Heart on level 25!
         if self.dungeon_level == 25:
-            from config.entity_factory import get_entity_factory
-            factory = get_entity_factory()
+            factory = self._entity_factory()
             
             # Place Ruby Heart in center of the last room (where stairs are)
             # Offset slightly so it doesn't overlap with stairs
@@ -367,6 +522,17 @@ class GameMap:
         # VALIDATION: Ensure secret doors are only on wall tiles
         self._validate_secret_door_placement(entities)
 
+    def _entity_factory(self):
+        """Factory for generation: make_map's SpawnRecorder, else the global factory."""
+        return self._spawner if self._spawner is not None else get_entity_factory()
+
+    def _equip_monster(self, monster, depth):
+        """Roll spawn equipment for a new monster (nothing to equip on a plan stand-in)."""
+        if is_planned(monster):
+            return []
+        from components.monster_equipment import spawn_equipment_on_monster
+        return spawn_equipment_on_monster(monster, depth)
+
     def create_room(self, room):
         """Create a room by making tiles passable.
 
@@ -375,10 +541,8 @@ class GameMap:
         """
         """Function to make a room on the map"""
         # go through the tiles in the rectangle and make them passable
-        for x in range(room.x1 + 1, room.x2):
-            for y in range(room.y1 + 1, room.y2):
-                self.tiles[x][y].blocked = False
-                self.tiles[x][y].block_sight = False
+        self.blocked[room.x1 + 1:room.x2, room.y1 + 1:room.y2] = False
+        self.block_sight[room.x1 + 1:room.x2, room.y1 + 1:room.y2] = False
 
     def create_h_tunnel(self, x1, x2, y):
         """Create a horizontal tunnel between two x coordinates.
@@ -388,9 +552,8 @@ class GameMap:
             x2 (int): Ending x coordinate
             y (int): Y coordinate of the tunnel
         """
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            self.tiles[x][y].blocked = False
-            self.tiles[x][y].block_sight = False
+        self.blocked[min(x1, x2):max(x1, x2) + 1, y] = False
+        self.block_sight[min(x1, x2):max(x1, x2) + 1, y] = False
 
     def create_v_tunnel(self, y1, y2, x):
         """Create a vertical tunnel between two y coordinates.
@@ -400,9 +563,8 @@ class GameMap:
             y2 (int): Ending y coordinate
             x (int): X coordinate of the tunnel
         """
-        for y in range(min(y1, y2), max(y1, y2) + 1):
-            self.tiles[x][y].blocked = False
-            self.tiles[x][y].block_sight = False
+        self.blocked[x, min(y1, y2):max(y1, y2) + 1] = False
+        self.block_sight[x, min(y1, y2):max(y1, y2) + 1] = False
     
     def place_secret_rooms(self, rooms, entities):
         """Place secret rooms adjacent to existing corridors.
@@ -450,14 +612,13 @@ class GameMap:
         Returns:
             bool: True if successfully created, False otherwise
         """
-        from random import randint, choice, random
         
         # Find valid position adjacent to a corridor or dead end
         # Try multiple times to find suitable location
         for _ in range(20):
             # Pick a random edge tile that's solid and adjacent to a corridor
-            x = randint(1, self.width - 2)
-            y = randint(1, self.height - 2)
+            x = get_rng("mapgen").randint(1, self.width - 2)
+            y = get_rng("mapgen").randint(1, self.height - 2)
             
             # Check if this is solid (wall)
             if not self.tiles[x][y].blocked:
@@ -476,7 +637,7 @@ class GameMap:
                 continue
             
             # Try to carve secret room from this position
-            room_size = randint(config.min_room_size, config.min_room_size + 3)
+            room_size = get_rng("mapgen").randint(config.min_room_size, config.min_room_size + 3)
             
             # Find space to carve (try in all directions)
             carve_x, carve_y = None, None
@@ -514,16 +675,6 @@ class GameMap:
                 entities.append(door_entity)
                 logger.debug(f"Created secret door at ({secret_door_x}, {secret_door_y})")
             
-            # Place hint tile marker outside the wall
-            hint_tile_x, hint_tile_y = x - (1 if carve_x < x else -1), y
-            if 0 <= hint_tile_x < self.width and 0 <= hint_tile_y < self.height:
-                # Store hint information on the tile for rendering
-                hint_tile = self.tiles[hint_tile_x][hint_tile_y]
-                if not hasattr(hint_tile, 'hint_marker'):
-                    hint_tile.hint_marker = config.discovery.ambient_hint
-                    hint_tile.hint_discoverable = config.discovery.search_action
-                    logger.debug(f"Placed hint marker '{config.discovery.ambient_hint}' at ({hint_tile_x}, {hint_tile_y})")
-            
             return True
         
         return False
@@ -539,13 +690,12 @@ class GameMap:
             Door entity or None
         """
         from components.door import Door
-        from config.entity_factory import get_entity_factory
         
         # Don't place if occupied
         if any(e.x == x and e.y == y for e in entities):
             return None
         
-        factory = get_entity_factory()
+        factory = self._entity_factory()
         door_entity = factory.create_door("wooden_door", x, y)
         
         if not door_entity:
@@ -624,10 +774,9 @@ class GameMap:
             door_rules: DoorRules configuration for this level
             entities: List to add door entity to
         """
-        from random import random
         
         # Check spawn probability
-        if random() > door_rules.spawn_ratio:
+        if get_rng("mapgen").random() > door_rules.spawn_ratio:
             return
         
         # Get the two rooms connected by this corridor
@@ -794,9 +943,7 @@ class GameMap:
         Returns:
             Door entity, or None if creation failed
         """
-        from random import random
         from components.door import Door
-        from config.entity_factory import get_entity_factory
         
         # SAFETY: Ensure position is within bounds before creating entity
         if not self.is_in_bounds(x, y):
@@ -814,7 +961,7 @@ class GameMap:
         door_style = door_rules.get_random_style()
         
         # Create door entity
-        factory = get_entity_factory()
+        factory = self._entity_factory()
         door_entity = factory.create_door(door_style, x, y)
         
         if not door_entity:
@@ -836,13 +983,13 @@ class GameMap:
             door_component.owner = door_entity
         
         # Apply locked state
-        if door_rules.locked and random() < door_rules.locked.chance:
+        if door_rules.locked and get_rng("mapgen").random() < door_rules.locked.chance:
             door_component.is_locked = True
             door_component.key_tag = door_rules.locked.key_tag
             logger.debug(f"Door at ({x}, {y}) locked with key tag '{door_component.key_tag}'")
         
         # Apply secret state
-        if door_rules.secret and random() < door_rules.secret.chance:
+        if door_rules.secret and get_rng("mapgen").random() < door_rules.secret.chance:
             door_component.is_secret = True
             door_component.is_discovered = False
             door_component.search_dc = door_rules.secret.search_dc
@@ -865,7 +1012,6 @@ class GameMap:
             entities (list): List to add trap entities to
         """
         from components.trap import Trap
-        from config.entity_factory import get_entity_factory
         
         # Get level template registry
         template_registry = get_level_template_registry()
@@ -880,7 +1026,7 @@ class GameMap:
             logger.debug("No trap rules configured for this level, skipping trap placement")
             return
         
-        factory = get_entity_factory()
+        factory = self._entity_factory()
         
         # Place traps in each room
         for room_entry in rooms:
@@ -897,7 +1043,6 @@ class GameMap:
             factory: EntityFactory for creating trap entities
             level_override: Level override config (for special room trap_rules)
         """
-        from random import random
         
         # Check room type whitelist (for now, accept all rooms)
         # Future: special_room types could have room_type set and filter by whitelist
@@ -906,7 +1051,7 @@ class GameMap:
         for x in range(room.x1 + 1, room.x2):
             for y in range(room.y1 + 1, room.y2):
                 # Check density probability for this tile
-                if random() > trap_rules.density:
+                if get_rng("mapgen").random() > trap_rules.density:
                     continue
                 
                 # Don't place trap if tile is occupied
@@ -1030,7 +1175,7 @@ class GameMap:
         
         spawn_plan = spawn_service.generate_room_plan(
             spawn_context,
-            randint_fn=randint,
+            randint_fn=get_rng("mapgen").randint,
             choice_fn=random_choice_from_dict,
         )
         
@@ -1061,8 +1206,8 @@ class GameMap:
                 break
             
             # Choose a random location in the room
-            x = randint(room.x1 + 1, room.x2 - 1)
-            y = randint(room.y1 + 1, room.y2 - 1)
+            x = get_rng("mapgen").randint(room.x1 + 1, room.x2 - 1)
+            y = get_rng("mapgen").randint(room.y1 + 1, room.y2 - 1)
             
             if not any(
                 [entity for entity in entities if entity.x == x and entity.y == y]
@@ -1096,13 +1241,12 @@ class GameMap:
                     continue
                 
                 # Create monster using EntityFactory
-                entity_factory = get_entity_factory()
+                entity_factory = self._entity_factory()
                 monster = entity_factory.create_monster(monster_choice, x, y, depth=self.dungeon_level)
                 
                 if monster:
                     # Try to spawn equipment on the monster
-                    from components.monster_equipment import spawn_equipment_on_monster
-                    equipment_list = spawn_equipment_on_monster(monster, self.dungeon_level)
+                    equipment_list = self._equip_monster(monster, self.dungeon_level)
                     
                     entities.append(monster)
                     # Invalidate entity sorting cache when new entities are added
@@ -1150,8 +1294,8 @@ class GameMap:
         spawned_item_ids = []
         
         for _ in range(spawn_plan.num_items):
-            x = randint(room.x1 + 1, room.x2 - 1)
-            y = randint(room.y1 + 1, room.y2 - 1)
+            x = get_rng("mapgen").randint(room.x1 + 1, room.x2 - 1)
+            y = get_rng("mapgen").randint(room.y1 + 1, room.y2 - 1)
 
             # SAFETY: Check tile is walkable, no entity already there, and not on excluded coords (stairs)
             if (not self.is_blocked(x, y) and 
@@ -1165,7 +1309,7 @@ class GameMap:
                     continue
                 
                 # Get entity factory for equipment creation
-                entity_factory = get_entity_factory()
+                entity_factory = self._entity_factory()
                 
                 # Create all items using EntityFactory for consistent identification
                 if item_choice == "healing_potion":
@@ -1261,11 +1405,11 @@ class GameMap:
             Returns:
                 True if item was successfully spawned
             """
-            entity_factory = get_entity_factory()
+            entity_factory = self._entity_factory()
             
             for _ in range(10):  # Try up to 10 times
-                x = randint(room.x1 + 1, room.x2 - 1)
-                y = randint(room.y1 + 1, room.y2 - 1)
+                x = get_rng("mapgen").randint(room.x1 + 1, room.x2 - 1)
+                y = get_rng("mapgen").randint(room.y1 + 1, room.y2 - 1)
                 
                 if (not self.is_blocked(x, y) and
                     not any([e for e in entities if e.x == x and e.y == y]) and
@@ -1282,6 +1426,8 @@ class GameMap:
                     
                     if pity_item:
                         entities.append(pity_item)
+                        if self._spawner is not None:
+                            self._spawner.mark_pity(pity_item, pity_type)
                         invalidate_entity_cache(f"entity_added_pity_{pity_type}")
                         spawned_item_ids.append(item_id)
                         logger.debug(
@@ -1305,7 +1451,6 @@ class GameMap:
             Returns:
                 Item ID to spawn, or fallback if none available
             """
-            from random import choice
             
             # Get all items in this category
             category_items = get_items_by_category(category)
@@ -1315,10 +1460,10 @@ class GameMap:
             valid_items = [item for item in category_items if item in band_items]
             
             if valid_items:
-                return choice(valid_items)
+                return get_rng("mapgen").choice(valid_items)
             elif category_items:
                 # Fall back to any item in category if band filtering is too strict
-                return choice(category_items)
+                return get_rng("mapgen").choice(category_items)
             else:
                 # Ultimate fallbacks by category
                 fallbacks = {
@@ -1372,22 +1517,21 @@ class GameMap:
             room (Rect): Room to place features in
             entities (list): List to add new feature entities to
         """
-        from random import random, choice
-        entity_factory = get_entity_factory()
+        entity_factory = self._entity_factory()
         
         # CHESTS - 30% chance per room
-        if random() < 0.30:
+        if get_rng("mapgen").random() < 0.30:
             # Determine chest quality based on dungeon level
             if self.dungeon_level >= 8:
-                chest_type = choice(['golden_chest', 'chest', 'trapped_chest'])
+                chest_type = get_rng("mapgen").choice(['golden_chest', 'chest', 'trapped_chest'])
             elif self.dungeon_level >= 5:
-                chest_type = choice(['chest', 'trapped_chest', 'chest'])
+                chest_type = get_rng("mapgen").choice(['chest', 'trapped_chest', 'chest'])
             else:
                 chest_type = 'chest'
             
             # Random position in room (not at edges)
-            x = randint(room.x1 + 1, room.x2 - 1)
-            y = randint(room.y1 + 1, room.y2 - 1)
+            x = get_rng("mapgen").randint(room.x1 + 1, room.x2 - 1)
+            y = get_rng("mapgen").randint(room.y1 + 1, room.y2 - 1)
             
             chest = entity_factory.create_chest(chest_type, x, y)
             if chest:
@@ -1395,13 +1539,13 @@ class GameMap:
                 logger.debug(f"Placed {chest_type} at ({x}, {y}) in room")
         
         # SIGNPOSTS - 20% chance per room
-        if random() < 0.20:
+        if get_rng("mapgen").random() < 0.20:
             # Random signpost type
-            sign_type = choice(['signpost', 'warning_sign', 'humor_sign', 'hint_sign'])
+            sign_type = get_rng("mapgen").choice(['signpost', 'warning_sign', 'humor_sign', 'hint_sign'])
             
             # Random position in room (not at edges)
-            x = randint(room.x1 + 1, room.x2 - 1)
-            y = randint(room.y1 + 1, room.y2 - 1)
+            x = get_rng("mapgen").randint(room.x1 + 1, room.x2 - 1)
+            y = get_rng("mapgen").randint(room.y1 + 1, room.y2 - 1)
             
             signpost = entity_factory.create_signpost(sign_type, x, y, depth=self.dungeon_level)
             if signpost:
@@ -1409,10 +1553,10 @@ class GameMap:
                 logger.debug(f"Placed {sign_type} at ({x}, {y}) in room (depth {self.dungeon_level})")
         
         # MURALS - 15% chance per room (Phase 4 environmental lore)
-        if random() < 0.15:
+        if get_rng("mapgen").random() < 0.15:
             # Random position in room (not at edges)
-            x = randint(room.x1 + 1, room.x2 - 1)
-            y = randint(room.y1 + 1, room.y2 - 1)
+            x = get_rng("mapgen").randint(room.x1 + 1, room.x2 - 1)
+            y = get_rng("mapgen").randint(room.y1 + 1, room.y2 - 1)
             
             mural = entity_factory.create_mural(x, y, depth=self.dungeon_level)
             if mural:
@@ -1428,11 +1572,10 @@ class GameMap:
         Args:
             rooms (list): List of Rect rooms in the dungeon
         """
-        from random import random, randint, choice
         from map_objects.secret_door import SecretDoor
         
         # 15% chance to have secret doors on this level
-        if random() > 0.15:
+        if get_rng("mapgen").random() > 0.15:
             return
         
         # Need at least 2 rooms to place secret doors
@@ -1440,13 +1583,13 @@ class GameMap:
             return
         
         # Generate 1-3 secret doors (but not more than rooms - 1)
-        num_doors = randint(1, min(3, len(rooms) - 1))
+        num_doors = get_rng("mapgen").randint(1, min(3, len(rooms) - 1))
         
         for _ in range(num_doors):
             
             # Pick two adjacent rooms to connect
-            room_entry_a = choice(rooms)
-            room_entry_b = choice([r for r in rooms if r != room_entry_a])
+            room_entry_a = get_rng("mapgen").choice(rooms)
+            room_entry_b = get_rng("mapgen").choice([r for r in rooms if r != room_entry_a])
             
             # Extract rects from room entries
             room_a = room_entry_a['rect'] if isinstance(room_entry_a, dict) else room_entry_a
@@ -1462,27 +1605,27 @@ class GameMap:
                 y_max = min(room_a.y2, room_b.y2) - 1
                 if y_min <= y_max:  # Valid overlap
                     x = room_a.x2
-                    y = randint(y_min, y_max)
+                    y = get_rng("mapgen").randint(y_min, y_max)
             elif room_b.x2 == room_a.x1 - 1:
                 # Rooms are horizontally adjacent (B is west of A)
                 y_min = max(room_a.y1, room_b.y1) + 1
                 y_max = min(room_a.y2, room_b.y2) - 1
                 if y_min <= y_max:  # Valid overlap
                     x = room_b.x2
-                    y = randint(y_min, y_max)
+                    y = get_rng("mapgen").randint(y_min, y_max)
             elif room_a.y2 == room_b.y1 - 1:
                 # Rooms are vertically adjacent (A is north of B)
                 x_min = max(room_a.x1, room_b.x1) + 1
                 x_max = min(room_a.x2, room_b.x2) - 1
                 if x_min <= x_max:  # Valid overlap
-                    x = randint(x_min, x_max)
+                    x = get_rng("mapgen").randint(x_min, x_max)
                     y = room_a.y2
             elif room_b.y2 == room_a.y1 - 1:
                 # Rooms are vertically adjacent (B is north of A)
                 x_min = max(room_a.x1, room_b.x1) + 1
                 x_max = min(room_a.x2, room_b.x2) - 1
                 if x_min <= x_max:  # Valid overlap
-                    x = randint(x_min, x_max)
+                    x = get_rng("mapgen").randint(x_min, x_max)
                     y = room_b.y2
             
             # Skip if rooms not adjacent or no valid overlap
@@ -1560,7 +1703,7 @@ class GameMap:
                     vault_chance = 0.20
             
             # Roll for vault
-            if random() > vault_chance:
+            if get_rng("mapgen").random() > vault_chance:
                 logger.debug(f"Level {self.dungeon_level}: No vault (rolled > {vault_chance})")
                 return
             
@@ -1576,8 +1719,7 @@ class GameMap:
         num_vaults = min(num_vaults, len(eligible_rooms))
         
         # Randomly select vault rooms
-        from random import sample
-        vault_room_entries = sample(eligible_rooms, num_vaults)
+        vault_room_entries = get_rng("mapgen").sample(eligible_rooms, num_vaults)
         
         # Load vault theme registry
         from config.vault_theme_registry import get_vault_theme_registry
@@ -1643,7 +1785,7 @@ class GameMap:
         if total_weight <= 0:
             return theme_registry.get_default_theme()
         
-        roll = random() * total_weight
+        roll = get_rng("mapgen").random() * total_weight
         cumulative = 0
         
         for theme_id, weight in theme_weights:
@@ -1687,10 +1829,9 @@ class GameMap:
             entities (list): List of entities on the map
             vault_theme (dict): Theme configuration with monsters and elite_scaling
         """
-        from config.entity_factory import get_entity_factory
         from random_utils import random_choice_from_dict
         
-        entity_factory = get_entity_factory()
+        entity_factory = self._entity_factory()
         
         # Get monster configuration from theme, or use defaults
         if vault_theme and 'monsters' in vault_theme:
@@ -1712,7 +1853,7 @@ class GameMap:
             defense_bonus = 1
         
         # Calculate monster count (2-6 monsters)
-        elite_monster_count = randint(2, 6)
+        elite_monster_count = get_rng("mapgen").randint(2, 6)
         
         theme_name = vault_theme.get('name', 'vault') if vault_theme else 'vault'
         logger.debug(
@@ -1724,8 +1865,8 @@ class GameMap:
         vault_depth = self.dungeon_level + 2
         
         for _ in range(elite_monster_count):
-            x = randint(room.x1 + 1, room.x2 - 1)
-            y = randint(room.y1 + 1, room.y2 - 1)
+            x = get_rng("mapgen").randint(room.x1 + 1, room.x2 - 1)
+            y = get_rng("mapgen").randint(room.y1 + 1, room.y2 - 1)
             
             # Check if tile is free
             if not any([e for e in entities if e.x == x and e.y == y]):
@@ -1733,19 +1874,19 @@ class GameMap:
                 monster_choice = random_choice_from_dict(monster_chances)
                 monster = entity_factory.create_monster(monster_choice, x, y, depth=self.dungeon_level)
                 
-                if monster and monster.get_component_optional(ComponentType.FIGHTER):
-                    # Apply elite bonuses from theme
-                    monster.fighter.base_max_hp = int(monster.fighter.base_max_hp * hp_multiplier)
-                    monster.fighter.hp = monster.fighter.max_hp  # Heal to new max
-                    monster.get_component_optional(ComponentType.FIGHTER).base_power += power_bonus
-                    monster.get_component_optional(ComponentType.FIGHTER).base_defense += defense_bonus
+                if monster and (is_planned(monster) or monster.get_component_optional(ComponentType.FIGHTER)):
+                    if not is_planned(monster):
+                        # Apply elite bonuses from theme
+                        monster.fighter.base_max_hp = int(monster.fighter.base_max_hp * hp_multiplier)
+                        monster.fighter.hp = monster.fighter.max_hp  # Heal to new max
+                        monster.get_component_optional(ComponentType.FIGHTER).base_power += power_bonus
+                        monster.get_component_optional(ComponentType.FIGHTER).base_defense += defense_bonus
                     
                     # Visual indication: append (Elite) to name
                     monster.name = f"{monster.name} (Elite)"
                     
                     # Spawn equipment on elite monster
-                    from components.monster_equipment import spawn_equipment_on_monster
-                    spawn_equipment_on_monster(monster, vault_depth)
+                    self._equip_monster(monster, vault_depth)
                     
                     entities.append(monster)
                     invalidate_entity_cache("entity_added_vault_monster")
@@ -1761,15 +1902,14 @@ class GameMap:
             entities (list): List of entities on the map
             vault_theme (dict): Theme configuration with chest_count, chest_quality, bonus_items
         """
-        from config.entity_factory import get_entity_factory
-        entity_factory = get_entity_factory()
+        entity_factory = self._entity_factory()
         
         # Get chest count from theme
         if vault_theme and 'chest_count' in vault_theme:
             chest_config = vault_theme['chest_count']
-            num_chests = randint(chest_config.get('min', 2), chest_config.get('max', 3))
+            num_chests = get_rng("mapgen").randint(chest_config.get('min', 2), chest_config.get('max', 3))
         else:
-            num_chests = randint(2, 3)
+            num_chests = get_rng("mapgen").randint(2, 3)
         
         # Build weighted quality table from theme
         quality_weights = []
@@ -1785,14 +1925,14 @@ class GameMap:
         
         # Spawn chests
         for _ in range(num_chests):
-            x = randint(room.x1 + 1, room.x2 - 1)
-            y = randint(room.y1 + 1, room.y2 - 1)
+            x = get_rng("mapgen").randint(room.x1 + 1, room.x2 - 1)
+            y = get_rng("mapgen").randint(room.y1 + 1, room.y2 - 1)
             
             # Check if tile is free
             if not any([e for e in entities if e.x == x and e.y == y]):
                 # Select quality using weighted random
                 total_weight = sum(weight for _, weight in quality_weights)
-                roll = random() * total_weight
+                roll = get_rng("mapgen").random() * total_weight
                 cumulative = 0
                 quality = 'rare'  # Default
                 
@@ -1806,7 +1946,7 @@ class GameMap:
                 if quality == 'legendary':
                     chest_type = 'golden_chest'
                 elif quality == 'rare':
-                    chest_type = choice(['golden_chest', 'chest'])
+                    chest_type = get_rng("mapgen").choice(['golden_chest', 'chest'])
                 else:
                     chest_type = 'chest'
                 
@@ -1818,20 +1958,20 @@ class GameMap:
         # Spawn bonus items on floor
         if vault_theme and 'bonus_items' in vault_theme:
             bonus_config = vault_theme['bonus_items']
-            num_items = randint(bonus_config.get('min', 1), bonus_config.get('max', 2))
+            num_items = get_rng("mapgen").randint(bonus_config.get('min', 1), bonus_config.get('max', 2))
         else:
-            num_items = randint(1, 2)
+            num_items = get_rng("mapgen").randint(1, 2)
         
         for _ in range(num_items):
-            x = randint(room.x1 + 1, room.x2 - 1)
-            y = randint(room.y1 + 1, room.y2 - 1)
+            x = get_rng("mapgen").randint(room.x1 + 1, room.x2 - 1)
+            y = get_rng("mapgen").randint(room.y1 + 1, room.y2 - 1)
             
             # Check if tile is free
             if not any([e for e in entities if e.x == x and e.y == y]):
                 # Use a simple selection of useful items for vault loot
                 item_choices = ['healing_potion', 'lightning_scroll', 'fireball_scroll', 
                                'speed_potion', 'teleport_scroll', 'identify_scroll']
-                item_type = choice(item_choices)
+                item_type = get_rng("mapgen").choice(item_choices)
                 
                 # Try to create the item
                 item = entity_factory.create_spell_item(item_type, x, y)
@@ -1884,10 +2024,9 @@ class GameMap:
         Returns:
             bool: True if the tile is blocked or out of bounds, False otherwise
         """
-        tile = self.get_tile(x, y)
-        if tile is None:
+        if not self.is_in_bounds(x, y):
             return True  # Out of bounds = blocked
-        return tile.blocked
+        return bool(self.blocked[x, y])
     
     def is_explored(self, x: int, y: int) -> bool:
         """Check if a tile has been explored by the player.
@@ -1901,10 +2040,9 @@ class GameMap:
         Returns:
             bool: True if tile is explored, False if unexplored or out of bounds
         """
-        tile = self.get_tile(x, y)
-        if tile is None:
+        if not self.is_in_bounds(x, y):
             return False  # Out of bounds = not explored
-        return tile.explored
+        return bool(self.explored[x, y])
     
     def is_walkable(self, x: int, y: int) -> bool:
         """Check if a tile is walkable (not blocked).
@@ -1977,25 +2115,11 @@ class GameMap:
                 f"Depth boon application failed at depth {self.dungeon_level}: {_boon_exc}"
             )
 
-        entities = [player]
+        entities = EntityList([player])
+
+        # Level template overrides might change map dimensions
+        map_width, map_height = floor_dimensions(self.dungeon_level, constants)
 
-        # Check for level template overrides that might change map dimensions
-        template_registry = get_level_template_registry()
-        level_override = template_registry.get_level_override(self.dungeon_level)
-        
-        # Get map dimensions (with potential overrides)
-        map_width = constants["map_width"]
-        map_height = constants["map_height"]
-        
-        if level_override and level_override.has_parameters():
-            params = level_override.parameters
-            if params.map_width is not None:
-                map_width = params.map_width
-                logger.info(f"Level {self.dungeon_level}: Overriding map_width = {map_width}")
-            if params.map_height is not None:
-                map_height = params.map_height
-                logger.info(f"Level {self.dungeon_level}: Overriding map_height = {map_height}")
-        
         # Update map dimensions before reinitializing tiles
         self.width = map_width
         self.height = map_height
@@ -2178,7 +2302,7 @@ class GameMap:
             removed_count = original_count - len(entities)
             logger.info(f"Replaced {removed_count} random spawns with guaranteed spawns")
             
-        entity_factory = get_entity_factory()
+        entity_factory = self._entity_factory()
         spawned_count = 0
         failed_count = 0
         
@@ -2226,8 +2350,7 @@ class GameMap:
                     
                     monster = entity_factory.create_monster(spawn.entity_type, x, y, depth=self.dungeon_level)
                     if monster:
-                        from components.monster_equipment import spawn_equipment_on_monster
-                        spawn_equipment_on_monster(monster, self.dungeon_level)
+                        self._equip_monster(monster, self.dungeon_level)
                         entities.append(monster)
                         invalidate_entity_cache("guaranteed_spawn_monster")
                         spawned_count += 1
@@ -2259,8 +2382,7 @@ class GameMap:
                     monster = entity_factory.create_monster(spawn.entity_type, x, y, depth=self.dungeon_level)
                     if monster:
                         # Try to spawn equipment on the monster
-                        from components.monster_equipment import spawn_equipment_on_monster
-                        spawn_equipment_on_monster(monster, self.dungeon_level)
+                        self._equip_monster(monster, self.dungeon_level)
                         
                         entities.append(monster)
                         invalidate_entity_cache("guaranteed_spawn_monster")
@@ -2383,14 +2505,14 @@ class GameMap:
         """
         for attempt in range(max_attempts):
             # Pick a random room entry
-            room_entry = rooms[randint(0, len(rooms) - 1)]
+            room_entry = rooms[get_rng("mapgen").randint(0, len(rooms) - 1)]
             
             # Extract rect from room entry (handle both old and new format)
             room = room_entry['rect'] if isinstance(room_entry, dict) else room_entry
             
             # Pick a random position in that room
-            x = randint(room.x1 + 1, room.x2 - 1)
-            y = randint(room.y1 + 1, room.y2 - 1)
+            x = get_rng("mapgen").randint(room.x1 + 1, room.x2 - 1)
+            y = get_rng("mapgen").randint(room.y1 + 1, room.y2 - 1)
             
             # Check if position is unoccupied
             if not any(entity.x == x and entity.y == y for entity in entities):
@@ -2454,9 +2576,8 @@ class GameMap:
             etp_max = level_override.encounter_budget.etp_max
         
         # Shuffle room order for randomness
-        from random import shuffle
         room_indices = list(range(len(rooms)))
-        shuffle(room_indices)
+        get_rng("mapgen").shuffle(room_indices)
         
         for attempt, room_idx in enumerate(room_indices):
             if attempt >= max_attempts:
@@ -2528,8 +2649,8 @@ class GameMap:
             tuple: (x, y) coordinates, or (None, None) if no position found
         """
         for attempt in range(max_attempts):
-            x = randint(room.x1 + 1, room.x2 - 1)
-            y = randint(room.y1 + 1, room.y2 - 1)
+            x = get_rng("mapgen").randint(room.x1 + 1, room.x2 - 1)
+            y = get_rng("mapgen").randint(room.y1 + 1, room.y2 - 1)
             
             # Check if position is unoccupied
             if not any(entity.x == x and entity.y == y for entity in entities):
@@ -2629,15 +2750,13 @@ class GameMap:
             available_rooms.sort(key=lambda r: self._get_room_size(r['rect']))
         elif special_room.placement == "random":
             # Shuffle for random selection
-            from random import shuffle
-            shuffle(available_rooms)
+            get_rng("mapgen").shuffle(available_rooms)
         else:
             logger.warning(
                 f"Unknown placement strategy '{special_room.placement}', "
                 f"using random"
             )
-            from random import shuffle
-            shuffle(available_rooms)
+            get_rng("mapgen").shuffle(available_rooms)
             
         # Return up to 'count' rooms
         return available_rooms[:special_room.count]
@@ -2680,7 +2799,7 @@ class GameMap:
             f"({room.center()[0]}, {room.center()[1]})"
         )
         
-        entity_factory = get_entity_factory()
+        entity_factory = self._entity_factory()
         spawned_count = 0
         failed_count = 0
         
@@ -2709,8 +2828,7 @@ class GameMap:
                     
                 monster = entity_factory.create_monster(spawn.entity_type, x, y, depth=self.dungeon_level)
                 if monster:
-                    from components.monster_equipment import spawn_equipment_on_monster
-                    spawn_equipment_on_monster(monster, self.dungeon_level)
+                    self._equip_monster(monster, self.dungeon_level)
                     entities.append(monster)
                     invalidate_entity_cache("special_room_monster")
                     spawned_count += 1
@@ -2792,8 +2910,8 @@ class GameMap:
             tuple: (x, y) coordinates, or (None, None) if no position found
         """
         for attempt in range(max_attempts):
-            x = randint(room.x1 + 1, room.x2 - 1)
-            y = randint(room.y1 + 1, room.y2 - 1)
+            x = get_rng("mapgen").randint(room.x1 + 1, room.x2 - 1)
+            y = get_rng("mapgen").randint(room.y1 + 1, room.y2 - 1)
             
             # Check if position is unoccupied
             if not any(entity.x == x and entity.y == y for entity in entities):
@@ -2819,7 +2937,7 @@ class GameMap:
         # Pick a room that's not the last room (where Ruby Heart/stairs are)
         # Prefer a room further from the start
         if len(rooms) > 3:
-            secret_room_entry = rooms[randint(len(rooms) // 2, len(rooms) - 2)]
+            secret_room_entry = rooms[get_rng("mapgen").randint(len(rooms) // 2, len(rooms) - 2)]
         else:
             secret_room_entry = rooms[0]
         
@@ -2873,17 +2991,16 @@ class GameMap:
         logger.info(f"=== SECRET RITUAL ROOM CREATED at ({secret_x}, {secret_y}) ===")
         
         # Spawn 2-3 Corrupted Ritualists in the secret room
-        from config.entity_factory import get_entity_factory
-        factory = get_entity_factory()
+        factory = self._entity_factory()
         
-        num_ritualists = randint(2, 3)
+        num_ritualists = get_rng("mapgen").randint(2, 3)
         ritual_center_x = secret_x + secret_w // 2
         ritual_center_y = secret_y + secret_h // 2
         
         for i in range(num_ritualists):
             # Spawn ritualists around the room
-            offset_x = randint(-2, 2)
-            offset_y = randint(-2, 2)
+            offset_x = get_rng("mapgen").randint(-2, 2)
+            offset_y = get_rng("mapgen").randint(-2, 2)
             ritualist_x = ritual_center_x + offset_x
             ritualist_y = ritual_center_y + offset_y
             
@@ -2930,7 +3047,7 @@ class GameMap:
             # No camp room exists, create one by converting a random room
             # Pick a room that's not the first (player spawn) or last (stairs)
             if len(rooms) > 2:
-                camp_room_entry = rooms[randint(1, len(rooms) - 2)]
+                camp_room_entry = rooms[get_rng("mapgen").randint(1, len(rooms) - 2)]
             else:
                 camp_room_entry = rooms[0]  # Fallback to first room
             
@@ -2942,7 +3059,7 @@ class GameMap:
             # Clear monsters from this room to make it safe
             entities_to_remove = [
                 e for e in entities
-                if (hasattr(e, 'ai') and e.get_component_optional(ComponentType.AI) and 
+                if (getattr(e, 'ai', None) and 
                     camp_room.x1 < e.x < camp_room.x2 and 
                     camp_room.y1 < e.y < camp_room.y2)
             ]
@@ -2966,8 +3083,7 @@ class GameMap:
                 return
         
         # Spawn the Ghost Guide!
-        from config.entity_factory import get_entity_factory
-        factory = get_entity_factory()
+        factory = self._entity_factory()
         
         guide = factory.create_unique_npc('ghost_guide', guide_x, guide_y, self.dungeon_level)
         if guide:
@@ -2989,7 +3105,6 @@ class GameMap:
         """
         from components.component_registry import ComponentType
         from components.door import Door
-        from config.entity_factory import get_entity_factory
         
         # Find all locked doors and their key requirements
         locked_doors = {}  # key_tag -> [door_entities]
@@ -3030,7 +3145,7 @@ class GameMap:
                 
                 if spawn_pos[0] is not None:
                     x, y = spawn_pos
-                    factory = get_entity_factory()
+                    factory = self._entity_factory()
                     
                     # Create key matching the key_tag
                     key = factory.create_spell_item(key_tag, x, y)
@@ -17,10 +17,10 @@ Usage:
 """
 
 from abc import ABC, abstractmethod
-from random import randint
 from typing import List, Tuple, Optional, TYPE_CHECKING
 
 from map_objects.rectangle import Rect
+from engine.rng_config import get_rng
 from random_utils import from_dungeon_level, random_choice_from_dict
 from config.testing_config import get_testing_config
 import logging
@@ -105,15 +105,15 @@ class RoomGenerator(ABC):
         x_min, y_min, x_max, y_max = bounds
         
         # Random dimensions
-        w = randint(self.min_size, self.max_size)
-        h = randint(self.min_size, self.max_size)
+        w = get_rng("mapgen").randint(self.min_size, self.max_size)
+        h = get_rng("mapgen").randint(self.min_size, self.max_size)
         
         # Random position without going out of bounds
         if x_max - w - 1 <= x_min or y_max - h - 1 <= y_min:
             return None  # Not enough space
         
-        x = randint(x_min, x_max - w - 1)
-        y = randint(y_min, y_max - h - 1)
+        x = get_rng("mapgen").randint(x_min, x_max - w - 1)
+        y = get_rng("mapgen").randint(y_min, y_max - h - 1)
         
         return Rect(x, y, w, h)
     
@@ -207,11 +207,11 @@ class TreasureRoomGenerator(RoomGenerator):
         
         # Fewer monsters (50% normal)
         max_monsters = max(1, from_dungeon_level([[2, 1], [3, 4], [5, 6]], dungeon_level) // 2)
-        num_monsters = randint(0, max_monsters)
+        num_monsters = get_rng("mapgen").randint(0, max_monsters)
         
         # More items (200% normal)
         max_items = from_dungeon_level([[1, 1], [2, 4]], dungeon_level) * 2
-        num_items = randint(2, max_items)  # At least 2 items
+        num_items = get_rng("mapgen").randint(2, max_items)  # At least 2 items
         
         factory = get_entity_factory()
         
@@ -246,13 +246,13 @@ class BossRoomGenerator(RoomGenerator):
         x_min, y_min, x_max, y_max = bounds
         
         # Square dimensions
-        size = randint(self.min_size, self.max_size)
+        size = get_rng("mapgen").randint(self.min_size, self.max_size)
         
         if x_max - size - 1 <= x_min or y_max - size - 1 <= y_min:
             return None
         
-        x = randint(x_min, x_max - size - 1)
-        y = randint(y_min, y_max - size - 1)
+        x = get_rng("mapgen").randint(x_min, x_max - size - 1)
+        y = get_rng("mapgen").randint(y_min, y_max - size - 1)
         
         return Rect(x, y, size, size)  # Square room
     
@@ -329,13 +329,12 @@ class CampRoomGenerator(RoomGenerator):
         # No monsters in camp rooms!
         
         # Maybe spawn some healing items (low chance)
-        from random import random
-        if random() < 0.3:  # 30% chance
+        if get_rng("mapgen").random() < 0.3:  # 30% chance
             # Spawn a single healing item
             from config.entity_factory import get_entity_factory
             
-            x = randint(room.x1 + 1, room.x2 - 1)
-            y = randint(room.y1 + 1, room.y2 - 1)
+            x = get_rng("mapgen").randint(room.x1 + 1, room.x2 - 1)
+            y = get_rng("mapgen").randint(room.y1 + 1, room.y2 - 1)
             
             # Check if position is free
             if not any(entity.x == x and entity.y == y for entity in entities):
@@ -398,7 +397,7 @@ class RoomGeneratorFactory:
         
         # Weighted random selection
         total_weight = sum(gen.spawn_chance for gen in self.generators)
-        roll = randint(1, int(total_weight * 100)) / 100.0
+        roll = get_rng("mapgen").randint(1, int(total_weight * 100)) / 100.0
         
         cumulative = 0.0
         for gen in self.generators:
@@ -15,7 +15,8 @@ Example:
 """
 
 from typing import Tuple, Optional, List, Dict, Any, TYPE_CHECKING
-import random
+
+from engine.rng_config import get_rng
 
 if TYPE_CHECKING:
     pass
@@ -105,7 +106,7 @@ class SecretDoor:
                         break
         
         # Roll for reveal
-        if random.random() < chance:
+        if get_rng("combat").random() < chance:
             self.revealed = True
             return {
                 "secret_revealed": True,
@@ -114,7 +115,7 @@ class SecretDoor:
             }
         
         # Not revealed yet - maybe give a hint
-        if not self.hint_given and distance <= 1 and random.random() < 0.5:
+        if not self.hint_given and distance <= 1 and get_rng("combat").random() < 0.5:
             self.hint_given = True
             return {
                 "secret_hint": True,
@@ -149,7 +150,7 @@ class SecretDoor:
             "Odd marks on the floor suggest this wall has been moved before...",
         ]
         
-        return random.choice(hints)
+        return get_rng("combat").choice(hints)
     
     def get_reveal_message(self, distance: float) -> str:
         """Get a reveal message based on how the door was found.
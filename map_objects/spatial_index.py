@@ -0,0 +1,352 @@
+"""Spatial hash of entities by tile.
+
+``EntityList`` is a drop-in ``list`` of entities that keeps a ``SpatialIndex``
+(and a ``ComponentIndex``, see ``map_objects.component_index``) current as
+entities are added, removed and moved. Entities notify every index
+they belong to when their ``x``/``y`` change (see ``Entity.x``), so direct
+coordinate assignments (teleports, knockback, portals) stay indexed too.
+
+Lookup helpers in this module accept any entity sequence: an ``EntityList``
+answers from its index, a plain list (tests, ad-hoc callers) falls back to a
+linear scan with the same results.
+"""
+
+from itertools import count
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from components.component_registry import ComponentType
+from map_objects.component_index import ComponentIndex
+
+Position = Tuple[int, int]
+
+
+class SpatialIndex:
+    """Maps tile positions to the entities standing on them.
+
+    Attributes:
+        cells (dict): (x, y) -> list of entities at that tile, in arrival order
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.cells: Dict[Position, List[Any]] = {}
+        # id(entity) -> [indexed position, membership count, insertion sequence]
+        self._members: Dict[int, list] = {}
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, entity: Any) -> bool:
+        return id(entity) in self._members
+
+    def add(self, entity: Any) -> None:
+        """Index an entity (again, if it is already a member)."""
+        member = self._members.get(id(entity))
+        if member is not None:
+            member[1] += 1
+            return
+        pos = (entity.x, entity.y)
+        self._members[id(entity)] = [pos, 1, next(self._sequence)]
+        self.cells.setdefault(pos, []).append(entity)
+        entity._spatial_indexes = entity._spatial_indexes + (self,)
+
+    def discard(self, entity: Any) -> None:
+        """Drop one membership of an entity; unindex it when none remain."""
+        member = self._members.get(id(entity))
+        if member is None:
+            return
+        member[1] -= 1
+        if member[1] > 0:
+            return
+        del self._members[id(entity)]
+        self._remove_from_cell(entity, member[0])
+        entity._spatial_indexes = tuple(
+            index for index in entity._spatial_indexes if index is not self
+        )
+
+    def clear(self) -> None:
+        """Drop every entity from the index."""
+        for cell in self.cells.values():
+            for entity in cell:
+                entity._spatial_indexes = tuple(
+                    index for index in entity._spatial_indexes if index is not self
+                )
+        self.cells.clear()
+        self._members.clear()
+
+    def update(self, entity: Any) -> None:
+        """Re-file an entity after its position changed."""
+        member = self._members.get(id(entity))
+        if member is None:
+            return
+        pos = (entity.x, entity.y)
+        if pos == member[0]:
+            return
+        self._remove_from_cell(entity, member[0])
+        member[0] = pos
+        self.cells.setdefault(pos, []).append(entity)
+
+    def resequence(self, entities: Iterable[Any]) -> None:
+        """Renumber insertion order to follow ``entities`` (after an insert or reorder)."""
+        sequence = count()
+        renumbered = set()
+        for entity in entities:
+            member = self._members.get(id(entity))
+            if member is not None and id(entity) not in renumbered:
+                renumbered.add(id(entity))
+                member[2] = next(sequence)
+        self._sequence = sequence
+
+    def _remove_from_cell(self, entity: Any, pos: Position) -> None:
+        cell = self.cells.get(pos)
+        if not cell:
+            return
+        for i, other in enumerate(cell):
+            if other is entity:
+                del cell[i]
+                break
+        if not cell:
+            del self.cells[pos]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def at(self, x: int, y: int) -> List[Any]:
+        """Return the entities at (x, y) (a new list; may be empty)."""
+        return list(self.cells.get((x, y), ()))
+
+    def blocking_at(self, x: int, y: int) -> Optional[Any]:
+        """Return the first blocking entity at (x, y), or None."""
+        for entity in self.cells.get((x, y), ()):
+            if entity.blocks:
+                return entity
+        return None
+
+    def in_range(self, x: int, y: int, radius: int) -> List[Any]:
+        """Return entities within Chebyshev distance ``radius`` of (x, y).
+
+        Results are in insertion order (list order for an ``EntityList``).
+        """
+        found = []
+        if (2 * radius + 1) ** 2 < len(self.cells):
+            for cx in range(x - radius, x + radius + 1):
+                for cy in range(y - radius, y + radius + 1):
+                    found.extend(self.cells.get((cx, cy), ()))
+        else:
+            for (cx, cy), cell in self.cells.items():
+                if abs(cx - x) <= radius and abs(cy - y) <= radius:
+                    found.extend(cell)
+        return self._in_insertion_order(found)
+
+    def in_mask(self, mask: np.ndarray) -> List[Any]:
+        """Return entities standing on True cells of a (width, height) bool mask.
+
+        Results are in insertion order (list order for an ``EntityList``).
+        """
+        width, height = mask.shape
+        found = []
+        for (cx, cy), cell in self.cells.items():
+            if 0 <= cx < width and 0 <= cy < height and mask[cx, cy]:
+                found.extend(cell)
+        return self._in_insertion_order(found)
+
+    def _in_insertion_order(self, entities: List[Any]) -> List[Any]:
+        members = self._members
+        entities.sort(key=lambda entity: members[id(entity)][2])
+        return entities
+
+
+class EntityList(list):
+    """A list of entities with a maintained ``SpatialIndex`` and ``ComponentIndex``.
+
+    All list mutators keep ``spatial_index`` and ``component_index`` in step
+    with the contents and in list order, and bump ``mutations`` so caches built from the list
+    can tell that its membership changed even when its length did not.
+    """
+
+    def __init__(self, iterable: Iterable[Any] = ()):
+        super().__init__(iterable)
+        self.spatial_index = SpatialIndex()
+        self.component_index = ComponentIndex()
+        self.mutations = 0
+        for entity in self:
+            self._track(entity)
+
+    def __reduce__(self):
+        # Rebuild the indexes on unpickle/deepcopy instead of copying them
+        return (EntityList, (list(self),))
+
+    def with_components(self, *component_types: ComponentType) -> List[Any]:
+        """Return entities that have every one of ``component_types``, in list order."""
+        return self.component_index.with_components(*component_types)
+
+    def _track(self, entity: Any) -> None:
+        self.spatial_index.add(entity)
+        self.component_index.add(entity)
+        self.mutations += 1
+
+    def _untrack(self, entity: Any) -> None:
+        self.spatial_index.discard(entity)
+        self.component_index.discard(entity)
+        self.mutations += 1
+
+    def append(self, entity: Any) -> None:
+        super().append(entity)
+        self._track(entity)
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        items = list(iterable)
+        super().extend(items)
+        for entity in items:
+            self._track(entity)
+
+    def __iadd__(self, iterable: Iterable[Any]) -> 'EntityList':
+        self.extend(iterable)
+        return self
+
+    def insert(self, i: int, entity: Any) -> None:
+        super().insert(i, entity)
+        self._track(entity)
+        self._resequence()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._resequence()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._resequence()
+
+    def _resequence(self) -> None:
+        # Indexes number entities in arrival order; renumber them when an
+        # entity lands anywhere but the end so queries stay in list order
+        self.spatial_index.resequence(self)
+        self.component_index.resequence(self)
+
+    def remove(self, entity: Any) -> None:
+        super().remove(entity)
+        self._untrack(entity)
+
+    def pop(self, i: int = -1) -> Any:
+        entity = super().pop(i)
+        self._untrack(entity)
+        return entity
+
+    def clear(self) -> None:
+        super().clear()
+        self.spatial_index.clear()
+        self.component_index.clear()
+        self.mutations += 1
+
+    def __setitem__(self, i, value) -> None:
+        old = self[i]
+        if isinstance(i, slice):
+            value = list(value)
+            super().__setitem__(i, value)
+            for entity in old:
+                self._untrack(entity)
+            for entity in value:
+                self._track(entity)
+        else:
+            super().__setitem__(i, value)
+            self._untrack(old)
+            self._track(value)
+        self._resequence()
+
+    def __delitem__(self, i) -> None:
+        old = self[i]
+        super().__delitem__(i)
+        for entity in (old if isinstance(i, slice) else (old,)):
+            self._untrack(entity)
+
+
+def _index_of(entities: Iterable[Any]) -> Optional[SpatialIndex]:
+    return getattr(entities, 'spatial_index', None)
+
+
+def entities_at(entities: Iterable[Any], x: int, y: int) -> List[Any]:
+    """Return every entity at (x, y).
+
+    Args:
+        entities: EntityList or any iterable of entities
+
+    Returns:
+        list: Entities at the tile (empty if none)
+    """
+    index = _index_of(entities)
+    if index is not None:
+        return index.at(x, y)
+    return [entity for entity in entities if entity.x == x and entity.y == y]
+
+
+def blocking_entity_at(entities: Iterable[Any], x: int, y: int) -> Optional[Any]:
+    """Return a blocking entity at (x, y), or None.
+
+    Args:
+        entities: EntityList or any iterable of entities
+    """
+    index = _index_of(entities)
+    if index is not None:
+        return index.blocking_at(x, y)
+    for entity in entities:
+        if entity.blocks and entity.x == x and entity.y == y:
+            return entity
+    return None
+
+
+def entities_in_range(entities: Iterable[Any], x: int, y: int, radius: int) -> List[Any]:
+    """Return entities within Chebyshev distance ``radius`` of (x, y).
+
+    Args:
+        entities: EntityList or any iterable of entities
+    """
+    index = _index_of(entities)
+    if index is not None:
+        return index.in_range(x, y, radius)
+    return [
+        entity for entity in entities
+        if abs(entity.x - x) <= radius and abs(entity.y - y) <= radius
+    ]
+
+
+def entities_in_fov(entities: Iterable[Any], fov_map: Any) -> List[Any]:
+    """Return entities standing on tiles currently visible in ``fov_map``.
+
+    Args:
+        entities: EntityList or any iterable of entities
+        fov_map: FOV map (ModernFOVMap, tcod.map.Map, or anything
+            map_is_in_fov accepts)
+    """
+    visibility = fov_map if isinstance(fov_map, np.ndarray) else getattr(fov_map, 'visibility', None)
+    if not isinstance(visibility, np.ndarray):
+        fov = getattr(fov_map, 'fov', None)
+        if isinstance(fov, np.ndarray) and not hasattr(fov_map, 'is_in_fov'):
+            # A bare tcod.map.Map: [y, x] by default, [x, y] when built with
+            # order="F". The shape tells them apart; on a square map the
+            # order="F" view is the one that steps fastest along its first axis.
+            width, height = fov_map.width, fov_map.height
+            if width != height:
+                x_major = fov.shape == (width, height)
+            else:
+                x_major = fov.strides[0] < fov.strides[1]
+            visibility = fov if x_major else fov.T
+
+    if isinstance(visibility, np.ndarray):
+        index = _index_of(entities)
+        if index is not None:
+            return index.in_mask(visibility)
+        width, height = visibility.shape
+        return [
+            entity for entity in entities
+            if 0 <= entity.x < width and 0 <= entity.y < height and visibility[entity.x, entity.y]
+        ]
+
+    if not hasattr(fov_map, 'is_in_fov'):
+        return []
+
+    from fov_functions import map_is_in_fov
+    return [entity for entity in entities if map_is_in_fov(fov_map, entity.x, entity.y)]
@@ -0,0 +1,414 @@
+"""Spawn plans - what a generated floor contains, with or without entities.
+
+``GameMap.make_map`` creates every monster, item, chest and trap through the
+entity factories. Tools that only count spawns or sum ETP (the worldgen, loot
+and ETP sanity scripts) paid for full instantiation: AI, fighter stats,
+monster equipment, item identification and wand charges.
+
+``SpawnRecorder`` wraps the entity factory for one ``make_map`` call. It
+records the kind and type id of everything it creates and, in plan-only
+mode, returns a ``PlannedEntity`` stand-in instead of building the entity.
+Placement, occupancy checks, ETP budgeting and pity run unchanged on the
+stand-ins, so a plan and the world built from the same seed cannot drift
+apart. When a ``RunRNG`` is active (see ``engine.rng_config``), factories
+draw from the loot stream and placement from the mapgen stream. Skipping
+instantiation therefore leaves every position and type choice the same.
+
+Doors, signposts and murals are cheap and are read back by the generator
+(key/door validation, mural uniqueness), so they are always built.
+
+Either way the result is a ``SpawnPlan`` (``game_map.spawn_plan``):
+
+    plan = game_map.make_map(..., plan_only=True)
+    plan.count("monster"), plan.total_etp, plan.pity_triggers
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# Kinds recorded for factory-created spawns
+MONSTER_KINDS = frozenset({"monster"})
+ITEM_KINDS = frozenset({"spell_item", "wand", "weapon", "armor", "ring", "unique_item"})
+FEATURE_KINDS = frozenset({"chest", "signpost", "mural", "door", "trap", "npc", "stairs"})
+
+
+@dataclass
+class PlannedSpawn:
+    """One entity on a generated floor.
+
+    Attributes:
+        kind (str): Factory kind ("monster", "weapon", "chest", ...)
+        type_id (str): Registry id passed to the factory (e.g. "orc")
+        name (str): Display name the entity has (or would have)
+        x (int): Tile x
+        y (int): Tile y
+        room_index (int): Index into SpawnPlan.rooms, -1 outside every room
+        etp (float): Monster ETP at this depth (0 for non-monsters)
+        pity (str): Pity category that forced this spawn, or None
+    """
+    kind: str
+    type_id: str
+    name: str
+    x: int
+    y: int
+    room_index: int = -1
+    etp: float = 0.0
+    pity: Optional[str] = None
+
+
+@dataclass
+class PlannedRoom:
+    """A generated room and what was placed in it.
+
+    Attributes:
+        index (int): Position in GameMap.rooms
+        x1, y1, x2, y2 (int): Room rectangle (walls inclusive)
+        role (str): RoomMetadata role ("normal", "boss", "vault", ...)
+        etp (float): Total ETP of the monsters inside
+    """
+    index: int
+    x1: int
+    y1: int
+    x2: int
+    y2: int
+    role: str = "normal"
+    etp: float = 0.0
+
+
+@dataclass
+class SpawnPlan:
+    """Everything ``make_map`` placed on one floor.
+
+    Attributes:
+        depth (int): Dungeon level
+        width (int): Map width
+        height (int): Map height
+        player_pos (tuple): Player start (x, y)
+        rooms (list): PlannedRoom per generated room
+        spawns (list): PlannedSpawn per entity, in entity-list order
+        instantiated (bool): False when built with plan_only=True
+    """
+    depth: int
+    width: int
+    height: int
+    player_pos: Tuple[int, int]
+    rooms: List[PlannedRoom] = field(default_factory=list)
+    spawns: List[PlannedSpawn] = field(default_factory=list)
+    instantiated: bool = True
+
+    def of_kind(self, *kinds: str) -> List[PlannedSpawn]:
+        """Spawns whose kind is one of ``kinds``."""
+        return [spawn for spawn in self.spawns if spawn.kind in kinds]
+
+    @property
+    def monsters(self) -> List[PlannedSpawn]:
+        return self.of_kind(*MONSTER_KINDS)
+
+    @property
+    def items(self) -> List[PlannedSpawn]:
+        return self.of_kind(*ITEM_KINDS)
+
+    def count(self, *kinds: str) -> int:
+        """Number of spawns of the given kinds."""
+        return len(self.of_kind(*kinds))
+
+    def in_room(self, room_index: int) -> List[PlannedSpawn]:
+        """Spawns inside one room."""
+        return [spawn for spawn in self.spawns if spawn.room_index == room_index]
+
+    @property
+    def total_etp(self) -> float:
+        return sum(spawn.etp for spawn in self.spawns)
+
+    @property
+    def pity_triggers(self) -> Dict[str, int]:
+        """Pity spawns on this floor by category."""
+        return dict(Counter(spawn.pity for spawn in self.spawns if spawn.pity))
+
+
+class _PlannedMarker:
+    """Truthy placeholder for a component a PlannedEntity would have."""
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __repr__(self) -> str:
+        return "<planned>"
+
+
+PLANNED = _PlannedMarker()
+
+
+class _NoComponents:
+    """Empty component registry: stand-ins carry no real components."""
+
+    __slots__ = ()
+
+    def has(self, component_type: Any) -> bool:
+        return False
+
+    def get(self, component_type: Any) -> None:
+        return None
+
+
+_NO_COMPONENTS = _NoComponents()
+
+# Attributes set to PLANNED on a stand-in, by kind, so the generator's and the
+# sanity tools' attribute checks (``entity.ai``, ``entity.item``) classify it
+# the way they classify the real entity
+_KIND_MARKERS: Dict[str, Tuple[str, ...]] = {
+    "monster": ("ai", "fighter"),
+    "spell_item": ("item",),
+    "wand": ("item", "wand"),
+    "weapon": ("item", "equippable"),
+    "armor": ("item", "equippable"),
+    "ring": ("item", "equippable"),
+    "unique_item": ("item",),
+    "chest": ("chest",),
+    "trap": ("trap",),
+    "npc": (),
+}
+
+
+class PlannedEntity:
+    """Stand-in returned by a plan-only SpawnRecorder instead of an Entity.
+
+    Has position, name, ``blocks`` and the component attributes the
+    generator inspects (PLANNED or None); ``components`` is always empty.
+    """
+
+    _spatial_indexes: Tuple[Any, ...] = ()
+    components = _NO_COMPONENTS
+
+    ai = fighter = item = equippable = wand = chest = trap = None
+    stairs = signpost = portal = door = None
+
+    def __init__(self, kind: str, type_id: str, name: str, x: int, y: int, blocks: bool = False):
+        self.kind = kind
+        self.type_id = type_id
+        self.name = name
+        self.x = x
+        self.y = y
+        self.blocks = blocks
+        for attr in _KIND_MARKERS.get(kind, ()):
+            setattr(self, attr, PLANNED)
+
+    def get_component_optional(self, component_type: Any) -> None:
+        return None
+
+    def __repr__(self) -> str:
+        return f"PlannedEntity({self.kind}:{self.type_id} @ {self.x},{self.y})"
+
+
+def is_planned(entity: Any) -> bool:
+    """True for a PlannedEntity stand-in."""
+    return isinstance(entity, PlannedEntity)
+
+
+def _definition_name(definition: Any, type_id: str) -> str:
+    if isinstance(definition, dict):
+        return definition.get("name") or type_id.replace("_", " ").title()
+    return getattr(definition, "name", None) or type_id.replace("_", " ").title()
+
+
+class SpawnRecorder:
+    """Entity factory wrapper used by GameMap.make_map.
+
+    Exposes the factory methods the generator calls; anything else is
+    forwarded to the wrapped factory unrecorded.
+
+    Attributes:
+        factory: The real EntityFactory
+        plan_only (bool): Return PlannedEntity stand-ins instead of building
+            monsters, items, chests, traps and NPCs
+    """
+
+    def __init__(self, factory: Any, plan_only: bool = False):
+        self.factory = factory
+        self.plan_only = plan_only
+        # id(entity) -> (entity, kind, type_id); holding the entity keeps ids unique
+        self._created: Dict[int, Tuple[Any, str, str]] = {}
+        self._pity: Dict[int, str] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.factory, name)
+
+    # ------------------------------------------------------------------
+    # Factory methods
+    # ------------------------------------------------------------------
+
+    def create_monster(self, monster_type: str, x: int, y: int, depth: int = 1):
+        if self.plan_only:
+            definition = self.factory.registry.get_monster(monster_type)
+            # Unknown types still get the factory's fallback monster
+            name = definition.name if definition else f"Unknown {monster_type}"
+            return self._plan("monster", monster_type, name, x, y, blocks=True)
+        return self._record(self.factory.create_monster(monster_type, x, y, depth=depth), "monster", monster_type)
+
+    def create_weapon(self, weapon_type: str, x: int, y: int):
+        if self.plan_only:
+            return self._plan_from("weapon", weapon_type, self.factory.registry.get_weapon(weapon_type), x, y)
+        return self._record(self.factory.create_weapon(weapon_type, x, y), "weapon", weapon_type)
+
+    def create_armor(self, armor_type: str, x: int, y: int):
+        if self.plan_only:
+            return self._plan_from("armor", armor_type, self.factory.registry.get_armor(armor_type), x, y)
+        return self._record(self.factory.create_armor(armor_type, x, y), "armor", armor_type)
+
+    def create_ring(self, ring_type: str, x: int, y: int):
+        if self.plan_only:
+            return self._plan_from("ring", ring_type, self.factory.registry.get_ring(ring_type), x, y)
+        return self._record(self.factory.create_ring(ring_type, x, y), "ring", ring_type)
+
+    def create_spell_item(self, spell_type: str, x: int, y: int):
+        if self.plan_only:
+            return self._plan_from("spell_item", spell_type, self.factory.registry.get_spell(spell_type), x, y)
+        return self._record(self.factory.create_spell_item(spell_type, x, y), "spell_item", spell_type)
+
+    def create_wand(self, wand_type: str, x: int, y: int, dungeon_level: int = 1):
+        if self.plan_only:
+            return self._plan_from("wand", wand_type, self.factory.registry.get_wand(wand_type), x, y)
+        return self._record(self.factory.create_wand(wand_type, x, y, dungeon_level), "wand", wand_type)
+
+    def create_chest(self, chest_type: str, x: int, y: int, loot_quality: Optional[str] = None):
+        if self.plan_only:
+            definition = self.factory.registry.get_map_feature(chest_type)
+            if definition is None or definition.feature_type != "chest":
+                return None
+            return self._plan_from("chest", chest_type, definition, x, y, blocks=True)
+        return self._record(self.factory.create_chest(chest_type, x, y, loot_quality=loot_quality), "chest", chest_type)
+
+    def create_unique_item(self, item_type: str, x: int, y: int):
+        if self.plan_only:
+            definition = self._registry_section("unique_items").get(item_type)
+            if definition is None:
+                return None
+            # The factory names unique items from their id, not the YAML name
+            return self._plan("unique_item", item_type, item_type.replace("_", " ").title(), x, y,
+                              blocks=definition.get("blocks", False))
+        return self._record(self.factory.create_unique_item(item_type, x, y), "unique_item", item_type)
+
+    def create_unique_npc(self, npc_type: str, x: int, y: int, dungeon_level: int = 1):
+        if self.plan_only:
+            definition = self._registry_section("unique_npcs").get(npc_type)
+            if definition is None:
+                return None
+            return self._plan_from("npc", npc_type, definition, x, y, blocks=definition.get("blocks", False))
+        return self._record(self.factory.create_unique_npc(npc_type, x, y, dungeon_level), "npc", npc_type)
+
+    def create_trap(self, trap_type: str, x: int, y: int):
+        if self.plan_only:
+            definition = self._registry_section("map_traps").get(trap_type)
+            if definition is None:
+                return None
+            return self._plan_from("trap", trap_type, definition, x, y, blocks=definition.get("blocks", False))
+        return self._record(self.factory.create_trap(trap_type, x, y), "trap", trap_type)
+
+    # Always instantiated (see module docstring)
+
+    def create_door(self, door_type: str, x: int, y: int):
+        return self._record(self.factory.create_door(door_type, x, y), "door", door_type)
+
+    def create_signpost(self, sign_type: str, x: int, y: int, message: Optional[str] = None, depth: int = 1):
+        return self._record(self.factory.create_signpost(sign_type, x, y, message=message, depth=depth),
+                            "signpost", sign_type)
+
+    def create_mural(self, x: int, y: int, depth: int = 1):
+        return self._record(self.factory.create_mural(x, y, depth=depth), "mural", "mural")
+
+    # ------------------------------------------------------------------
+    # Plan building
+    # ------------------------------------------------------------------
+
+    def mark_pity(self, entity: Any, pity_type: str) -> None:
+        """Note that ``entity`` was spawned by the pity system."""
+        self._pity[id(entity)] = pity_type
+
+    def build_plan(self, game_map: Any, player: Any, entities: List[Any]) -> SpawnPlan:
+        """Describe the generated floor.
+
+        Args:
+            game_map: The GameMap after make_map placed everything
+            player: The player entity (left out of the spawns)
+            entities: Final entity list
+
+        Returns:
+            SpawnPlan for the floor
+        """
+        from balance.etp import get_monster_etp
+
+        depth = game_map.dungeon_level
+        rooms = []
+        for index, room_entry in enumerate(game_map.rooms):
+            rect = room_entry["rect"]
+            metadata = room_entry.get("metadata")
+            rooms.append(PlannedRoom(index, rect.x1, rect.y1, rect.x2, rect.y2,
+                                     role=getattr(metadata, "role", "normal") or "normal"))
+
+        plan = SpawnPlan(
+            depth=depth,
+            width=game_map.width,
+            height=game_map.height,
+            player_pos=(player.x, player.y),
+            rooms=rooms,
+            instantiated=not self.plan_only,
+        )
+
+        for entity in entities:
+            if entity is player:
+                continue
+            created = self._created.get(id(entity))
+            if created is not None and created[0] is entity:
+                _, kind, type_id = created
+            elif getattr(entity, "stairs", None):
+                kind, type_id = "stairs", "stairs"
+            else:
+                kind, type_id = "other", entity.name.lower().replace(" ", "_")
+
+            room_index = next(
+                (room.index for room in rooms
+                 if room.x1 <= entity.x <= room.x2 and room.y1 <= entity.y <= room.y2),
+                -1,
+            )
+            etp = get_monster_etp(type_id, depth) if kind == "monster" else 0.0
+            plan.spawns.append(PlannedSpawn(
+                kind=kind,
+                type_id=type_id,
+                name=entity.name,
+                x=entity.x,
+                y=entity.y,
+                room_index=room_index,
+                etp=etp,
+                pity=self._pity.get(id(entity)),
+            ))
+            if room_index >= 0:
+                rooms[room_index].etp += etp
+
+        return plan
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _record(self, entity: Any, kind: str, type_id: str) -> Any:
+        if entity is not None:
+            self._created[id(entity)] = (entity, kind, type_id)
+        return entity
+
+    def _plan(self, kind: str, type_id: str, name: str, x: int, y: int, blocks: bool = False) -> PlannedEntity:
+        return self._record(PlannedEntity(kind, type_id, name, x, y, blocks=blocks), kind, type_id)
+
+    def _plan_from(self, kind: str, type_id: str, definition: Any, x: int, y: int,
+                   blocks: bool = False) -> Optional[PlannedEntity]:
+        # Same None as the real factory for unknown types, so fallback chains
+        # (weapon -> armor -> ring -> spell) pick the same kind
+        if not definition:
+            return None
+        return self._plan(kind, type_id, _definition_name(definition, type_id), x, y, blocks=blocks)
+
+    def _registry_section(self, section: str) -> Dict[str, Any]:
+        data = getattr(self.factory.registry, "data", None) or {}
+        return data.get(section) or {}
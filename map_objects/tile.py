@@ -1,10 +1,12 @@
 """Contains the class for handling tiles on the map"""
 
+import numpy as np
+
 
 class Tile:
     """
     A tile on a map. It may or may not be blocked, and may or may not block sight.
-    
+
     Attributes:
         blocked: Whether the tile blocks movement
         block_sight: Whether the tile blocks line of sight
@@ -22,7 +24,243 @@ class Tile:
 
         self.block_sight = block_sight
         self.explored = False
-        
+
         # Custom colors for special tiles (e.g. vault walls)
         self.light = light  # Color when visible
         self.dark = dark    # Color when explored but not visible
+
+
+# Structured per-cell storage used by GameMap. One record per tile replaces a
+# Tile object per tile; has_light/has_dark distinguish "no custom color" from
+# black since the color fields themselves cannot hold None.
+tile_dt = np.dtype([
+    ("blocked", np.bool_),
+    ("block_sight", np.bool_),
+    ("explored", np.bool_),
+    ("has_light", np.bool_),
+    ("has_dark", np.bool_),
+    ("light", np.uint8, (3,)),
+    ("dark", np.uint8, (3,)),
+])
+
+
+def new_tile_array(width, height, blocked=True):
+    """Create a (width, height) tile array with every cell set alike.
+
+    Args:
+        width (int): Map width in tiles
+        height (int): Map height in tiles
+        blocked (bool): Whether every tile starts blocked (and sight-blocking)
+
+    Returns:
+        np.ndarray: Structured array of ``tile_dt`` in Fortran order, so
+            ``array[x, y]`` matches the ``tiles[x][y]`` convention and field
+            slices can be handed to tcod without transposing.
+    """
+    data = np.zeros((width, height), dtype=tile_dt, order="F")
+    data["blocked"] = blocked
+    data["block_sight"] = blocked
+    return data
+
+
+def tile_array_from_tiles(tiles):
+    """Build a tile array from a list-of-lists of Tile objects.
+
+    Args:
+        tiles: Nested sequence indexed ``tiles[x][y]``
+
+    Returns:
+        np.ndarray: Structured array of ``tile_dt``
+    """
+    width = len(tiles)
+    height = len(tiles[0]) if width else 0
+    data = new_tile_array(width, height)
+    for x in range(width):
+        column = tiles[x]
+        for y in range(height):
+            write_tile(data[x, y], column[y])
+    return data
+
+
+def write_tile(record, tile):
+    """Copy a Tile's fields into one record of a tile array.
+
+    Args:
+        record (np.void): Writable record, e.g. ``data[x, y]``
+        tile (Tile): Source tile
+    """
+    record["blocked"] = bool(tile.blocked)
+    record["block_sight"] = bool(tile.block_sight)
+    record["explored"] = bool(getattr(tile, "explored", False))
+    _write_color(record, "light", getattr(tile, "light", None))
+    _write_color(record, "dark", getattr(tile, "dark", None))
+
+
+def _write_color(record, field, color):
+    if color is None:
+        record["has_" + field] = False
+        record[field] = (0, 0, 0)
+    else:
+        record["has_" + field] = True
+        record[field] = tuple(color)[:3]
+
+
+class TileView(Tile):
+    """Tile-compatible proxy for one cell of a GameMap tile array.
+
+    Reads and writes go straight through to the underlying array, so code
+    written against ``game_map.tiles[x][y].blocked = False`` keeps working.
+    """
+
+    __slots__ = ("_grid", "_x", "_y")
+
+    def __init__(self, grid, x, y):
+        self._grid = grid
+        self._x = x
+        self._y = y
+
+    @property
+    def blocked(self):
+        return bool(self._grid.blocked[self._x, self._y])
+
+    @blocked.setter
+    def blocked(self, value):
+        self._grid.blocked[self._x, self._y] = value
+
+    @property
+    def block_sight(self):
+        return bool(self._grid.block_sight[self._x, self._y])
+
+    @block_sight.setter
+    def block_sight(self, value):
+        self._grid.block_sight[self._x, self._y] = value
+
+    @property
+    def explored(self):
+        return bool(self._grid.explored[self._x, self._y])
+
+    @explored.setter
+    def explored(self, value):
+        grid = self._grid
+        value = bool(value)
+        if value != grid.explored[self._x, self._y]:
+            grid.explored[self._x, self._y] = value
+            grid.explored_count += 1 if value else -1
+
+    @property
+    def light(self):
+        record = self._grid.data[self._x, self._y]
+        if not record["has_light"]:
+            return None
+        return tuple(int(c) for c in record["light"])
+
+    @light.setter
+    def light(self, value):
+        _write_color(self._grid.data[self._x, self._y], "light", value)
+
+    @property
+    def dark(self):
+        record = self._grid.data[self._x, self._y]
+        if not record["has_dark"]:
+            return None
+        return tuple(int(c) for c in record["dark"])
+
+    @dark.setter
+    def dark(self, value):
+        _write_color(self._grid.data[self._x, self._y], "dark", value)
+
+
+class TileColumnView:
+    """One ``tiles[x]`` column of a tile array, indexable by y."""
+
+    __slots__ = ("_grid", "_x")
+
+    def __init__(self, grid, x):
+        self._grid = grid
+        self._x = x
+
+    def __getitem__(self, y):
+        height = self._grid.height
+        if y < 0:
+            y += height
+        if not 0 <= y < height:
+            raise IndexError("tile row index out of range")
+        return TileView(self._grid, self._x, y)
+
+    def __setitem__(self, y, tile):
+        write_tile(self._grid.data[self._x, y], tile)
+
+    def __len__(self):
+        return self._grid.height
+
+    def __iter__(self):
+        for y in range(self._grid.height):
+            yield TileView(self._grid, self._x, y)
+
+
+class TileGridView:
+    """``tiles[x][y]`` compatibility view over a GameMap tile array.
+
+    Attributes:
+        data (np.ndarray): The structured ``tile_dt`` array being viewed
+        blocked, block_sight, explored (np.ndarray): Field views of ``data``
+        explored_count (int): Running number of explored cells. Kept in step
+            by TileView and GameMap.mark_explored; raw writes to ``explored``
+            bypass it.
+    """
+
+    __slots__ = ("data", "blocked", "block_sight", "explored", "explored_count", "width", "height")
+
+    def __init__(self, data):
+        self.data = data
+        self.blocked = data["blocked"]
+        self.block_sight = data["block_sight"]
+        self.explored = data["explored"]
+        self.explored_count = int(np.count_nonzero(self.explored))
+        self.width, self.height = data.shape
+
+    def __getitem__(self, x):
+        if x < 0:
+            x += self.width
+        if not 0 <= x < self.width:
+            raise IndexError("tile column index out of range")
+        return TileColumnView(self, x)
+
+    def __len__(self):
+        return self.width
+
+    def __iter__(self):
+        for x in range(self.width):
+            yield TileColumnView(self, x)
+
+    def __reduce__(self):
+        # Rebuild the field views from the copied array so copies and pickles
+        # don't end up with detached blocked/explored arrays.
+        return (TileGridView, (self.data,))
+
+
+def tile_field_array(game_map, field):
+    """Return a (width, height) bool array of one tile field for a map.
+
+    Real GameMaps hand back their live field view (so writes go through).
+    Maps that only expose ``tiles[x][y]`` (test doubles, ad-hoc maps) get a
+    read-only snapshot built cell by cell.
+
+    Args:
+        game_map: GameMap or any object with width/height/tiles
+        field (str): 'blocked', 'block_sight' or 'explored'
+
+    Returns:
+        np.ndarray: Bool array indexed ``[x, y]``
+    """
+    array = getattr(game_map, field, None)
+    if isinstance(array, np.ndarray):
+        return array
+    width, height = game_map.width, game_map.height
+    tiles = game_map.tiles
+    array = np.zeros((width, height), dtype=bool, order="F")
+    for x in range(width):
+        column = tiles[x]
+        for y in range(height):
+            array[x, y] = bool(getattr(column[y], field))
+    return array
@@ -13,38 +13,42 @@ Key Components:
 - PooledObjects: Pre-configured pooled versions of common game objects
 """
 
-from .core import (
-    ObjectPool, PooledObject, PoolableObject, PoolManager,
-    MemoryManager, MemoryConfig, MemoryStats, PoolStrategy
-)
-from .pools import (
-    MessagePool, EntityPool, ComponentPool, EventPool,
-    TemporaryObjectPool, create_default_pools,
-    PooledMessage, PooledEntity, PooledEvent, PooledComponent, TemporaryObject
-)
-from .cache import (
-    SmartCache, CacheConfig, CacheStats, LRUCache, TTLCache,
-    WeakRefCache, create_cache, CacheStrategy, CacheManager
-)
-from .profiler import (
-    MemoryProfiler, MemorySnapshot, MemoryLeak, LeakDetector,
-    AllocationTracker, create_memory_profiler, LeakSeverity
-)
-from .gc_optimizer import (
-    GCOptimizer, GCConfig, GCStats, optimize_gc_settings,
-    disable_gc_during, gc_collect_if_needed, GCMode
-)
-from .integration import (
-    GameMemoryManager, PooledSystem, integrate_memory_optimization,
-    MemoryOptimizedEngine, create_optimized_engine, MemoryOptimizationConfig,
-    initialize_game_memory_manager
-)
-from .utils import (
-    get_object_size, get_memory_usage, format_memory_size,
-    memory_usage_context, track_allocations, MemoryMonitor, ObjectRegistry,
-    AllocationTracker as UtilsAllocationTracker, get_global_allocation_tracker,
-    get_global_memory_monitor
-)
+from utils.lazy_exports import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    '.core': [
+        'ObjectPool', 'PooledObject', 'PoolableObject', 'PoolManager', 'MemoryManager',
+        'MemoryConfig', 'MemoryStats', 'PoolStrategy',
+    ],
+    '.pools': [
+        'MessagePool', 'EntityPool', 'ComponentPool', 'EventPool', 'TemporaryObjectPool',
+        'create_default_pools', 'PooledMessage', 'PooledEntity', 'PooledEvent',
+        'PooledComponent', 'TemporaryObject',
+    ],
+    '.cache': [
+        'SmartCache', 'CacheConfig', 'CacheStats', 'LRUCache', 'TTLCache', 'WeakRefCache',
+        'create_cache', 'CacheStrategy', 'CacheManager',
+    ],
+    '.profiler': [
+        'MemoryProfiler', 'MemorySnapshot', 'MemoryLeak', 'LeakDetector', 'AllocationTracker',
+        'create_memory_profiler', 'LeakSeverity',
+    ],
+    '.gc_optimizer': [
+        'GCOptimizer', 'GCConfig', 'GCStats', 'optimize_gc_settings', 'disable_gc_during',
+        'gc_collect_if_needed', 'GCMode', 'GCPauseRecorder', 'HarnessGC', 'scoped_harness_gc',
+    ],
+    '.integration': [
+        'GameMemoryManager', 'PooledSystem', 'integrate_memory_optimization',
+        'MemoryOptimizedEngine', 'create_optimized_engine', 'MemoryOptimizationConfig',
+        'initialize_game_memory_manager',
+    ],
+    '.utils': [
+        'get_object_size', 'get_memory_usage', 'format_memory_size', 'memory_usage_context',
+        'track_allocations', 'MemoryMonitor', 'ObjectRegistry',
+        'AllocationTracker as UtilsAllocationTracker', 'get_global_allocation_tracker',
+        'get_global_memory_monitor',
+    ],
+})
 
 __all__ = [
     # Core
@@ -98,6 +102,9 @@ __all__ = [
     'disable_gc_during',
     'gc_collect_if_needed',
     'GCMode',
+    'GCPauseRecorder',
+    'HarnessGC',
+    'scoped_harness_gc',
     
     # Integration
     'GameMemoryManager',
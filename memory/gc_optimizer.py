@@ -518,3 +518,225 @@ def shutdown_gc_optimizer() -> None:
     if _global_gc_optimizer:
         _global_gc_optimizer.shutdown()
         _global_gc_optimizer = None
+
+
+# ============================================================================
+# HARNESS GC MANAGEMENT
+# ============================================================================
+
+class GCPauseRecorder:
+    """Records every collection, automatic or manual, through gc.callbacks.
+
+    GCOptimizer only sees the collections it triggers itself; this hooks the
+    interpreter so the pauses the game actually takes are counted too.
+    """
+
+    def __init__(self):
+        """Initialize a recorder (not yet listening)."""
+        self.stats = GCStats()
+        self._started_at = 0.0
+        self._listening = False
+
+    def start(self) -> None:
+        """Start recording collections."""
+        if not self._listening:
+            gc.callbacks.append(self._on_gc)
+            self._listening = True
+
+    def stop(self) -> None:
+        """Stop recording collections."""
+        if self._listening:
+            gc.callbacks.remove(self._on_gc)
+            self._listening = False
+
+    def reset(self) -> None:
+        """Clear recorded statistics."""
+        self.stats = GCStats()
+
+    def _on_gc(self, phase: str, info: Dict[str, int]) -> None:
+        if phase == 'start':
+            self._started_at = time.perf_counter()
+            return
+        pause_ms = (time.perf_counter() - self._started_at) * 1000
+        stats = self.stats
+        generation = info.get('generation', 2)
+        if generation == 0:
+            stats.collections_gen0 += 1
+        elif generation == 1:
+            stats.collections_gen1 += 1
+        else:
+            stats.collections_gen2 += 1
+        stats.objects_collected += info.get('collected', 0)
+        stats.objects_uncollectable += info.get('uncollectable', 0)
+        stats.total_gc_time_ms += pause_ms
+        stats.max_gc_time_ms = max(stats.max_gc_time_ms, pause_ms)
+        stats.average_gc_time_ms = stats.total_gc_time_ms / stats.total_collections
+
+
+class HarnessGC:
+    """GC policy for batch harnesses (bot soak, scenario runs).
+
+    - ``freeze_static_content()``: collect once, then ``gc.freeze()`` so the
+      loaded content registries are never rescanned.
+    - ``begin_run()``/``end_run()``: automatic GC is off for the whole run.
+      Every ``turn_batch`` enemy phases the harness runs the young-generation
+      collection the interpreter's thresholds call for, if any; the oldest
+      generation is only collected between runs.
+    - ``enemy_phase()``: GC off while monsters act; counts turns for batching.
+    - ``collect_between_runs()``: one full collection outside the timed run.
+
+    Pauses are recorded either way, so a run with ``manage=False`` is the
+    baseline to compare against.
+
+    Attributes:
+        manage (bool): Whether GC is managed (False: only record pauses)
+        turn_batch (int): Enemy phases per batch collection (0: no batching,
+            GC is only disabled during enemy phases)
+        recorder (GCPauseRecorder): Pause statistics for the current run
+        between_runs_ms (float): Time spent in between-run collections
+    """
+
+    def __init__(self, manage: bool = True, turn_batch: int = 8):
+        """Initialize the policy.
+
+        Args:
+            manage (bool): Manage GC; when False only record pauses
+            turn_batch (int): Enemy phases per batch collection
+        """
+        self.manage = manage
+        self.turn_batch = turn_batch
+        self.recorder = GCPauseRecorder()
+        self.between_runs_ms = 0.0
+        self._turns_in_batch = 0
+        self._frozen = False
+        self._in_run = False
+        self._gc_was_enabled = gc.isenabled()
+
+    def start(self) -> None:
+        """Make this the active harness policy and start recording pauses."""
+        global _active_harness_gc
+        self._gc_was_enabled = gc.isenabled()
+        self.recorder.start()
+        _active_harness_gc = self
+
+    def stop(self) -> None:
+        """Restore the interpreter's GC state and stop recording."""
+        global _active_harness_gc
+        if self._in_run:
+            self.end_run()
+        if self._frozen:
+            gc.unfreeze()
+            self._frozen = False
+        if self._gc_was_enabled:
+            gc.enable()
+        self.recorder.stop()
+        if _active_harness_gc is self:
+            _active_harness_gc = None
+
+    def freeze_static_content(self) -> None:
+        """Move everything alive now into the permanent generation.
+
+        Call after content registries are loaded and before the first run.
+        """
+        if not self.manage or self._frozen:
+            return
+        gc.collect()
+        gc.freeze()
+        self._frozen = True
+        logger.debug(f"GC: froze {gc.get_freeze_count()} objects of static content")
+
+    def begin_run(self) -> None:
+        """Reset pause statistics and start a run's GC policy."""
+        self.recorder.reset()
+        self._turns_in_batch = 0
+        self._in_run = True
+        if self.manage and self.turn_batch:
+            gc.disable()
+
+    def end_run(self) -> Dict[str, Any]:
+        """End a run's GC policy.
+
+        Returns:
+            Dict[str, Any]: The run's pause statistics (GCStats.to_dict())
+        """
+        self._in_run = False
+        if self._gc_was_enabled:
+            gc.enable()
+        return self.recorder.stats.to_dict()
+
+    def collect_between_runs(self) -> float:
+        """Run a full collection between runs.
+
+        Returns:
+            float: Collection time in milliseconds (0.0 when not managing)
+        """
+        if not self.manage:
+            return 0.0
+        start_time = time.perf_counter()
+        gc.collect()
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self.between_runs_ms += elapsed_ms
+        return elapsed_ms
+
+    @contextlib.contextmanager
+    def enemy_phase(self) -> ContextManager[None]:
+        """Disable GC while the enemy phase runs, then count the turn.
+
+        Yields:
+            None
+        """
+        if not self.manage:
+            yield
+            return
+        with disable_gc_during():
+            yield
+        if self._in_run and self.turn_batch:
+            self._turns_in_batch += 1
+            if self._turns_in_batch >= self.turn_batch:
+                self._collect_batch()
+
+    def _collect_batch(self) -> None:
+        # Run the collection the interpreter would have run by now, if any:
+        # collections move to batch boundaries, they don't become more frequent
+        self._turns_in_batch = 0
+        counts, thresholds = gc.get_count(), gc.get_threshold()
+        if counts[0] < thresholds[0]:
+            return
+        gc.collect(1 if counts[1] >= thresholds[1] else 0)
+
+
+_active_harness_gc: Optional[HarnessGC] = None
+
+_NULL_PHASE = contextlib.nullcontext()
+
+
+def get_active_harness_gc() -> Optional[HarnessGC]:
+    """Return the active harness GC policy if one is set."""
+    return _active_harness_gc
+
+
+def harness_enemy_phase():
+    """Enemy-phase GC context of the active harness, or a no-op if none."""
+    harness_gc = _active_harness_gc
+    if harness_gc is None:
+        return _NULL_PHASE
+    return harness_gc.enemy_phase()
+
+
+@contextlib.contextmanager
+def scoped_harness_gc(manage: bool = True, turn_batch: int = 8):
+    """Context manager to scope a HarnessGC policy to a harness session.
+
+    Args:
+        manage (bool): Manage GC; when False only record pauses
+        turn_batch (int): Enemy phases per batch collection
+
+    Yields:
+        HarnessGC: The active policy
+    """
+    harness_gc = HarnessGC(manage=manage, turn_batch=turn_batch)
+    harness_gc.start()
+    try:
+        yield harness_gc
+    finally:
+        harness_gc.stop()
@@ -13,37 +13,41 @@ Key Components:
 - Reports: Detailed performance analysis and recommendations
 """
 
-from .core import (
-    PerformanceProfiler, ProfilerContext, ProfilerResult, ProfilerError,
-    Timer, HighPrecisionTimer, FrameTimer, SystemTimer,
-    get_global_profiler, profile, profile_function
-)
-from .monitor import (
-    PerformanceMonitor, SystemMonitor, MemoryMonitor, FrameRateMonitor,
-    EventMonitor, CustomMonitor, MonitorConfig, MonitorResult
-)
-from .analyzer import (
-    PerformanceAnalyzer, AnalysisResult, PerformanceReport, Benchmark,
-    BottleneckDetector, TrendAnalyzer, StatisticalAnalyzer, Severity
-)
-from .dashboard import (
-    PerformanceDashboard, DashboardConfig, MetricWidget, ChartWidget,
-    AlertWidget, create_dashboard
-)
-from .alerts import (
-    PerformanceAlert, AlertManager, AlertRule, AlertCondition,
-    AlertSeverity, create_alert_rule, ThresholdCondition, TrendCondition,
-    create_threshold_rule, create_trend_rule
-)
-from .integration import (
-    GameEngineProfiler, SystemProfiler, EventProfiler, StateProfiler,
-    integrate_profiling, ProfiledSystem, ProfilingConfig
-)
-from .utils import (
-    format_time, format_memory, format_percentage, format_rate,
-    calculate_percentile, moving_average, exponential_smoothing,
-    calculate_statistics, RollingStatistics, PerformanceThresholds
-)
+from utils.lazy_exports import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    '.core': [
+        'PerformanceProfiler', 'ProfilerContext', 'ProfilerResult', 'ProfilerError', 'Timer',
+        'HighPrecisionTimer', 'FrameTimer', 'SystemTimer', 'get_global_profiler', 'profile',
+        'profile_function',
+    ],
+    '.monitor': [
+        'PerformanceMonitor', 'SystemMonitor', 'MemoryMonitor', 'FrameRateMonitor',
+        'EventMonitor', 'CustomMonitor', 'MonitorConfig', 'MonitorResult',
+    ],
+    '.analyzer': [
+        'PerformanceAnalyzer', 'AnalysisResult', 'PerformanceReport', 'Benchmark',
+        'BottleneckDetector', 'TrendAnalyzer', 'StatisticalAnalyzer', 'Severity',
+    ],
+    '.dashboard': [
+        'PerformanceDashboard', 'DashboardConfig', 'MetricWidget', 'ChartWidget',
+        'AlertWidget', 'create_dashboard',
+    ],
+    '.alerts': [
+        'PerformanceAlert', 'AlertManager', 'AlertRule', 'AlertCondition', 'AlertSeverity',
+        'create_alert_rule', 'ThresholdCondition', 'TrendCondition', 'create_threshold_rule',
+        'create_trend_rule',
+    ],
+    '.integration': [
+        'GameEngineProfiler', 'SystemProfiler', 'EventProfiler', 'StateProfiler',
+        'integrate_profiling', 'ProfiledSystem', 'ProfilingConfig',
+    ],
+    '.utils': [
+        'format_time', 'format_memory', 'format_percentage', 'format_rate',
+        'calculate_percentile', 'moving_average', 'exponential_smoothing',
+        'calculate_statistics', 'RollingStatistics', 'PerformanceThresholds',
+    ],
+})
 
 __all__ = [
     # Core
@@ -4,7 +4,7 @@ This module provides helper functions for making weighted random choices
 and level-based value lookups commonly used in roguelike games.
 """
 
-from random import randint
+from engine.rng_config import get_rng
 
 
 def random_choice_index(chances):
@@ -16,7 +16,7 @@ def random_choice_index(chances):
     Returns:
         int: Index of the chosen option
     """
-    random_chance = randint(1, sum(chances))
+    random_chance = get_rng("mapgen").randint(1, sum(chances))
 
     running_sum = 0
     choice = 0
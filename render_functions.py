@@ -511,8 +511,27 @@ def _render_hazard_at_tile(con, game_map, world_x, world_y, viewport_x, viewport
     if not visible and not game_map.tiles[world_x][world_y].explored:
         return
     
-    # Get hazard character and color based on type
+    hazard_char, hazard_color = _hazard_glyph(hazard, visible, colors)
+    
+    # Render the hazard character on the tile
+    libtcod.console_set_default_foreground(con, hazard_color)
+    libtcod.console_put_char(con, viewport_x, viewport_y, hazard_char, libtcod.BKGND_NONE)
+
+
+def _hazard_glyph(hazard, visible, colors):
+    """Return the (character code, faded color) a ground hazard is drawn with.
+    
+    Shared by the per-tile path above and the vectorized tile renderer.
+    
+    Args:
+        hazard: GroundHazard to draw
+        visible: Whether the tile is currently visible in FOV
+        colors: Color configuration dictionary for floor colors
     
+    Returns:
+        tuple: (character code, (r, g, b) color)
+    """
+    # Get hazard character and color based on type
     if hazard.hazard_type == HazardType.FIRE:
         # Fireball leaves burning embers - use * character
         hazard_char = ord('*')
@@ -545,9 +564,7 @@ def _render_hazard_at_tile(con, game_map, world_x, world_y, viewport_x, viewport
         int(base_color[2] * intensity + floor_color[2] * (1 - intensity))
     )
     
-    # Render the hazard character on the tile
-    libtcod.console_set_default_foreground(con, hazard_color)
-    libtcod.console_put_char(con, viewport_x, viewport_y, hazard_char, libtcod.BKGND_NONE)
+    return hazard_char, hazard_color
 
 
 def clear_all(con, entities):
@@ -19,6 +19,8 @@ from typing import Dict, Optional, Tuple, Any
 from pathlib import Path
 import yaml
 
+from config.content_cache import load_yaml
+
 
 @dataclass(frozen=True)
 class VisualSpec:
@@ -83,8 +85,7 @@ def _load_registry_from_yaml() -> Dict[str, VisualSpec]:
             return registry
     
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(str(config_path))
     except (yaml.YAMLError, IOError):
         return registry
     
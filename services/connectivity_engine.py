@@ -9,7 +9,7 @@ This module provides:
 
 from typing import List, Dict, Tuple, Set, Optional
 from dataclasses import dataclass
-from random import randint, random, choice, sample
+from engine.rng_config import get_rng
 from logger_config import get_logger
 import math
 
@@ -147,7 +147,7 @@ class ConnectivityEngine:
         
         # Select random connections for loops
         loop_count = min(loop_count, len(possible_connections))
-        loop_edges = sample(possible_connections, loop_count)
+        loop_edges = get_rng("mapgen").sample(possible_connections, loop_count)
         
         logger.info(f"Added {len(loop_edges)} loop connections")
         self.loops = loop_edges
@@ -183,7 +183,7 @@ class ConnectivityEngine:
         x1, y1 = start
         x2, y2 = end
         
-        if random() > 0.5:
+        if get_rng("mapgen").random() > 0.5:
             # Horizontal first
             for x in range(min(x1, x2), max(x1, x2) + 1):
                 tiles.append((x, y1))
@@ -221,7 +221,7 @@ class ConnectivityEngine:
                 y += dy
             elif y_dist == 0:
                 x += dx
-            elif random() < (x_dist / (x_dist + y_dist)):
+            elif get_rng("mapgen").random() < (x_dist / (x_dist + y_dist)):
                 x += dx
             else:
                 y += dy
@@ -251,8 +251,8 @@ class ConnectivityEngine:
             tiles.append((x, y))
             
             # Small chance to deviate for organic feel
-            if random() < turn_chance and ((x != x_end and y != y_end)):
-                if random() > 0.5:
+            if get_rng("mapgen").random() < turn_chance and ((x != x_end and y != y_end)):
+                if get_rng("mapgen").random() > 0.5:
                     x += sx
                 else:
                     y += sy
@@ -15,13 +15,13 @@ Key concepts:
 - Pity: Soft (increase weight) → Hard (inject item)
 """
 
-import yaml
 import logging
 import os
 from typing import Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from collections import defaultdict
 
+from config.content_cache import load_yaml
 from utils.resource_paths import get_resource_path
 
 logger = logging.getLogger(__name__)
@@ -184,8 +184,7 @@ class LootController:
             return
         
         try:
-            with open(self.policy_path, 'r') as f:
-                data = yaml.safe_load(f)
+            data = load_yaml(self.policy_path)
             
             if not data or 'loot_policy' not in data:
                 logger.warning("Invalid loot policy format, using defaults")
@@ -0,0 +1,174 @@
+"""Monster activation - keep far-away, unaware monsters dormant.
+
+A ``BasicMonster`` that is not aware of the player, not in combat, not
+taunted and out of the player's FOV does nothing on its turn: it checks for
+taunts and faction rage, looks for the player, and returns. On full-size
+floors most monsters are in that state, yet each still got a full
+``take_turn`` (plus status-effect, regeneration and portal bookkeeping) every
+enemy phase.
+
+``MonsterActivation.select_active`` splits the phase's AI entities into an
+active list, which takes turns as before, and a dormant set, which is skipped.
+A monster is only dormant when skipping it cannot change the game:
+
+- its AI runs ``BasicMonster.take_turn`` unmodified (subclasses that override
+  it, such as necromancers and shamans, always act)
+- it is unaware of the player, not in combat and has no rally directive
+- it has no active status effects (rage, fear, DOTs all tick on its turn)
+- it has nothing to regenerate
+- no entity on the floor is taunted
+- it is outside the player's FOV and further than ``AI_WAKE_RADIUS`` tiles
+
+Dormancy is decided again every phase, so any of those changing (the player
+approaching or coming into view, an attack, a scroll of aggravation, a taunt)
+wakes the monster on the next enemy phase.
+"""
+
+from typing import Any, List, Optional, Set, TYPE_CHECKING
+
+from components.component_registry import ComponentType
+from fov_functions import map_is_in_fov
+from logger_config import get_logger
+
+if TYPE_CHECKING:
+    from entity import Entity
+
+logger = get_logger(__name__)
+
+
+class MonsterActivation:
+    """Splits each enemy phase into active and dormant monsters.
+
+    Attributes:
+        enabled (bool): When False every monster is active
+        wake_radius (int): Chebyshev distance to the player inside which
+            monsters always act
+        phases (int): Enemy phases seen
+        active_turns (int): Monster turns taken over all phases
+        dormant_turns (int): Monster turns skipped over all phases
+        last_active (int): Active monsters in the most recent phase
+        last_dormant (int): Dormant monsters in the most recent phase
+        wakes (int): Monsters that were dormant one phase and active the next
+    """
+
+    def __init__(self, wake_radius: Optional[int] = None, enabled: Optional[bool] = None):
+        """Initialize the service.
+
+        Args:
+            wake_radius: Override for ``PerformanceConfig.AI_WAKE_RADIUS``
+            enabled: Override for ``PerformanceConfig.AI_DORMANCY_ENABLED``
+        """
+        if wake_radius is None or enabled is None:
+            from config.game_constants import get_performance_config
+            config = get_performance_config()
+            if wake_radius is None:
+                wake_radius = config.AI_WAKE_RADIUS
+            if enabled is None:
+                enabled = config.AI_DORMANCY_ENABLED
+        self.enabled = enabled
+        self.wake_radius = wake_radius
+
+        self._dormant_ids: Set[int] = set()
+        self.phases = 0
+        self.active_turns = 0
+        self.dormant_turns = 0
+        self.last_active = 0
+        self.last_dormant = 0
+        self.wakes = 0
+
+    def select_active(self, ai_entities: List['Entity'], player: 'Entity', fov_map: Any,
+                      taunt_active: bool = False) -> List['Entity']:
+        """Return the monsters that should take a turn this phase.
+
+        Args:
+            ai_entities: Living AI entities in turn order
+            player: The player entity
+            fov_map: The player's FOV map (None in headless runs)
+            taunt_active: Whether some entity is taunted (every monster acts)
+
+        Returns:
+            list: ``ai_entities`` minus the dormant ones, order preserved
+        """
+        if not self.enabled or taunt_active or player is None:
+            active = list(ai_entities)
+            dormant_ids: Set[int] = set()
+        else:
+            active = []
+            dormant_ids = set()
+            for entity in ai_entities:
+                if self.is_dormant(entity, player, fov_map):
+                    dormant_ids.add(id(entity))
+                else:
+                    active.append(entity)
+
+        self.wakes += sum(1 for entity in active if id(entity) in self._dormant_ids)
+        self._dormant_ids = dormant_ids
+
+        self.phases += 1
+        self.last_active = len(active)
+        self.last_dormant = len(dormant_ids)
+        self.active_turns += self.last_active
+        self.dormant_turns += self.last_dormant
+        self._record_telemetry()
+        return active
+
+    def is_dormant(self, entity: 'Entity', player: 'Entity', fov_map: Any) -> bool:
+        """Whether ``entity``'s turn would be a no-op this phase (see module docstring).
+
+        Args:
+            entity: A living AI entity
+            player: The player entity
+            fov_map: The player's FOV map
+
+        Returns:
+            bool: True if the monster can be skipped
+        """
+        from components.ai.basic_monster import BasicMonster
+
+        ai = entity.get_component_optional(ComponentType.AI) or getattr(entity, 'ai', None)
+        if getattr(type(ai), 'take_turn', None) is not BasicMonster.take_turn:
+            return False
+        try:
+            if ai.aware_of_player or ai.in_combat or getattr(ai, 'rally_directive_target_id', None):
+                return False
+
+            status_effects = entity.get_component_optional(ComponentType.STATUS_EFFECTS)
+            if status_effects and status_effects.active_effects:
+                return False
+
+            fighter = entity.fighter
+            if getattr(entity, 'regeneration_amount', 0) > 0 and fighter.hp < fighter.max_hp:
+                return False
+
+            if entity.chebyshev_distance_to(player) <= self.wake_radius:
+                return False
+            return not map_is_in_fov(fov_map, entity.x, entity.y)
+        except (AttributeError, TypeError):
+            # Half-built entities (test doubles) always act
+            return False
+
+    def _record_telemetry(self) -> None:
+        from services.telemetry_service import get_telemetry_service
+        get_telemetry_service().record_monster_activity(self.last_active, self.last_dormant)
+
+
+# Singleton instance
+_monster_activation: Optional[MonsterActivation] = None
+
+
+def get_monster_activation() -> MonsterActivation:
+    """Get the global monster activation instance.
+
+    Returns:
+        MonsterActivation instance
+    """
+    global _monster_activation
+    if _monster_activation is None:
+        _monster_activation = MonsterActivation()
+    return _monster_activation
+
+
+def reset_monster_activation() -> None:
+    """Reset the global monster activation instance (for testing)."""
+    global _monster_activation
+    _monster_activation = None
@@ -15,6 +15,12 @@ import logging
 from typing import Tuple, Dict, Any, Optional, List, TYPE_CHECKING
 from dataclasses import dataclass
 
+import numpy as np
+
+from engine.rng_config import get_rng
+from map_objects.spatial_index import entities_at
+from map_objects.tile import tile_field_array
+
 if TYPE_CHECKING:
     from entity import Entity
     from map_objects.game_map import GameMap
@@ -299,14 +305,12 @@ class MovementService:
             result: MovementResult to append messages to
         """
         from components.component_registry import ComponentType
-        from random import random
         from message_builder import MessageBuilder as MB
         
         # Find trap at player's position
         trap_entity = None
-        for entity in entities:
-            if (entity.x == player.x and entity.y == player.y and 
-                entity.components.has(ComponentType.TRAP)):
+        for entity in entities_at(entities, player.x, player.y):
+            if entity.components.has(ComponentType.TRAP):
                 trap_entity = entity
                 break
         
@@ -327,7 +331,7 @@ class MovementService:
             return
         
         # Check for passive detection
-        if trap.can_be_detected() and random() < trap.passive_detect_chance:
+        if trap.can_be_detected() and get_rng("combat").random() < trap.passive_detect_chance:
             trap.detect("passive")
             result.messages.append({"message": MB.success(f"You notice the {trap_entity.name}!")})
             return
@@ -533,7 +537,7 @@ class MovementService:
         """Apply teleport trap effect - randomly teleport entity to valid tile.
         
         Phase 21.3: Canonical teleport execution point for trap-based teleportation.
-        Uses deterministic RNG (respects set_global_seed) for reproducible teleports.
+        Uses the run's combat RNG stream for reproducible teleports.
         
         Selection rules:
         - Choose uniformly from all valid tiles on the same dungeon level
@@ -548,7 +552,6 @@ class MovementService:
             result: MovementResult to append messages to
         """
         from message_builder import MessageBuilder as MB
-        from random import choice
         
         # Increment trap metrics (single source of truth)
         try:
@@ -569,22 +572,14 @@ class MovementService:
         
         # Find all valid teleport destinations
         # Valid = walkable + not occupied + in bounds
-        valid_tiles = []
-        for x in range(game_map.width):
-            for y in range(game_map.height):
-                tile = game_map.get_tile(x, y)
-                if not tile or tile.blocked:
-                    continue
-                
-                # Check if tile is occupied by a blocking entity
-                occupied = False
-                for other in entities:
-                    if other.blocks and other.x == x and other.y == y:
-                        occupied = True
-                        break
-                
-                if not occupied:
-                    valid_tiles.append((x, y))
+        free = ~tile_field_array(game_map, "blocked")
+        for (x, y), occupants in _occupied_cells(entities):
+            if 0 <= x < game_map.width and 0 <= y < game_map.height:
+                if any(other.blocks for other in occupants):
+                    free[x, y] = False
+        # np.nonzero walks x-major, matching the old x-then-y scan order
+        xs, ys = np.nonzero(free)
+        valid_tiles = list(zip(xs.tolist(), ys.tolist()))
         
         # Check if we have valid destinations
         if not valid_tiles:
@@ -605,9 +600,8 @@ class MovementService:
         # Store old position for logging
         old_x, old_y = entity.x, entity.y
         
-        # Select random destination (deterministic via canonical RNG)
-        # Uses Python's random module which respects set_global_seed()
-        dest_x, dest_y = choice(valid_tiles)
+        # Select random destination (deterministic via the run's combat stream)
+        dest_x, dest_y = get_rng("combat").choice(valid_tiles)
         
         # CANONICAL TELEPORT EXECUTION POINT
         # This is the only acceptable place to set x/y directly for teleport trap
@@ -810,7 +804,6 @@ class MovementService:
             result: MovementResult to append messages to
         """
         from components.component_registry import ComponentType
-        from random import random
         from message_builder import MessageBuilder as MB
         
         # Check adjacent 8 tiles
@@ -823,16 +816,15 @@ class MovementService:
                 check_y = player.y + dy
                 
                 # Find trap at this position
-                for entity in entities:
-                    if (entity.x == check_x and entity.y == check_y and 
-                        entity.components.has(ComponentType.TRAP)):
+                for entity in entities_at(entities, check_x, check_y):
+                    if entity.components.has(ComponentType.TRAP):
                         
                         trap = entity.components.get(ComponentType.TRAP)
                         if not trap or trap.is_detected or trap.is_disarmed:
                             continue
                         
                         # Check for passive detection
-                        if trap.can_be_detected() and random() < trap.passive_detect_chance:
+                        if trap.can_be_detected() and get_rng("combat").random() < trap.passive_detect_chance:
                             trap.detect("passive_adjacent")
                             result.messages.append({"message": MB.success(f"You notice a {entity.name} nearby!")})
                             
@@ -858,8 +850,8 @@ class MovementService:
         """
         from components.component_registry import ComponentType
         
-        for entity in entities:
-            if entity.x == x and entity.y == y and entity.components.has(ComponentType.DOOR):
+        for entity in entities_at(entities, x, y):
+            if entity.components.has(ComponentType.DOOR):
                 return entity
         return None
     
@@ -988,6 +980,17 @@ class MovementService:
             return door_result
 
 
+def _occupied_cells(entities: List['Entity']):
+    """Yield ((x, y), entities at that tile) for every occupied tile."""
+    index = getattr(entities, 'spatial_index', None)
+    if index is not None:
+        return index.cells.items()
+    cells: Dict[Tuple[int, int], List['Entity']] = {}
+    for entity in entities:
+        cells.setdefault((entity.x, entity.y), []).append(entity)
+    return cells.items()
+
+
 # Singleton instance
 _movement_service = None
 
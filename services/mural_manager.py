@@ -12,6 +12,7 @@ Features:
 """
 
 from typing import Dict, List, Optional, Set, Tuple
+from engine.rng_config import get_rng
 from logger_config import get_logger
 from config.murals_registry import MuralsRegistry
 
@@ -78,8 +79,7 @@ class MuralManager:
             unused_murals = available_murals
         
         # Select random unused mural
-        import random
-        selected_mural = random.choice(unused_murals)
+        selected_mural = get_rng("mapgen").choice(unused_murals)
         
         # Mark as used
         self.used_messages_per_floor[self.current_floor].add(selected_mural[1])
@@ -0,0 +1,254 @@
+"""Navigation service - shared per-phase pathfinding for monster AI.
+
+Every chasing monster used to run its own A* in ``Entity.move_astar``: build
+walkable/cost arrays from the map, overlay every blocking entity and hazard,
+then construct a fresh tcod graph and pathfinder. With dozens of monsters
+chasing the same player that work is repeated dozens of times per turn.
+
+This service does it once:
+- The base cost grid (walls) is cached per map and rebuilt only when the
+  map's ``blocked`` array changes.
+- Blocking entities and ground hazard costs are overlaid once per enemy
+  phase (``begin_enemy_phase``).
+- A single Dijkstra field rooted at the player is resolved lazily the first
+  time a monster asks for it; each monster then just steps to the free
+  neighbour with the lowest step weight plus field distance. Monsters move
+  one after another within the phase, so occupancy is re-checked against the
+  live entity list at step time rather than trusted from the phase snapshot.
+
+Outside an enemy phase (unit tests, scripted moves) ``move_astar`` falls back
+to its per-entity A*, so behaviour there is unchanged.
+"""
+
+import logging
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+import tcod
+
+from map_objects.spatial_index import blocking_entity_at
+from map_objects.tile import tile_field_array
+
+if TYPE_CHECKING:
+    from entity import Entity
+    from map_objects.game_map import GameMap
+
+logger = logging.getLogger(__name__)
+
+# Step weights shared with Entity.move_astar's SimpleGraph
+CARDINAL_COST = 2
+DIAGONAL_COST = 3
+
+_NEIGHBOR_OFFSETS = (
+    (-1, -1), (0, -1), (1, -1),
+    (-1, 0), (1, 0),
+    (-1, 1), (0, 1), (1, 1),
+)
+
+
+class NavigationService:
+    """Shares one cost grid and one player-rooted Dijkstra field per enemy phase."""
+
+    def __init__(self):
+        """Initialize an empty service with no active phase."""
+        self._map_id: Optional[int] = None
+        self._blocked: Optional[np.ndarray] = None
+        self._base_cost: Optional[np.ndarray] = None
+
+        self._phase_active = False
+        self._game_map: Optional['GameMap'] = None
+        self._root: Optional['Entity'] = None
+        self._root_pos: Optional[Tuple[int, int]] = None
+        self._cost: Optional[np.ndarray] = None
+        self._pathfinder: Optional[tcod.path.Pathfinder] = None
+        self._unreachable = 0
+
+        # Counters for profiling/diagnostics
+        self.base_rebuilds = 0
+        self.fields_resolved = 0
+
+    # ------------------------------------------------------------------
+    # Phase lifecycle
+    # ------------------------------------------------------------------
+
+    def begin_enemy_phase(self, game_map: 'GameMap', entities: List['Entity'],
+                          root: 'Entity') -> None:
+        """Build the per-phase cost grid for monsters chasing ``root``.
+
+        Args:
+            game_map: The current map
+            entities: All entities; blocking ones (other than root) are obstacles
+            root: The entity monsters are pathing towards (normally the player)
+        """
+        try:
+            base = self._get_base_cost(game_map)
+        except (AttributeError, TypeError):
+            # Map without usable tile data (test doubles): leave the phase
+            # closed so move_astar keeps its per-entity A*
+            self.end_enemy_phase()
+            return
+        cost = base.copy()
+
+        for entity in entities:
+            if getattr(entity, 'blocks', False) and entity is not root:
+                if 0 <= entity.x < game_map.width and 0 <= entity.y < game_map.height:
+                    cost[entity.x, entity.y] = 0
+
+        # Hazards add their current damage as extra cost (see Entity.move_astar)
+        try:
+            hazard_manager = getattr(game_map, 'hazard_manager', None)
+            if hazard_manager is not None:
+                for hazard in hazard_manager.get_all_hazards():
+                    hx, hy = hazard.x, hazard.y
+                    if cost[hx, hy]:
+                        cost[hx, hy] += hazard.get_current_damage()
+        except (AttributeError, TypeError, IndexError):
+            pass
+
+        self._phase_active = True
+        self._game_map = game_map
+        self._root = root
+        self._root_pos = (root.x, root.y)
+        self._cost = cost
+        self._pathfinder = None
+
+    def end_enemy_phase(self) -> None:
+        """Drop the per-phase grid and field. The base cost grid stays cached."""
+        self._phase_active = False
+        self._game_map = None
+        self._root = None
+        self._root_pos = None
+        self._cost = None
+        self._pathfinder = None
+
+    def invalidate(self) -> None:
+        """Forget everything, including the cached base grid (e.g. on level change)."""
+        self.end_enemy_phase()
+        self._map_id = None
+        self._blocked = None
+        self._base_cost = None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def covers(self, target: 'Entity', game_map: 'GameMap') -> bool:
+        """Whether a shared field can answer a path request towards ``target``.
+
+        Args:
+            target: The entity being chased
+            game_map: The map the chaser is on
+
+        Returns:
+            bool: True during an enemy phase on this map when target is the
+                field's root and has not moved since the phase began
+        """
+        return (
+            self._phase_active
+            and game_map is self._game_map
+            and target is self._root
+            and (target.x, target.y) == self._root_pos
+        )
+
+    def next_step(self, entity: 'Entity', entities: Optional[List['Entity']] = None
+                  ) -> Optional[Tuple[Tuple[int, int], int]]:
+        """Pick the next tile for ``entity`` by descending the shared field.
+
+        Args:
+            entity: The monster moving towards the field's root
+            entities: Live entity list; neighbours a blocking entity has moved
+                onto since the phase began are skipped. Omit to trust the
+                phase snapshot.
+
+        Returns:
+            ((x, y), path_length) for the best free neighbouring tile, where
+            path_length counts tiles from entity to root inclusive (the same
+            as ``len(path)`` of the equivalent A* path), or None if the root
+            is unreachable from every free neighbour.
+        """
+        pf = self._get_pathfinder()
+        distance = pf.distance
+        cost = self._cost
+        width, height = cost.shape
+
+        best = None
+        best_score = None
+        for dx, dy in _NEIGHBOR_OFFSETS:
+            nx, ny = entity.x + dx, entity.y + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            if (nx, ny) == self._root_pos:
+                # Adjacent to the root: the path is just [here, root]
+                return (nx, ny), 2
+            if cost[nx, ny] == 0:
+                continue
+            # distance prices the route from the neighbour onwards; the step
+            # from our own tile onto it is not in the field, so add its weight
+            remaining = int(distance[nx, ny])
+            if remaining >= self._unreachable:
+                continue
+            score = remaining + (DIAGONAL_COST if dx and dy else CARDINAL_COST)
+            if best_score is not None and score >= best_score:
+                continue
+            if entities is not None:
+                blocker = blocking_entity_at(entities, nx, ny)
+                if blocker is not None and blocker is not entity:
+                    continue
+            best, best_score = (nx, ny), score
+
+        if best is None:
+            return None
+        # path_from includes both the neighbour and the root; add our own tile
+        return best, len(pf.path_from(best)) + 1
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _get_base_cost(self, game_map: 'GameMap') -> np.ndarray:
+        """Return the (width, height) wall cost grid, rebuilding it on map change."""
+        blocked = tile_field_array(game_map, 'blocked')
+        if (self._base_cost is None
+                or self._map_id != id(game_map)
+                or self._blocked.shape != blocked.shape
+                or not np.array_equal(self._blocked, blocked)):
+            self._map_id = id(game_map)
+            self._blocked = blocked.copy()
+            self._base_cost = np.where(blocked, 0, 1).astype(np.int32)
+            self.base_rebuilds += 1
+        return self._base_cost
+
+    def _get_pathfinder(self) -> tcod.path.Pathfinder:
+        """Resolve the Dijkstra field rooted at the phase root on first use."""
+        if self._pathfinder is None:
+            graph = tcod.path.SimpleGraph(cost=self._cost, cardinal=CARDINAL_COST,
+                                          diagonal=DIAGONAL_COST)
+            pf = tcod.path.Pathfinder(graph)
+            pf.add_root(self._root_pos)
+            pf.resolve()
+            self._pathfinder = pf
+            self._unreachable = np.iinfo(pf.distance.dtype).max
+            self.fields_resolved += 1
+        return self._pathfinder
+
+
+# Singleton instance
+_navigation_service: Optional[NavigationService] = None
+
+
+def get_navigation_service() -> NavigationService:
+    """Get the global navigation service instance.
+
+    Returns:
+        NavigationService instance
+    """
+    global _navigation_service
+    if _navigation_service is None:
+        _navigation_service = NavigationService()
+    return _navigation_service
+
+
+def reset_navigation_service() -> None:
+    """Reset the global navigation service instance (for testing)."""
+    global _navigation_service
+    _navigation_service = None
@@ -47,8 +47,8 @@ Metrics (tracked on SUCCESSFUL HITS only unless noted):
 
 from contextlib import contextmanager
 from typing import Dict, Any, List, Optional, TYPE_CHECKING, Tuple
-import random
 
+from engine.rng_config import get_rng
 from logger_config import get_logger
 
 if TYPE_CHECKING:
@@ -502,7 +502,7 @@ def roll_ranged_knockback() -> bool:
     Returns:
         bool: True if knockback should be applied (10% chance)
     """
-    return random.random() < RANGED_KNOCKBACK_CHANCE
+    return get_rng("combat").random() < RANGED_KNOCKBACK_CHANCE
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
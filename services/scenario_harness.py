@@ -26,19 +26,26 @@ import logging
 import os
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Protocol, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Protocol, Tuple
 
 from components.component_registry import ComponentType
+from map_objects.component_index import entities_with
 from game_states import GameStates
 from loader_functions.initialize_new_game import get_constants
-from game_messages import MessageLog
+from game_messages import NullMessageLog
 from services.scenario_invariants import ScenarioInvariantError, validate_scenario_instance
+from services.turn_profiler import merge_profiles, profile_phase, scoped_turn_profiler
 from services.scenario_level_loader import (
     ScenarioBuildError,
     ScenarioMapResult,
+    ScenarioWorldSnapshot,
     build_scenario_map,
+    snapshot_scenario_world,
 )
 
+if TYPE_CHECKING:
+    from memory.gc_optimizer import HarnessGC
+
 logger = logging.getLogger(__name__)
 
 
@@ -175,6 +182,11 @@ class RunMetrics:
     terminal_overwrite_by_target: Dict[str, int] = field(default_factory=dict)
     # Phase 23: Depth Boons — ordered list of boon IDs applied during this run
     boons_applied: List[str] = field(default_factory=list)
+    # Monster activation: AI turns taken vs skipped as dormant
+    monster_turns_active: int = 0
+    monster_turns_dormant: int = 0
+    # Per-phase wall time / call counts (only when run with profile=True)
+    phase_profile: Dict[str, Dict[str, float]] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -313,6 +325,8 @@ class RunMetrics:
             result['terminal_overwrite_by_target'] = dict(self.terminal_overwrite_by_target)
         # Phase 23: Depth Boons — always present (empty list if no boons)
         result['boons_applied'] = list(self.boons_applied)
+        result['monster_turns_active'] = self.monster_turns_active
+        result['monster_turns_dormant'] = self.monster_turns_dormant
         return result
 
 
@@ -458,6 +472,9 @@ class AggregatedMetrics:
     # boons_applied and other per-run fields that are lost in aggregation.
     # Not included in to_dict() unless the list is non-empty (backwards compat).
     run_details: List[Dict[str, Any]] = field(default_factory=list)
+    # Per-phase timings merged across runs (profile=True only). Exported next
+    # to, not inside, to_dict() so the gameplay metrics shape is unchanged.
+    phase_profile: Dict[str, Dict[str, float]] = field(default_factory=dict)
 
     def get_oath_summary(self) -> Dict[str, Any]:
         """Get Oath Identity summary for reporting.
@@ -697,7 +714,8 @@ def _initialize_headless_mode() -> None:
 
 def _create_game_state_from_map(result: ScenarioMapResult, constants: Dict[str, Any]):
     """Create a simple game state object from a scenario map result."""
-    message_log = MessageLog(
+    # Nothing renders the log headlessly; count messages instead of wrapping them
+    message_log = NullMessageLog(
         constants["message_x"],
         constants["message_width"],
         constants["message_height"],
@@ -1081,7 +1099,7 @@ def _process_enemy_turn(game_state: Any, metrics: RunMetrics, state_manager=None
     """
     # Get all AI entities
     ai_entities = [
-        e for e in game_state.entities
+        e for e in entities_with(game_state.entities, ComponentType.AI, ComponentType.FIGHTER)
         if e != game_state.player
         and hasattr(e, 'ai') and e.ai is not None
         and hasattr(e, 'fighter') and e.fighter is not None
@@ -1093,6 +1111,22 @@ def _process_enemy_turn(game_state: Any, metrics: RunMetrics, state_manager=None
     # if liches:
     #     logger.debug(f"[ENEMY TURN] {len(liches)} lich(es) alive")
     
+    # Monsters share one TurnContext (entity lookups + pathfinding field) this phase
+    from services.turn_context import begin_enemy_phase, end_enemy_phase
+    if ai_entities:
+        context = begin_enemy_phase(game_state.game_map, game_state.entities, game_state.player,
+                                    getattr(game_state, 'fov_map', None))
+
+        # Far-away, unaware monsters would do nothing this phase; skip them
+        from services.monster_activation import get_monster_activation
+        activation = get_monster_activation()
+        ai_entities = activation.select_active(
+            ai_entities, game_state.player, getattr(game_state, 'fov_map', None),
+            taunt_active=context.taunted_target() is not None,
+        )
+        metrics.monster_turns_active += activation.last_active
+        metrics.monster_turns_dormant += activation.last_dormant
+    
     # Process each AI entity's turn
     for entity in ai_entities:
         try:
@@ -1104,7 +1138,8 @@ def _process_enemy_turn(game_state: Any, metrics: RunMetrics, state_manager=None
                 entities = game_state.entities
                 
                 # Process AI turn
-                ai_results = entity.ai.take_turn(target, fov_map, game_map, entities)
+                with profile_phase(f"enemy_ai.{type(entity.ai).__name__}"):
+                    ai_results = entity.ai.take_turn(target, fov_map, game_map, entities)
                 
                 # Phase 20C.1: Handle AI results (combat, messages, etc.)
                 if ai_results:
@@ -1126,11 +1161,15 @@ def _process_enemy_turn(game_state: Any, metrics: RunMetrics, state_manager=None
         except Exception as e:
             logger.debug(f"AI turn error for {entity.name}: {e}")
     
+    end_enemy_phase()
+    
     # Process pending reanimations (Phase 10: plague zombies)
-    _process_pending_reanimations(game_state, metrics)
+    with profile_phase("reanimations"):
+        _process_pending_reanimations(game_state, metrics)
     
     # Phase 20A: Process player status effects (DOT ticks, debuff durations, etc.)
-    _process_player_status_effects_harness(game_state, state_manager=state_manager)
+    with profile_phase("status_effects"):
+        _process_player_status_effects_harness(game_state, state_manager=state_manager)
     
     # Return to player turn
     game_state.current_state = GameStates.PLAYERS_TURN
@@ -1234,6 +1273,8 @@ def run_scenario_once(
     *,
     disable_depth_boons: bool = False,
     inject_boons: list[str] | None = None,
+    profile: bool = False,
+    world: Optional[ScenarioWorldSnapshot] = None,
 ) -> RunMetrics:
     """Run a scenario once and collect metrics.
 
@@ -1252,12 +1293,18 @@ def run_scenario_once(
         inject_boons: When provided, applies each boon ID to the player after creation
             and sets disable_depth_boons=True (auto boons suppressed). Unknown IDs raise
             ValueError immediately (fail loudly). Used for A/B ON variant injection.
+        profile: When True, record per-phase wall time and call counts into
+            metrics.phase_profile (see services/turn_profiler.py).
+        world: Optional snapshot of this scenario (snapshot_scenario_world);
+            the run forks it instead of calling build_scenario_map().
 
     Returns:
         RunMetrics with collected data
     """
     logger.info(f"Starting scenario run: {scenario.scenario_id} (turn_limit={turn_limit})")
     
+    from memory.gc_optimizer import get_active_harness_gc, harness_enemy_phase
+
     # Initialize headless mode
     _initialize_headless_mode()
     
@@ -1275,12 +1322,15 @@ def run_scenario_once(
     game_state = None  # Phase 23: initialised here so boon capture below is safe
 
     try:
-        with scoped_metrics_collector(metrics):
+        with scoped_metrics_collector(metrics), scoped_turn_profiler(profile) as profiler:
             constants = get_constants()
             if scenario.depth is not None:
                 constants["start_level"] = scenario.depth
 
-            map_result = build_scenario_map(scenario)
+            if world is not None:
+                map_result = world.fork()
+            else:
+                map_result = build_scenario_map(scenario)
 
             # Phase 23 A/B: override boon-disable flag post-creation.
             # Player statistics exist at this point; YAML is never mutated.
@@ -1318,13 +1368,16 @@ def run_scenario_once(
                     break
 
                 if game_state.current_state == GameStates.PLAYERS_TURN:
-                    action = bot_policy.choose_action(game_state)
+                    with profile_phase("bot_decision"):
+                        action = bot_policy.choose_action(game_state)
                     # logger.info(f"Turn {turn}: Player action: {action}")
-                    _process_player_action(game_state, action, metrics)
+                    with profile_phase("player_action"):
+                        _process_player_action(game_state, action, metrics)
 
                 elif game_state.current_state == GameStates.ENEMY_TURN:
                     # logger.info(f"Turn {turn}: Enemy turn")
-                    _process_enemy_turn(game_state, metrics, state_manager=state_manager)
+                    with profile_phase("enemy_turn"), harness_enemy_phase():
+                        _process_enemy_turn(game_state, metrics, state_manager=state_manager)
                     metrics.turns_taken += 1
                     game_state.turn_number += 1  # Increment turn for reanimation timing
 
@@ -1341,6 +1394,13 @@ def run_scenario_once(
 
             _count_dead_entities(game_state, metrics)
 
+            if profiler is not None:
+                harness_gc = get_active_harness_gc()
+                if harness_gc is not None:
+                    gc_stats = harness_gc.recorder.stats
+                    profiler.record("gc_pause", gc_stats.total_gc_time_ms / 1000.0, gc_stats.total_collections)
+                metrics.phase_profile = profiler.to_dict()
+
     except (ScenarioBuildError, ScenarioInvariantError, ValueError) as e:
         logger.error(f"Scenario setup failed: {e}")
         raise
@@ -1375,6 +1435,9 @@ def run_scenario_many(
     *,
     disable_depth_boons: bool = False,
     inject_boons: list[str] | None = None,
+    workers: int = 1,
+    profile: bool = False,
+    fork_world: bool = False,
 ) -> AggregatedMetrics:
     """Run a scenario multiple times and aggregate metrics.
 
@@ -1388,6 +1451,15 @@ def run_scenario_many(
             run_scenario_once() call. Used for A/B depth pressure analysis.
         inject_boons: When provided, passes inject_boons to every run_scenario_once()
             call. Used for A/B ON variant injection.
+        workers: Number of worker processes. 1 (default) runs serially in this
+            process. Values > 1 spread runs across a process pool; each run is
+            reset and seeded exactly as in the serial path and results are
+            aggregated in run order, so output is identical for a given seed_base.
+        profile: When True, every run records per-phase timings; the merged
+            profile is returned in AggregatedMetrics.phase_profile.
+        fork_world: When True, the seed-independent part of the world is
+            built once (snapshot_scenario_world) and forked for every run
+            instead of rebuilding it. Metrics are identical either way.
 
     Returns:
         AggregatedMetrics with combined data from all runs
@@ -1396,30 +1468,52 @@ def run_scenario_many(
     if seed_base is not None:
         logger.info(f"Deterministic mode enabled: seed_base={seed_base}")
     
+    world = snapshot_world(scenario) if fork_world else None
+
     # Collect individual run results
     all_runs: List[RunMetrics] = []
     
-    for run_num in range(1, runs + 1):
-        logger.info(f"Run {run_num}/{runs}")
-        
-        # Reset any necessary state between runs
-        _reset_global_services()
-        
-        # Set deterministic seed for this run if seed_base is provided
-        if seed_base is not None:
-            from engine.rng_config import stable_scenario_seed, set_global_seed
-            run_seed = stable_scenario_seed(scenario.scenario_id, run_num - 1, seed_base)
-            set_global_seed(run_seed)
-            logger.debug(f"Run {run_num}: seed={run_seed}")
-        
-        # Run the scenario
-        run_metrics = run_scenario_once(
-            scenario, bot_policy, turn_limit,
+    if workers > 1 and runs > 1:
+        all_runs = _run_scenario_runs_parallel(
+            scenario, bot_policy, runs, turn_limit, seed_base, workers,
             disable_depth_boons=disable_depth_boons,
             inject_boons=inject_boons,
+            profile=profile,
+            world=world,
         )
-        all_runs.append(run_metrics)
+    else:
+        harness_gc = _start_harness_gc()
+        try:
+            for run_num in range(1, runs + 1):
+                all_runs.append(_run_seeded_scenario(
+                    scenario, bot_policy, run_num, runs, turn_limit, seed_base,
+                    disable_depth_boons=disable_depth_boons,
+                    inject_boons=inject_boons,
+                    profile=profile,
+                    world=world,
+                ))
+                harness_gc.collect_between_runs()
+        finally:
+            harness_gc.stop()
     
+    return aggregate_runs(scenario, all_runs)
+
+
+def aggregate_runs(scenario, all_runs: List[RunMetrics]) -> AggregatedMetrics:
+    """Combine per-run metrics into an AggregatedMetrics summary.
+
+    Split out of run_scenario_many so callers that collect runs themselves
+    (e.g. the suite worker pool) aggregate exactly the same way.
+
+    Args:
+        scenario: ScenarioDefinition the runs were executed from
+        all_runs: RunMetrics in run order
+
+    Returns:
+        AggregatedMetrics with combined data from all runs
+    """
+    runs = len(all_runs)
+
     # Aggregate results
     total_turns = sum(r.turns_taken for r in all_runs)
     player_deaths = sum(1 for r in all_runs if r.player_died)
@@ -1827,6 +1921,7 @@ def run_scenario_many(
     
     # Phase 23: Attach per-run details (includes boons_applied per run)
     aggregated.run_details = [r.to_dict() for r in all_runs]
+    aggregated.phase_profile = merge_profiles(r.phase_profile for r in all_runs)
 
     logger.info(f"Scenario runs complete: {runs} runs, "
                 f"avg_turns={aggregated.average_turns:.1f}, "
@@ -1860,6 +1955,182 @@ def run_scenario_many(
     return aggregated
 
 
+def _run_seeded_scenario(
+    scenario,
+    bot_policy: BotPolicy,
+    run_num: int,
+    runs: int,
+    turn_limit: int,
+    seed_base: Optional[int],
+    *,
+    disable_depth_boons: bool = False,
+    inject_boons: list[str] | None = None,
+    profile: bool = False,
+    world: Optional[ScenarioWorldSnapshot] = None,
+) -> RunMetrics:
+    """Reset global services, seed, and execute a single run.
+
+    Shared by the serial loop and the process-pool workers so both paths
+    prepare each run identically.
+
+    Args:
+        scenario: ScenarioDefinition from the registry
+        bot_policy: BotPolicy for player control
+        run_num: One-based run number (seed index is run_num - 1)
+        runs: Total runs in the batch (for logging)
+        turn_limit: Maximum turns for this run
+        seed_base: Base seed for deterministic runs (or None)
+        disable_depth_boons: Forwarded to run_scenario_once()
+        inject_boons: Forwarded to run_scenario_once()
+        profile: Forwarded to run_scenario_once()
+        world: Forwarded to run_scenario_once()
+
+    Returns:
+        RunMetrics for this run
+    """
+    logger.info(f"Run {run_num}/{runs}")
+    
+    # Reset any necessary state between runs
+    _reset_global_services()
+    
+    run_kwargs = dict(
+        disable_depth_boons=disable_depth_boons,
+        inject_boons=inject_boons,
+        profile=profile,
+        world=world,
+    )
+
+    from memory.gc_optimizer import get_active_harness_gc
+    harness_gc = get_active_harness_gc()
+    if harness_gc is not None:
+        harness_gc.begin_run()
+    try:
+        if seed_base is None:
+            return run_scenario_once(scenario, bot_policy, turn_limit, **run_kwargs)
+
+        # Deterministic run: the run's own RNG streams, so its rolls depend only
+        # on its seed and not on anything else drawing in this process
+        from engine.rng_config import stable_scenario_seed, set_global_seed, run_rng_scope
+        run_seed = stable_scenario_seed(scenario.scenario_id, run_num - 1, seed_base)
+        set_global_seed(run_seed)
+        logger.debug(f"Run {run_num}: seed={run_seed}")
+
+        with run_rng_scope(run_seed):
+            return run_scenario_once(scenario, bot_policy, turn_limit, **run_kwargs)
+    finally:
+        if harness_gc is not None:
+            harness_gc.end_run()
+
+
+def snapshot_world(scenario) -> ScenarioWorldSnapshot:
+    """Snapshot a scenario world the way run_scenario_many's runs build it.
+
+    Prepares the process like a run (headless mode, spells, reset services)
+    so the snapshot's player matches what build_scenario_map() would create.
+
+    Args:
+        scenario: ScenarioDefinition from the registry
+
+    Returns:
+        ScenarioWorldSnapshot to pass as run_scenario_once(world=...)
+    """
+    _initialize_headless_mode()
+    from spells.spell_catalog import register_all_spells
+    register_all_spells()
+    _reset_global_services()
+    return snapshot_scenario_world(scenario)
+
+
+def _start_harness_gc() -> "HarnessGC":
+    """Load run content once and start this process's HarnessGC.
+
+    Headless display, spells and the entity factory are set up first so
+    they are frozen out of the cyclic GC along with everything else loaded.
+
+    Returns:
+        The started HarnessGC (the caller stops it, or the process exits)
+    """
+    _initialize_headless_mode()
+    from spells.spell_catalog import register_all_spells
+    from config.factories import get_entity_factory
+    from memory.gc_optimizer import HarnessGC
+    register_all_spells()
+    get_entity_factory()
+
+    harness_gc = HarnessGC()
+    harness_gc.start()
+    harness_gc.freeze_static_content()
+    return harness_gc
+
+
+def _scenario_worker_init() -> None:
+    """Process-pool initializer: headless display, content and GC policy set up once."""
+    _start_harness_gc()
+
+
+def _scenario_worker_run(job: Tuple[Any, ...]) -> RunMetrics:
+    """Process-pool entry point; unpacks a job tuple for _run_seeded_scenario."""
+    (scenario, bot_policy, run_num, runs, turn_limit, seed_base,
+     disable_depth_boons, inject_boons, profile, world) = job
+    try:
+        return _run_seeded_scenario(
+            scenario, bot_policy, run_num, runs, turn_limit, seed_base,
+            disable_depth_boons=disable_depth_boons,
+            inject_boons=inject_boons,
+            profile=profile,
+            world=world,
+        )
+    finally:
+        from memory.gc_optimizer import get_active_harness_gc
+        harness_gc = get_active_harness_gc()
+        if harness_gc is not None:
+            harness_gc.collect_between_runs()
+
+
+def _run_scenario_runs_parallel(
+    scenario,
+    bot_policy: BotPolicy,
+    runs: int,
+    turn_limit: int,
+    seed_base: Optional[int],
+    workers: int,
+    *,
+    disable_depth_boons: bool = False,
+    inject_boons: list[str] | None = None,
+    profile: bool = False,
+    world: Optional[ScenarioWorldSnapshot] = None,
+) -> List[RunMetrics]:
+    """Execute runs across a process pool and return them in run order.
+
+    Workers use the "spawn" start method so no parent-process singleton or
+    RNG state leaks into a run; every run then goes through the same
+    reset + stable_scenario_seed preparation as the serial path.
+
+    Returns:
+        List of RunMetrics ordered by run number (1..runs)
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = [
+        (scenario, bot_policy, run_num, runs, turn_limit, seed_base,
+         disable_depth_boons, inject_boons, profile, world)
+        for run_num in range(1, runs + 1)
+    ]
+    max_workers = min(workers, runs)
+    logger.info(f"Parallel mode: {runs} runs across {max_workers} workers")
+
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=ctx,
+        initializer=_scenario_worker_init,
+    ) as executor:
+        # executor.map preserves submission order, which keeps aggregation
+        # (and run_details) identical to the serial loop.
+        return list(executor.map(_scenario_worker_run, jobs))
+
+
 def _reset_global_services() -> None:
     """Reset global services between scenario runs.
     
@@ -1903,6 +2174,13 @@ def _reset_global_services() -> None:
     except ImportError:
         pass
 
+    # Reset monster activation (dormant set and activity counters)
+    try:
+        from services.monster_activation import reset_monster_activation
+        reset_monster_activation()
+    except ImportError:
+        pass
+
 
 # =============================================================================
 # Expected invariants evaluation
@@ -2025,4 +2303,5 @@ __all__ = [
     'evaluate_expected_invariants',
     'run_scenario_once',
     'run_scenario_many',
+    'snapshot_world',
 ]
@@ -3,13 +3,20 @@
 Creates a lightweight map plus player/monster/item placements from a
 ScenarioDefinition. This module is used only by the scenario harness and
 does not affect normal campaign generation.
+
+For repeated runs of one scenario, snapshot_scenario_world() builds the
+seed-independent part of the world once and ScenarioWorldSnapshot.fork()
+produces a fresh world per run (see the class docstring).
 """
 
 from __future__ import annotations
 
+import io
 import logging
+import pickle
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from types import SimpleNamespace
 from typing import Any, Dict, List, Optional, Tuple
 
 from components.component_registry import ComponentType
@@ -22,9 +29,12 @@ from components.speed_bonus_tracker import SpeedBonusTracker
 from components.statistics import Statistics
 from components.faction import Faction
 from config.factories import get_entity_factory
+from config.identification_manager import get_identification_manager
 from config.game_constants import get_combat_config, get_inventory_config
+from engine.rng_config import RunRNG, get_rng, run_rng_scope
 from entity import Entity
 from map_objects.game_map import GameMap
+from map_objects.spatial_index import EntityList
 from render_functions import RenderOrder
 
 logger = logging.getLogger(__name__)
@@ -44,21 +54,21 @@ class ScenarioBuildError(Exception):
 
 
 class _ModuleLevelRandom:
-    """Wrapper that delegates to module-level random functions.
+    """Wrapper that delegates to the run's mapgen stream.
     
-    This allows build_scenario_map to use the module-level random (which is
-    seeded by set_global_seed) by default, while still accepting an explicit
-    random.Random instance for tests.
+    This allows build_scenario_map to use the active run's mapgen stream (or
+    the module-level random, seeded by set_global_seed, outside a run) by
+    default, while still accepting an explicit random.Random instance for tests.
     """
     
     def randint(self, a: int, b: int) -> int:
-        return random.randint(a, b)
+        return get_rng("mapgen").randint(a, b)
     
     def choice(self, seq):
-        return random.choice(seq)
+        return get_rng("mapgen").choice(seq)
     
     def shuffle(self, seq):
-        return random.shuffle(seq)
+        return get_rng("mapgen").shuffle(seq)
 
 
 # Singleton instance for module-level random delegation
@@ -71,7 +81,7 @@ def build_scenario_map(scenario, rng: Optional[random.Random] = None) -> Scenari
     Args:
         scenario: ScenarioDefinition
         rng: Optional random.Random for deterministic tests. If None, uses
-             the module-level random (which respects set_global_seed).
+             the run's mapgen stream (see engine.rng_config.get_rng).
 
     Returns:
         ScenarioMapResult with map, player, and all entities (player first)
@@ -79,39 +89,207 @@ def build_scenario_map(scenario, rng: Optional[random.Random] = None) -> Scenari
     Raises:
         ScenarioBuildError: on construction failures (invalid types, etc.)
     """
-    # Use module-level random by default (respects set_global_seed)
-    rng = rng or _module_rng
+    game_map = _build_scenario_terrain(scenario)
+
+    player = _create_player_entity(scenario.player)
+    _apply_player_position(player, scenario.player, game_map)
+
+    return _populate_scenario_map(scenario, game_map, player, rng)
+
+
+@dataclass
+class ScenarioWorldSnapshot:
+    """Frozen, seed-independent part of a built scenario world.
+
+    build_scenario_map() carves the terrain tile by tile and creates the
+    player through the factories (loadout, oath, boons) on every run, although
+    only the seed differs between runs of a scenario. A snapshot keeps the
+    carved tile array and, when it is seed-independent, the finished player as
+    pickled component state; fork() restores both and then spawns monsters,
+    items, portals and traps live.
+
+    The live part is exactly what consumes the RNG: random placements,
+    monster equipment rolls and item identification rolls all happen in
+    the factories, so re-running them in build order keeps a forked world
+    identical to a fresh build_scenario_map() under the same seed. If
+    creating the player consumed the RNG (e.g. an unidentified potion
+    in the loadout), the player is rebuilt on every fork instead.
+
+    Attributes:
+        scenario: ScenarioDefinition the snapshot was built from
+        tile_data: Read-only carved tile array (terrain plus obstacles)
+        dungeon_level: Map dungeon level
+        player_state: Pickled player entity, or None if it must be rebuilt
+        identification_state: IdentificationManager.to_dict() after creating
+            the player (restored together with player_state)
+        player_metrics: Scenario metrics incremented while creating the
+            player (e.g. oath_*_chosen), replayed into the run's collector
+    """
+
+    scenario: Any
+    tile_data: Any
+    dungeon_level: int
+    player_state: Optional[bytes] = None
+    identification_state: Optional[Dict[str, Any]] = None
+    player_metrics: Dict[str, int] = field(default_factory=dict)
+
+    def fork(self, rng: Optional[random.Random] = None) -> ScenarioMapResult:
+        """Create a fresh mutable world from the snapshot.
+
+        Call it where build_scenario_map() would be called: after resetting
+        global services and seeding.
+
+        Args:
+            rng: Optional random.Random for placements (see build_scenario_map)
+
+        Returns:
+            ScenarioMapResult equivalent to build_scenario_map(scenario, rng)
+        """
+        width, height = self.tile_data.shape
+        game_map = GameMap(width, height, dungeon_level=self.dungeon_level)
+        game_map.tiles = self.tile_data.copy()
+
+        if self.player_state is not None:
+            player = _load_entity_state(self.player_state)
+            get_identification_manager().from_dict(self.identification_state)
+            if self.player_metrics:
+                from services.scenario_metrics import get_active_metrics_collector
+                collector = get_active_metrics_collector()
+                if collector:
+                    for name, amount in self.player_metrics.items():
+                        collector.increment(name, amount)
+        else:
+            player = _create_player_entity(self.scenario.player)
+            _apply_player_position(player, self.scenario.player, game_map)
+
+        return _populate_scenario_map(self.scenario, game_map, player, rng)
+
+
+def snapshot_scenario_world(scenario) -> ScenarioWorldSnapshot:
+    """Build the seed-independent part of a scenario world once.
+
+    Creating the player may register item identification decisions, so call
+    this with global services reset (the harness does). The global RNG state
+    is left untouched.
+
+    Args:
+        scenario: ScenarioDefinition
+
+    Returns:
+        ScenarioWorldSnapshot to fork() once per run
+
+    Raises:
+        ScenarioBuildError: on construction failures (invalid types, etc.)
+    """
+    game_map = _build_scenario_terrain(scenario)
+    tile_data = game_map.tile_data.copy()
+    tile_data.flags.writeable = False
+
+    from services.scenario_metrics import (
+        ScenarioMetricsCollector,
+        get_active_metrics_collector,
+        set_active_metrics_collector,
+    )
+
+    # Record what the player's creation reports to the metrics collector
+    player_metrics = SimpleNamespace()
+    active_collector = get_active_metrics_collector()
+    set_active_metrics_collector(ScenarioMetricsCollector(player_metrics))
+    rng_state = random.getstate()
+    probe = RunRNG(0)
+    try:
+        with run_rng_scope(probe):
+            player = _create_player_entity(scenario.player)
+            _apply_player_position(player, scenario.player, game_map)
+    finally:
+        set_active_metrics_collector(active_collector)
+    seed_independent = random.getstate() == rng_state and not probe.streams_used()
+    random.setstate(rng_state)
+
+    if not seed_independent:
+        logger.debug(f"Scenario {scenario.scenario_id}: player creation uses the RNG, rebuilt per fork")
+        return ScenarioWorldSnapshot(scenario, tile_data, game_map.dungeon_level)
+
+    return ScenarioWorldSnapshot(
+        scenario,
+        tile_data,
+        game_map.dungeon_level,
+        player_state=_dump_entity_state(player),
+        identification_state=get_identification_manager().to_dict(),
+        player_metrics=vars(player_metrics),
+    )
 
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+# Components may keep bound methods of the module-level Random (e.g. a
+# SpeedBonusTracker built with rng=random.random). Pickling would copy that generator
+# and detach the fork from set_global_seed, so it is stored by reference.
+_GLOBAL_RANDOM_ID = "global_random"
+
+
+class _EntityPickler(pickle.Pickler):
+    def persistent_id(self, obj):
+        if obj is random._inst:
+            return _GLOBAL_RANDOM_ID
+        return None
+
+
+class _EntityUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        if pid == _GLOBAL_RANDOM_ID:
+            return random._inst
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}")
+
+
+def _dump_entity_state(entity: Entity) -> bytes:
+    buffer = io.BytesIO()
+    _EntityPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(entity)
+    return buffer.getvalue()
+
+
+def _load_entity_state(state: bytes) -> Entity:
+    return _EntityUnpickler(io.BytesIO(state)).load()
+
+
+def _build_scenario_terrain(scenario) -> GameMap:
+    """Create the scenario map with open floor and obstacles (no RNG)."""
     # Map dimensions: derive from rooms if present; otherwise use a small arena.
     default_width = 30
     default_height = 20
     width, height = _derive_map_size(scenario.rooms, default_width, default_height)
-    dungeon_level = scenario.depth or 1
 
-    game_map = GameMap(width, height, dungeon_level=dungeon_level)
+    game_map = GameMap(width, height, dungeon_level=scenario.depth or 1)
     _carve_open_floor(game_map)
-    
+
     # Apply obstacles (walls/pillars) after carving floor
     _apply_obstacles(scenario.rooms, game_map)
+    return game_map
 
-    player = _create_player_entity(scenario.player)
-    _apply_player_position(player, scenario.player, game_map)
 
-    entities: List[Entity] = [player]
+def _populate_scenario_map(
+    scenario,
+    game_map: GameMap,
+    player: Entity,
+    rng: Optional[random.Random],
+) -> ScenarioMapResult:
+    """Spawn the seed-dependent entities around an existing map and player."""
+    # Use the run's mapgen stream by default
+    rng = rng or _module_rng
+
+    entities: List[Entity] = EntityList([player])
 
     _spawn_monsters(scenario.monsters or [], entities, game_map, rng)
-    _spawn_items(scenario.items or [], entities, game_map, rng, dungeon_level)
+    _spawn_items(scenario.items or [], entities, game_map, rng, game_map.dungeon_level)
     _spawn_portals(scenario.portals or [], entities, game_map)
     _spawn_traps(scenario.traps if hasattr(scenario, 'traps') and scenario.traps else [], entities, game_map)
 
     return ScenarioMapResult(game_map=game_map, player=player, entities=entities)
 
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-
 def _derive_map_size(
     rooms: Optional[List[Dict[str, Any]]],
     fallback_w: int,
@@ -191,7 +191,8 @@ class SunburstPotionUserPolicy:
     1. If player has sunburst_potion and any enemy is within 5 tiles: throw at nearest
     2. Otherwise: delegate to TacticalFighterPolicy for melee combat
     
-    Targeting: Nearest enemy by Manhattan distance, tie-break by entity id (deterministic)
+    Targeting: Nearest enemy by Manhattan distance, ties go to the earlier entity in the
+    entity list (deterministic; id() is a memory address and varies between runs)
     
     Usage: sunburst_potion_blind_identity scenario
     """
@@ -226,7 +227,7 @@ class SunburstPotionUserPolicy:
             for enemy in enemies:
                 dist = abs(enemy.x - player.x) + abs(enemy.y - player.y)
                 if dist <= 5:  # Within throw range
-                    if dist < nearest_dist or (dist == nearest_dist and (nearest_enemy is None or id(enemy) < id(nearest_enemy))):
+                    if dist < nearest_dist:  # strict: ties keep the earlier entity
                         nearest_enemy = enemy
                         nearest_dist = dist
             
@@ -247,7 +248,7 @@ class DisarmScrollUserPolicy:
     1. If player has disarm_scroll and any enemy is within range: use on nearest
     2. Otherwise: delegate to TacticalFighterPolicy for melee combat
     
-    Targeting: Nearest enemy by Manhattan distance, tie-break by entity id (deterministic)
+    Targeting: Nearest enemy by Manhattan distance, ties go to the earlier entity in the entity list
     
     Usage: disarm_scroll_identity scenario
     """
@@ -281,7 +282,7 @@ class DisarmScrollUserPolicy:
             
             for enemy in enemies:
                 dist = abs(enemy.x - player.x) + abs(enemy.y - player.y)
-                if dist < nearest_dist or (dist == nearest_dist and (nearest_enemy is None or id(enemy) < id(nearest_enemy))):
+                if dist < nearest_dist:  # strict: ties keep the earlier entity
                     nearest_enemy = enemy
                     nearest_dist = dist
             
@@ -375,7 +376,7 @@ class SilenceScrollUserPolicy:
     3. Otherwise: delegate to TacticalFighterPolicy for melee combat
     
     Caster Detection: Entities with orc_shaman or lich in name (or has special_abilities with spell tags)
-    Targeting: Nearest caster by Manhattan distance, tie-break by entity id (deterministic)
+    Targeting: Nearest caster by Manhattan distance, ties go to the earlier entity in the entity list
     
     Usage: silence_scroll identity scenarios
     """
@@ -419,7 +420,7 @@ class SilenceScrollUserPolicy:
             
             for enemy in target_pool:
                 dist = abs(enemy.x - player.x) + abs(enemy.y - player.y)
-                if dist < nearest_dist or (dist == nearest_dist and (nearest_enemy is None or id(enemy) < id(nearest_enemy))):
+                if dist < nearest_dist:  # strict: ties keep the earlier entity
                     nearest_enemy = enemy
                     nearest_dist = dist
             
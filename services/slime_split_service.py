@@ -18,7 +18,7 @@ KEY CONTRACTS:
   - Original slime is removed (effectively dies) when split triggers
   - Spawns >= 1 children (never 0)
   - Split happens at most ONCE per slime
-  - Uses deterministic RNG (existing game random pathways)
+  - Uses deterministic RNG (the run's combat stream)
 
 INTEGRATION:
   - Called from Fighter.take_damage() after HP reduction
@@ -37,9 +37,9 @@ SEE ALSO:
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
-import random
 from typing import List, Optional, Tuple, Dict, Any
 
+from engine.rng_config import get_rng
 from message_builder import MessageBuilder as MB
 
 
@@ -183,7 +183,7 @@ def _determine_child_count(entity) -> int:
     
     # If no weights specified, uniform random
     if not weights:
-        return random.randint(min_children, max_children)
+        return get_rng("combat").randint(min_children, max_children)
     
     # Weighted selection
     # weights[i] corresponds to (min_children + i) children
@@ -192,11 +192,11 @@ def _determine_child_count(entity) -> int:
     # Ensure weights list matches number of options
     if len(weights) != num_options:
         # Fallback to uniform if misconfigured
-        return random.randint(min_children, max_children)
+        return get_rng("combat").randint(min_children, max_children)
     
-    # Use random.choices for weighted selection
+    # Use choices() for weighted selection
     options = list(range(min_children, max_children + 1))
-    selected = random.choices(options, weights=weights, k=1)[0]
+    selected = get_rng("combat").choices(options, weights=weights, k=1)[0]
     
     return selected
 
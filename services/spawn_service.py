@@ -7,10 +7,10 @@ and does not mutate map state.
 """
 
 from dataclasses import dataclass
-from random import randint
 from typing import Dict, List
 
 from balance.etp import get_monster_etp
+from engine.rng_config import get_rng
 from balance.loot_tags import (
     get_band_density_multiplier,
     get_healing_multiplier,
@@ -133,19 +133,23 @@ class SpawnService:
     def generate_room_plan(
         self,
         context: SpawnContext,
-        randint_fn=randint,
+        randint_fn=None,
         choice_fn=random_choice_from_dict,
     ) -> RoomSpawnPlan:
         """Generate spawn counts and chance tables for a single room.
 
         Args:
             context: Spawn parameters for this room.
-            randint_fn: Optional randint override (useful for tests mocking RNG).
+            randint_fn: Optional randint override (useful for tests mocking RNG);
+                defaults to the run's mapgen stream.
             choice_fn: Optional weighted choice override.
         """
         monster_chances = self._build_monster_chances(context.testing_mode, context.band_id)
         item_chances = self._build_item_chances(context.item_spawn_config, context.band_num)
 
+        if randint_fn is None:
+            randint_fn = get_rng("mapgen").randint
+
         num_monsters = 0 if context.no_monsters else randint_fn(0, context.max_monsters)
         num_items = randint_fn(0, context.max_items)
 
@@ -205,7 +209,6 @@ class SpawnService:
         Returns:
             Resolved monster type: "orc", "orc_brute", "orc_shaman", or "orc_skirmisher"
         """
-        from random import random
         
         depth = self.depth
         
@@ -213,7 +216,7 @@ class SpawnService:
         if depth < 3:
             # Can still have brutes/shamans at depth 1-2 (rare)
             if depth >= 2:
-                roll = random()
+                roll = get_rng("mapgen").random()
                 if roll < 0.05:  # 5% brute
                     return "orc_brute"
                 elif roll < 0.08:  # 3% shaman
@@ -222,7 +225,7 @@ class SpawnService:
         
         # Depth 3: 5-10% skirmisher
         if depth == 3:
-            roll = random()
+            roll = get_rng("mapgen").random()
             if roll < 0.075:  # 7.5% skirmisher (midpoint of 5-10%)
                 return "orc_skirmisher"
             elif roll < 0.15:  # 7.5% brute
@@ -233,7 +236,7 @@ class SpawnService:
         
         # Depth 4-5: 10-15% skirmisher
         if depth in [4, 5]:
-            roll = random()
+            roll = get_rng("mapgen").random()
             if roll < 0.125:  # 12.5% skirmisher (midpoint of 10-15%)
                 return "orc_skirmisher"
             elif roll < 0.225:  # 10% brute
@@ -243,7 +246,7 @@ class SpawnService:
             return "orc"
         
         # Depth 6+: 15-20% skirmisher, with rare chance of "premium" encounters
-        roll = random()
+        roll = get_rng("mapgen").random()
         if roll < 0.175:  # 17.5% skirmisher (midpoint of 15-20%)
             return "orc_skirmisher"
         elif roll < 0.275:  # 10% brute
@@ -0,0 +1,394 @@
+"""Warm worker pool for the scenario suites.
+
+The balance, hazards and identity suites used to start one
+``ecosystem_sanity.py`` subprocess per scenario, paying interpreter startup,
+tcod import, YAML registry loading and spell registration every time, and
+running scenarios one after another. ``SuiteRunner`` instead keeps a pool of
+worker processes that load all of that once and then execute individual
+(scenario, run-index) jobs from the whole matrix across every core.
+
+Each run is prepared exactly like ``run_scenario_many`` prepares it (service
+reset + ``stable_scenario_seed``) and runs are aggregated in run order with
+``aggregate_runs``, so a scenario's export payload is identical to what
+``ecosystem_sanity.py --export-json`` writes for the same seed base.
+
+Usage:
+    from services.suite_runner import SuiteRunner
+
+    with SuiteRunner(workers=8) as runner:
+        for outcome in runner.run(SCENARIO_MATRIX, seed_base=1337):
+            if outcome.ok:
+                write(outcome.payload)
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PLAYER_BOT = "tactical_fighter"
+
+
+@dataclass
+class ScenarioOutcome:
+    """Result of one scenario of a suite matrix.
+
+    Attributes:
+        scenario_id: Scenario identifier
+        payload: Export payload (ecosystem_sanity --export-json format), or
+            None if the scenario failed
+        error: Failure description, or None on success
+    """
+    scenario_id: str
+    payload: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def build_export_payload(
+    scenario_id: str,
+    runs: int,
+    turn_limit: int,
+    player_bot: str,
+    scenario: Any,
+    metrics: Any,
+) -> Dict[str, Any]:
+    """Build the JSON export payload for an aggregated scenario batch.
+
+    Args:
+        scenario_id: Scenario identifier
+        runs: Number of runs requested
+        turn_limit: Turn limit per run
+        player_bot: Bot policy name
+        scenario: ScenarioDefinition the runs came from
+        metrics: AggregatedMetrics for the batch
+
+    Returns:
+        dict: Payload as written by ``ecosystem_sanity.py --export-json``.
+        Profiled batches also carry a "profile" key with per-phase timings.
+    """
+    payload = {
+        "scenario_id": scenario_id,
+        "runs": runs,
+        "turn_limit": turn_limit,
+        "player_bot": player_bot,
+        "depth": getattr(scenario, "depth", None),
+        "metrics": metrics.to_dict(),
+    }
+    phase_profile = getattr(metrics, "phase_profile", None)
+    if phase_profile:
+        payload["profile"] = phase_profile
+    return payload
+
+
+def write_metrics_sidecar(payload: Dict[str, Any], metrics_dir: Optional[Path] = None) -> Path:
+    """Write the normalized reports/metrics copy of an export payload.
+
+    Phase 16D tooling (visualizers, depth pressure reports) reads these.
+
+    Args:
+        payload: Export payload from build_export_payload()
+        metrics_dir: Destination directory (default: reports/metrics)
+
+    Returns:
+        Path: The file written
+    """
+    scenario_id = payload["scenario_id"]
+    runs = payload["runs"]
+    metrics_dir = metrics_dir or Path("reports") / "metrics"
+    metrics_dir.mkdir(parents=True, exist_ok=True)
+    dest = metrics_dir / f"{scenario_id}_metrics.json"
+
+    def _safe_div(numerator: float, denominator: float) -> float:
+        return numerator / denominator if denominator else 0.0
+
+    totals = payload["metrics"]
+    runs_for_div = totals.get("runs", runs) or runs or 1
+    player_attacks = totals.get("total_player_attacks", 0)
+    monster_attacks = totals.get("total_monster_attacks", 0)
+    player_hits = totals.get("total_player_hits", 0)
+    monster_hits = totals.get("total_monster_hits", 0)
+    bonus_attacks = totals.get("total_bonus_attacks_triggered", 0)
+    player_deaths = totals.get("player_deaths", 0)
+
+    player_attacks_per_run = _safe_div(player_attacks, runs_for_div)
+    monster_attacks_per_run = _safe_div(monster_attacks, runs_for_div)
+
+    family_parts = scenario_id.split("_")
+    family = "_".join(family_parts[:2]) if len(family_parts) > 1 else scenario_id
+
+    normalized = {
+        "scenario_id": scenario_id,
+        "family": family,
+        "runs": runs_for_div,
+        "depth": payload.get("depth") or totals.get("depth"),
+        "player_hit_rate": _safe_div(player_hits, player_attacks),
+        "monster_hit_rate": _safe_div(monster_hits, monster_attacks),
+        "bonus_attacks_per_run": _safe_div(bonus_attacks, runs_for_div),
+        "death_rate": _safe_div(player_deaths, runs_for_div),
+        "player_attacks_per_run": player_attacks_per_run,
+        "monster_attacks_per_run": monster_attacks_per_run,
+        "pressure_index": monster_attacks_per_run - player_attacks_per_run,
+        "raw": payload,
+    }
+    dest.write_text(json.dumps(normalized, indent=2, sort_keys=True), encoding="utf-8")
+    return dest
+
+
+# =============================================================================
+# Worker side
+# =============================================================================
+
+# Scenario definitions resolved in this worker process, by id
+_worker_scenarios: Dict[str, Any] = {}
+
+# World snapshots built in this worker process, by scenario id
+_worker_worlds: Dict[str, Any] = {}
+
+
+def _suite_worker_init() -> None:
+    """Pool initializer: headless display, spells, scenario and entity registries."""
+    from services.scenario_harness import _scenario_worker_init
+    _scenario_worker_init()
+
+    from config.factories import get_entity_factory
+    from config.level_template_registry import get_scenario_registry
+    get_scenario_registry()
+    get_entity_factory()
+
+
+def _resolve_scenario(scenario_id: str) -> Any:
+    scenario = _worker_scenarios.get(scenario_id)
+    if scenario is None:
+        from config.level_template_registry import get_scenario_registry
+        scenario = get_scenario_registry().get_scenario_definition(scenario_id)
+        if scenario is None:
+            raise ValueError(f"Scenario '{scenario_id}' not found")
+        _worker_scenarios[scenario_id] = scenario
+    return scenario
+
+
+def _resolve_world(scenario_id: str, scenario: Any) -> Any:
+    world = _worker_worlds.get(scenario_id)
+    if world is None:
+        from services.scenario_harness import snapshot_world
+        world = snapshot_world(scenario)
+        _worker_worlds[scenario_id] = world
+    return world
+
+
+def _suite_worker_run(job: Tuple[str, str, int, int, int, Optional[int], bool]):
+    """Execute one (scenario, run) job; returns (scenario_id, run_num, RunMetrics).
+
+    Each worker snapshots a scenario's world on its first run of it and forks
+    that snapshot for the rest (see snapshot_scenario_world).
+    """
+    from services.scenario_harness import _run_seeded_scenario, make_bot_policy
+
+    scenario_id, player_bot, run_num, runs, turn_limit, seed_base, profile = job
+    scenario = _resolve_scenario(scenario_id)
+    metrics = _run_seeded_scenario(
+        scenario, make_bot_policy(player_bot), run_num, runs, turn_limit, seed_base,
+        profile=profile,
+        world=_resolve_world(scenario_id, scenario),
+    )
+    return scenario_id, run_num, metrics
+
+
+# =============================================================================
+# Parent side
+# =============================================================================
+
+class SuiteRunner:
+    """Runs suite scenario matrices on a persistent pool of warm workers.
+
+    The pool is created on first use and reused by every ``run()`` call until
+    ``close()``, so ``tools/all_suites.py`` pays worker startup once for the
+    identity, hazards and balance suites together. ``workers=1`` runs jobs in
+    this process without a pool.
+
+    Attributes:
+        workers: Number of worker processes
+        player_bot: Bot policy name used for every run
+        profile: Whether runs record per-phase timings
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        player_bot: str = DEFAULT_PLAYER_BOT,
+        profile: bool = False,
+    ):
+        """Initialize the runner.
+
+        Args:
+            workers: Worker processes (default: os.cpu_count())
+            player_bot: Bot policy name used for every run
+            profile: Record per-phase timings into each export's "profile"
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.player_bot = player_bot
+        self.profile = profile
+        self._executor = None
+        self._local_ready = False
+
+    def __enter__(self) -> 'SuiteRunner':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut the worker pool down."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _pool(self):
+        if self._executor is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # "spawn" for the same reason as run_scenario_many's pool: no
+            # parent singleton or RNG state leaks into a run.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_suite_worker_init,
+            )
+        return self._executor
+
+    def run(
+        self,
+        matrix: Iterable[Dict[str, Any]],
+        seed_base: Optional[int] = None,
+    ) -> Iterator[ScenarioOutcome]:
+        """Run every run of every scenario in ``matrix``.
+
+        Jobs are queued scenario by scenario, so early scenarios finish first;
+        outcomes are yielded as soon as all runs of a scenario are in.
+
+        Args:
+            matrix: Scenario entries with "id", "runs" and "turn_limit" keys
+            seed_base: Base seed for deterministic runs (or None)
+
+        Yields:
+            ScenarioOutcome for each scenario, in completion order
+        """
+        matrix = list(matrix)
+        jobs = [
+            (entry["id"], self.player_bot, run_num, entry["runs"], entry["turn_limit"], seed_base,
+             self.profile)
+            for entry in matrix
+            for run_num in range(1, entry["runs"] + 1)
+        ]
+        pending = {entry["id"]: entry["runs"] for entry in matrix}
+        results: Dict[str, Dict[int, Any]] = {entry["id"]: {} for entry in matrix}
+        errors: Dict[str, str] = {}
+        by_id = {entry["id"]: entry for entry in matrix}
+
+        for scenario_id, run_num, metrics, error in self._execute(jobs):
+            if error is not None:
+                errors.setdefault(scenario_id, error)
+            else:
+                results[scenario_id][run_num] = metrics
+            pending[scenario_id] -= 1
+            if pending[scenario_id] == 0:
+                runs = results.pop(scenario_id)
+                yield self._finish(by_id[scenario_id], runs, errors.get(scenario_id))
+
+    def _execute(self, jobs: List[Tuple[Any, ...]]):
+        """Yield (scenario_id, run_num, RunMetrics or None, error or None) per job."""
+        if self.workers == 1:
+            if not self._local_ready:
+                _suite_worker_init()
+                self._local_ready = True
+            for job in jobs:
+                try:
+                    yield _suite_worker_run(job) + (None,)
+                except Exception as e:  # noqa: BLE001 - reported per scenario
+                    yield job[0], job[2], None, f"{type(e).__name__}: {e}"
+            return
+
+        from concurrent.futures import as_completed
+
+        executor = self._pool()
+        futures = {executor.submit(_suite_worker_run, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                yield future.result() + (None,)
+            except Exception as e:  # noqa: BLE001 - reported per scenario
+                yield job[0], job[2], None, f"{type(e).__name__}: {e}"
+
+    def _finish(
+        self,
+        entry: Dict[str, Any],
+        runs: Dict[int, Any],
+        error: Optional[str],
+    ) -> ScenarioOutcome:
+        scenario_id = entry["id"]
+        if error is not None:
+            return ScenarioOutcome(scenario_id, error=error)
+
+        from config.level_template_registry import get_scenario_registry
+        from services.scenario_harness import aggregate_runs
+
+        scenario = get_scenario_registry().get_scenario_definition(scenario_id)
+        ordered = [runs[run_num] for run_num in sorted(runs)]
+        metrics = aggregate_runs(scenario, ordered)
+        payload = build_export_payload(
+            scenario_id, entry["runs"], entry["turn_limit"], self.player_bot, scenario, metrics,
+        )
+        return ScenarioOutcome(scenario_id, payload=payload)
+
+
+def export_matrix(
+    runner: SuiteRunner,
+    matrix: Iterable[Dict[str, Any]],
+    out_dir: Path,
+    seed_base: Optional[int] = None,
+) -> List[str]:
+    """Run a suite matrix and write each scenario's export as it completes.
+
+    Writes ``<out_dir>/<scenario_id>.json`` (plus the reports/metrics
+    sidecar), the same files the per-scenario ``ecosystem_sanity.py
+    --export-json`` subprocess used to produce.
+
+    Args:
+        runner: SuiteRunner to execute on
+        matrix: Scenario entries with "id", "runs" and "turn_limit" keys
+        out_dir: Directory for the raw JSON exports
+        seed_base: Base seed for deterministic runs
+
+    Returns:
+        list: IDs of scenarios that failed, in matrix order
+    """
+    matrix = list(matrix)
+    total_runs = sum(entry["runs"] for entry in matrix)
+    print(f"  Queued {len(matrix)} scenarios ({total_runs} runs) on {runner.workers} workers...")
+
+    failed = set()
+    for outcome in runner.run(matrix, seed_base=seed_base):
+        if not outcome.ok:
+            print(f"    ⚠️  {outcome.scenario_id} failed: {outcome.error}")
+            failed.add(outcome.scenario_id)
+            continue
+        output_path = out_dir / f"{outcome.scenario_id}.json"
+        output_path.write_text(
+            json.dumps(outcome.payload, separators=(",", ":")), encoding="utf-8",
+        )
+        try:
+            write_metrics_sidecar(outcome.payload)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Failed to write reports/metrics sidecar: %s", e)
+        print(f"  ✓ {outcome.scenario_id} ({outcome.payload['runs']} runs)")
+
+    return [entry["id"] for entry in matrix if entry["id"] in failed]
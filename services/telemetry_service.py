@@ -6,6 +6,7 @@ This module handles recording and dumping gameplay telemetry including:
 - Map features (traps, secrets, doors)
 - Item usage (keys)
 - Pity events (loot rebalancing)
+- Monster activation (active vs dormant AI turns)
 """
 
 from typing import Dict, List, Optional, Any
@@ -40,6 +41,9 @@ class FloorTelemetry:
         room_count: Total rooms on floor
         monster_count: Total monsters spawned
         item_count: Total items spawned
+        enemy_phases: Enemy phases processed on this floor
+        active_monster_turns: Monster turns taken over those phases
+        dormant_monster_turns: Monster turns skipped as dormant
     """
     depth: int
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
@@ -58,6 +62,9 @@ class FloorTelemetry:
     room_count: int = 0
     monster_count: int = 0
     item_count: int = 0
+    enemy_phases: int = 0
+    active_monster_turns: int = 0
+    dormant_monster_turns: int = 0
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization.
@@ -238,6 +245,22 @@ class TelemetryService:
         if floor:
             floor.keys_used += 1
     
+    def record_monster_activity(self, active: int, dormant: int) -> None:
+        """Record one enemy phase's active and dormant monster counts.
+        
+        Args:
+            active: Monsters that took a turn
+            dormant: Monsters skipped as dormant
+        """
+        if not self.enabled or self.current_floor is None:
+            return
+        
+        floor = self.floors.get(self.current_floor)
+        if floor:
+            floor.enemy_phases += 1
+            floor.active_monster_turns += active
+            floor.dormant_monster_turns += dormant
+    
     def record_pity_event(self, event_type: str, data: Dict[str, Any]) -> None:
         """Record a pity event (loot rebalancing).
         
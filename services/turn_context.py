@@ -0,0 +1,201 @@
+"""Turn context - shared per-enemy-phase lookups for monster AI.
+
+Every monster's ``take_turn`` used to rescan the whole entity list for the
+same answers: who is taunted, which creatures are alive (per faction), which
+items lie on the floor. Most entities on a floor are items, corpses and
+features, so with N monsters the enemy phase did O(N * entities) work just to
+rediscover state no monster had changed.
+
+``begin_enemy_phase`` builds one ``TurnContext`` per phase and opens the
+navigation service's shared player-rooted Dijkstra field alongside it. AI
+components ask ``get_turn_context(entities)`` for it and fall back to their
+own scans when there is none (unit tests, scripted turns).
+
+Lookups are snapshots taken at phase start, so callers still re-check the
+per-entity facts that can change mid-phase (hp, status effects, position).
+Membership changes (summons, pickups, removed corpses) are caught through
+the entity list's mutation counter (``EntityList.mutations``; the length for
+plain lists) and rebuild the buckets. Entities by
+tile come from the entity list's maintained spatial index
+(``map_objects.spatial_index``).
+"""
+
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from components.component_registry import ComponentType
+from logger_config import get_logger
+
+if TYPE_CHECKING:
+    from entity import Entity
+    from map_objects.game_map import GameMap
+
+logger = get_logger(__name__)
+
+
+class TurnContext:
+    """Per-enemy-phase snapshot of the entity list for monster AI.
+
+    Attributes:
+        entities (list): The entity list the phase was built from
+        player (Entity): The player (root of the navigation field)
+        fov_map: The player's FOV map for this phase
+        game_map (GameMap): The current map
+        rebuilds (int): Times the buckets were (re)built this phase
+    """
+
+    def __init__(self, entities: List['Entity'], player: 'Entity', fov_map: Any,
+                 game_map: 'GameMap'):
+        """Build the lookups for one enemy phase.
+
+        Args:
+            entities: All entities on the floor
+            player: The player entity
+            fov_map: The player's FOV map
+            game_map: The current map
+        """
+        self.entities = entities
+        self.player = player
+        self.fov_map = fov_map
+        self.game_map = game_map
+        self.rebuilds = 0
+        self._build()
+
+    def _build(self) -> None:
+        taunt_candidates = []
+        living = []
+        living_by_faction: Dict[Any, List['Entity']] = {}
+        ground_items = []
+        by_id = {}
+
+        for entity in self.entities:
+            by_id[id(entity)] = entity
+            components = getattr(entity, 'components', None)
+
+            status_effects = entity.get_component_optional(ComponentType.STATUS_EFFECTS)
+            if status_effects and status_effects.has_effect('taunted'):
+                taunt_candidates.append(entity)
+
+            fighter = entity.get_component_optional(ComponentType.FIGHTER)
+            try:
+                alive = bool(fighter) and fighter.hp > 0
+            except TypeError:
+                # Mock fighters in tests; callers re-check hp anyway
+                alive = True
+            if alive:
+                living.append(entity)
+                living_by_faction.setdefault(getattr(entity, 'faction', None), []).append(entity)
+
+            if (components is not None and components.has(ComponentType.ITEM)
+                    and not getattr(entity, 'owner', None)):
+                ground_items.append(entity)
+
+        self._taunt_candidates = taunt_candidates
+        self._living = living
+        self._living_by_faction = living_by_faction
+        self._ground_items = ground_items
+        self._by_id = by_id
+        self._entities_version = self._version()
+        self.rebuilds += 1
+
+    def _version(self) -> Any:
+        """Membership version of the entity list: its mutation counter, else its length."""
+        mutations = getattr(self.entities, 'mutations', None)
+        return len(self.entities) if mutations is None else mutations
+
+    def _refresh(self) -> None:
+        """Rebuild the buckets if entities were added or removed since the last build."""
+        if self._version() != self._entities_version:
+            self._build()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def taunted_target(self) -> Optional['Entity']:
+        """Return the living taunted entity, if any (same as find_taunted_target)."""
+        from components.ai._helpers import find_taunted_target
+
+        self._refresh()
+        # Re-run the full check on the few candidates: taunts expire and
+        # taunted monsters die mid-phase
+        return find_taunted_target(self._taunt_candidates)
+
+    def living_entities(self) -> List['Entity']:
+        """Entities that had a living fighter at the last build, in entity order.
+
+        Callers must still check ``fighter.hp`` for deaths earlier this phase.
+        """
+        self._refresh()
+        return self._living
+
+    def living_members(self, faction: Any) -> List['Entity']:
+        """Like ``living_entities`` but only members of ``faction``."""
+        self._refresh()
+        return self._living_by_faction.get(faction, [])
+
+    def ground_items(self) -> List['Entity']:
+        """Item entities lying on the floor at the last build, in entity order."""
+        self._refresh()
+        return self._ground_items
+
+    def entity_by_id(self, entity_id: int) -> Optional['Entity']:
+        """Find an entity by ``id(entity)`` (e.g. a rally directive target)."""
+        self._refresh()
+        return self._by_id.get(entity_id)
+
+
+# Active context for the current enemy phase
+_turn_context: Optional[TurnContext] = None
+
+
+def begin_enemy_phase(game_map: 'GameMap', entities: List['Entity'], player: 'Entity',
+                      fov_map: Any = None) -> TurnContext:
+    """Open an enemy phase: build the TurnContext and the shared navigation field.
+
+    Args:
+        game_map: The current map
+        entities: All entities on the floor
+        player: The player entity
+        fov_map: The player's FOV map
+
+    Returns:
+        TurnContext: The context monsters will read this phase
+    """
+    global _turn_context
+    from services.navigation_service import get_navigation_service
+
+    get_navigation_service().begin_enemy_phase(game_map, entities, player)
+    _turn_context = TurnContext(entities, player, fov_map, game_map)
+    return _turn_context
+
+
+def end_enemy_phase() -> None:
+    """Close the enemy phase and drop its context and navigation field."""
+    global _turn_context
+    from services.navigation_service import get_navigation_service
+
+    get_navigation_service().end_enemy_phase()
+    _turn_context = None
+
+
+def get_turn_context(entities: Optional[List['Entity']] = None) -> Optional[TurnContext]:
+    """Get the active enemy-phase context.
+
+    Args:
+        entities: If given, only return the context when it was built from
+            this very list, so callers passing some other list scan it themselves
+
+    Returns:
+        TurnContext or None outside an enemy phase
+    """
+    if _turn_context is None:
+        return None
+    if entities is not None and entities is not _turn_context.entities:
+        return None
+    return _turn_context
+
+
+def reset_turn_context() -> None:
+    """Drop any active context (for testing)."""
+    global _turn_context
+    _turn_context = None
@@ -0,0 +1,113 @@
+"""Per-phase turn profiler for scenario harness runs (optional, harness-scoped).
+
+When a run is started with profiling enabled, the harness wraps each turn
+phase (bot decision, player action, each AI type's turns, reanimations,
+status effects) in ``profile_phase(name)``. With no active profiler that is a
+shared no-op context, so unprofiled runs pay one global lookup per phase.
+
+Profiles are plain dicts so they travel through process pools and JSON:
+
+    {"enemy_ai.BasicMonster": {"calls": 412, "total_ms": 96.3, "mean_us": 233.7}, ...}
+"""
+
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, Optional
+
+PhaseProfile = Dict[str, Dict[str, float]]
+
+_NULL_PHASE = nullcontext()
+
+
+class TurnProfiler:
+    """Accumulates wall time and call counts per named phase."""
+
+    def __init__(self):
+        # phase name -> [total seconds, calls]
+        self._phases: Dict[str, list] = {}
+
+    def record(self, name: str, seconds: float, calls: int = 1) -> None:
+        """Add ``seconds`` of wall time and ``calls`` calls to a phase."""
+        entry = self._phases.get(name)
+        if entry is None:
+            self._phases[name] = [seconds, calls]
+        else:
+            entry[0] += seconds
+            entry[1] += calls
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as one call of ``name``."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, perf_counter() - start)
+
+    def to_dict(self) -> PhaseProfile:
+        """Return the profile, phases sorted by name."""
+        return {
+            name: _phase_entry(seconds * 1000.0, calls)
+            for name, (seconds, calls) in sorted(self._phases.items())
+        }
+
+
+def _phase_entry(total_ms: float, calls: int) -> Dict[str, float]:
+    return {
+        "calls": calls,
+        "total_ms": round(total_ms, 3),
+        "mean_us": round(total_ms * 1000.0 / calls, 3) if calls else 0.0,
+    }
+
+
+def merge_profiles(profiles: Iterable[PhaseProfile]) -> PhaseProfile:
+    """Sum several run profiles into one (call counts and total time)."""
+    totals: Dict[str, list] = {}
+    for profile in profiles:
+        for name, entry in profile.items():
+            total = totals.setdefault(name, [0.0, 0])
+            total[0] += entry["total_ms"]
+            total[1] += entry["calls"]
+    return {
+        name: _phase_entry(total_ms, calls)
+        for name, (total_ms, calls) in sorted(totals.items())
+    }
+
+
+_active_turn_profiler: Optional[TurnProfiler] = None
+
+
+def get_active_turn_profiler() -> Optional[TurnProfiler]:
+    """Return the active profiler if one is set."""
+    return _active_turn_profiler
+
+
+def profile_phase(name: str):
+    """Time a phase on the active profiler, or do nothing if none is active."""
+    profiler = _active_turn_profiler
+    if profiler is None:
+        return _NULL_PHASE
+    return profiler.phase(name)
+
+
+@contextmanager
+def scoped_turn_profiler(enabled: bool = True) -> Iterator[Optional[TurnProfiler]]:
+    """Context manager to scope an active profiler to a scenario run.
+
+    Args:
+        enabled: When False, yields None and leaves profiling off
+
+    Yields:
+        The active TurnProfiler, or None
+    """
+    global _active_turn_profiler
+    if not enabled:
+        yield None
+        return
+    previous = _active_turn_profiler
+    profiler = TurnProfiler()
+    _active_turn_profiler = profiler
+    try:
+        yield profiler
+    finally:
+        _active_turn_profiler = previous
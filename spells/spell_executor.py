@@ -7,12 +7,16 @@ execution engine.
 
 from typing import List, Dict, Any, Optional
 import math
+
+import numpy as np
+
 from spells.spell_definition import SpellDefinition
 from spells.spell_types import SpellCategory, TargetingType, DamageType, EffectType
 from game_messages import Message
 from message_builder import MessageBuilder as MB
-from fov_functions import map_is_in_fov
+from fov_functions import map_is_in_fov, mark_visible_as_explored
 from dice import roll_dice
+from engine.rng_config import get_rng
 from components.component_registry import ComponentType
 
 
@@ -876,9 +880,12 @@ class SpellExecutor:
         Classic roguelike utility spell.
         """
         # Reveal entire map
-        for y in range(game_map.height):
-            for x in range(game_map.width):
-                game_map.tiles[x][y].explored = True
+        if hasattr(game_map, "reveal_all"):
+            game_map.reveal_all()
+        else:
+            for y in range(game_map.height):
+                for x in range(game_map.width):
+                    game_map.tiles[x][y].explored = True
         
         return [
             {
@@ -901,11 +908,17 @@ class SpellExecutor:
         """
         # Reveal all tiles in current FOV
         revealed_count = 0
-        for y in range(game_map.height):
-            for x in range(game_map.width):
-                if map_is_in_fov(fov_map, x, y) and not game_map.tiles[x][y].explored:
-                    game_map.tiles[x][y].explored = True
-                    revealed_count += 1
+        explored = getattr(game_map, "explored", None)
+        visibility = getattr(fov_map, "visibility", None)
+        if (isinstance(explored, np.ndarray) and isinstance(visibility, np.ndarray)
+                and visibility.shape == explored.shape):
+            revealed_count = mark_visible_as_explored(fov_map, game_map)
+        else:
+            for y in range(game_map.height):
+                for x in range(game_map.width):
+                    if map_is_in_fov(fov_map, x, y) and not game_map.tiles[x][y].explored:
+                        game_map.tiles[x][y].explored = True
+                        revealed_count += 1
         
         message = spell.success_message
         if revealed_count > 0:
@@ -1229,7 +1242,6 @@ class SpellExecutor:
         **kwargs
     ) -> List[Dict[str, Any]]:
         """Enhance equipped armor's AC bonus."""
-        import random
         
         bonus = kwargs.get("bonus", 1)
         
@@ -1263,7 +1275,7 @@ class SpellExecutor:
             }]
         
         # Randomly select an armor piece
-        slot_name, armor = random.choice(armor_pieces)
+        slot_name, armor = get_rng("combat").choice(armor_pieces)
         old_bonus = armor.equippable.armor_class_bonus
 
         # Directly modify the armor class bonus
@@ -1521,10 +1533,9 @@ class SpellExecutor:
         **kwargs
     ) -> List[Dict[str, Any]]:
         """Cast Yo Mama spell - target yells a joke and becomes taunted."""
-        import yaml
-        import random
         import os
         from components.status_effects import TauntedTargetEffect, StatusEffectManager
+        from config.content_cache import load_yaml
         from utils.resource_paths import get_resource_path
         
         results = []
@@ -1552,9 +1563,8 @@ class SpellExecutor:
         # Load jokes from YAML
         jokes_path = get_resource_path("config/yo_mama_jokes.yaml")
         try:
-            with open(jokes_path, 'r') as f:
-                jokes_data = yaml.safe_load(f)
-                jokes = jokes_data.get('jokes', [])
+            jokes_data = load_yaml(jokes_path)
+            jokes = jokes_data.get('jokes', [])
         except Exception as e:
             jokes = ["Yo mama so ugly, even the game couldn't load her jokes!"]
             print(f"Warning: Could not load yo_mama_jokes.yaml: {e}")
@@ -1563,7 +1573,7 @@ class SpellExecutor:
             jokes = ["Yo mama so forgettable, even the joke list forgot about her!"]
         
         # Select random joke
-        joke = random.choice(jokes)
+        joke = get_rng("combat").choice(jokes)
         
         # Target yells the joke
         results.append({
@@ -13,30 +13,35 @@ Key Components:
 - StatePersistence: Save/load state information
 """
 
-from .core import (
-    State, StateMachine, StateTransition, TransitionGuard, TransitionAction,
-    StateContext, StateResult, StateMachineError
-)
-from .hierarchical import HierarchicalState, StateHierarchy, CompositeState
-from .manager import EnhancedStateManager, StateManagerConfig, StateManagerMode
-from .persistence import (
-    StatePersistence, StateSnapshot, PersistenceError, 
-    JsonPersistenceBackend, create_json_persistence
-)
-from .game_states import (
-    GameStateMachine, GameStateContext, BaseGameState,
-    PlayerTurnState, EnemyTurnState, InventoryState, TargetingState,
-    CharacterScreenState, PlayerDeadState, LevelUpState
-)
-from .transitions import (
-    StateTransitionBuilder, ConditionalTransition, TimedTransition,
-    EventTriggeredTransition, create_transition
-)
-from .events import (
-    StateEvent, StateEventType, StateChangeEvent, StateTransitionEvent,
-    create_state_change_event, create_state_transition_event, create_state_request_event,
-    create_state_lifecycle_event, create_state_error_event, create_hierarchical_state_event
-)
+from utils.lazy_exports import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    '.core': [
+        'State', 'StateMachine', 'StateTransition', 'TransitionGuard', 'TransitionAction',
+        'StateContext', 'StateResult', 'StateMachineError',
+    ],
+    '.hierarchical': ['HierarchicalState', 'StateHierarchy', 'CompositeState'],
+    '.manager': ['EnhancedStateManager', 'StateManagerConfig', 'StateManagerMode'],
+    '.persistence': [
+        'StatePersistence', 'StateSnapshot', 'PersistenceError', 'JsonPersistenceBackend',
+        'create_json_persistence',
+    ],
+    '.game_states': [
+        'GameStateMachine', 'GameStateContext', 'BaseGameState', 'PlayerTurnState',
+        'EnemyTurnState', 'InventoryState', 'TargetingState', 'CharacterScreenState',
+        'PlayerDeadState', 'LevelUpState',
+    ],
+    '.transitions': [
+        'StateTransitionBuilder', 'ConditionalTransition', 'TimedTransition',
+        'EventTriggeredTransition', 'create_transition',
+    ],
+    '.events': [
+        'StateEvent', 'StateEventType', 'StateChangeEvent', 'StateTransitionEvent',
+        'create_state_change_event', 'create_state_transition_event',
+        'create_state_request_event', 'create_state_lifecycle_event',
+        'create_state_error_event', 'create_hierarchical_state_event',
+    ],
+})
 
 __all__ = [
     # Core
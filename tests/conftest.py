@@ -2,6 +2,19 @@
 Pytest configuration and shared fixtures for rlike game testing.
 """
 
+import atexit
+import os
+import shutil
+import tempfile
+
+# Keep the persistent content cache out of the user's data directory. Set
+# before any game module loads content; a throwaway file per session still
+# exercises the on-disk path (including in spawned workers and subprocesses).
+if "YARL_CONTENT_CACHE" not in os.environ:
+    _content_cache_dir = tempfile.mkdtemp(prefix="yarl-test-content-cache-")
+    os.environ["YARL_CONTENT_CACHE"] = os.path.join(_content_cache_dir, "content_cache.pickle")
+    atexit.register(shutil.rmtree, _content_cache_dir, ignore_errors=True)
+
 import pytest
 import config.level_template_registry as ltr_module
 from unittest.mock import Mock, MagicMock, patch
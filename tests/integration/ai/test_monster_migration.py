@@ -31,7 +31,7 @@ class TestMonsterMigrationCompatibility:
         self.test_room = Rect(x=5, y=5, w=8, h=8)
         
         # Mock random functions to ensure predictable testing
-        self.mock_randint_patcher = patch('map_objects.game_map.randint')
+        self.mock_randint_patcher = patch('random.randint')
         self.mock_randint = self.mock_randint_patcher.start()
         
         self.mock_choice_patcher = patch('map_objects.game_map.random_choice_from_dict')
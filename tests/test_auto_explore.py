@@ -272,6 +272,37 @@ class TestPathfinding:
         # Should find (10, 5) as it's closer
         assert closest == (10, 5)
     
+    def test_find_closest_tile_skips_hazard_blocked_targets(self, auto_explore, game_map):
+        """Targets only reachable through a hazard are unreachable."""
+        from components.ground_hazard import HazardType, GroundHazard
+        
+        game_map.hazard_manager.add_hazard(GroundHazard(HazardType.FIRE, 7, 5, 10, 3, 3))
+        
+        assert auto_explore._find_closest_tile([(10, 5)], game_map) is None
+        assert auto_explore._find_closest_tile([(6, 5), (10, 5)], game_map) == (6, 5)
+    
+    def test_distance_map_survives_owner_moves(self, auto_explore, game_map):
+        """The frontier-rooted field is reused until walls or the frontier change."""
+        import numpy as np
+        
+        frontier = np.zeros((game_map.width, game_map.height), dtype=bool)
+        frontier[15, 5] = True
+        first = auto_explore._distance_map(game_map, frontier)
+        auto_explore.owner.x = 8
+        assert auto_explore._distance_map(game_map, frontier) is first
+        
+        game_map.tiles[5][6].blocked = False
+        second = auto_explore._distance_map(game_map, frontier)
+        assert second is not first
+        
+        frontier[10, 5] = True
+        assert auto_explore._distance_map(game_map, frontier) is not second
+    
+    def test_find_closest_tile_records_the_route_down_the_field(self, auto_explore, game_map):
+        """The route to the closest tile is kept for get_next_action to walk."""
+        assert auto_explore._find_closest_tile([(10, 5), (15, 5)], game_map) == (10, 5)
+        assert auto_explore._frontier_route == [(6, 5), (7, 5), (8, 5), (9, 5), (10, 5)]
+    
     def test_calculate_path_to_target(self, auto_explore, game_map):
         """Test A* path calculation."""
         target = (10, 5)
@@ -156,3 +156,69 @@ class TestScenarioHarnessDeterminism:
         # It's technically possible but extremely unlikely for all to match
         # If this fails, it suggests the seeding isn't being applied
         assert not all_same, "Different seed bases should produce different results"
+    
+    def test_parallel_workers_match_serial_output(self):
+        """workers>1 must produce byte-identical aggregated output to the serial path."""
+        import json
+        from config.level_template_registry import get_scenario_registry
+        from services.scenario_harness import run_scenario_many, make_bot_policy
+        
+        registry = get_scenario_registry()
+        scenario = registry.get_scenario_definition("monster_skeleton_identity")
+        if scenario is None:
+            scenario_ids = registry.list_scenarios()
+            if not scenario_ids:
+                pytest.skip("No scenarios available")
+            scenario = registry.get_scenario_definition(scenario_ids[0])
+        
+        policy = make_bot_policy("tactical_fighter")
+        runs = 4
+        turn_limit = 30
+        
+        serial = run_scenario_many(scenario, policy, runs, turn_limit, seed_base=1337)
+        parallel = run_scenario_many(
+            scenario, policy, runs, turn_limit, seed_base=1337, workers=2
+        )
+        
+        serial_json = json.dumps(serial.to_dict(), sort_keys=True)
+        parallel_json = json.dumps(parallel.to_dict(), sort_keys=True)
+        assert serial_json == parallel_json
+
+    @pytest.mark.parametrize("scenario_id", [
+        "orc_swarm_tight",        # random placements + monster equipment rolls
+        "ranged_chains_synergy",  # oath applied at player creation
+        "dueling_pit",            # player loadout rolls identification (rebuilt per fork)
+    ])
+    def test_forked_worlds_match_fresh_builds(self, scenario_id):
+        """fork_world=True must produce the same metrics as building every run."""
+        import json
+        from config.level_template_registry import get_scenario_registry
+        from services.scenario_harness import run_scenario_many, make_bot_policy
+        
+        scenario = get_scenario_registry().get_scenario_definition(scenario_id)
+        if scenario is None:
+            pytest.skip(f"Scenario {scenario_id} not available")
+        
+        policy = make_bot_policy("tactical_fighter")
+        fresh = run_scenario_many(scenario, policy, 3, 40, seed_base=1337)
+        forked = run_scenario_many(scenario, policy, 3, 40, seed_base=1337, fork_world=True)
+        
+        assert json.dumps(forked.to_dict(), sort_keys=True) == json.dumps(fresh.to_dict(), sort_keys=True)
+    
+    def test_forked_worlds_match_in_parallel_workers(self):
+        """A snapshot shipped to worker processes forks the same worlds."""
+        import json
+        from config.level_template_registry import get_scenario_registry
+        from services.scenario_harness import run_scenario_many, make_bot_policy
+        
+        scenario = get_scenario_registry().get_scenario_definition("orc_swarm_tight")
+        if scenario is None:
+            pytest.skip("Scenario orc_swarm_tight not available")
+        
+        policy = make_bot_policy("tactical_fighter")
+        serial = run_scenario_many(scenario, policy, 4, 30, seed_base=1337)
+        parallel = run_scenario_many(
+            scenario, policy, 4, 30, seed_base=1337, workers=2, fork_world=True
+        )
+        
+        assert json.dumps(parallel.to_dict(), sort_keys=True) == json.dumps(serial.to_dict(), sort_keys=True)
@@ -64,6 +64,30 @@ class TestSoakRunResult:
         assert result.bot_steps == 0
         assert result.bot_actions == {}
     
+    def test_turns_per_second_from_steps_and_duration(self):
+        """turns_per_second is steps_taken / duration_seconds."""
+        mock_run_metrics = Mock()
+        mock_run_metrics.run_id = "tps-run"
+        mock_run_metrics.seed = None
+        mock_run_metrics.outcome = "max_turns"
+        mock_run_metrics.duration_seconds = 2.0
+        mock_run_metrics.deepest_floor = 1
+        mock_run_metrics.floors_visited = 1
+        mock_run_metrics.monsters_killed = 0
+        mock_run_metrics.items_picked_up = 0
+        mock_run_metrics.portals_used = 0
+        mock_run_metrics.tiles_explored = 10
+        mock_run_metrics.steps_taken = 500
+        
+        result = SoakRunResult.from_run_metrics_and_telemetry(
+            run_number=1,
+            run_metrics=mock_run_metrics,
+            telemetry_stats={},
+        )
+        
+        assert result.turns_per_second == pytest.approx(250.0)
+        assert result.to_dict()['turns_per_second'] == 250.0
+    
     def test_from_run_metrics_and_telemetry_with_none_metrics(self):
         """Test fallback when run_metrics is None."""
         telemetry_stats = {
@@ -219,6 +243,53 @@ class TestSoakSessionResult:
 class TestRunBotSoakIntegration:
     """Integration-ish tests for run_bot_soak (with heavy mocking)."""
     
+    @patch('engine.soak_harness.libtcod.console_init_root')
+    @patch('engine.soak_harness.libtcod.console_set_custom_font')
+    @patch('tcod.libtcodpy.console_new')
+    @patch('loader_functions.initialize_new_game.get_game_variables')
+    @patch('engine_integration.play_game_with_engine')
+    @patch('instrumentation.run_metrics.get_run_metrics_recorder')
+    @patch('services.telemetry_service.get_telemetry_service')
+    def test_run_bot_soak_simulate_skips_consoles(
+        self,
+        mock_get_telemetry,
+        mock_get_recorder,
+        mock_play_game,
+        mock_get_game_vars,
+        mock_console_new,
+        mock_set_font,
+        mock_init_root,
+    ):
+        """Simulation mode creates no root/per-run consoles and flags constants."""
+        mock_get_game_vars.return_value = (Mock(), [], Mock(), Mock(), Mock())
+        mock_play_game.return_value = {"restart": False}
+        
+        mock_recorder = Mock()
+        mock_recorder.get_metrics.return_value = None
+        mock_get_recorder.return_value = mock_recorder
+        
+        mock_telemetry = Mock()
+        mock_telemetry.get_stats.return_value = {}
+        mock_get_telemetry.return_value = mock_telemetry
+        
+        constants = {'input_config': {}}
+        result = run_bot_soak(
+            runs=1,
+            telemetry_enabled=False,
+            constants=constants,
+            simulate=True,
+        )
+        
+        mock_set_font.assert_not_called()
+        mock_init_root.assert_not_called()
+        mock_console_new.assert_not_called()
+        assert constants["simulation_mode"] is True
+        assert result.simulate is True
+        
+        # Consoles passed to play_game_with_engine are all None
+        args = mock_play_game.call_args[0]
+        assert args[5] is None and args[6] is None and args[7] is None
+    
     @patch('engine.soak_harness.libtcod.console_init_root')
     @patch('engine.soak_harness.libtcod.console_set_custom_font')
     @patch('tcod.libtcodpy.console_new')
@@ -0,0 +1,128 @@
+"""Tests for the component-type entity index."""
+
+import copy
+import pickle
+from unittest.mock import Mock
+
+from components.component_registry import ComponentType
+from components.fighter import Fighter
+from entity import Entity
+from map_objects.component_index import entities_with
+from map_objects.spatial_index import EntityList
+
+AI, FIGHTER, ITEM = ComponentType.AI, ComponentType.FIGHTER, ComponentType.ITEM
+
+
+class _Brain:
+    def take_turn(self, *args):
+        return []
+
+
+def _monster(name, x=0, y=0):
+    return Entity(x, y, 'o', (255, 0, 0), name, blocks=True,
+                  fighter=Fighter(hp=10, defense=0, power=1), ai=_Brain())
+
+
+def _item(name):
+    return Entity(0, 0, '!', (0, 255, 0), name, item=object())
+
+
+class TestMembership:
+    """Queries follow spawns, despawns and registry changes."""
+
+    def test_query_by_several_components_in_list_order(self):
+        orc, potion, troll = _monster('orc'), _item('potion'), _monster('troll')
+        entities = EntityList([orc, potion, troll])
+
+        assert entities.with_components(AI, FIGHTER) == [orc, troll]
+        assert entities.with_components(ITEM) == [potion]
+        assert entities.with_components() == [orc, potion, troll]
+
+    def test_registry_add_and_remove_update_queries(self):
+        orc, troll = _monster('orc'), _monster('troll')
+        entities = EntityList([orc, troll])
+
+        orc.components.remove(AI)
+        assert entities.with_components(AI) == [troll]
+
+        orc.ai = _Brain()
+        assert entities.with_components(AI) == [orc, troll]
+
+        troll.components.clear()
+        assert entities.with_components(FIGHTER) == [orc]
+
+    def test_despawn_stops_tracking_the_registry(self):
+        orc = _monster('orc')
+        entities = EntityList([orc])
+
+        entities.remove(orc)
+        assert orc.components._indexes == ()
+        orc.components.remove(AI)
+        assert entities.with_components(AI) == []
+
+    def test_slice_assignment_keeps_order_and_membership(self):
+        a, b, c = _monster('a'), _monster('b'), _monster('c')
+        entities = EntityList([a, b, c])
+
+        entities[:] = [e for e in entities if e is not b]
+        entities.append(b)
+        assert entities.with_components(AI) == [a, c, b]
+
+    def test_insert_and_reorder_keep_list_order(self):
+        a, b, c, potion = _monster('a'), _monster('b'), _monster('c'), _item('potion')
+        entities = EntityList([a, potion, b])
+
+        entities.insert(0, c)
+        assert entities.with_components(AI) == [c, a, b]
+        assert entities.with_components() == [c, a, potion, b]
+
+        entities[1] = _monster('d')
+        entities.reverse()
+        assert entities.with_components(AI) == [b, entities[2], c]
+        assert entities.with_components(AI) == [e for e in entities if e.ai]
+
+    def test_entity_in_two_lists(self):
+        orc = _monster('orc')
+        first, second = EntityList([orc]), EntityList([orc])
+
+        orc.components.remove(AI)
+        assert first.with_components(AI) == second.with_components(AI) == []
+
+        first.clear()
+        assert len(orc.components._indexes) == 1
+
+    def test_copies_rebuild_the_index(self):
+        entities = EntityList([_monster('orc'), _item('potion')])
+
+        for clone in (copy.deepcopy(entities), pickle.loads(pickle.dumps(entities))):
+            orc = clone[0]
+            assert clone.with_components(AI) == [orc]
+            orc.components.remove(AI)
+            assert clone.with_components(AI) == []
+        assert len(entities.with_components(AI)) == 1
+
+
+class TestFallback:
+    """entities_with gives the same answer for plain lists and test doubles."""
+
+    def test_plain_list_matches_index(self):
+        members = [_monster('orc'), _item('potion'), _monster('troll')]
+        assert entities_with(members, AI, FIGHTER) == entities_with(EntityList(members), AI, FIGHTER)
+
+    def test_entities_without_a_registry(self):
+        class Double:
+            x = y = 0
+            blocks = False
+            _spatial_indexes = ()
+
+        orc = _monster('orc')
+        double = Double()
+        double.components = Mock()
+        double.components.has.side_effect = lambda component_type: component_type is AI
+        legacy = Double()
+        legacy.ai = _Brain()
+        entities = EntityList([double, orc, Double(), legacy])
+
+        assert entities.with_components(AI) == [double, orc, legacy]
+        assert entities.with_components(AI, FIGHTER) == [orc]
+        assert entities_with(list(entities), AI) == [double, orc, legacy]
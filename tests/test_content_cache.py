@@ -0,0 +1,99 @@
+"""Tests for the parsed-YAML content cache (config/content_cache.py)."""
+
+import os
+
+import pytest
+import yaml
+
+import config.content_cache as content_cache
+from config.content_cache import ContentCache
+
+
+@pytest.fixture
+def content_dir(tmp_path, monkeypatch):
+    """A fake bundled config/ directory with one content file."""
+    root = tmp_path / "config"
+    root.mkdir()
+    (root / "monsters.yaml").write_text("monsters:\n  orc: {hp: 20}\n")
+    monkeypatch.setattr(content_cache, "get_resource_path", lambda rel: str(tmp_path / rel))
+    return root
+
+
+def test_loads_match_safe_load_and_are_independent_copies(content_dir):
+    path = str(content_dir / "monsters.yaml")
+    cache = ContentCache(None)
+
+    first = cache.load_yaml(path)
+    first["monsters"]["orc"]["hp"] = 1
+    second = cache.load_yaml(path)
+
+    assert second == yaml.safe_load(open(path))
+    assert (cache.files_parsed, cache.files_from_cache) == (1, 1)
+
+
+def test_touched_file_hits_by_hash_and_edited_file_reparses(content_dir):
+    path = content_dir / "monsters.yaml"
+    cache = ContentCache(None)
+    cache.load_yaml(str(path))
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cache.load_yaml(str(path))
+    assert cache.files_parsed == 1
+
+    path.write_text("monsters:\n  orc: {hp: 25}\n")
+    assert cache.load_yaml(str(path))["monsters"]["orc"]["hp"] == 25
+    assert cache.files_parsed == 2
+
+
+def test_compiled_cache_file_serves_a_new_process(content_dir, tmp_path):
+    cache_file = tmp_path / "cache" / "content.pickle"
+    assert ContentCache(cache_file).compile() == 1
+
+    fresh = ContentCache(cache_file)
+    data = fresh.load_yaml(str(content_dir / "monsters.yaml"))
+
+    assert data == {"monsters": {"orc": {"hp": 20}}}
+    assert (fresh.files_parsed, fresh.files_from_cache) == (0, 1)
+
+
+def test_only_bundled_content_is_persisted(content_dir, tmp_path):
+    outside = tmp_path / "save.yaml"
+    outside.write_text("a: 1\n")
+    cache_file = tmp_path / "content.pickle"
+
+    cache = ContentCache(cache_file)
+    cache.load_yaml(str(outside))
+    cache.save()
+
+    fresh = ContentCache(cache_file)
+    fresh.load_yaml(str(outside))
+    assert fresh.files_parsed == 1
+
+
+def test_invalid_yaml_raises_and_is_not_cached(content_dir):
+    bad = content_dir / "bad.yaml"
+    bad.write_text("key: [unclosed\n")
+    cache = ContentCache(None)
+
+    for _ in range(2):
+        with pytest.raises(yaml.YAMLError):
+            cache.load_yaml(str(bad))
+
+
+def test_stale_format_version_is_ignored(content_dir, tmp_path, monkeypatch):
+    cache_file = tmp_path / "content.pickle"
+    ContentCache(cache_file).compile()
+    monkeypatch.setattr(content_cache, "CACHE_FORMAT_VERSION", content_cache.CACHE_FORMAT_VERSION + 1)
+
+    fresh = ContentCache(cache_file)
+    fresh.load_yaml(str(content_dir / "monsters.yaml"))
+    assert fresh.files_parsed == 1
+
+
+def test_env_var_disables_or_relocates_the_cache_file(monkeypatch, tmp_path):
+    monkeypatch.setenv(content_cache.CACHE_ENV_VAR, "0")
+    assert content_cache.default_cache_path() is None
+
+    monkeypatch.setenv(content_cache.CACHE_ENV_VAR, str(tmp_path / "c.pickle"))
+    assert content_cache.default_cache_path() == tmp_path / "c.pickle"
@@ -0,0 +1,158 @@
+"""Tests for the analytical duel model."""
+
+import random
+
+import pytest
+
+from balance.duel_model import (
+    CombatantProfile,
+    attack_distribution,
+    dice_distribution,
+    hit_chances,
+    solve_duel,
+    surprise_attack_distribution,
+    uniform_distribution,
+)
+
+
+def _player(**changes):
+    profile = CombatantProfile("Player", hp=30, armor_class=14, accuracy=2, evasion=1, to_hit=3,
+                               strength_mod=1, damage=dice_distribution("1d6"), speed_bonus=0.25)
+    return profile.with_changes(**changes)
+
+
+def _orc(**changes):
+    profile = CombatantProfile("Orc", hp=12, armor_class=12, accuracy=2, evasion=1, to_hit=1,
+                               strength_mod=2, damage=uniform_distribution(3, 7))
+    return profile.with_changes(**changes)
+
+
+def test_dice_distribution():
+    dist = dice_distribution("2d6+1")
+    assert sum(dist.values()) == pytest.approx(1.0)
+    assert min(dist) == 3 and max(dist) == 13
+    assert dist[8] == pytest.approx(6 / 36)
+
+
+def test_bonus_schedule_matches_speed_tracker():
+    assert _player(speed_bonus=0.25).bonus_schedule() == (0.25, 0.5, 0.75, 1.0)
+    assert _player(speed_bonus=0.5).bonus_schedule() == (0.5, 1.0)
+    assert _player(speed_bonus=0.0).bonus_schedule() == ()
+
+
+def test_hit_chances_and_crit_damage():
+    attacker = _player(to_hit=0, strength_mod=0, damage={4: 1.0}, crit_threshold=19)
+    accuracy, hit, crit = hit_chances(attacker, _orc(armor_class=30), accuracy_roll=False)
+    assert (accuracy, hit, crit) == (1.0, 0.1, 0.1)
+
+    dist = attack_distribution(attacker, _orc(armor_class=30), accuracy_roll=False)
+    assert dist == pytest.approx({0: 0.9, 8: 0.1})
+
+
+def test_resistances_apply_after_crit():
+    attacker = _player(strength_mod=0, damage={10: 1.0}, damage_type="fire")
+    defender = _orc(resistances={"fire": 50}, damage_type_modifiers={"fire": 1.5})
+    dist = attack_distribution(attacker, defender, accuracy_roll=False)
+    # int(10 * 1.5) = 15 -> 7 after 50% resistance; crit 30 -> 15
+    assert set(dist) == {0, 7, 15}
+
+
+def test_surprise_attack_always_hits_and_crits():
+    attacker = _player(strength_mod=1, damage={3: 0.5, 4: 0.5})
+    assert surprise_attack_distribution(attacker, _orc(armor_class=30)) == {8: 0.5, 10: 0.5}
+
+
+def test_outcome_probabilities_sum_to_one():
+    outcome = solve_duel(_player(), [_orc(), _orc()], max_rounds=15)
+    assert outcome.win_rate + outcome.loss_rate + outcome.timeout_rate == pytest.approx(1.0)
+    assert sum(outcome.hp_loss_distribution.values()) == pytest.approx(1.0)
+    assert sum(outcome.rounds_distribution.values()) == pytest.approx(1.0)
+    assert 0.0 < outcome.timeout_rate < 1.0
+
+
+def test_no_monsters_is_a_free_win():
+    outcome = solve_duel(_player(), [])
+    assert outcome.win_rate == 1.0
+    assert outcome.expected_hp_loss == 0.0
+
+
+def _sample(dist, rng):
+    roll = rng.random()
+    total = 0.0
+    for value, p in dist.items():
+        total += p
+        if roll < total:
+            return value
+    return value
+
+
+def _simulate(player, monsters, trials, rng, max_rounds=100):
+    """Straightforward Monte Carlo of the same round structure.
+
+    Returns (win rate, mean rounds, player hits / player attacks).
+    """
+    player_attacks = [attack_distribution(player, m, False) for m in monsters]
+    surprise_attacks = [surprise_attack_distribution(player, m) for m in monsters]
+    monster_attacks = [attack_distribution(m, player) for m in monsters]
+    schedule = player.bonus_schedule()
+    wins = rounds = attacks = hits = 0
+    for _ in range(trials):
+        hp = player.hp
+        monster_hp = [m.hp for m in monsters]
+        unaware = [m.unaware for m in monsters]
+        idx = counter = 0
+        for rnd in range(1, max_rounds + 1):
+            first = surprise_attacks[idx] if unaware[idx] else player_attacks[idx]
+            unaware[idx] = False
+            dmg = _sample(first, rng)
+            monster_hp[idx] -= dmg
+            attacks += 1
+            hits += dmg > 0
+            if monster_hp[idx] > 0 and schedule:
+                counter += 1
+                if counter * player.speed_bonus >= 1.0:
+                    counter = 0
+                    bonus = True
+                else:
+                    bonus = rng.random() < counter * player.speed_bonus
+                if bonus:
+                    dmg = _sample(player_attacks[idx], rng)
+                    monster_hp[idx] -= dmg
+                    attacks += 1
+                    hits += dmg > 0
+            if monster_hp[idx] <= 0:
+                idx += 1
+                if idx == len(monsters):
+                    wins += 1
+                    rounds += rnd
+                    break
+            hp -= sum(_sample(monster_attacks[j], rng) for j in range(idx, len(monsters)))
+            if hp <= 0:
+                rounds += rnd
+                break
+    return wins / trials, rounds / trials, hits / attacks
+
+
+@pytest.mark.parametrize("unaware", [False, True])
+def test_matches_monte_carlo(unaware):
+    player = _player(hp=40)
+    monsters = [_orc(unaware=unaware), _orc(hp=15, unaware=unaware)]
+    outcome = solve_duel(player, monsters)
+
+    win_rate, mean_rounds, hit_rate = _simulate(player, monsters, 4000, random.Random(7))
+    assert outcome.win_rate == pytest.approx(win_rate, abs=0.03)
+    assert outcome.expected_rounds == pytest.approx(mean_rounds, rel=0.05)
+    assert outcome.expected_player_hits / outcome.expected_player_attacks == pytest.approx(hit_rate, abs=0.01)
+
+
+def test_surprise_opening_lands_one_sure_hit_per_monster():
+    monsters = [_orc(), _orc(hp=15)]
+    aware = solve_duel(_player(), monsters)
+    surprised = solve_duel(_player(), [m.with_changes(unaware=True) for m in monsters])
+
+    assert surprised.win_rate > aware.win_rate
+    assert surprised.expected_rounds < aware.expected_rounds
+    # Fewer attacks overall, but more of them land
+    assert (surprised.expected_player_hits / surprised.expected_player_attacks
+            > aware.expected_player_hits / aware.expected_player_attacks)
+
@@ -275,6 +275,22 @@ class TestETPConfigLoading:
         # Should still have same structure
         assert len(new_config.bands) == 5
     
+    def test_monster_etp_memoized_until_reload(self):
+        """Repeat lookups don't re-read monster data; reload clears the cache."""
+        first = get_monster_etp("orc", 1)
+        
+        with patch("balance.etp._calculate_monster_etp") as calculate:
+            assert get_monster_etp("orc", 1) == first
+            calculate.assert_not_called()
+        
+        reload_etp_config()
+        assert get_monster_etp("orc", 1) == pytest.approx(first)
+    
+    def test_synergy_bypasses_memoized_etp(self):
+        """Synergy bonuses are applied on top of the cached lookup path."""
+        base = get_monster_etp("orc", 1)
+        assert get_monster_etp("orc", 1, synergy_bonus=0.2) > base
+    
     def test_all_bands_present(self):
         """Test that all 5 bands are defined."""
         config = get_etp_config()
@@ -0,0 +1,116 @@
+"""Tests for the Fighter derived-stat cache and its invalidation."""
+
+import pytest
+
+from components.equipment import Equipment
+from components.equippable import Equippable
+from components.fighter import Fighter, set_derived_stats_crosscheck
+from components.inventory import Inventory
+from components.status_effects import ProtectionEffect
+from entity import Entity
+from equipment_slots import EquipmentSlots
+
+
+@pytest.fixture
+def crosscheck():
+    """Fail loudly on any stale cache hit during the test."""
+    set_derived_stats_crosscheck(True)
+    yield
+    set_derived_stats_crosscheck(False)
+
+
+def _make_player():
+    player = Entity(0, 0, '@', (255, 255, 255), 'Player', blocks=True)
+    player.fighter = Fighter(hp=30, defense=1, power=2, dexterity=14, constitution=14)
+    player.equipment = Equipment()
+    player.inventory = Inventory(10)
+    return player
+
+
+def _make_item(name, slot, **bonuses):
+    item = Entity(0, 0, '[', (255, 255, 255), name)
+    item.equippable = Equippable(slot=slot, **bonuses)
+    return item
+
+
+def test_stats_served_from_cache(crosscheck):
+    player = _make_player()
+    fighter = player.fighter
+
+    assert (fighter.armor_class, fighter.max_hp, fighter.power, fighter.defense) == (12, 32, 2, 1)
+    assert set(fighter._derived_stats[1]) == {'armor_class', 'max_hp', 'power', 'defense'}
+    assert fighter.armor_class == 12
+
+
+def test_equip_and_unequip_invalidate(crosscheck):
+    player = _make_player()
+    fighter = player.fighter
+    sword = _make_item('Sword', EquipmentSlots.MAIN_HAND, power_bonus=3)
+    plate = _make_item('Plate', EquipmentSlots.CHEST, armor_class_bonus=6,
+                       armor_type='heavy', dex_cap=0, max_hp_bonus=5)
+    assert (fighter.power, fighter.armor_class, fighter.max_hp) == (2, 12, 32)
+
+    player.equipment.toggle_equip(sword)
+    player.equipment.toggle_equip(plate)
+    assert (fighter.power, fighter.armor_class, fighter.max_hp) == (5, 16, 37)
+
+    player.equipment.toggle_equip(sword)
+    player.equipment.chest = None
+    assert (fighter.power, fighter.armor_class, fighter.max_hp) == (2, 12, 32)
+
+
+def test_in_place_item_change_invalidates(crosscheck):
+    player = _make_player()
+    armor = _make_item('Leather', EquipmentSlots.CHEST, armor_class_bonus=2, armor_type='light')
+    player.equipment.toggle_equip(armor)
+    assert player.fighter.armor_class == 14
+
+    armor.equippable.armor_class_bonus += 1  # enchant armor
+    assert player.fighter.armor_class == 15
+
+
+def test_status_effects_and_base_stats_invalidate(crosscheck):
+    player = _make_player()
+    fighter = player.fighter
+    assert fighter.armor_class == 12
+
+    player.get_status_effect_manager().add_effect(ProtectionEffect(duration=3, owner=player, ac_bonus=4))
+    assert fighter.armor_class == 16
+    player.status_effects.remove_effect('protection')
+    assert fighter.armor_class == 12
+
+    fighter.base_max_hp += 20  # level-up
+    fighter.base_power += 1  # boon
+    fighter.dexterity = 18
+    assert (fighter.max_hp, fighter.power, fighter.armor_class) == (52, 3, 14)
+
+
+def test_shield_wall_bonus_stays_live(crosscheck):
+    player = _make_player()
+    player.shieldwall_ac_per_adjacent = 1
+    assert player.fighter.armor_class == 12
+
+    player._cached_adjacent_skeleton_count = 2
+    assert player.fighter.armor_class == 14
+
+
+def test_crosscheck_detects_stale_cache(crosscheck):
+    player = _make_player()
+    fighter = player.fighter
+    assert fighter.power == 2
+
+    # Bypass __setattr__ to simulate a write the cache doesn't know about
+    fighter.__dict__['base_power'] = 7
+    with pytest.raises(AssertionError, match="Stale cached power"):
+        fighter.power
+
+
+def test_mock_owner_is_never_cached():
+    from unittest.mock import Mock
+
+    fighter = Fighter(hp=10, defense=0, power=1)
+    fighter.owner = Mock(equipment=Mock(power_bonus=2), status_effects=None)
+    assert fighter.power == 3
+    fighter.owner.equipment.power_bonus = 4
+    assert fighter.power == 5
+    assert fighter._derived_stats is None
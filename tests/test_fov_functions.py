@@ -0,0 +1,59 @@
+"""Tests for FOV maps linked to their GameMap."""
+
+from fov_functions import initialize_fov, mark_visible_as_explored, recompute_fov
+from map_objects.game_map import GameMap
+
+
+def _room_map():
+    """10x10 map: open interior with a sight-blocking wall column at x=6."""
+    game_map = GameMap(10, 10)
+    game_map.blocked[1:9, 1:9] = False
+    game_map.block_sight[1:9, 1:9] = False
+    game_map.blocked[6, 1:9] = True
+    game_map.block_sight[6, 1:9] = True
+    return game_map
+
+
+def test_tile_changes_seen_without_reinitializing():
+    """Opening a wall tile in place is picked up by the next compute."""
+    game_map = _room_map()
+    fov_map = initialize_fov(game_map)
+
+    recompute_fov(fov_map, 3, 5, 10)
+    assert not fov_map.is_in_fov(8, 5)
+
+    game_map.tiles[6][5].block_sight = False
+    recompute_fov(fov_map, 3, 5, 10)
+    assert fov_map.is_in_fov(8, 5)
+    assert fov_map.computes == 2
+
+
+def test_recompute_skipped_when_nothing_changed():
+    """Same viewer, same parameters and same walls reuse the last result."""
+    game_map = _room_map()
+    fov_map = initialize_fov(game_map)
+
+    recompute_fov(fov_map, 3, 5, 4)
+    recompute_fov(fov_map, 3, 5, 4)
+    assert (fov_map.computes, fov_map.skipped) == (1, 1)
+
+    # A change outside the radius doesn't matter either
+    game_map.block_sight[8, 8] = True
+    recompute_fov(fov_map, 3, 5, 2)
+    recompute_fov(fov_map, 3, 5, 2)
+    assert fov_map.computes == 2
+
+    recompute_fov(fov_map, 4, 5, 2)
+    assert fov_map.computes == 3
+
+
+def test_mark_visible_as_explored_updates_running_count():
+    """Visible tiles become explored once; repeats add nothing."""
+    game_map = _room_map()
+    fov_map = initialize_fov(game_map)
+
+    recompute_fov(fov_map, 3, 5, 10)
+    newly_explored = mark_visible_as_explored(fov_map, game_map)
+    assert newly_explored == int(fov_map.visibility.sum())
+    assert game_map.explored_count == newly_explored
+    assert mark_visible_as_explored(fov_map, game_map) == 0
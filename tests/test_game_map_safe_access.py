@@ -7,6 +7,7 @@ These tests verify that the safe accessor methods properly handle:
 - None/default value returns
 """
 
+import numpy as np
 import pytest
 from map_objects.game_map import GameMap
 from map_objects.tile import Tile
@@ -297,3 +298,54 @@ class TestRealWorldScenarios:
             if not is_valid:
                 assert is_walkable is False
 
+
+
+class TestTileArrays:
+    """The numpy tile arrays and the tiles[x][y] view share storage."""
+    
+    def test_tiles_view_writes_through_to_arrays(self, test_map):
+        """Writing through tiles[x][y] updates the field arrays."""
+        assert test_map.blocked.shape == (10, 10)
+        assert bool(test_map.blocked[5, 5]) is False
+        assert bool(test_map.explored[9, 9]) is True
+        
+        test_map.tiles[2][3].blocked = False
+        assert bool(test_map.blocked[2, 3]) is False
+    
+    def test_array_writes_visible_through_tiles_view(self, test_map):
+        """Slicing the arrays is reflected by tiles[x][y]."""
+        test_map.explored[:, 0] = True
+        assert test_map.tiles[7][0].explored is True
+        assert test_map.is_explored(7, 0) is True
+    
+    def test_custom_colors_round_trip(self, test_map):
+        """light/dark default to None and keep assigned colors."""
+        assert test_map.tiles[1][1].light is None
+        test_map.tiles[1][1].light = (10, 20, 30)
+        assert test_map.tiles[1][1].light == (10, 20, 30)
+    
+    def test_assigning_tile_list_converts_to_arrays(self):
+        """Legacy list-of-lists assignment is converted to the array layout."""
+        game_map = GameMap(width=3, height=2, dungeon_level=1)
+        game_map.tiles = [[Tile(x == 1) for y in range(2)] for x in range(3)]
+        assert game_map.blocked.tolist() == [[False, False], [True, True], [False, False]]
+    
+    def test_explored_count_tracks_marking(self):
+        """explored_count stays a running total across every marking path."""
+        game_map = GameMap(width=6, height=4, dungeon_level=1)
+        assert game_map.explored_count == 0
+        
+        game_map.tiles[0][0].explored = True
+        game_map.tiles[0][0].explored = True
+        assert game_map.explored_count == 1
+        
+        mask = np.zeros((2, 2), dtype=bool)
+        mask[:, 0] = True
+        assert game_map.mark_explored(mask, x0=0, y0=0) == 1
+        assert game_map.explored_count == 2
+        
+        assert game_map.reveal_all() == 22
+        assert game_map.explored_count == 24
+        
+        game_map.tiles[5][3].explored = False
+        assert game_map.explored_count == int(np.count_nonzero(game_map.explored)) == 23
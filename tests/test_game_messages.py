@@ -5,7 +5,7 @@ Tests message creation and message log functionality.
 """
 
 import pytest
-from game_messages import Message, MessageLog
+from game_messages import Message, MessageLog, NullMessageLog
 
 
 class TestMessage:
@@ -143,3 +143,50 @@ class TestMessageLog:
         except (TypeError, AttributeError):
             # If it rejects None, that's also fine
             pass
+
+    def test_message_log_wraps_long_messages(self):
+        """Test long messages wrap to width and only the newest lines are kept."""
+        # Arrange
+        log = MessageLog(x=0, width=10, height=3)
+
+        # Act
+        log.add_message(Message("first line", (1, 1, 1)))
+        log.add_message(Message("aaaa bbbb cccc dddd", (2, 2, 2)))
+
+        # Assert
+        assert [m.text for m in log.messages] == ["first line", "aaaa bbbb", "cccc dddd"]
+        assert log.messages[-1].color == (2, 2, 2)
+
+        log.add_message(Message("last", (3, 3, 3)))
+        assert [m.text for m in log.messages] == ["aaaa bbbb", "cccc dddd", "last"]
+
+    def test_message_log_ignores_blank_messages(self):
+        """Test blank messages don't evict visible lines."""
+        # Arrange
+        log = MessageLog(x=0, width=20, height=2)
+        log.add_message(Message("one"))
+        log.add_message(Message("two"))
+
+        # Act
+        log.add_message(Message("   "))
+
+        # Assert
+        assert [m.text for m in log.messages] == ["one", "two"]
+        assert log.message_count == 3
+
+
+class TestNullMessageLog:
+    """Test the counting-only NullMessageLog."""
+
+    def test_counts_without_storing(self):
+        """Test messages are counted but never stored."""
+        # Arrange
+        log = NullMessageLog(x=0, width=50, height=5)
+
+        # Act
+        for i in range(20):
+            log.add_message(Message(f"Message {i}"))
+
+        # Assert
+        assert log.message_count == 20
+        assert log.messages == []
@@ -0,0 +1,91 @@
+"""Tests for the harness GC policy in memory/gc_optimizer.py."""
+
+import gc
+
+import pytest
+
+from memory.gc_optimizer import (
+    GCPauseRecorder,
+    HarnessGC,
+    get_active_harness_gc,
+    harness_enemy_phase,
+    scoped_harness_gc,
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_gc():
+    was_enabled = gc.isenabled()
+    yield
+    gc.unfreeze()
+    if was_enabled:
+        gc.enable()
+
+
+def test_recorder_counts_every_collection():
+    recorder = GCPauseRecorder()
+    recorder.start()
+    try:
+        gc.collect(0)
+        gc.collect()
+    finally:
+        recorder.stop()
+    gc.collect()
+
+    stats = recorder.stats
+    assert (stats.collections_gen0, stats.collections_gen2) == (1, 1)
+    assert stats.max_gc_time_ms <= stats.total_gc_time_ms
+    assert stats.to_dict()['total_collections'] == 2
+
+
+def test_session_restores_interpreter_state():
+    gc.enable()
+    with scoped_harness_gc() as harness_gc:
+        assert get_active_harness_gc() is harness_gc
+        harness_gc.freeze_static_content()
+        assert gc.get_freeze_count() > 0
+        harness_gc.begin_run()
+        assert not gc.isenabled()
+
+    assert get_active_harness_gc() is None
+    assert gc.isenabled()
+    assert gc.get_freeze_count() == 0
+
+
+def test_batches_collect_only_when_thresholds_are_due():
+    harness_gc = HarnessGC(turn_batch=2)
+    harness_gc.start()
+    try:
+        harness_gc.begin_run()
+        gc.collect()  # Reset the young-generation count
+        for _ in range(4):
+            with harness_gc.enemy_phase():
+                assert not gc.isenabled()
+        assert harness_gc.recorder.stats.collections_gen0 == 0
+
+        garbage = [[] for _ in range(gc.get_threshold()[0] + 1)]
+        for _ in range(2):
+            with harness_gc.enemy_phase():
+                pass
+        del garbage
+        stats = harness_gc.end_run()
+    finally:
+        harness_gc.stop()
+
+    assert stats['collections_gen0'] + stats['collections_gen1'] == 1
+    assert stats['collections_gen2'] == 1  # The gc.collect() above
+
+
+def test_unmanaged_harness_only_records():
+    gc.enable()
+    with scoped_harness_gc(manage=False) as harness_gc:
+        harness_gc.begin_run()
+        with harness_enemy_phase():
+            assert gc.isenabled()
+        assert harness_gc.collect_between_runs() == 0.0
+
+
+def test_enemy_phase_without_a_harness_is_a_no_op():
+    gc.enable()
+    with harness_enemy_phase():
+        assert gc.isenabled()
@@ -0,0 +1,94 @@
+"""Tests for the background log writer and LazyLogger in logger_config."""
+
+import logging
+
+import pytest
+
+from logger_config import LazyLogger, start_background_logging, stop_background_logging
+
+
+class _Collect(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def loggers():
+    """A parent/child logger pair with collecting handlers."""
+    parent = logging.getLogger('logtest')
+    child = logging.getLogger('logtest.app')
+    parent_handler, child_handler = _Collect(), _Collect(logging.INFO)
+    parent.addHandler(parent_handler)
+    parent.setLevel(logging.DEBUG)
+    parent.propagate = False
+    child.addHandler(child_handler)
+    yield parent, child, parent_handler, child_handler
+    stop_background_logging()
+    for logger in (parent, child):
+        logger.handlers.clear()
+        logger.propagate = True
+    parent.setLevel(logging.NOTSET)
+
+
+class TestLazyLogger:
+    def test_disabled_level_skips_the_callable(self, loggers):
+        parent, _, handler, _ = loggers
+        parent.setLevel(logging.WARNING)
+        calls = []
+        lazy = LazyLogger(parent)
+
+        lazy.debug(lambda: calls.append('built') or 'msg')
+        assert calls == [] and handler.records == []
+
+        lazy.warning(lambda: f"{len(calls)} calls")
+        assert [r.getMessage() for r in handler.records] == ['0 calls']
+
+    def test_record_points_at_the_caller(self, loggers):
+        parent, _, handler, _ = loggers
+
+        LazyLogger(parent).info('plain %s', 'args')
+
+        record = handler.records[0]
+        assert record.getMessage() == 'plain args'
+        assert record.funcName == 'test_record_points_at_the_caller'
+
+
+class TestBackgroundLogging:
+    def test_records_reach_the_original_handlers(self, loggers):
+        parent, child, parent_handler, child_handler = loggers
+        start_background_logging('logtest', 'logtest.app')
+        assert not child.propagate
+
+        child.debug('quiet %d', 1)
+        child.info('loud %d', 2)
+        parent.debug('parent')
+        stop_background_logging()
+
+        # Propagation and handler levels as in synchronous logging
+        assert [r.getMessage() for r in parent_handler.records] == ['quiet 1', 'loud 2', 'parent']
+        assert [r.getMessage() for r in child_handler.records] == ['loud 2']
+
+    def test_stop_restores_handlers_and_propagation(self, loggers):
+        parent, child, parent_handler, child_handler = loggers
+        start_background_logging('logtest', 'logtest.app')
+        start_background_logging('logtest', 'logtest.app')
+        stop_background_logging()
+
+        assert parent.handlers == [parent_handler]
+        assert child.handlers == [child_handler]
+        assert child.propagate
+
+    def test_message_is_frozen_when_queued(self, loggers):
+        parent, _, handler, _ = loggers
+        start_background_logging('logtest')
+        state = ['before']
+
+        parent.debug('%s', state)
+        state[0] = 'after'
+        stop_background_logging()
+
+        assert handler.records[0].getMessage() == "['before']"
@@ -0,0 +1,69 @@
+"""Tests for dormant-monster culling in services.monster_activation."""
+
+import pytest
+
+from components.ai.basic_monster import BasicMonster
+from components.ai.orc_shaman_ai import OrcShamanAI
+from components.component_registry import ComponentType
+from components.fighter import Fighter
+from components.status_effects import StatusEffectManager, SlowedEffect
+from entity import Entity
+from services.monster_activation import MonsterActivation, reset_monster_activation
+
+
+@pytest.fixture(autouse=True)
+def fresh_activation():
+    reset_monster_activation()
+    yield
+    reset_monster_activation()
+
+
+def _monster(x, y, ai=None):
+    monster = Entity(x, y, 'o', (63, 127, 63), 'orc', blocks=True,
+                     fighter=Fighter(hp=10, defense=0, power=3), ai=ai or BasicMonster())
+    monster.status_effects = StatusEffectManager(monster)
+    monster.components.add(ComponentType.STATUS_EFFECTS, monster.status_effects)
+    return monster
+
+
+@pytest.fixture
+def player():
+    return Entity(0, 0, '@', (255, 255, 255), 'Player', blocks=True,
+                  fighter=Fighter(hp=30, defense=2, power=5))
+
+
+def test_far_unaware_monster_is_dormant(player):
+    activation = MonsterActivation(wake_radius=5, enabled=True)
+    near, far = _monster(3, 3), _monster(40, 20)
+
+    active = activation.select_active([near, far], player, fov_map=None)
+
+    assert active == [near]
+    assert (activation.last_active, activation.last_dormant) == (1, 1)
+
+
+@pytest.mark.parametrize('wake', ['aware', 'in_combat', 'status_effect'])
+def test_state_changes_wake_a_dormant_monster(player, wake):
+    activation = MonsterActivation(wake_radius=5, enabled=True)
+    monster = _monster(40, 20)
+    assert activation.select_active([monster], player, fov_map=None) == []
+
+    if wake == 'aware':
+        monster.ai.aware_of_player = True
+    elif wake == 'in_combat':
+        monster.ai.in_combat = True
+    else:
+        monster.status_effects.add_effect(SlowedEffect(duration=3, owner=monster))
+
+    assert activation.select_active([monster], player, fov_map=None) == [monster]
+    assert activation.wakes == 1
+
+
+def test_overridden_take_turn_and_taunts_always_act(player):
+    activation = MonsterActivation(wake_radius=5, enabled=True)
+    shaman, orc = _monster(40, 20, ai=OrcShamanAI()), _monster(40, 22)
+
+    assert activation.select_active([shaman, orc], player, fov_map=None) == [shaman]
+    assert activation.select_active([shaman, orc], player, fov_map=None,
+                                    taunt_active=True) == [shaman, orc]
+    assert activation.dormant_turns == 1
@@ -0,0 +1,117 @@
+"""Tests for the shared per-phase navigation field used by monster AI."""
+
+import pytest
+
+from components.ground_hazard import GroundHazard, HazardType
+from entity import Entity
+from map_objects.game_map import GameMap
+from services.navigation_service import NavigationService, reset_navigation_service
+
+
+@pytest.fixture
+def open_map():
+    """A 20x10 map with an open room from (1, 1) to (18, 8)."""
+    game_map = GameMap(width=20, height=10, dungeon_level=1)
+    game_map.blocked[1:19, 1:9] = False
+    game_map.block_sight[1:19, 1:9] = False
+    return game_map
+
+
+@pytest.fixture(autouse=True)
+def fresh_service():
+    reset_navigation_service()
+    yield
+    reset_navigation_service()
+
+
+def _entity(x, y, name='orc'):
+    return Entity(x, y, 'o', (255, 255, 255), name, blocks=True)
+
+
+def test_next_step_moves_closer_to_root(open_map):
+    player = _entity(15, 5, 'Player')
+    orc = _entity(3, 5)
+    nav = NavigationService()
+    nav.begin_enemy_phase(open_map, [player, orc], player)
+
+    (x, y), length = nav.next_step(orc)
+    assert (x, y) == (4, 5)
+    assert length == 13  # 12 steps, 13 tiles including both ends
+
+
+def test_blocking_entities_are_routed_around(open_map):
+    player = _entity(10, 5, 'Player')
+    orc = _entity(3, 5)
+    # Wall with a single gap at y=2, plugged by another monster
+    open_map.blocked[6, 1:9] = True
+    open_map.blocked[6, 2] = False
+    blocker = _entity(6, 2, 'blocker')
+    nav = NavigationService()
+
+    nav.begin_enemy_phase(open_map, [player, orc, blocker], player)
+    assert nav.next_step(orc) is None
+
+    nav.begin_enemy_phase(open_map, [player, orc], player)
+    assert nav.next_step(orc) is not None
+
+
+def test_next_step_skips_neighbour_taken_during_the_phase(open_map):
+    player = _entity(15, 5, 'Player')
+    orc = _entity(3, 5)
+    other = _entity(3, 3, 'other')
+    entities = [player, orc, other]
+    nav = NavigationService()
+    nav.begin_enemy_phase(open_map, entities, player)
+
+    # An earlier monster moves onto the orc's best tile after the phase began
+    other.x, other.y = 4, 5
+    (x, y), _ = nav.next_step(orc, entities)
+    assert (x, y) in ((4, 4), (4, 6))
+
+
+def test_next_step_adds_the_weight_of_the_step_itself(open_map):
+    player = _entity(3, 3, 'Player')
+    orc = _entity(13, 7)
+    for x, y, damage in ((11, 5, 3), (11, 6, 1)):
+        open_map.hazard_manager.add_hazard(GroundHazard(
+            hazard_type=HazardType.FIRE, x=x, y=y, base_damage=damage,
+            remaining_turns=3, max_duration=3, source_name='test'))
+    nav = NavigationService()
+    nav.begin_enemy_phase(open_map, [player, orc], player)
+
+    # The hazards leave the diagonal (12, 6) and the cardinal (12, 7) at the
+    # same field distance; the cardinal step is the cheaper one to take
+    distance = nav._get_pathfinder().distance
+    assert distance[12, 6] == distance[12, 7]
+    (x, y), _ = nav.next_step(orc)
+    assert (x, y) == (12, 7)
+
+
+def test_base_grid_rebuilt_only_on_map_change(open_map):
+    player = _entity(10, 5, 'Player')
+    nav = NavigationService()
+
+    nav.begin_enemy_phase(open_map, [player], player)
+    nav.begin_enemy_phase(open_map, [player], player)
+    assert nav.base_rebuilds == 1
+
+    open_map.blocked[4, 4] = True
+    nav.begin_enemy_phase(open_map, [player], player)
+    assert nav.base_rebuilds == 2
+
+
+def test_covers_only_phase_root_on_phase_map(open_map):
+    player = _entity(10, 5, 'Player')
+    orc = _entity(3, 5)
+    nav = NavigationService()
+    assert not nav.covers(player, open_map)
+
+    nav.begin_enemy_phase(open_map, [player, orc], player)
+    assert nav.covers(player, open_map)
+    assert not nav.covers(orc, open_map)
+
+    player.x += 1
+    assert not nav.covers(player, open_map)
+
+    nav.end_enemy_phase()
+    assert not nav.covers(player, open_map)
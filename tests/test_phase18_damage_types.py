@@ -58,7 +58,7 @@ class TestDamageTypeVulnerability:
         
         return target
     
-    @patch('components.fighter.random.randint')
+    @patch('random.randint')
     def test_vulnerable_target_takes_extra_damage(self, mock_randint):
         """Vulnerable targets take +1 damage."""
         attacker = self._create_attacker_with_weapon(damage_type="bludgeoning")
@@ -77,7 +77,7 @@ class TestDamageTypeVulnerability:
         assert any('8 damage' in str(m['message']) for m in damage_messages), \
             "Vulnerable target should take +1 damage (expected 8)"
     
-    @patch('components.fighter.random.randint')
+    @patch('random.randint')
     def test_resistant_target_takes_reduced_damage(self, mock_randint):
         """Resistant targets take -1 damage."""
         attacker = self._create_attacker_with_weapon(damage_type="piercing")
@@ -96,7 +96,7 @@ class TestDamageTypeVulnerability:
         assert any('6 damage' in str(m['message']) for m in damage_messages), \
             "Resistant target should take -1 damage (expected 6)"
     
-    @patch('components.fighter.random.randint')
+    @patch('random.randint')
     def test_neutral_target_takes_normal_damage(self, mock_randint):
         """Neutral targets (no resistance/vulnerability) take normal damage."""
         attacker = self._create_attacker_with_weapon(damage_type="slashing")
@@ -115,7 +115,7 @@ class TestDamageTypeVulnerability:
         assert any('7 damage' in str(m['message']) for m in damage_messages), \
             "Neutral target should take normal damage (expected 7)"
     
-    @patch('components.fighter.random.randint')
+    @patch('random.randint')
     def test_damage_type_applies_before_crit_multiplier(self, mock_randint):
         """Damage type modifier should apply before crit doubles damage."""
         attacker = self._create_attacker_with_weapon(damage_type="bludgeoning")
@@ -135,7 +135,7 @@ class TestDamageTypeVulnerability:
         assert any('16 damage' in str(m['message']) for m in damage_messages), \
             "Vulnerable + crit should be (base+STR+1)×2 = 16"
     
-    @patch('components.fighter.random.randint')
+    @patch('random.randint')
     def test_resistance_cannot_reduce_below_1_damage(self, mock_randint):
         """Damage cannot be reduced below 1 by resistance."""
         attacker = self._create_attacker_with_weapon(damage_type="piercing")
@@ -56,7 +56,7 @@ class TestKeenWeaponCritThreshold:
         target.fighter.owner = target
         return target
     
-    @patch('components.fighter.random.randint')
+    @patch('random.randint')
     def test_normal_weapon_crits_only_on_20(self, mock_randint):
         """Normal weapons (crit_threshold=20) crit only on natural 20."""
         attacker = self._create_attacker_with_weapon(crit_threshold=20)
@@ -71,7 +71,7 @@ class TestKeenWeaponCritThreshold:
         crit_messages = [r for r in results if r.get('message') and 'CRITICAL' in str(r['message'])]
         assert len(crit_messages) == 0, "Roll 19 with normal weapon should NOT crit"
     
-    @patch('components.fighter.random.randint')
+    @patch('random.randint')
     def test_keen_weapon_crits_on_19(self, mock_randint):
         """Keen weapons (crit_threshold=19) crit on roll 19."""
         attacker = self._create_attacker_with_weapon(crit_threshold=19)
@@ -86,7 +86,7 @@ class TestKeenWeaponCritThreshold:
         crit_messages = [r for r in results if r.get('message') and 'CRITICAL' in str(r['message'])]
         assert len(crit_messages) > 0, "Roll 19 with Keen weapon SHOULD crit"
     
-    @patch('components.fighter.random.randint')
+    @patch('random.randint')
     def test_keen_weapon_still_crits_on_20(self, mock_randint):
         """Keen weapons also crit on natural 20."""
         attacker = self._create_attacker_with_weapon(crit_threshold=19)
@@ -101,7 +101,7 @@ class TestKeenWeaponCritThreshold:
         crit_messages = [r for r in results if r.get('message') and 'CRITICAL' in str(r['message'])]
         assert len(crit_messages) > 0, "Roll 20 should always crit"
     
-    @patch('components.fighter.random.randint')
+    @patch('random.randint')
     def test_normal_weapon_crits_on_20(self, mock_randint):
         """Normal weapons crit on natural 20."""
         attacker = self._create_attacker_with_weapon(crit_threshold=20)
@@ -122,7 +122,7 @@ class TestKeenWeaponCritThreshold:
         attacker = self._create_attacker_with_weapon(crit_threshold=20)
         target = self._create_target(ac=15)
         
-        with patch('components.fighter.random.randint', return_value=10):  # Non-crit roll
+        with patch('random.randint', return_value=10):  # Non-crit roll
             with patch('components.fighter.show_hit'), patch('components.fighter.show_miss'):
                 results = attacker.fighter.attack_d20(target, is_surprise=True)
         
@@ -20,7 +20,7 @@ from random_utils import (
 class TestRandomChoiceIndex:
     """Test random_choice_index function for weighted selection."""
 
-    @patch("random_utils.randint")
+    @patch("random.randint")
     def test_random_choice_index_first_choice(self, mock_randint):
         """Test selecting the first choice."""
         mock_randint.return_value = 1
@@ -31,7 +31,7 @@ class TestRandomChoiceIndex:
         assert result == 0
         mock_randint.assert_called_once_with(1, 100)
 
-    @patch("random_utils.randint")
+    @patch("random.randint")
     def test_random_choice_index_middle_choice(self, mock_randint):
         """Test selecting a middle choice."""
         mock_randint.return_value = 75
@@ -41,7 +41,7 @@ class TestRandomChoiceIndex:
 
         assert result == 1
 
-    @patch("random_utils.randint")
+    @patch("random.randint")
     def test_random_choice_index_last_choice(self, mock_randint):
         """Test selecting the last choice."""
         mock_randint.return_value = 100
@@ -51,7 +51,7 @@ class TestRandomChoiceIndex:
 
         assert result == 2
 
-    @patch("random_utils.randint")
+    @patch("random.randint")
     def test_random_choice_index_boundary_values(self, mock_randint):
         """Test boundary values for selection."""
         chances = [25, 25, 50]
@@ -68,7 +68,7 @@ class TestRandomChoiceIndex:
         mock_randint.return_value = 100
         assert random_choice_index(chances) == 2
 
-    @patch("random_utils.randint")
+    @patch("random.randint")
     def test_random_choice_index_single_choice(self, mock_randint):
         """Test with only one choice."""
         mock_randint.return_value = 1
@@ -78,7 +78,7 @@ class TestRandomChoiceIndex:
 
         assert result == 0
 
-    @patch("random_utils.randint")
+    @patch("random.randint")
     def test_random_choice_index_zero_weight(self, mock_randint):
         """Test with zero weights in the list."""
         mock_randint.return_value = 30
@@ -90,7 +90,7 @@ class TestRandomChoiceIndex:
         # randint(30) <= 50, so should select index 1
         assert result == 1
 
-    @patch("random_utils.randint")
+    @patch("random.randint")
     def test_random_choice_index_uneven_weights(self, mock_randint):
         """Test with uneven weight distribution."""
         chances = [1, 99]
@@ -311,7 +311,7 @@ class TestRandomUtilsIntegration:
         assert monster_chances["troll"] == 30
 
         # Test that random selection works with these chances
-        with patch("random_utils.randint") as mock_randint:
+        with patch("random.randint") as mock_randint:
             # Select orc (80 out of 110 total weight)
             mock_randint.return_value = 50
             result = random_choice_from_dict(monster_chances)
@@ -338,7 +338,7 @@ class TestRandomUtilsIntegration:
         assert item_chances["confusion_scroll"] == 10
 
         # Total weight: 35 + 25 + 25 + 10 = 95
-        with patch("random_utils.randint") as mock_randint:
+        with patch("random.randint") as mock_randint:
             mock_randint.return_value = 95  # Last item
             result = random_choice_from_dict(item_chances)
             assert result == "confusion_scroll"
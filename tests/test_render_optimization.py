@@ -10,6 +10,8 @@ from unittest.mock import Mock, patch, call
 import sys
 import os
 
+import tcod.console
+
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
 
@@ -322,5 +324,55 @@ class TestRenderingCorrectness(unittest.TestCase):
         self.assertTrue(any('light_ground_color' in str(call) for call in center_calls))
 
 
+class TestVectorizedRendering(unittest.TestCase):
+    """Bulk Console.rgb writes match the per-tile path on a real console."""
+    
+    def setUp(self):
+        self.colors = {
+            'light_wall': (130, 110, 50),
+            'light_ground': (200, 180, 50),
+            'dark_wall': (0, 0, 100),
+            'dark_ground': (50, 50, 150),
+        }
+        self.game_map = GameMap(12, 8)
+        self.game_map.blocked[1:11, 1:7] = False
+        self.game_map.block_sight[1:11, 1:7] = False
+        self.game_map.block_sight[6, 1:7] = True
+        # Remembered tiles beyond the wall
+        self.game_map.explored[8:10, 2:4] = True
+        self.fov_map = initialize_fov(self.game_map)
+        recompute_fov(self.fov_map, 3, 3, 10)
+    
+    def _render(self, vectorized):
+        con = tcod.console.Console(12, 8)
+        renderer = OptimizedTileRenderer()
+        if vectorized:
+            renderer.render_tiles_optimized(con, self.game_map, self.fov_map, self.colors)
+        else:
+            with patch.object(renderer, '_render_window_vectorized', return_value=False):
+                renderer.render_tiles_optimized(con, self.game_map, self.fov_map, self.colors)
+        return con, renderer
+    
+    def test_matches_per_tile_rendering(self):
+        legacy, _ = self._render(vectorized=False)
+        explored_after_legacy = self.game_map.explored.copy()
+        self.game_map.explored[...] = False
+        self.game_map.explored[8:10, 2:4] = True
+        
+        bulk, renderer = self._render(vectorized=True)
+        
+        self.assertEqual(renderer.optimization_stats['vectorized_redraws'], 1)
+        self.assertTrue((bulk.rgb == legacy.rgb).all())
+        self.assertTrue((self.game_map.explored == explored_after_legacy).all())
+        self.assertEqual(tuple(bulk.rgb[3, 3]["bg"]), self.colors['light_ground'])
+        self.assertEqual(tuple(bulk.rgb[2, 8]["bg"]), self.colors['dark_ground'])
+    
+    def test_mock_console_falls_back_to_per_tile(self):
+        renderer = OptimizedTileRenderer()
+        self.assertFalse(renderer._render_window_vectorized(
+            Mock(), self.game_map, self.fov_map, self.colors
+        ))
+
+
 if __name__ == '__main__':
     unittest.main()
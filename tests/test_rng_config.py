@@ -5,6 +5,7 @@ Tests that:
 2. get_current_seed returns the correct seed
 3. generate_seed produces unique values
 4. Seeded random produces deterministic sequences
+5. RunRNG per-run streams are independent, scoped and reproducible
 """
 
 import random
@@ -16,6 +17,11 @@ from engine.rng_config import (
     generate_seed,
     reset_rng_state,
     stable_scenario_seed,
+    RunRNG,
+    get_rng,
+    get_run_rng,
+    set_run_rng,
+    run_rng_scope,
 )
 
 
@@ -212,3 +218,77 @@ class TestStableScenarioSeed:
         """Reset RNG state after each test."""
         reset_rng_state()
 
+
+
+class TestRunRNG:
+    """Tests for per-run RNG streams (RunRNG, run_rng_scope, get_rng)."""
+    
+    def setup_method(self):
+        """Reset RNG state before each test."""
+        reset_rng_state()
+    
+    def teardown_method(self):
+        """Reset RNG state after each test."""
+        reset_rng_state()
+    
+    def test_same_seed_reproduces_each_stream(self):
+        """Two RunRNGs with the same seed should draw identical sequences per stream."""
+        a, b = RunRNG(1337), RunRNG(1337)
+        for name in ("combat", "mapgen", "loot", "ai"):
+            assert [a.stream(name).random() for _ in range(5)] == [b.stream(name).random() for _ in range(5)]
+    
+    def test_streams_are_independent(self):
+        """Extra draws on one stream must not shift another stream's sequence."""
+        a, b = RunRNG(7), RunRNG(7)
+        for _ in range(50):
+            a.ai.random()
+        assert [a.combat.randint(1, 20) for _ in range(10)] == [b.combat.randint(1, 20) for _ in range(10)]
+        assert a.combat.random() != a.mapgen.random()
+    
+    def test_unknown_stream_raises(self):
+        """Asking for a stream outside RNG_STREAMS is a programming error."""
+        with pytest.raises(ValueError):
+            RunRNG(1).stream("weather")
+    
+    def test_streams_created_lazily(self):
+        """streams_used should only list streams that were drawn from."""
+        rng = RunRNG(1)
+        assert rng.streams_used() == ()
+        rng.loot.random()
+        assert rng.streams_used() == ("loot",)
+    
+    def test_reseed_restarts_one_stream(self):
+        """reseed should restart only the named stream."""
+        rng, reference = RunRNG(3), RunRNG(3)
+        rng.reseed("mapgen", 99)
+        layout = [rng.mapgen.random() for _ in range(3)]
+        rng.reseed("mapgen", 99)
+        
+        assert [rng.mapgen.random() for _ in range(3)] == layout
+        assert layout != [reference.mapgen.random() for _ in range(3)]
+        assert rng.combat.random() == reference.combat.random()
+    
+    def test_get_rng_falls_back_to_global_random(self):
+        """With no active run, get_rng returns the random module itself."""
+        assert get_run_rng() is None
+        assert get_rng("combat") is random
+    
+    def test_scope_activates_and_restores(self):
+        """run_rng_scope should install a run and restore the previous one on exit."""
+        outer = RunRNG(1)
+        set_run_rng(outer)
+        with run_rng_scope(2) as inner:
+            assert get_run_rng() is inner
+            assert get_rng("ai") is inner.ai
+        assert get_run_rng() is outer
+    
+    def test_scope_isolates_global_random(self):
+        """Draws through an active run must not consume the global random sequence."""
+        set_global_seed(5)
+        expected = [random.random() for _ in range(3)]
+        
+        set_global_seed(5)
+        with run_rng_scope(5):
+            for _ in range(20):
+                get_rng("combat").random()
+        assert [random.random() for _ in range(3)] == expected
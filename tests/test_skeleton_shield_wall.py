@@ -157,7 +157,7 @@ class TestDamageTypeModifiers:
         skeleton = self._create_skeleton_target()
         
         # Mock d20 roll to ensure hit (not crit)
-        with patch('components.fighter.random.randint', return_value=15):
+        with patch('random.randint', return_value=15):
             with patch('components.fighter.show_hit'), patch('components.fighter.show_miss'):
                 with patch('dice.roll_dice', return_value=6):  # 1d8 = 6
                     results = attacker.fighter.attack_d20(skeleton)
@@ -174,7 +174,7 @@ class TestDamageTypeModifiers:
         skeleton = self._create_skeleton_target()
         
         # Mock d20 roll to ensure hit (not crit)
-        with patch('components.fighter.random.randint', return_value=15):
+        with patch('random.randint', return_value=15):
             with patch('components.fighter.show_hit'), patch('components.fighter.show_miss'):
                 with patch('dice.roll_dice', return_value=6):  # 1d8 = 6
                     results = attacker.fighter.attack_d20(skeleton)
@@ -191,7 +191,7 @@ class TestDamageTypeModifiers:
         skeleton = self._create_skeleton_target()
         
         # Mock d20 roll to ensure hit (not crit)
-        with patch('components.fighter.random.randint', return_value=15):
+        with patch('random.randint', return_value=15):
             with patch('components.fighter.show_hit'), patch('components.fighter.show_miss'):
                 with patch('dice.roll_dice', return_value=6):  # 1d8 = 6
                     results = attacker.fighter.attack_d20(skeleton)
@@ -208,7 +208,7 @@ class TestDamageTypeModifiers:
         skeleton = self._create_skeleton_target()
         
         # Mock d20 roll for critical hit
-        with patch('components.fighter.random.randint', return_value=20):  # Natural 20
+        with patch('random.randint', return_value=20):  # Natural 20
             with patch('components.fighter.show_hit'), patch('components.fighter.show_miss'):
                 with patch('dice.roll_dice', return_value=6):  # 1d8 = 6
                     results = attacker.fighter.attack_d20(skeleton)
@@ -375,7 +375,7 @@ class TestSkirmisherFastPressure:
     """Test fast pressure extra attack mechanics."""
     
     @patch('components.ai.skirmisher_ai.map_is_in_fov', side_effect=mock_is_in_fov)
-    @patch('components.ai.skirmisher_ai.random')
+    @patch('random.random')
     def test_fast_pressure_triggers_when_adjacent(self, mock_random, mock_fov, skirmisher, player, game_map, fov_map):
         """Fast pressure should trigger extra attack when adjacent and RNG succeeds."""
         # Position skirmisher adjacent to player
@@ -395,7 +395,7 @@ class TestSkirmisherFastPressure:
             assert mock_attack.call_count >= 1  # At least main attack
     
     @patch('components.ai.skirmisher_ai.map_is_in_fov', side_effect=mock_is_in_fov)
-    @patch('components.ai.skirmisher_ai.random')
+    @patch('random.random')
     def test_fast_pressure_does_not_trigger_when_rng_fails(self, mock_random, mock_fov, skirmisher, player, game_map, fov_map):
         """Fast pressure should NOT trigger when RNG fails."""
         # Position skirmisher adjacent to player
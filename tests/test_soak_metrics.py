@@ -235,6 +235,7 @@ class TestCSVOutput:
                 'bot_steps', 'bot_floors', 'bot_actions', 'bot_contexts', 'bot_reasons',
                 'exception', 'timestamp',
                 'final_hp', 'final_max_hp', 'final_hp_percent', 'potions_remaining_on_death',
+                'turns_per_second', 'gc_collections', 'gc_pause_ms', 'gc_pause_max_ms',
             ]
             assert headers == expected_headers
 
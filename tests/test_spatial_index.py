@@ -0,0 +1,102 @@
+"""Tests for the tile-keyed entity spatial index."""
+
+import copy
+import pickle
+
+import numpy as np
+import pytest
+import tcod
+
+from entity import Entity, get_blocking_entities_at_location
+from map_objects.spatial_index import (
+    EntityList,
+    entities_at,
+    entities_in_fov,
+    entities_in_range,
+)
+
+
+def _entity(x, y, name='thing', blocks=False):
+    return Entity(x, y, '?', (255, 255, 255), name, blocks=blocks)
+
+
+class TestEntityList:
+    """EntityList keeps its index in step with list mutations."""
+
+    def test_append_and_remove(self):
+        orc = _entity(3, 4, 'orc', blocks=True)
+        entities = EntityList()
+        entities.append(orc)
+        assert entities.spatial_index.at(3, 4) == [orc]
+
+        entities.remove(orc)
+        assert entities.spatial_index.at(3, 4) == []
+        assert orc._spatial_indexes == ()
+
+    def test_slice_assignment_and_pop(self):
+        a, b, c = _entity(1, 1), _entity(2, 2), _entity(3, 3)
+        entities = EntityList([a, b])
+        entities[:] = [b, c]
+        assert entities_at(entities, 1, 1) == []
+        assert entities_at(entities, 3, 3) == [c]
+
+        entities.pop(0)
+        assert entities_at(entities, 2, 2) == []
+
+    def test_move_and_direct_assignment_update_index(self):
+        orc = _entity(5, 5, 'orc', blocks=True)
+        entities = EntityList([orc])
+
+        orc.move(1, 0)
+        assert get_blocking_entities_at_location(entities, 6, 5) is orc
+        assert get_blocking_entities_at_location(entities, 5, 5) is None
+
+        orc.x, orc.y = 10, 2
+        assert entities_at(entities, 10, 2) == [orc]
+
+    def test_deepcopy_rebuilds_index(self):
+        orc = _entity(5, 5, 'orc', blocks=True)
+        entities = EntityList([orc])
+
+        for clone in (copy.deepcopy(entities), pickle.loads(pickle.dumps(entities))):
+            moved = clone[0]
+            moved.move(1, 1)
+            assert entities_at(clone, 6, 6) == [moved]
+            assert entities_at(entities, 5, 5) == [orc]
+
+
+class TestQueries:
+    """Index-backed queries agree with a plain-list scan."""
+
+    def setup_method(self):
+        self.items = [_entity(x, y) for x, y in [(0, 0), (2, 2), (4, 1), (9, 9)]]
+
+    def test_range_query(self):
+        indexed = entities_in_range(EntityList(self.items), 3, 1, 1)
+        assert indexed == entities_in_range(list(self.items), 3, 1, 1)
+        assert indexed == [self.items[1], self.items[2]]
+
+    def test_queries_follow_list_order_after_insert(self):
+        entities = EntityList(self.items)
+        first = _entity(3, 2)
+        entities.insert(0, first)
+
+        assert entities_in_range(entities, 3, 1, 1) == entities_in_range(list(entities), 3, 1, 1)
+        assert entities_in_range(entities, 3, 1, 1)[0] is first
+
+    def test_fov_mask_query(self):
+        class FakeFov:
+            visibility = np.zeros((10, 10), dtype=bool)
+
+        FakeFov.visibility[0:3, 0:3] = True
+        assert entities_in_fov(EntityList(self.items), FakeFov) == self.items[:2]
+
+    @pytest.mark.parametrize("order", ["C", "F"])
+    @pytest.mark.parametrize("size", [(10, 12), (12, 12)])
+    def test_fov_query_reads_a_bare_tcod_map(self, order, size):
+        fov_map = tcod.map.Map(*size, order=order)
+        fov_map.transparent[:] = True
+        fov_map.compute_fov(4, 1, radius=1)
+
+        assert entities_in_fov(EntityList(self.items), fov_map) == [self.items[2]]
+        assert entities_in_fov(list(self.items), fov_map) == [self.items[2]]
@@ -0,0 +1,95 @@
+"""Tests for plan-only map generation (map_objects/spawn_plan.py)."""
+
+import pytest
+
+from balance.pity import reset_pity_state
+from config.entity_factory import get_entity_factory
+from engine.rng_config import run_rng_scope
+from entity import Entity
+from map_objects.game_map import GameMap
+from map_objects.spawn_plan import PlannedEntity, SpawnRecorder, is_planned
+from services.mural_manager import get_mural_manager
+from worldgen_sanity import _collect_run_metrics
+
+
+def _generate(depth, seed, plan_only):
+    reset_pity_state()
+    get_mural_manager().reset_all()
+    player = Entity(0, 0, "@", (255, 255, 255), "Player", blocks=True)
+    entities = [player]
+    game_map = GameMap(80, 45, dungeon_level=depth)
+    with run_rng_scope(seed):
+        plan = game_map.make_map(9, 6, 10, 80, 45, player, entities, plan_only=plan_only)
+    return game_map, entities, plan
+
+
+def _blocked(game_map):
+    return [[tile.blocked for tile in column] for column in game_map.tiles]
+
+
+def _spawn_keys(plan):
+    return [(s.kind, s.type_id, s.name, s.x, s.y, s.room_index, s.pity) for s in plan.spawns]
+
+
+@pytest.mark.parametrize("depth", [1, 5, 13, 23])
+def test_plan_only_places_the_same_spawns_as_full_generation(depth):
+    for seed in range(3):
+        full_map, _, full = _generate(depth, seed, plan_only=False)
+        planned_map, _, planned = _generate(depth, seed, plan_only=True)
+
+        assert _spawn_keys(planned) == _spawn_keys(full)
+        assert [r.etp for r in planned.rooms] == [r.etp for r in full.rooms]
+        assert _blocked(planned_map) == _blocked(full_map)
+
+
+def test_plan_only_entities_are_stand_ins():
+    game_map, entities, plan = _generate(5, 7, plan_only=True)
+
+    assert plan.instantiated is False
+    assert game_map.spawn_plan is plan
+    assert plan.monsters and plan.items
+    for entity in entities[1:]:
+        if entity.name in {s.name for s in plan.monsters + plan.items}:
+            assert is_planned(entity)
+            assert isinstance(entity, PlannedEntity)
+
+    monster = next(e for e in entities if is_planned(e) and e.ai)
+    assert monster.fighter and monster.blocks
+    assert monster.get_component_optional(object) is None
+
+
+def test_full_generation_records_a_plan_of_real_entities():
+    _, entities, plan = _generate(5, 7, plan_only=False)
+
+    assert plan.instantiated is True
+    assert not any(is_planned(e) for e in entities)
+    assert plan.total_etp == pytest.approx(sum(r.etp for r in plan.rooms))
+    for spawn in plan.monsters:
+        if spawn.room_index >= 0:
+            assert spawn in plan.in_room(spawn.room_index)
+
+
+def test_recorder_mirrors_factory_lookups_in_plan_mode():
+    recorder = SpawnRecorder(get_entity_factory(), plan_only=True)
+
+    assert recorder.create_weapon("no_such_weapon", 1, 1) is None
+    # Unknown monsters get the factory's fallback monster, as in full mode
+    assert recorder.create_monster("no_such_monster", 1, 1).name == "Unknown no_such_monster"
+
+    orc = recorder.create_monster("orc", 3, 4)
+    assert is_planned(orc) and (orc.x, orc.y) == (3, 4)
+
+
+@pytest.mark.parametrize("depth", [3, 6])
+def test_worldgen_plan_only_sizes_floors_like_the_full_path(depth, monkeypatch):
+    from config import testing_config as tc_module
+    # _collect_run_metrics resets the global testing config; restore it after
+    monkeypatch.setattr(tc_module, "_testing_config", tc_module._testing_config)
+
+    with run_rng_scope(depth):
+        full = _collect_run_metrics(depth, 0)
+    with run_rng_scope(depth):
+        planned = _collect_run_metrics(depth, 0, plan_only=True)
+
+    assert (planned.width, planned.height) == (full.width, full.height)
+    assert planned.total_tiles == full.total_tiles
@@ -0,0 +1,90 @@
+"""Tests for the warm-pool suite runner used by the scenario suites."""
+
+import json
+
+import pytest
+
+from services import scenario_harness, suite_runner
+from services.suite_runner import SuiteRunner, export_matrix, write_metrics_sidecar
+
+
+class FakeRun:
+    def __init__(self, scenario_id, run_num):
+        self.scenario_id = scenario_id
+        self.run_num = run_num
+
+
+class FakeAggregate:
+    def __init__(self, runs):
+        self.runs = runs
+
+    def to_dict(self):
+        return {"runs": len(self.runs), "order": [r.run_num for r in self.runs]}
+
+
+@pytest.fixture
+def in_process_runner(monkeypatch):
+    """SuiteRunner(workers=1) with scenario execution faked out."""
+    def fake_run(job):
+        scenario_id, _bot, run_num, _runs, _turn_limit, _seed_base, _profile = job
+        if scenario_id == "broken":
+            raise RuntimeError("boom")
+        return scenario_id, run_num, FakeRun(scenario_id, run_num)
+
+    monkeypatch.setattr(suite_runner, "_suite_worker_init", lambda: None)
+    monkeypatch.setattr(suite_runner, "_suite_worker_run", fake_run)
+    monkeypatch.setattr(scenario_harness, "aggregate_runs", lambda scenario, runs: FakeAggregate(runs))
+    return SuiteRunner(workers=1)
+
+
+MATRIX = [
+    {"id": "depth2_orc_baseline", "runs": 3, "turn_limit": 100},
+    {"id": "broken", "runs": 2, "turn_limit": 10},
+]
+
+
+def test_outcomes_aggregate_runs_in_order(in_process_runner):
+    outcomes = {o.scenario_id: o for o in in_process_runner.run(MATRIX, seed_base=1337)}
+
+    ok = outcomes["depth2_orc_baseline"]
+    assert ok.ok
+    assert ok.payload["metrics"] == {"runs": 3, "order": [1, 2, 3]}
+    assert ok.payload["player_bot"] == "tactical_fighter"
+    assert ok.payload["turn_limit"] == 100
+
+    assert not outcomes["broken"].ok
+    assert "boom" in outcomes["broken"].error
+
+
+def test_export_matrix_writes_raw_json(in_process_runner, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    failed = export_matrix(in_process_runner, MATRIX, tmp_path, seed_base=1337)
+
+    assert failed == ["broken"]
+    raw = json.loads((tmp_path / "depth2_orc_baseline.json").read_text(encoding="utf-8"))
+    assert raw["scenario_id"] == "depth2_orc_baseline"
+    assert not (tmp_path / "broken.json").exists()
+
+
+def test_metrics_sidecar_normalizes_rates(tmp_path):
+    payload = {
+        "scenario_id": "depth3_orc_brutal",
+        "runs": 10,
+        "depth": 3,
+        "metrics": {
+            "runs": 10,
+            "player_deaths": 2,
+            "total_player_attacks": 100,
+            "total_player_hits": 60,
+            "total_monster_attacks": 50,
+            "total_monster_hits": 0,
+        },
+    }
+    dest = write_metrics_sidecar(payload, tmp_path)
+    normalized = json.loads(dest.read_text(encoding="utf-8"))
+
+    assert normalized["family"] == "depth3_orc"
+    assert normalized["death_rate"] == pytest.approx(0.2)
+    assert normalized["player_hit_rate"] == pytest.approx(0.6)
+    assert normalized["monster_hit_rate"] == 0.0
+    assert normalized["pressure_index"] == pytest.approx(-5.0)
@@ -0,0 +1,98 @@
+"""Tests for the per-enemy-phase TurnContext shared by monster AI."""
+
+import pytest
+
+from components.component_registry import ComponentType
+from components.faction import Faction
+from components.fighter import Fighter
+from components.status_effects import StatusEffectManager, TauntedTargetEffect
+from entity import Entity
+from map_objects.game_map import GameMap
+from map_objects.spatial_index import EntityList
+from services.turn_context import (
+    begin_enemy_phase,
+    end_enemy_phase,
+    get_turn_context,
+    reset_turn_context,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_context():
+    reset_turn_context()
+    yield
+    end_enemy_phase()
+
+
+def _creature(x, y, name, faction=Faction.NEUTRAL, hp=10):
+    entity = Entity(x, y, 'o', (255, 255, 255), name, blocks=True,
+                    fighter=Fighter(hp=hp, defense=0, power=1))
+    entity.faction = faction
+    entity.status_effects = StatusEffectManager(entity)
+    entity.components.add(ComponentType.STATUS_EFFECTS, entity.status_effects)
+    return entity
+
+
+@pytest.fixture
+def floor():
+    game_map = GameMap(width=20, height=10, dungeon_level=1)
+    game_map.blocked[1:19, 1:9] = False
+    game_map.block_sight[1:19, 1:9] = False
+    player = _creature(2, 2, 'Player', Faction.PLAYER)
+    orc = _creature(5, 5, 'orc', Faction.ORC_FACTION)
+    slime = _creature(8, 5, 'slime', Faction.NEUTRAL)
+    corpse = Entity(9, 9, '%', (255, 0, 0), 'corpse', blocks=False)
+    entities = EntityList([player, orc, slime, corpse])
+    return game_map, entities, player, orc, slime
+
+
+def test_context_only_served_for_its_entity_list(floor):
+    game_map, entities, player, _, _ = floor
+    context = begin_enemy_phase(game_map, entities, player)
+
+    assert get_turn_context(entities) is context
+    assert get_turn_context(list(entities)) is None
+    end_enemy_phase()
+    assert get_turn_context(entities) is None
+
+
+def test_living_buckets_skip_non_fighters(floor):
+    game_map, entities, player, orc, slime = floor
+    context = begin_enemy_phase(game_map, entities, player)
+
+    assert context.living_entities() == [player, orc, slime]
+    assert context.living_members(Faction.ORC_FACTION) == [orc]
+    assert context.entity_by_id(id(slime)) is slime
+
+
+def test_taunt_is_revalidated_each_query(floor):
+    game_map, entities, player, orc, _ = floor
+    orc.status_effects.add_effect(TauntedTargetEffect(duration=3, owner=orc))
+    context = begin_enemy_phase(game_map, entities, player)
+
+    assert context.taunted_target() is orc
+    orc.fighter.hp = 0
+    assert context.taunted_target() is None
+
+
+def test_buckets_rebuilt_when_entities_change(floor):
+    game_map, entities, player, _, _ = floor
+    context = begin_enemy_phase(game_map, entities, player)
+    summoned = _creature(12, 4, 'zombie', Faction.UNDEAD)
+
+    entities.append(summoned)
+    assert context.living_members(Faction.UNDEAD) == [summoned]
+    assert context.rebuilds == 2
+
+
+def test_buckets_rebuilt_when_an_entity_is_swapped_at_equal_length(floor):
+    game_map, entities, player, _, slime = floor
+    context = begin_enemy_phase(game_map, entities, player)
+    summoned = _creature(12, 4, 'zombie', Faction.UNDEAD)
+
+    # A death and a summon in the same phase leave the length unchanged
+    entities.remove(slime)
+    entities.append(summoned)
+    assert context.living_members(Faction.NEUTRAL) == []
+    assert context.living_members(Faction.UNDEAD) == [summoned]
+    assert context.rebuilds == 2
@@ -0,0 +1,51 @@
+"""Tests for the scenario harness per-phase turn profiler."""
+
+from services.turn_profiler import (
+    TurnProfiler,
+    get_active_turn_profiler,
+    merge_profiles,
+    profile_phase,
+    scoped_turn_profiler,
+)
+
+
+def test_phase_counts_calls_and_time():
+    profiler = TurnProfiler()
+    for _ in range(3):
+        with profiler.phase("bot_decision"):
+            pass
+    profiler.record("enemy_ai.BasicMonster", 0.002, calls=4)
+
+    profile = profiler.to_dict()
+    assert list(profile) == ["bot_decision", "enemy_ai.BasicMonster"]
+    assert profile["bot_decision"]["calls"] == 3
+    assert profile["enemy_ai.BasicMonster"] == {"calls": 4, "total_ms": 2.0, "mean_us": 500.0}
+
+
+def test_profile_phase_is_noop_without_active_profiler():
+    assert get_active_turn_profiler() is None
+    with profile_phase("player_action"):
+        pass
+
+    with scoped_turn_profiler(enabled=False) as profiler:
+        assert profiler is None
+        assert get_active_turn_profiler() is None
+
+
+def test_scoped_profiler_collects_and_clears():
+    with scoped_turn_profiler() as profiler:
+        with profile_phase("status_effects"):
+            pass
+    assert get_active_turn_profiler() is None
+    assert profiler.to_dict()["status_effects"]["calls"] == 1
+
+
+def test_merge_profiles_sums_runs():
+    run_a = {"enemy_turn": {"calls": 2, "total_ms": 1.0, "mean_us": 500.0}}
+    run_b = {
+        "enemy_turn": {"calls": 3, "total_ms": 2.0, "mean_us": 666.667},
+        "reanimations": {"calls": 1, "total_ms": 0.5, "mean_us": 500.0},
+    }
+    merged = merge_profiles([run_a, run_b, {}])
+    assert merged["enemy_turn"] == {"calls": 5, "total_ms": 3.0, "mean_us": 600.0}
+    assert merged["reanimations"]["calls"] == 1
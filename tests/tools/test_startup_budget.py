@@ -0,0 +1,67 @@
+"""Tests for tools/startup_budget.py and the lazy subsystem packages it guards."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from tools.startup_budget import LAZY_MODULES, lazy_violations, parse_importtime
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_parse_importtime_sums_top_level_cumulative_time():
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        100 |   _io",
+        "import time:       500 |       2000 | site",
+        "import time:       300 |        300 |     yaml.events",
+        "import time:      1000 |       1500 |   yaml",
+        "import time:      4000 |       5500 | game",
+    ])
+
+    total_ms, imports = parse_importtime(stderr)
+
+    assert total_ms == 7.5
+    assert ("yaml.events", 0.3, 2) in imports
+
+
+def test_lazy_violations_match_packages_and_submodules_only():
+    modules = ["events", "events.core", "yaml.events", "performance.config",
+               "performance.monitor", "ui.sidebar", "memory_utils"]
+
+    assert lazy_violations(modules) == ["events", "events.core", "performance.monitor"]
+
+
+def test_entry_point_import_leaves_lazy_subsystems_unloaded():
+    code = (
+        "import sys, ecosystem_sanity, engine_integration\n"
+        "print('\\n'.join(sys.modules))\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT,
+                          capture_output=True, text=True, timeout=120)
+
+    assert proc.returncode == 0, proc.stderr
+    assert lazy_violations(proc.stdout.split()) == []
+
+
+def test_lazy_package_exports_resolve_on_access():
+    code = (
+        "import sys, performance, events\n"
+        "assert 'performance.monitor' not in sys.modules\n"
+        "from performance import PerformanceMonitor\n"
+        "from performance.monitor import PerformanceMonitor as direct\n"
+        "assert PerformanceMonitor is direct\n"
+        "assert events.get_event_bus is sys.modules['events.bus'].get_event_bus\n"
+        "assert 'EventBus' in dir(events)\n"
+        "try:\n"
+        "    events.NotAnExport\n"
+        "except AttributeError:\n"
+        "    pass\n"
+        "else:\n"
+        "    raise SystemExit('missing export did not raise')\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT,
+                          capture_output=True, text=True, timeout=120)
+
+    assert proc.returncode == 0, proc.stderr
+    assert "performance.monitor" in LAZY_MODULES
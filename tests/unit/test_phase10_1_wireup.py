@@ -273,7 +273,7 @@ class TestPlagueSpreadOnAttack:
         target.get_component_optional = Mock(return_value=None)  # No status effects yet
         
         # Force random to be below 0.25 (plague spreads)
-        with patch('components.fighter.random.random', return_value=0.10):
+        with patch('random.random', return_value=0.10):
             with patch('item_functions._is_corporeal_flesh', return_value=True):
                 with patch('item_functions.apply_plague_effect', return_value=[]) as mock_apply:
                     results = attacker._apply_plague_spread(target)
@@ -305,7 +305,7 @@ class TestPlagueSpreadOnAttack:
         target.get_component_optional = Mock(return_value=None)
         
         # Force random to be above 0.25 (plague does not spread)
-        with patch('components.fighter.random.random', return_value=0.50):
+        with patch('random.random', return_value=0.50):
             with patch('item_functions._is_corporeal_flesh', return_value=True):
                 results = attacker._apply_plague_spread(target)
                 
@@ -179,7 +179,7 @@ class TestSurpriseAttackEffects:
         fighter.owner = mock_owner
         
         # Call attack_d20 with is_surprise=True
-        with patch('components.fighter.random.randint', return_value=10):  # Normal roll
+        with patch('random.randint', return_value=10):  # Normal roll
             results = fighter.attack_d20(mock_target, is_surprise=True)
         
         # Should have dealt damage (critical hit)
@@ -214,7 +214,7 @@ class TestSurpriseAttackEffects:
         fighter.owner = mock_owner
         
         # Roll a 1 (would normally be fumble)
-        with patch('components.fighter.random.randint', return_value=1):
+        with patch('random.randint', return_value=1):
             results = fighter.attack_d20(mock_target, is_surprise=True)
         
         # Should still hit (surprise bypasses fumble)
@@ -248,7 +248,7 @@ class TestSurpriseAttackEffects:
         fighter.owner = mock_owner
         
         # Roll low (would miss against high AC)
-        with patch('components.fighter.random.randint', return_value=5):
+        with patch('random.randint', return_value=5):
             results = fighter.attack_d20(mock_target, is_surprise=True)
         
         # Should hit anyway (surprise auto-hit)
@@ -454,7 +454,7 @@ class TestSurpriseAttackDamage:
         fighter.owner = mock_owner
         
         # Attack without surprise
-        with patch('components.fighter.random.randint', return_value=15):  # Normal hit
+        with patch('random.randint', return_value=15):  # Normal hit
             results_normal = fighter.attack_d20(mock_target, is_surprise=False)
         
         normal_damage = mock_target_fighter.take_damage.call_args[0][0]
@@ -463,7 +463,7 @@ class TestSurpriseAttackDamage:
         mock_target_fighter.take_damage.reset_mock()
         
         # Attack with surprise (forced crit = 2× damage)
-        with patch('components.fighter.random.randint', return_value=15):  # Same roll
+        with patch('random.randint', return_value=15):  # Same roll
             results_surprise = fighter.attack_d20(mock_target, is_surprise=True)
         
         surprise_damage = mock_target_fighter.take_damage.call_args[0][0]
@@ -501,7 +501,7 @@ class TestFighterSurpriseParameter:
         fighter.owner = mock_owner
         
         # Should not raise
-        with patch('components.fighter.random.randint', return_value=10):
+        with patch('random.randint', return_value=10):
             results = fighter.attack_d20(mock_target, is_surprise=True)
             results = fighter.attack_d20(mock_target, is_surprise=False)
     
@@ -530,7 +530,7 @@ class TestFighterSurpriseParameter:
         fighter.owner = mock_owner
         
         # Call without is_surprise parameter (should use default False)
-        with patch('components.fighter.random.randint', return_value=1):  # Fumble roll
+        with patch('random.randint', return_value=1):  # Fumble roll
             results = fighter.attack_d20(mock_target)
         
         # With fumble roll and no surprise, should miss (no damage)
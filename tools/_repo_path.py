@@ -0,0 +1,15 @@
+"""Put the repo root on sys.path for scripts run as ``python3 tools/<name>.py``.
+
+Running a script by path puts its own directory (tools/) on sys.path, not the
+repo root the game packages import from. Scripts import this module when they
+are run that way; ``python3 -m tools.<name>`` and the tests already have the
+root on the path.
+"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
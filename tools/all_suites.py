@@ -10,14 +10,22 @@ Usage:
     python3 tools/all_suites.py
     python3 tools/all_suites.py --seed-base 42
     python3 tools/all_suites.py --skip-balance
+    python3 tools/all_suites.py --workers 8
+    python3 tools/all_suites.py --isolated    # each suite as its own subprocess
+
+By default the suites run in this process on one shared pool of warm worker
+processes (services/suite_runner.py), so worker startup and registry loading
+are paid once for all three suites.
 """
 
 import argparse
 import subprocess
 import sys
 from datetime import datetime
-from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, List, Optional, Tuple
+
+if not __package__:
+    import _repo_path  # noqa: F401  run by path: put the repo root on sys.path
 
 
 def run_suite(name: str, cmd: List[str]) -> Tuple[bool, str]:
@@ -42,6 +50,83 @@ def run_suite(name: str, cmd: List[str]) -> Tuple[bool, str]:
         return False, str(e)
 
 
+def run_suite_in_process(name: str, suite: Callable[[], int]) -> bool:
+    """Run a suite entry point in this process and return whether it passed.
+
+    Args:
+        name: Suite name for display
+        suite: Zero-argument callable returning the suite's exit code
+    """
+    print(f"\n{'='*60}")
+    print(f"Running: {name}")
+    print(f"{'='*60}\n")
+
+    try:
+        return suite() == 0
+    except SystemExit as e:
+        return e.code == 0
+    except Exception as e:  # noqa: BLE001 - a crashing suite is a failed suite
+        print(f"⚠️  {name} raised: {e}")
+        return False
+
+
+def _run_suites_isolated(args: argparse.Namespace) -> List[Tuple[str, Optional[bool]]]:
+    """Run each suite as a separate subprocess."""
+    results = []
+
+    # Suite 1: Identity Suite
+    if not args.skip_identity:
+        cmd = ["python3", "tools/identity_suite.py", "--seed-base", str(args.seed_base)]
+        success, _ = run_suite("Identity Suite", cmd)
+        results.append(("Identity Suite", success))
+    else:
+        print("\n⏭️  Skipping Identity Suite")
+        results.append(("Identity Suite", None))
+
+    # Suite 2: Hazards Suite
+    if not args.skip_hazards:
+        cmd = ["python3", "tools/hazards_suite.py", "--seed-base", str(args.seed_base)]
+        success, _ = run_suite("Hazards Suite", cmd)
+        results.append(("Hazards Suite", success))
+    else:
+        print("\n⏭️  Skipping Hazards Suite")
+        results.append(("Hazards Suite", None))
+
+    # Suite 3: Balance Suite
+    if not args.skip_balance:
+        cmd = ["python3", "tools/balance_suite.py", "--seed-base", str(args.seed_base)]
+        success, _ = run_suite("Balance Suite", cmd)
+        results.append(("Balance Suite", success))
+    else:
+        print("\n⏭️  Skipping Balance Suite")
+        results.append(("Balance Suite", None))
+
+    return results
+
+
+def _run_suites_shared(args: argparse.Namespace, runner) -> List[Tuple[str, Optional[bool]]]:
+    """Run the suites in this process on one shared SuiteRunner."""
+    from tools import balance_suite, hazards_suite, identity_suite
+
+    suites = [
+        ("Identity Suite", args.skip_identity,
+         lambda: identity_suite.run_identity_suite(seed_base=args.seed_base, runner=runner)),
+        ("Hazards Suite", args.skip_hazards,
+         lambda: hazards_suite.run_hazards_suite(seed_base=args.seed_base, runner=runner)),
+        ("Balance Suite", args.skip_balance,
+         lambda: balance_suite.main(["--seed-base", str(args.seed_base)], runner=runner)),
+    ]
+
+    results = []
+    for name, skip, suite in suites:
+        if skip:
+            print(f"\n⏭️  Skipping {name}")
+            results.append((name, None))
+        else:
+            results.append((name, run_suite_in_process(name, suite)))
+    return results
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -69,6 +154,22 @@ def main() -> int:
         action="store_true",
         help="Skip the balance suite",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Shared worker pool size (default: CPU count)",
+    )
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run each suite as its own subprocess (suites then use their own pools)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record per-phase turn timings into every scenario export",
+    )
 
     args = parser.parse_args()
 
@@ -79,37 +180,17 @@ def main() -> int:
     print(f"Skip Identity: {args.skip_identity}")
     print(f"Skip Hazards: {args.skip_hazards}")
     print(f"Skip Balance: {args.skip_balance}")
+    print(f"Workers: {args.workers or 'auto'}")
     print("=" * 60)
 
-    results = []
     start_time = datetime.now()
-
-    # Suite 1: Identity Suite
-    if not args.skip_identity:
-        cmd = ["python3", "tools/identity_suite.py", "--seed-base", str(args.seed_base)]
-        success, _ = run_suite("Identity Suite", cmd)
-        results.append(("Identity Suite", success))
+    if args.isolated:
+        results = _run_suites_isolated(args)
     else:
-        print("\n⏭️  Skipping Identity Suite")
-        results.append(("Identity Suite", None))
+        from services.suite_runner import SuiteRunner
 
-    # Suite 2: Hazards Suite
-    if not args.skip_hazards:
-        cmd = ["python3", "tools/hazards_suite.py", "--seed-base", str(args.seed_base)]
-        success, _ = run_suite("Hazards Suite", cmd)
-        results.append(("Hazards Suite", success))
-    else:
-        print("\n⏭️  Skipping Hazards Suite")
-        results.append(("Hazards Suite", None))
-
-    # Suite 3: Balance Suite
-    if not args.skip_balance:
-        cmd = ["python3", "tools/balance_suite.py", "--seed-base", str(args.seed_base)]
-        success, _ = run_suite("Balance Suite", cmd)
-        results.append(("Balance Suite", success))
-    else:
-        print("\n⏭️  Skipping Balance Suite")
-        results.append(("Balance Suite", None))
+        with SuiteRunner(workers=args.workers, profile=args.profile) as runner:
+            results = _run_suites_shared(args, runner)
 
     # Summary
     end_time = datetime.now()
@@ -9,6 +9,9 @@ Usage:
     python3 tools/balance_suite.py
     python3 tools/balance_suite.py --fast
     python3 tools/balance_suite.py --baseline reports/baselines/custom_baseline.json
+    python3 tools/balance_suite.py --workers 8      # warm worker pool size
+    python3 tools/balance_suite.py --isolated       # one ecosystem_sanity subprocess per scenario
+    python3 tools/balance_suite.py --profile        # add per-phase turn timings to raw exports
     
     # Baseline update mode - writes baseline, exits 0 on success
     python3 tools/balance_suite.py --update-baseline
@@ -23,6 +26,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+if not __package__:
+    import _repo_path  # noqa: F401  run by path: put the repo root on sys.path
+
 
 # ============================================================================
 # SCENARIO MATRIX CONFIGURATION
@@ -80,6 +86,8 @@ def run_ecosystem_scenario(
     turn_limit: int,
     output_path: Path,
     seed_base: int = 1337,
+    workers: int = 1,
+    profile: bool = False,
 ) -> bool:
     """Run ecosystem_sanity for a single scenario and export JSON.
     
@@ -89,6 +97,8 @@ def run_ecosystem_scenario(
         turn_limit: Turn limit per run
         output_path: Where to write JSON export
         seed_base: Base seed for deterministic runs (default: 1337)
+        workers: Worker processes per scenario (forwarded to ecosystem_sanity --workers)
+        profile: Forward --profile (per-phase timings in the exported JSON)
         
     Returns:
         True if successful, False otherwise
@@ -103,6 +113,10 @@ def run_ecosystem_scenario(
         "--export-json", str(output_path),
         "--seed-base", str(seed_base),
     ]
+    if workers > 1:
+        cmd += ["--workers", str(workers)]
+    if profile:
+        cmd.append("--profile")
     
     print(f"  Running {scenario_id} ({runs} runs, {turn_limit} turns)...")
     try:
@@ -298,8 +312,14 @@ def generate_verdict_json(
     print(f"✅ Verdict JSON written: {output_path}")
 
 
-def main() -> int:
-    """Main entry point."""
+def main(argv: Optional[List[str]] = None, runner: Any = None) -> int:
+    """Main entry point.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+        runner: Existing SuiteRunner to run on (tools/all_suites.py shares one
+            warm pool across suites); a new one is created when omitted
+    """
     parser = argparse.ArgumentParser(description="Balance Suite - Ecosystem scenario matrix runner")
     parser.add_argument(
         "--out-dir",
@@ -329,8 +349,24 @@ def main() -> int:
         default=1337,
         help="Base seed for deterministic scenario runs (default: 1337)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count; with --isolated: per scenario, default 1)",
+    )
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run each scenario in its own ecosystem_sanity.py subprocess instead of the worker pool",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record per-phase turn timings into each raw scenario export (\"profile\" key)",
+    )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Setup output directory
     if args.out_dir:
@@ -351,6 +387,8 @@ def main() -> int:
     print(f"Fast Mode: {args.fast}")
     print(f"Update Baseline Mode: {args.update_baseline}")
     print(f"Seed Base: {args.seed_base}")
+    print(f"Workers: {args.workers or 'auto'}")
+    print(f"Mode: {'isolated subprocesses' if args.isolated else 'worker pool'}")
     print(f"{'='*60}\n")
     
     # Load baseline (if exists) - for comparison/visibility only in update mode
@@ -372,18 +410,32 @@ def main() -> int:
     summary = {}
     failed = []
     
+    if args.isolated:
+        for scenario_config in SCENARIO_MATRIX:
+            scenario_id = scenario_config["id"]
+            success = run_ecosystem_scenario(
+                scenario_id, scenario_config["runs"], scenario_config["turn_limit"],
+                raw_dir / f"{scenario_id}.json", args.seed_base,
+                workers=args.workers or 1,
+                profile=args.profile,
+            )
+            if not success:
+                failed.append(scenario_id)
+    else:
+        from services.suite_runner import SuiteRunner, export_matrix
+
+        if runner is None:
+            with SuiteRunner(workers=args.workers, profile=args.profile) as own_runner:
+                failed = export_matrix(own_runner, SCENARIO_MATRIX, raw_dir, args.seed_base)
+        else:
+            failed = export_matrix(runner, SCENARIO_MATRIX, raw_dir, args.seed_base)
+    
+    # Parse and normalize (in matrix order, however the runs completed)
     for scenario_config in SCENARIO_MATRIX:
         scenario_id = scenario_config["id"]
-        runs = scenario_config["runs"]
-        turn_limit = scenario_config["turn_limit"]
-        raw_json_path = raw_dir / f"{scenario_id}.json"
-        
-        success = run_ecosystem_scenario(scenario_id, runs, turn_limit, raw_json_path, args.seed_base)
-        if not success:
-            failed.append(scenario_id)
+        if scenario_id in failed:
             continue
-        
-        # Parse and normalize
+        raw_json_path = raw_dir / f"{scenario_id}.json"
         try:
             raw_json = json.loads(raw_json_path.read_text(encoding="utf-8"))
             normalized = normalize_metrics(raw_json)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Duel Calculator - Analytical outcome of melee scenarios.
+
+Solves a scenario's 1-vs-N melee fight with balance.duel_model instead of
+simulating it, and optionally cross-validates the result against
+run_scenario_many. Use it to sanity-check a weapon/armor variant in
+milliseconds before spending a full balance suite run on it.
+
+Usage:
+    python3 tools/duel_calc.py dueling_pit
+    python3 tools/duel_calc.py orc_swarm_tight --turn-limit 150 --json
+    python3 tools/duel_calc.py dueling_pit --validate 30
+"""
+
+import argparse
+import json
+import sys
+
+if not __package__:
+    import _repo_path  # noqa: F401  run by path: put the repo root on sys.path
+
+
+def _print_outcome(scenario_id: str, player, monsters, outcome) -> None:
+    print("=" * 60)
+    print(f"DUEL MODEL: {scenario_id}")
+    print("=" * 60)
+    print(f"Player: {player.name} (HP {player.hp}, AC {player.armor_class}, to-hit {player.to_hit:+d})")
+    for monster in monsters:
+        print(f"  vs {monster.name} (HP {monster.hp}, AC {monster.armor_class}, to-hit {monster.to_hit:+d})")
+    print()
+    print(f"Win rate:        {outcome.win_rate:.2%}")
+    print(f"Death rate:      {outcome.loss_rate:.2%}")
+    print(f"Timeout rate:    {outcome.timeout_rate:.2%}")
+    print(f"Expected rounds: {outcome.expected_rounds:.2f}")
+    print(f"Expected kills:  {outcome.expected_kills:.2f}")
+    print(f"Expected HP lost: {outcome.expected_hp_loss:.2f}")
+
+
+def _print_validation(report) -> None:
+    print()
+    print(f"Cross-validation ({report['runs']} simulated runs):")
+    print(f"  {'metric':<24}{'analytic':>10}{'simulated':>11}{'delta':>9}")
+    for key, analytic in report["analytic"].items():
+        simulated = report["simulated"][key]
+        print(f"  {key:<24}{analytic:>10.3f}{simulated:>11.3f}{report['delta'][key]:>+9.3f}")
+
+
+def main(argv=None) -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Solve a melee scenario analytically",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("scenario", help="Scenario ID (e.g. dueling_pit)")
+    parser.add_argument(
+        "--turn-limit",
+        type=int,
+        default=None,
+        help="Round limit (default: scenario default, else 100)",
+    )
+    parser.add_argument(
+        "--validate",
+        type=int,
+        default=0,
+        metavar="RUNS",
+        help="Also simulate RUNS runs and compare (default: off)",
+    )
+    parser.add_argument(
+        "--seed-base",
+        type=int,
+        default=1337,
+        help="Base seed for simulated runs (default: 1337)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a report")
+    args = parser.parse_args(argv)
+
+    from balance.duel_model import cross_validate_scenario, scenario_profiles, solve_duel
+    from config.level_template_registry import get_scenario_registry
+
+    scenario = get_scenario_registry().get_scenario_definition(args.scenario)
+    if scenario is None:
+        print(f"Error: Scenario '{args.scenario}' not found", file=sys.stderr)
+        return 1
+    turn_limit = args.turn_limit or (scenario.defaults or {}).get("turn_limit", 100)
+
+    player, monsters = scenario_profiles(scenario, seed=args.seed_base)
+    outcome = solve_duel(player, monsters, max_rounds=turn_limit)
+    report = None
+    if args.validate > 0:
+        report = cross_validate_scenario(
+            args.scenario, runs=args.validate, turn_limit=turn_limit, seed_base=args.seed_base,
+        )
+
+    if args.json:
+        payload = {"scenario_id": args.scenario, "turn_limit": turn_limit, "outcome": outcome.to_dict()}
+        if report is not None:
+            payload["validation"] = {key: report[key] for key in ("runs", "analytic", "simulated", "delta")}
+        print(json.dumps(payload, indent=2))
+    else:
+        _print_outcome(args.scenario, player, monsters, outcome)
+        if report is not None:
+            _print_validation(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
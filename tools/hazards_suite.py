@@ -8,6 +8,7 @@ scenarios distinct from mechanics-focused scenarios.
 Usage:
     python3 tools/hazards_suite.py
     python3 tools/hazards_suite.py --fast
+    python3 tools/hazards_suite.py --isolated    # one ecosystem_sanity subprocess per scenario
 """
 
 import argparse
@@ -16,7 +17,10 @@ import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+if not __package__:
+    import _repo_path  # noqa: F401  run by path: put the repo root on sys.path
 
 
 # ============================================================================
@@ -100,12 +104,21 @@ def run_ecosystem_scenario(
         return False
 
 
-def run_hazards_suite(fast_mode: bool = False, seed_base: int = 1337) -> int:
+def run_hazards_suite(
+    fast_mode: bool = False,
+    seed_base: int = 1337,
+    workers: Optional[int] = None,
+    isolated: bool = False,
+    runner: Any = None,
+) -> int:
     """Run all hazards suite scenarios.
     
     Args:
         fast_mode: If True, run fewer iterations for faster feedback
         seed_base: Base seed for deterministic runs
+        workers: Worker pool size (default: CPU count)
+        isolated: Run each scenario in its own ecosystem_sanity subprocess
+        runner: Existing SuiteRunner to share (see tools/all_suites.py)
         
     Returns:
         Exit code (0 = success, 1 = failure)
@@ -135,25 +148,30 @@ def run_hazards_suite(fast_mode: bool = False, seed_base: int = 1337) -> int:
     success_count = 0
     fail_count = 0
     
-    for scenario in scenarios:
-        scenario_id = scenario["id"]
-        runs = scenario["runs"]
-        turn_limit = scenario["turn_limit"]
-        
-        output_path = output_dir / f"{scenario_id}.json"
-        
-        success = run_ecosystem_scenario(
-            scenario_id=scenario_id,
-            runs=runs,
-            turn_limit=turn_limit,
-            output_path=output_path,
-            seed_base=seed_base,
-        )
-        
-        if success:
-            success_count += 1
+    if isolated:
+        for scenario in scenarios:
+            scenario_id = scenario["id"]
+            success = run_ecosystem_scenario(
+                scenario_id=scenario_id,
+                runs=scenario["runs"],
+                turn_limit=scenario["turn_limit"],
+                output_path=output_dir / f"{scenario_id}.json",
+                seed_base=seed_base,
+            )
+            if success:
+                success_count += 1
+            else:
+                fail_count += 1
+    else:
+        from services.suite_runner import SuiteRunner, export_matrix
+
+        if runner is None:
+            with SuiteRunner(workers=workers) as own_runner:
+                failed = export_matrix(own_runner, scenarios, output_dir, seed_base)
         else:
-            fail_count += 1
+            failed = export_matrix(runner, scenarios, output_dir, seed_base)
+        fail_count = len(failed)
+        success_count = len(scenarios) - fail_count
     
     print(f"\n✅ Completed {success_count + fail_count}/{len(scenarios)} scenarios\n")
     
@@ -210,12 +228,25 @@ def main():
         default=1337,
         help="Base seed for deterministic runs (default: 1337)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker pool size (default: CPU count)",
+    )
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run each scenario in its own ecosystem_sanity.py subprocess instead of the worker pool",
+    )
     
     args = parser.parse_args()
     
     exit_code = run_hazards_suite(
         fast_mode=args.fast,
         seed_base=args.seed_base,
+        workers=args.workers,
+        isolated=args.isolated,
     )
     
     sys.exit(exit_code)
@@ -12,6 +12,7 @@ Distinct from:
 Usage:
     python3 tools/identity_suite.py
     python3 tools/identity_suite.py --seed-base 42
+    python3 tools/identity_suite.py --isolated    # one ecosystem_sanity subprocess per scenario
 """
 
 import argparse
@@ -20,7 +21,10 @@ import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+if not __package__:
+    import _repo_path  # noqa: F401  run by path: put the repo root on sys.path
 
 
 # ============================================================================
@@ -154,11 +158,19 @@ def run_ecosystem_scenario(
         return False
 
 
-def run_identity_suite(seed_base: int = 1337) -> int:
+def run_identity_suite(
+    seed_base: int = 1337,
+    workers: Optional[int] = None,
+    isolated: bool = False,
+    runner: Any = None,
+) -> int:
     """Run all identity suite scenarios.
 
     Args:
         seed_base: Base seed for deterministic runs
+        workers: Worker pool size (default: CPU count)
+        isolated: Run each scenario in its own ecosystem_sanity subprocess
+        runner: Existing SuiteRunner to share (see tools/all_suites.py)
 
     Returns:
         Exit code (0 = success, 1 = failure)
@@ -183,27 +195,36 @@ def run_identity_suite(seed_base: int = 1337) -> int:
     fail_count = 0
     scenario_results: List[Dict[str, Any]] = []
 
-    for scenario in IDENTITY_SCENARIOS:
-        scenario_id = scenario["id"]
-        runs = scenario["runs"]
-        turn_limit = scenario["turn_limit"]
-
-        output_path = output_dir / f"{scenario_id}.json"
-
-        success = run_ecosystem_scenario(
-            scenario_id=scenario_id,
-            runs=runs,
-            turn_limit=turn_limit,
-            output_path=output_path,
-            seed_base=seed_base,
-        )
+    if isolated:
+        failed = []
+        for scenario in IDENTITY_SCENARIOS:
+            scenario_id = scenario["id"]
+            success = run_ecosystem_scenario(
+                scenario_id=scenario_id,
+                runs=scenario["runs"],
+                turn_limit=scenario["turn_limit"],
+                output_path=output_dir / f"{scenario_id}.json",
+                seed_base=seed_base,
+            )
+            if not success:
+                failed.append(scenario_id)
+    else:
+        from services.suite_runner import SuiteRunner, export_matrix
 
-        if success:
-            success_count += 1
-            scenario_results.append({"id": scenario_id, "status": "success"})
+        if runner is None:
+            with SuiteRunner(workers=workers) as own_runner:
+                failed = export_matrix(own_runner, IDENTITY_SCENARIOS, output_dir, seed_base)
         else:
+            failed = export_matrix(runner, IDENTITY_SCENARIOS, output_dir, seed_base)
+
+    for scenario in IDENTITY_SCENARIOS:
+        scenario_id = scenario["id"]
+        if scenario_id in failed:
             fail_count += 1
             scenario_results.append({"id": scenario_id, "status": "failed"})
+        else:
+            success_count += 1
+            scenario_results.append({"id": scenario_id, "status": "success"})
 
     print(f"\n✅ Completed {success_count + fail_count}/{len(IDENTITY_SCENARIOS)} scenarios\n")
 
@@ -256,11 +277,24 @@ def main():
         default=1337,
         help="Base seed for deterministic runs (default: 1337)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker pool size (default: CPU count)",
+    )
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run each scenario in its own ecosystem_sanity.py subprocess instead of the worker pool",
+    )
 
     args = parser.parse_args()
 
     exit_code = run_identity_suite(
         seed_base=args.seed_base,
+        workers=args.workers,
+        isolated=args.isolated,
     )
 
     sys.exit(exit_code)
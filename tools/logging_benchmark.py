@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Logging Benchmark - turn-time cost of logging in a bot soak run.
+
+Runs the same seeded, render-free bot soak under several logging setups,
+with the handlers engine.py installs (debug.log on the root logger, a rotating
+rlike.log on 'rlike'), and reports per player turn:
+
+- wall ms:   elapsed time of the session
+- game ms:   CPU time of the game thread (time.thread_time)
+
+Setups:
+
+- warning:      root and 'rlike' loggers at WARNING
+- debug:        DEBUG, log files written from the game thread
+- debug-queued: DEBUG with logger_config.start_background_logging(), so the
+                game thread only builds and enqueues records
+
+Simulate mode never idles, so the listener thread's formatting and writes
+compete with the game for the GIL and show up in wall time. In the
+interactive game they run while the loop waits for input or the next frame;
+the game-thread column is the per-turn cost the player feels.
+
+Each setup gets the same seeds, so every setup plays the same turns. The
+best of ``--repeat`` sessions is reported.
+
+Usage:
+    python3 tools/logging_benchmark.py
+    python3 tools/logging_benchmark.py --runs 3 --turns 500 --repeat 3
+    python3 tools/logging_benchmark.py --modes warning debug-queued
+"""
+
+import argparse
+import contextlib
+import logging
+import logging.handlers
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+if not __package__:
+    import _repo_path  # noqa: F401  run by path: put the repo root on sys.path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+MODES: Dict[str, Tuple[int, bool]] = {
+    # mode -> (log level, background writer)
+    "warning": (logging.WARNING, False),
+    "debug": (logging.DEBUG, False),
+    "debug-queued": (logging.DEBUG, True),
+}
+
+
+def configure_logging(mode: str, log_dir: Path) -> None:
+    """Install engine.py's log files under ``log_dir`` at the mode's level.
+
+    Root gets a debug.log file handler (as debug_logging.setup_debug_logging)
+    and 'rlike' a rotating rlike.log (as logger_config.setup_logging); 'rlike'
+    records propagate to both.
+    """
+    from logger_config import start_background_logging, stop_background_logging
+
+    level, queued = MODES[mode]
+    stop_background_logging()
+
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S"
+    )
+    debug_handler = logging.FileHandler(str(log_dir / f"{mode}_debug.log"), mode="w")
+    debug_handler.setFormatter(formatter)
+    root = logging.getLogger()
+    root.handlers.clear()
+    root.addHandler(debug_handler)
+    root.setLevel(level)
+
+    app_handler = logging.handlers.RotatingFileHandler(
+        str(log_dir / f"{mode}_rlike.log"), maxBytes=10_000_000, backupCount=1
+    )
+    app_handler.setFormatter(formatter)
+    app_logger = logging.getLogger("rlike")
+    app_logger.handlers.clear()
+    app_logger.addHandler(app_handler)
+    app_logger.setLevel(level)
+
+    if queued:
+        start_background_logging()
+
+
+def run_session(mode: str, log_dir: Path, runs: int, turns: int, seed: int) -> Tuple[float, float, int, int]:
+    """Play one soak session under ``mode``.
+
+    Returns:
+        (wall seconds, game-thread CPU seconds, player turns, log bytes written)
+    """
+    from engine.soak_harness import run_bot_soak
+    from logger_config import stop_background_logging
+
+    configure_logging(mode, log_dir)
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            start, start_cpu = time.perf_counter(), time.thread_time()
+            result = run_bot_soak(
+                runs=runs,
+                telemetry_enabled=False,
+                max_turns=turns,
+                base_seed=seed,
+                simulate=True,
+            )
+            elapsed, cpu = time.perf_counter() - start, time.thread_time() - start_cpu
+    finally:
+        # Drain the queue outside the timed section
+        stop_background_logging()
+        for name in ("", "rlike"):
+            for handler in logging.getLogger(name).handlers:
+                handler.close()
+    log_bytes = sum(path.stat().st_size for path in log_dir.glob(f"{mode}_*.log"))
+    return elapsed, cpu, result.total_turns, log_bytes
+
+
+def main() -> int:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Measure how much turn time logging costs in a soak run.")
+    parser.add_argument("--runs", type=int, default=2, help="Bot runs per session (default: 2)")
+    parser.add_argument("--turns", type=int, default=400, help="Turn limit per run (default: 400)")
+    parser.add_argument("--seed", type=int, default=1337, help="Base seed (default: 1337)")
+    parser.add_argument("--repeat", type=int, default=3, help="Sessions per mode; best is used (default: 3)")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES),
+                        help="Logging setups to compare (default: all)")
+    args = parser.parse_args()
+
+    results: List[Tuple[str, float, float, int, int]] = []
+    with tempfile.TemporaryDirectory(prefix="logbench_") as tmp:
+        log_dir = Path(tmp)
+        # Warm-up: content loading and first-import costs are not logging costs
+        run_session("warning", log_dir, 1, min(args.turns, 50), args.seed)
+
+        for mode in args.modes:
+            sessions = [
+                run_session(mode, log_dir, args.runs, args.turns, args.seed)
+                for _ in range(max(1, args.repeat))
+            ]
+            elapsed = min(session[0] for session in sessions)
+            cpu = min(session[1] for session in sessions)
+            _, _, turns, log_bytes = sessions[0]
+            results.append((mode, elapsed, cpu, turns, log_bytes))
+
+    for name in ("", "rlike"):
+        logging.getLogger(name).handlers.clear()
+
+    baseline = next((r for r in results if r[0] == "warning"), results[0])
+
+    def per_turn(seconds: float, turns: int) -> float:
+        return seconds * 1000 / max(1, turns)
+
+    base_wall, base_cpu = per_turn(baseline[1], baseline[3]), per_turn(baseline[2], baseline[3])
+    print(f"{'mode':<14} {'turns':>6} {'wall ms':>8} {'':>8} {'game ms':>8} {'':>8} {'log MB':>7}")
+    for mode, elapsed, cpu, turns, log_bytes in results:
+        wall_ms, cpu_ms = per_turn(elapsed, turns), per_turn(cpu, turns)
+        print(f"{mode:<14} {turns:>6} {wall_ms:>8.3f} {(wall_ms / base_wall - 1) * 100:>+7.1f}% "
+              f"{cpu_ms:>8.3f} {(cpu_ms / base_cpu - 1) * 100:>+7.1f}% {log_bytes / 1e6:>7.2f}")
+    print(f"(percentages relative to {baseline[0]})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
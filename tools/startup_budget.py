@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Startup Budget - cold-start import time check for the game entry points.
+
+Every suite run spawns hundreds of ``ecosystem_sanity.py`` / ``engine.py``
+subprocesses, so module import time is paid over and over. This tool runs
+each entry point in a fresh interpreter under ``python -X importtime``, sums
+the cumulative time of the top-level imports and fails when:
+
+- the best-of-N import time exceeds the entry point's budget, or
+- a subsystem that is meant to load lazily (memory, assets, events,
+  state_machine, the performance monitor stack, psutil) was imported.
+
+The second check is deterministic and catches the usual regression, an eager
+package ``__init__`` or a new top-level import, on any machine; the time
+budget catches everything else.
+
+Usage:
+    python3 tools/startup_budget.py
+    python3 tools/startup_budget.py --runs 5 --scale 1.5   # slower machine
+    python3 tools/startup_budget.py --report               # top imports per target
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+# ============================================================================
+# BUDGETS
+# ============================================================================
+
+# Budgets leave ~40% headroom over a warm-pyc run on the reference machine
+# (ecosystem_sanity ~540 ms, engine.py ~500 ms)
+STARTUP_TARGETS: List[Dict[str, Any]] = [
+    {"name": "ecosystem_sanity", "argv": ["-c", "import ecosystem_sanity"], "budget_ms": 750},
+    {"name": "engine.py", "argv": ["engine.py", "--help"], "budget_ms": 700},
+]
+
+# Modules that must not be imported just by starting an entry point. A name
+# matches itself and its submodules.
+LAZY_MODULES: Tuple[str, ...] = (
+    "memory",
+    "assets",
+    "events",
+    "state_machine",
+    "psutil",
+    "performance.core",
+    "performance.monitor",
+    "performance.analyzer",
+    "performance.alerts",
+    "performance.dashboard",
+    "performance.integration",
+    "ui.dialog",
+    "ui.menu",
+    "ui.panel",
+    "ui.tooltip",
+)
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( +)(\S+)\s*$")
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def parse_importtime(stderr: str) -> Tuple[float, List[Tuple[str, float, int]]]:
+    """Parse ``-X importtime`` output.
+
+    Args:
+        stderr: The interpreter's stderr
+
+    Returns:
+        (total_ms, imports): total is the sum of the top-level imports'
+        cumulative time; imports lists (module, cumulative_ms, depth)
+    """
+    total_us = 0
+    imports: List[Tuple[str, float, int]] = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative_us = int(match.group(2))
+        depth = (len(match.group(3)) - 1) // 2
+        imports.append((match.group(4), cumulative_us / 1000.0, depth))
+        if depth == 0:
+            total_us += cumulative_us
+    return total_us / 1000.0, imports
+
+
+def lazy_violations(modules: List[str]) -> List[str]:
+    """Return the imported modules that should have been loaded lazily."""
+    return sorted(
+        name for name in set(modules)
+        if any(name == lazy or name.startswith(lazy + ".") for lazy in LAZY_MODULES)
+    )
+
+
+def measure(target: Dict[str, Any]) -> Tuple[float, List[Tuple[str, float, int]]]:
+    """Run one entry point in a fresh interpreter under ``-X importtime``.
+
+    Returns:
+        (total_ms, imports) as from parse_importtime
+    """
+    env = dict(os.environ)
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *target["argv"]],
+        cwd=_REPO_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=120,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{target['name']} exited with {proc.returncode}:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def check_target(target: Dict[str, Any], runs: int, scale: float,
+                 report: int = 0) -> Optional[str]:
+    """Measure one target and print its result.
+
+    Args:
+        target: Entry from STARTUP_TARGETS
+        runs: Fresh interpreters to start; the fastest run is compared
+        scale: Budget multiplier
+        report: Print this many of the slowest top-level imports
+
+    Returns:
+        A failure message, or None when the target is within budget
+    """
+    timings = []
+    imports: List[Tuple[str, float, int]] = []
+    for _ in range(runs):
+        total_ms, imports = measure(target)
+        timings.append(total_ms)
+
+    best = min(timings)
+    budget = target["budget_ms"] * scale
+    status = "OK  " if best <= budget else "FAIL"
+    print(f"{status} {target['name']:<20} {best:7.1f} ms  (budget {budget:.0f} ms, "
+          f"runs: {', '.join(f'{t:.0f}' for t in timings)})")
+
+    if report:
+        for name, cumulative_ms, depth in sorted(
+                (i for i in imports if i[2] <= 1), key=lambda i: -i[1])[:report]:
+            print(f"       {cumulative_ms:7.1f} ms  {'  ' * depth}{name}")
+
+    violations = lazy_violations([name for name, _, _ in imports])
+    if violations:
+        return f"{target['name']} imported lazy subsystems: {', '.join(violations)}"
+    if best > budget:
+        return f"{target['name']} import time {best:.1f} ms exceeds budget {budget:.0f} ms"
+    return None
+
+
+def main() -> int:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Check entry point import time against a budget.")
+    parser.add_argument("--runs", type=int, default=3, help="Interpreters per target (best is used)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget (slow machines)")
+    parser.add_argument("--report", type=int, nargs="?", const=15, default=0,
+                        help="Show the N slowest top-level imports per target")
+    args = parser.parse_args()
+
+    failures = [
+        failure for failure in (
+            check_target(target, max(1, args.runs), args.scale, args.report)
+            for target in STARTUP_TARGETS
+        ) if failure
+    ]
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Startup within budget")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,14 +15,18 @@ Key Components:
 - Theme: Styling and appearance management
 """
 
-from .component import Component, ComponentState
-from .layout import Layout, GridLayout, FlowLayout, AbsoluteLayout
-from .button import Button
-from .panel import Panel
-from .menu import Menu, MenuItem
-from .dialog import Dialog, DialogType, DialogResult
-from .theme import Theme, DefaultTheme, DarkTheme, LightTheme, GameTheme
-from .events import UIEvent, UIEventType
+from utils.lazy_exports import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    '.component': ['Component', 'ComponentState'],
+    '.layout': ['Layout', 'GridLayout', 'FlowLayout', 'AbsoluteLayout'],
+    '.button': ['Button'],
+    '.panel': ['Panel'],
+    '.menu': ['Menu', 'MenuItem'],
+    '.dialog': ['Dialog', 'DialogType', 'DialogResult'],
+    '.theme': ['Theme', 'DefaultTheme', 'DarkTheme', 'LightTheme', 'GameTheme'],
+    '.events': ['UIEvent', 'UIEventType'],
+})
 
 __all__ = [
     'Component',
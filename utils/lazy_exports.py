@@ -0,0 +1,57 @@
+"""Lazy package re-exports.
+
+Several subsystem packages (``performance``, ``memory``, ``events``,
+``state_machine``, ``ui``, ``assets``) re-export their whole API from
+``__init__``. Importing any one submodule, e.g. ``performance.config`` or
+``ui.sidebar``, therefore imported every sibling and their dependencies
+(asyncio, psutil, the event bus, the state machine), which headless runs and
+suite subprocesses never use.
+
+``lazy_exports`` keeps the same public names but resolves each one on first
+attribute access (PEP 562), importing only the submodule that defines it:
+
+    __getattr__, __dir__ = lazy_exports(__name__, {
+        '.core': ['EventBus', 'get_event_bus'],
+        '.utils': ['AllocationTracker as UtilsAllocationTracker'],
+    })
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(package: str,
+                 exports: Dict[str, Iterable[str]]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` for lazy re-exports.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Relative submodule name -> exported names; ``'Name as Alias'``
+            exports ``Name`` under ``Alias``
+
+    Returns:
+        (__getattr__, __dir__) to assign at module level in the package
+    """
+    targets: Dict[str, Tuple[str, str]] = {}
+    for module, names in exports.items():
+        for name in names:
+            source, _, alias = name.partition(' as ')
+            targets[(alias or source).strip()] = (module, source.strip())
+
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module, attr = targets[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(module, package), attr)
+        # Cache so later lookups skip __getattr__
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(targets))
+
+    return __getattr__, __dir__
@@ -3,6 +3,9 @@
 
 Generates many maps, captures basic invariants/metrics, and can export JSON
 for offline analysis. This is renderer-agnostic and runs headless.
+
+``--plan-only`` generates each depth directly with ``make_map(plan_only=True)``:
+spawns are placed but not instantiated, which is several times faster.
 """
 
 import argparse
@@ -19,7 +22,9 @@ warnings.filterwarnings("ignore")
 
 from balance.etp import get_monster_etp
 from config.testing_config import get_testing_config, set_testing_mode
+from entity import Entity
 from loader_functions.initialize_new_game import get_constants, get_game_variables
+from map_objects.game_map import GameMap, floor_dimensions
 from map_objects.rectangle import Rect
 
 
@@ -104,11 +109,38 @@ def _reachable_tiles(game_map, start: Tuple[int, int]) -> int:
     return reachable
 
 
-def _collect_run_metrics(depth: int, run_idx: int) -> RunMetrics:
+def _generate_plan_only(depth: int, constants: Dict):
+    """Generate one floor at ``depth`` without instantiating its spawns.
+
+    Returns:
+        (player, entities, game_map); entities holds PlannedEntity stand-ins
+    """
+    player = Entity(0, 0, "@", (255, 255, 255), "Player", blocks=True)
+    entities = [player]
+    # Sized per depth the same way GameMap.next_floor sizes it
+    map_width, map_height = floor_dimensions(depth, constants)
+    game_map = GameMap(map_width, map_height, dungeon_level=depth)
+    game_map.make_map(
+        constants["max_rooms"],
+        constants["room_min_size"],
+        constants["room_max_size"],
+        map_width,
+        map_height,
+        player,
+        entities,
+        plan_only=True,
+    )
+    return player, entities, game_map
+
+
+def _collect_run_metrics(depth: int, run_idx: int, plan_only: bool = False) -> RunMetrics:
     """Generate a single map and collect metrics."""
     _reset_testing_config(depth)
     constants = get_constants()
-    player, entities, game_map, _, _ = get_game_variables(constants)
+    if plan_only:
+        player, entities, game_map = _generate_plan_only(depth, constants)
+    else:
+        player, entities, game_map, _, _ = get_game_variables(constants)
 
     walkable, total_tiles, walkable_percent = game_map.get_walkable_stats()
     reachable = _reachable_tiles(game_map, (player.x, player.y))
@@ -252,6 +284,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Print per-run results (walkable %, reachable %, counts)",
     )
+    parser.add_argument(
+        "--plan-only",
+        action="store_true",
+        help="Generate each depth directly without instantiating monsters/items (fast sampling)",
+    )
     return parser.parse_args()
 
 
@@ -278,7 +315,7 @@ def main() -> None:
 
     for depth in depths:
         for run_idx in range(1, args.runs + 1):
-            metrics = _collect_run_metrics(depth, run_idx)
+            metrics = _collect_run_metrics(depth, run_idx, plan_only=args.plan_only)
             all_runs.append(metrics)
             if args.verbose:
                 print(